@@ -0,0 +1,183 @@
+"""Admin commands added to the ``litestar`` CLI.
+
+Run them with ``litestar --app app.main:app <command>``, e.g.
+``litestar --app app.main:app retention purge --older-than-days 90`` or
+``litestar --app app.main:app ingredients import pantry.csv``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import click
+from click import Group
+from litestar.plugins import CLIPlugin
+
+from app.config import get_settings
+from app.core.completion_cache import CompletionCache
+from app.core.inflight import InflightCoalescer
+from app.core.ingredient_batcher import IngredientBatcher
+from app.core.ingredient_import import ai_enricher, import_ingredients
+from app.core.marvin_config import configure_marvin
+from app.core.retention import PurgeReport, run_retention
+from app.database import DatabaseManager
+from app.enums import ImportFormat
+from app.repositories import SuggestionRepository
+from app.schemas.responses.ingredient import IngredientImportError
+from app.services import SuggestionService
+
+# Bytes read from an import file at a time
+IMPORT_CHUNK_SIZE = 64 * 1024
+
+
+async def _purge(
+    *, retention_days: int, batch_size: int, pause_ms: float, full_vacuum: bool
+) -> PurgeReport:
+    manager = DatabaseManager(get_settings())
+    try:
+        await manager.init_db()
+        return await run_retention(
+            manager.get_session_factory(),
+            manager.get_engine(),
+            retention_days=retention_days,
+            batch_size=batch_size,
+            pause_ms=pause_ms,
+            full_vacuum=full_vacuum,
+        )
+    finally:
+        await manager.close()
+
+
+async def _file_chunks(path: Path) -> AsyncIterator[bytes]:
+    with path.open("rb") as file:
+        while chunk := file.read(IMPORT_CHUNK_SIZE):
+            yield chunk
+
+
+async def _import(path: Path, *, fmt: ImportFormat, batch_size: int, enrich: bool) -> None:
+    if enrich:
+        # Fail on a missing API key before importing anything
+        configure_marvin()
+    settings = get_settings()
+    manager = DatabaseManager(settings)
+    try:
+        await manager.init_db()
+        session_factory = manager.get_session_factory()
+        cache = (
+            CompletionCache(
+                session_factory,
+                ttl_seconds=settings.marvin_cache_ttl_seconds,
+                max_entries=settings.marvin_cache_max_entries,
+            )
+            if settings.marvin_cache_enabled
+            else None
+        )
+        batcher = (
+            IngredientBatcher(
+                window_ms=settings.marvin_batch_window_ms,
+                max_batch_size=settings.marvin_batch_max_size,
+            )
+            if settings.marvin_batch_enabled
+            else None
+        )
+        async with session_factory() as session:
+            enricher = (
+                ai_enricher(
+                    SuggestionService(
+                        SuggestionRepository(session, cache, InflightCoalescer(), batcher)
+                    )
+                )
+                if enrich
+                else None
+            )
+            async for event in import_ingredients(
+                session_factory,
+                _file_chunks(path),
+                fmt=fmt,
+                batch_size=batch_size,
+                enrich=enricher,
+            ):
+                click.echo(event.model_dump_json(), err=isinstance(event, IngredientImportError))
+    finally:
+        await manager.close()
+
+
+class MenooCLIPlugin(CLIPlugin):
+    """Register the Menoo admin command groups."""
+
+    def on_cli_init(self, cli: Group) -> None:
+        """Add the ``retention`` and ``ingredients`` groups to the CLI."""
+
+        @cli.group(name="retention")
+        def retention() -> None:
+            """Archive and purge soft-deleted rows."""
+
+        @retention.command(name="purge")
+        @click.option(
+            "--older-than-days",
+            type=click.IntRange(min=1),
+            default=None,
+            help="Purge rows soft-deleted longer ago than this (default: RETENTION_DAYS).",
+        )
+        @click.option(
+            "--batch-size",
+            type=click.IntRange(min=1),
+            default=None,
+            help="Rows per transaction (default: RETENTION_BATCH_SIZE).",
+        )
+        @click.option(
+            "--full-vacuum",
+            is_flag=True,
+            help="Rewrite the SQLite file once with VACUUM and enable incremental vacuum.",
+        )
+        def purge(older_than_days: int | None, batch_size: int | None, full_vacuum: bool) -> None:
+            """Archive and hard-delete expired soft-deleted rows, then ANALYZE and vacuum."""
+            settings = get_settings()
+            report = asyncio.run(
+                _purge(
+                    retention_days=older_than_days or settings.retention_days,
+                    batch_size=batch_size or settings.retention_batch_size,
+                    pause_ms=settings.retention_batch_pause_ms,
+                    full_vacuum=full_vacuum,
+                )
+            )
+            click.echo(
+                f"Purged {report.recipes} recipes and {report.ingredients} ingredients "
+                f"in {report.batches} batches; freed {report.freed_pages} pages"
+            )
+
+        @cli.group(name="ingredients")
+        def ingredients() -> None:
+            """Bulk ingredient maintenance."""
+
+        @ingredients.command(name="import")
+        @click.argument("path", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+        @click.option(
+            "--format",
+            "fmt",
+            type=click.Choice([fmt.value for fmt in ImportFormat]),
+            default=None,
+            help="File format (default: from the file extension, .jsonl or .csv).",
+        )
+        @click.option(
+            "--batch-size",
+            type=click.IntRange(min=1, max=10_000),
+            default=1000,
+            show_default=True,
+            help="Rows upserted per transaction.",
+        )
+        @click.option(
+            "--enrich",
+            is_flag=True,
+            help="Complete each row with AI before saving (needs OPENAI_API_KEY).",
+        )
+        def import_(path: Path, fmt: str | None, batch_size: int, enrich: bool) -> None:
+            """Upsert ingredients from a CSV or JSONL file, printing NDJSON progress.
+
+            Skipped rows are reported on stderr, progress on stdout.
+            """
+            if fmt is None:
+                fmt = "jsonl" if path.suffix.lower() in {".jsonl", ".ndjson"} else "csv"
+            asyncio.run(_import(path, fmt=ImportFormat(fmt), batch_size=batch_size, enrich=enrich))
@@ -42,11 +42,92 @@ class Settings(BaseSettings):
         description="SQLite database URL",
     )
     database_echo: bool = False
+    database_connection_profile: Literal["raspberry-pi-sd", "ssd", "test-memory", "none"] = Field(
+        default="ssd",
+        description="SQLite PRAGMA profile applied to every pooled connection ('none' disables it)",
+    )
+    database_read_pool_size: int = Field(
+        default=4,
+        ge=0,
+        description="Read-only SQLite connections for GET requests (0 shares the writer engine)",
+    )
+    database_schema_mode: Literal["create_all", "check", "migrate"] = Field(
+        default="create_all",
+        description=(
+            "Startup schema handling: create_all runs Base.metadata.create_all, check only "
+            "verifies the Alembic revision is at head, migrate upgrades to head under a file lock"
+        ),
+    )
+    database_write_coalescing: bool = Field(
+        default=False,
+        description="Group-commit concurrent writes through a single writer task",
+    )
+    database_write_batch_size: int = Field(default=32, ge=1, description="Max writes per commit")
+    database_write_batch_window_ms: float = Field(
+        default=2.0, ge=0, description="Max time to wait for more writes before committing"
+    )
+
+    # Retention of soft-deleted rows
+    retention_enabled: bool = Field(
+        default=False,
+        description="Periodically archive and purge rows soft-deleted longer than retention_days",
+    )
+    retention_days: int = Field(
+        default=30, ge=1, description="Days a soft-deleted row is kept before it is purged"
+    )
+    retention_batch_size: int = Field(
+        default=200, ge=1, le=10_000, description="Rows archived and deleted per transaction"
+    )
+    retention_batch_pause_ms: float = Field(
+        default=50.0, ge=0, description="Pause between purge batches so other writers get a turn"
+    )
+    retention_interval_hours: float = Field(
+        default=24.0, gt=0, description="Time between background retention runs"
+    )
 
     # OpenAI / Marvin
     openai_api_key: str = Field(default="", description="OpenAI API key")
-    marvin_cache_enabled: bool = True
-    marvin_cache_ttl_seconds: int = 3600  # 1 hour
+    marvin_cache_enabled: bool = Field(
+        default=True, description="Answer identical completion requests from a cache"
+    )
+    marvin_cache_ttl_seconds: int = Field(
+        default=3600, ge=1, description="Seconds a cached completion stays valid"
+    )
+    marvin_cache_max_entries: int = Field(
+        default=1024, ge=1, description="Completions kept in each worker's in-memory LRU"
+    )
+    marvin_batch_enabled: bool = Field(
+        default=True, description="Complete concurrent ingredient drafts in one Marvin call"
+    )
+    marvin_batch_window_ms: float = Field(
+        default=50.0, ge=0, description="Max time a draft waits for others to share its call"
+    )
+    marvin_batch_max_size: int = Field(
+        default=10, ge=1, le=50, description="Max ingredient drafts per Marvin call"
+    )
+    ingredient_classifier_enabled: bool = Field(
+        default=True, description="Complete well-known ingredients locally instead of with Marvin"
+    )
+    ingredient_classifier_threshold: float = Field(
+        default=0.7, ge=0, le=1, description="Classifier confidence needed to skip Marvin"
+    )
+    ingredient_enrichment_background: bool = Field(
+        default=True,
+        description="Save new ingredients at once and fill in AI fields from a background queue",
+    )
+    ingredient_enrichment_workers: int = Field(
+        default=2, ge=1, description="Background enrichment workers per app worker"
+    )
+    ingredient_enrichment_max_attempts: int = Field(
+        default=5, ge=1, description="Tries per ingredient before enrichment gives up"
+    )
+    ingredient_enrichment_backoff_seconds: float = Field(
+        default=30.0, gt=0, description="Delay before the first retry; doubles per attempt"
+    )
+    marvin_warm_on_startup: bool = Field(
+        default=False,
+        description="Configure Marvin and connect to the provider at startup, not on first use",
+    )
     marvin_home_path: Path | None = Field(
         default=None,
         description="Optional override for Marvin home directory (for tests).",
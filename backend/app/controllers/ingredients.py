@@ -2,18 +2,42 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from litestar import Controller, Request, delete, get, patch, post
-from litestar.status_codes import HTTP_201_CREATED, HTTP_204_NO_CONTENT
+from litestar.background_tasks import BackgroundTask
+from litestar.response import Response, Stream
+from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED, HTTP_204_NO_CONTENT
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.enums import IngredientCategory
+from app.core.completion_cache import CompletionCache
+from app.core.enrichment import EnrichmentQueue
+from app.core.export import ingredients_ndjson
+from app.core.inflight import InflightCoalescer
+from app.core.ingredient_batcher import IngredientBatcher
+from app.core.ingredient_classifier import IngredientClassifier
+from app.core.ingredient_import import ai_enricher, import_ingredients
+from app.core.marvin_config import configure_marvin
+from app.core.streaming import UploadStream, ndjson_stream
+from app.dependencies import READ_ONLY_DEPENDENCIES, SuggestionServiceFactory
+from app.enums import ImportFormat, IngredientCategory, TotalMode
+from app.repositories import SuggestionRepository
+from app.repositories.pagination import has_next_page, next_cursor
 from app.schemas.core.ingredient import Ingredient
+from app.schemas.requests.export import ExportRequest
 from app.schemas.requests.ingredient import (
+    IngredientAutocompleteRequest,
     IngredientCreateRequest,
+    IngredientImportRequest,
     IngredientListRequest,
     IngredientPatch,
 )
 from app.schemas.requests.suggestion import IngredientSuggestionRequest
-from app.schemas.responses.ingredient import IngredientResponse
+from app.schemas.responses.ingredient import (
+    IngredientListResponse,
+    IngredientNameMatch,
+    IngredientResponse,
+)
 from app.services import IngredientService, SuggestionService
 
 
@@ -23,12 +47,12 @@ class IngredientController(Controller):
     path = "/api/v1/ingredients"
     tags = ["ingredients"]
 
-    @get("/")
+    @get("/", dependencies=READ_ONLY_DEPENDENCIES)
     async def list_ingredients(
         self,
         ingredient_service: IngredientService,
-        request: Request,
-    ) -> list[IngredientResponse]:
+        request: Request[Any, Any, Any],
+    ) -> IngredientListResponse:
         """List all ingredients with optional filters."""
         # Build filters from query parameters explicitly to ensure correct parsing
         qp = request.query_params
@@ -37,29 +61,88 @@ class IngredientController(Controller):
             storage_location=qp.get("storage_location") or None,
             expiring_before=qp.get("expiring_before") or None,  # Pydantic will parse date
             name_contains=qp.get("name_contains") or None,
-            page=int(qp.get("page")) if qp.get("page") is not None else 1,
-            page_size=int(qp.get("page_size")) if qp.get("page_size") is not None else 100,
+            page=qp.get("page") or 1,
+            page_size=qp.get("page_size") or 100,
+            cursor=qp.get("cursor") or None,
+            total=qp.get("total") or TotalMode.EXACT,
+        )
+        ingredients, total = await ingredient_service.list_ingredients(filters)
+        cursor = next_cursor(ingredients, filters.page_size)
+
+        return IngredientListResponse(
+            items=[IngredientResponse.model_validate(ing) for ing in ingredients],
+            total=total,
+            total_mode=filters.total,
+            page=filters.page,
+            page_size=filters.page_size,
+            has_next=has_next_page(
+                page=filters.page,
+                page_size=filters.page_size,
+                total=total,
+                exact=filters.total is TotalMode.EXACT and filters.cursor is None,
+                full_page=len(ingredients) == filters.page_size,
+            ),
+            next_cursor=cursor,
         )
-        ingredients = await ingredient_service.list_ingredients(filters)
-        return [IngredientResponse.model_validate(ing) for ing in ingredients]
+
+    @get("/autocomplete", dependencies=READ_ONLY_DEPENDENCIES)
+    async def autocomplete_ingredients(
+        self,
+        ingredient_service: IngredientService,
+        request: Request[Any, Any, Any],
+    ) -> list[IngredientNameMatch]:
+        """Suggest ingredient names for a prefix (typeahead; called on every keystroke)."""
+        qp = request.query_params
+        filters = IngredientAutocompleteRequest(
+            prefix=qp.get("prefix") or "",
+            limit=qp.get("limit") or 10,
+        )
+        matches = await ingredient_service.autocomplete(filters)
+        return [IngredientNameMatch(id=row_id, name=name) for row_id, name in matches]
 
     @post("/", status_code=HTTP_201_CREATED)
     async def create_ingredient(
         self,
         ingredient_service: IngredientService,
-        suggestion_service: SuggestionService,
+        suggestion_service_factory: SuggestionServiceFactory,
+        ingredient_classifier: IngredientClassifier | None,
+        enrichment_queue: EnrichmentQueue | None,
         data: IngredientCreateRequest,
-    ) -> IngredientResponse:
+    ) -> Response[IngredientResponse]:
         """Create a new ingredient or add quantity to existing one.
         
         Accepts a partially populated Ingredient (only name and quantity required).
-        Uses AI suggestion service to populate remaining fields (category, storage_location, etc.)
-        before saving to database.
+        Well-known ingredients are completed by the local classifier. Others are saved
+        right away and completed by the background enrichment queue, or, when that is
+        disabled, by the AI suggestion service before saving to database.
         """
         # Extract draft ingredient (should only have name and quantity)
         draft = data.ingredient
-        
-        # Use suggestion service to complete the ingredient with AI
+
+        # Try the local classifier first; it only answers when confident
+        completed_ingredient = (
+            ingredient_classifier.complete(draft) if ingredient_classifier is not None else None
+        )
+        if completed_ingredient is None and enrichment_queue is not None:
+            # Save as sent; workers are woken once the response (and its commit) is done
+            ingredient = await ingredient_service.create_ingredient(draft, enrich_later=True)
+            return Response(
+                IngredientResponse.model_validate(ingredient),
+                status_code=HTTP_201_CREATED,
+                background=BackgroundTask(enrichment_queue.notify),
+            )
+        if completed_ingredient is None:
+            completed_ingredient = await self._complete_with_ai(suggestion_service_factory(), draft)
+
+        # Save the completed ingredient to database
+        ingredient = await ingredient_service.create_ingredient(completed_ingredient)
+        return Response(IngredientResponse.model_validate(ingredient), status_code=HTTP_201_CREATED)
+
+    @staticmethod
+    async def _complete_with_ai(
+        suggestion_service: SuggestionService, draft: Ingredient
+    ) -> Ingredient:
+        """Complete a draft with the AI suggestion service, keeping the draft if it fails."""
         suggestion_request = IngredientSuggestionRequest(
             ingredient=draft,
             prompt=(
@@ -81,12 +164,68 @@ class IngredientController(Controller):
             # Ensure category is populated (required by database)
             if completed_ingredient.category is None:
                 completed_ingredient.category = IngredientCategory.OTHER
-        
-        # Save the completed ingredient to database
-        ingredient = await ingredient_service.create_ingredient(completed_ingredient)
-        return IngredientResponse.model_validate(ingredient)
+        return completed_ingredient
+
+    # No body size limit: the body is read in chunks as the import goes
+    @post("/import", status_code=HTTP_200_OK, request_max_body_size=None)
+    async def import_ingredients(
+        self,
+        request: Request[Any, Any, Any],
+        db_session: AsyncSession,
+        completion_cache: CompletionCache | None,
+        completion_coalescer: InflightCoalescer | None,
+        ingredient_batcher: IngredientBatcher | None,
+    ) -> UploadStream:
+        """Bulk-upsert ingredients from a CSV or JSONL body, streaming NDJSON progress.
+
+        Rows are validated against the Ingredient schema and upserted by name
+        in batches, one transaction each. AI enrichment runs only with
+        ``enrich=true``. The response is one JSON object per line: an
+        ``error`` for each skipped row, ``progress`` after each batch and a
+        final ``done``.
+        """
+        qp = request.query_params
+        options = IngredientImportRequest(
+            format=qp.get("format") or ImportFormat.CSV,
+            enrich=qp.get("enrich") or False,
+            batch_size=qp.get("batch_size") or 1000,
+        )
+        enrich = None
+        if options.enrich:
+            # Checked before streaming starts so a missing API key is still a 400
+            configure_marvin()
+            enrich = ai_enricher(
+                SuggestionService(
+                    SuggestionRepository(
+                        db_session, completion_cache, completion_coalescer, ingredient_batcher
+                    )
+                )
+            )
+        events = import_ingredients(
+            request.app.state.session_factory,
+            request.stream(),
+            fmt=options.format,
+            batch_size=options.batch_size,
+            enrich=enrich,
+        )
+        return UploadStream(
+            (event.model_dump_json() + "\n" async for event in events),
+            media_type="application/x-ndjson",
+        )
+
+    @get("/export")
+    async def export_ingredients(self, request: Request[Any, Any, Any]) -> Stream:
+        """Stream ingredients as NDJSON, one ingredient per line.
+
+        Every live ingredient by default; with ``since``, the ingredients
+        updated at or after it, soft-deleted ones included so a sync sees
+        deletions. The body is gzipped when the client accepts it.
+        """
+        options = ExportRequest(since=request.query_params.get("since") or None)
+        chunks = ingredients_ndjson(request.app.state.read_session_factory, since=options.since)
+        return ndjson_stream(request, chunks)
 
-    @get("/{ingredient_id:int}")
+    @get("/{ingredient_id:int}", dependencies=READ_ONLY_DEPENDENCIES)
     async def get_ingredient(
         self,
         ingredient_service: IngredientService,
@@ -2,15 +2,30 @@
 
 from __future__ import annotations
 
-from litestar import Controller, delete, get, patch, post
+from typing import Any
 
+from litestar import Controller, Request, delete, get, patch, post
+from litestar.response import Stream
+
+from app.core.export import recipes_ndjson
+from app.core.streaming import ndjson_stream
+from app.dependencies import READ_ONLY_DEPENDENCIES
+from app.enums import ListView, TotalMode
+from app.repositories.pagination import has_next_page, next_cursor
 from app.schemas import (
+    ExportRequest,
     Recipe,
+    RecipeBatchCreateRequest,
+    RecipeBatchCreateResponse,
+    RecipeBatchItemResult,
     RecipeCreateRequest,
     RecipeDetail,
     RecipeIngredientRead,
     RecipeListResponse,
     RecipeResponse,
+    RecipeSearchResult,
+    RecipeSummary,
+    RecipeSummarySearchResult,
     RecipeUpdateRequest,
 )
 from app.schemas.core.recipe import IngredientPreparation
@@ -24,23 +39,73 @@ class RecipeController(Controller):
     path = "/api/v1/recipes"
     tags = ["recipes"]
 
-    @get("/")
+    @get("/", dependencies=READ_ONLY_DEPENDENCIES)
     async def list_recipes(
         self,
         recipe_service: RecipeService,
-        filters: RecipeListRequest | None = None,
+        request: Request[Any, Any, Any],
     ) -> RecipeListResponse:
-        """List all recipes with optional filters."""
-        if filters is None:
-            filters = RecipeListRequest()
-        recipes, total = await recipe_service.list_recipes(filters)
+        """List recipes with optional filters, or full-text search them with ``q``."""
+        # Build filters from query parameters explicitly to ensure correct parsing
+        qp = request.query_params
+        filters = RecipeListRequest(
+            cuisine=qp.get("cuisine") or None,
+            max_prep_time_minutes=qp.get("max_prep_time_minutes") or None,
+            max_cook_time_minutes=qp.get("max_cook_time_minutes") or None,
+            name_contains=qp.get("name_contains") or None,
+            cooking_method=qp.get("cooking_method") or None,
+            author=qp.get("author") or None,
+            meal_types=qp.getall("meal_types", []),
+            dietary=qp.getall("dietary", []),
+            exclude_allergens=qp.getall("exclude_allergens", []),
+            # Accept both ids=1&ids=2 and ids=1,2
+            ids=[part for value in qp.getall("ids", []) for part in value.split(",") if part],
+            q=qp.get("q") or None,
+            page=qp.get("page") or 1,
+            page_size=qp.get("page_size") or 100,
+            cursor=qp.get("cursor") or None,
+            total=qp.get("total") or TotalMode.EXACT,
+            view=qp.get("view") or ListView.FULL,
+        )
+        summary = filters.view is ListView.SUMMARY
+        items: list[RecipeSearchResult | RecipeResponse | RecipeSummarySearchResult | RecipeSummary]
+        if filters.q:
+            matches, total = await recipe_service.search_recipes(filters)
+            result_schema = RecipeSummarySearchResult if summary else RecipeSearchResult
+            items = [
+                result_schema.model_validate(recipe).model_copy(
+                    update={"rank": rank, "snippet": snippet}
+                )
+                for recipe, rank, snippet in matches
+            ]
+            # Relevance order has no stable key to resume from, so no cursor;
+            # search counts are always exact, even when an estimate was asked for
+            cursor = None
+            exact = filters.total is not TotalMode.NONE
+            full_page = len(matches) == filters.page_size
+        else:
+            recipes, total = await recipe_service.list_recipes(filters)
+            row_schema = RecipeSummary if summary else RecipeResponse
+            items = [row_schema.model_validate(recipe) for recipe in recipes]
+            cursor = next_cursor(recipes, filters.page_size)
+            exact = filters.total is TotalMode.EXACT and filters.cursor is None
+            full_page = len(recipes) == filters.page_size
 
         return RecipeListResponse(
-            items=[RecipeResponse.model_validate(recipe) for recipe in recipes],
+            items=items,
+            view=filters.view,
             total=total,
+            total_mode=filters.total,
             page=filters.page,
             page_size=filters.page_size,
-            has_next=(filters.page * filters.page_size) < total,
+            has_next=has_next_page(
+                page=filters.page,
+                page_size=filters.page_size,
+                total=total,
+                exact=exact,
+                full_page=full_page,
+            ),
+            next_cursor=cursor,
         )
 
     @post("/")
@@ -51,31 +116,48 @@ class RecipeController(Controller):
     ) -> RecipeDetail:
         """Create a new recipe."""
         recipe = await recipe_service.create_recipe(data.recipe)
+        return recipe_service.build_detail(recipe)
 
-        # Build detailed response
-        ingredients = await recipe_service.get_recipe_ingredients(recipe.id)
-
-        response = RecipeDetail.model_validate(recipe)
-        response.ingredients = ingredients
-        response.missing_ingredients = []
-
-        return response
-
-    @get("/{recipe_id:int}")
+    @post("/batch")
+    async def create_recipes_batch(
+        self,
+        recipe_service: RecipeService,
+        data: RecipeBatchCreateRequest,
+    ) -> RecipeBatchCreateResponse:
+        """Create several recipes in one transaction, reporting each one's outcome.
+
+        Invalid recipes are reported and skipped; the rest are still created.
+        """
+        results = await recipe_service.create_recipes(data.recipes)
+        items = [
+            RecipeBatchItemResult(index=index, error=result)
+            if isinstance(result, str)
+            else RecipeBatchItemResult(index=index, recipe=recipe_service.build_detail(result))
+            for index, result in enumerate(results)
+        ]
+        failed = sum(item.error is not None for item in items)
+        return RecipeBatchCreateResponse(items=items, created=len(items) - failed, failed=failed)
+
+    @get("/export")
+    async def export_recipes(self, request: Request[Any, Any, Any]) -> Stream:
+        """Stream recipes with their ingredients as NDJSON, one recipe detail per line.
+
+        Every live recipe by default; with ``since``, the recipes updated at
+        or after it, soft-deleted ones included so a sync sees deletions.
+        The body is gzipped when the client accepts it.
+        """
+        options = ExportRequest(since=request.query_params.get("since") or None)
+        chunks = recipes_ndjson(request.app.state.read_session_factory, since=options.since)
+        return ndjson_stream(request, chunks)
+
+    @get("/{recipe_id:int}", dependencies=READ_ONLY_DEPENDENCIES)
     async def get_recipe(
         self,
         recipe_service: RecipeService,
         recipe_id: int,
     ) -> RecipeDetail:
         """Get a specific recipe by ID with ingredients."""
-        recipe = await recipe_service.get_recipe(recipe_id, load_ingredients=True)
-        ingredients = await recipe_service.get_recipe_ingredients(recipe_id)
-
-        response = RecipeDetail.model_validate(recipe)
-        response.ingredients = ingredients
-        response.missing_ingredients = []
-
-        return response
+        return await recipe_service.get_recipe_detail(recipe_id)
 
     @patch("/{recipe_id:int}")
     async def update_recipe(
@@ -86,13 +168,7 @@ class RecipeController(Controller):
     ) -> RecipeDetail:
         """Partially update a recipe."""
         recipe = await recipe_service.update_recipe(recipe_id, data.recipe)
-        ingredients = await recipe_service.get_recipe_ingredients(recipe_id)
-
-        response = RecipeDetail.model_validate(recipe)
-        response.ingredients = ingredients
-        response.missing_ingredients = []
-
-        return response
+        return recipe_service.build_detail(recipe)
 
     @delete("/{recipe_id:int}", status_code=200)
     async def delete_recipe(
@@ -104,7 +180,7 @@ class RecipeController(Controller):
         await recipe_service.delete_recipe(recipe_id)
         return {"message": "Recipe deleted successfully"}
 
-    @get("/{recipe_id:int}/ingredients")
+    @get("/{recipe_id:int}/ingredients", dependencies=READ_ONLY_DEPENDENCIES)
     async def get_recipe_ingredients(
         self,
         recipe_service: RecipeService,
@@ -123,5 +199,5 @@ class RecipeController(Controller):
         """Add or update ingredients for a recipe."""
         # Use update with just ingredients
         update_data = Recipe(ingredients=data)
-        await recipe_service.update_recipe(recipe_id, update_data)
-        return await recipe_service.get_recipe_ingredients(recipe_id)
+        recipe = await recipe_service.update_recipe(recipe_id, update_data)
+        return recipe_service.build_detail(recipe).ingredients
@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
-from litestar import Controller, post
+from typing import Any
 
+from litestar import Controller, Request, get, post
+from litestar.response import ServerSentEvent, ServerSentEventMessage
+
+from app.core.completion_cache import CacheStats
+from app.core.enrichment import EnrichmentStats
+from app.core.inflight import InflightStats
+from app.core.ingredient_batcher import BatchStats
 from app.schemas import (
     IngredientSuggestionRequest,
     IngredientSuggestionResponse,
@@ -29,6 +36,24 @@ class SuggestionController(Controller):
         recipes = await suggestion_service.complete_recipe(data)
         return SuggestionResponse(recipes=recipes)
 
+    @post("/recipes/stream")
+    async def stream_recipe_suggestions(
+        self,
+        suggestion_service: SuggestionService,
+        data: SuggestionRequest,
+    ) -> ServerSentEvent:
+        """Stream recipe suggestions as Server-Sent Events, each as soon as it is ready.
+
+        The variations are completed concurrently. Each arrives as a
+        ``recipe`` event (or ``error`` if it failed), in the order they
+        finish, followed by one ``done`` event with the counts and timings.
+        """
+        events = suggestion_service.stream_recipe_completions(data)
+        return ServerSentEvent(
+            ServerSentEventMessage(event=event.event, data=event.model_dump_json())
+            async for event in events
+        )
+
     @post("/ingredient")
     async def get_ingredient_suggestions(
         self,
@@ -38,3 +63,27 @@ class SuggestionController(Controller):
         """Get ingredient suggestions based on prompt."""
         ingredients = await suggestion_service.complete_ingredient(data)
         return IngredientSuggestionResponse(ingredients=ingredients)
+
+    @get("/cache")
+    async def get_cache_stats(self, request: Request[Any, Any, Any]) -> CacheStats:
+        """Hit and miss counts of this worker's completion cache."""
+        cache = request.app.state.get("completion_cache")
+        return cache.stats() if cache is not None else CacheStats(enabled=False)
+
+    @get("/inflight")
+    async def get_inflight_stats(self, request: Request[Any, Any, Any]) -> InflightStats:
+        """Completions started and coalesced into a running one by this worker."""
+        stats: InflightStats = request.app.state.completion_coalescer.stats()
+        return stats
+
+    @get("/batching")
+    async def get_batching_stats(self, request: Request[Any, Any, Any]) -> BatchStats:
+        """Ingredient drafts this worker completed per batched Marvin call."""
+        batcher = request.app.state.get("ingredient_batcher")
+        return batcher.stats() if batcher is not None else BatchStats(enabled=False)
+
+    @get("/enrichment")
+    async def get_enrichment_stats(self, request: Request[Any, Any, Any]) -> EnrichmentStats:
+        """Depth of the ingredient enrichment queue and this worker's outcomes."""
+        queue = request.app.state.get("enrichment_queue")
+        return await queue.stats() if queue is not None else EnrichmentStats(enabled=False)
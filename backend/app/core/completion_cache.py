@@ -0,0 +1,119 @@
+"""Two-tier cache of Marvin completions.
+
+Completions are stored under their
+:func:`~app.core.completion_key.completion_key`. An in-process LRU answers
+repeats within a worker; the ``completion_cache`` table shares entries
+across workers and restarts. Both tiers honour the TTL.
+
+The cache never fails a completion: a database error counts as a miss and
+a result that cannot be stored is simply not cached.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from datetime import datetime, timedelta
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, computed_field
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.logging import get_logger
+from app.repositories.completion_cache_repository import CompletionCacheRepository
+
+logger = get_logger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Request header that skips the cache for one request
+BYPASS_HEADER = "X-Completion-Cache"
+BYPASS_VALUE = "bypass"
+
+
+class CacheStats(BaseModel):
+    """Hit and miss counts of the completion cache since the worker started."""
+
+    enabled: bool = True
+    memory_hits: int = 0
+    persistent_hits: int = 0
+    misses: int = 0
+    memory_entries: int = 0
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups answered by either tier."""
+        lookups = self.memory_hits + self.persistent_hits + self.misses
+        return round((self.memory_hits + self.persistent_hits) / lookups, 4) if lookups else 0.0
+
+
+class CompletionCache:
+    """In-memory LRU in front of the ``completion_cache`` table."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        ttl_seconds: int,
+        max_entries: int = 1024,
+        clock: Callable[[], datetime] = datetime.utcnow,
+    ) -> None:
+        """Initialize the cache; ``clock`` returns naive UTC like the stored timestamps."""
+        self.session_factory = session_factory
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.max_entries = max_entries
+        self.clock = clock
+        self._memory: OrderedDict[str, tuple[datetime, list[dict[str, Any]]]] = OrderedDict()
+        self._stats = CacheStats()
+
+    def stats(self) -> CacheStats:
+        """Current hit and miss counts."""
+        return self._stats.model_copy(update={"memory_entries": len(self._memory)})
+
+    async def get(self, key: str, target: type[ModelT]) -> list[ModelT] | None:
+        """Return fresh copies of the completions cached under ``key``, or None."""
+        now = self.clock()
+        entry = self._memory.get(key)
+        if entry is not None and entry[0] > now:
+            self._memory.move_to_end(key)
+            self._stats.memory_hits += 1
+            return [target.model_validate(item) for item in entry[1]]
+        self._memory.pop(key, None)
+
+        try:
+            async with self.session_factory() as session:
+                stored = await CompletionCacheRepository(session).get(key, now=now)
+        except SQLAlchemyError:
+            logger.warning("completion_cache_read_failed", exc_info=True)
+            stored = None
+        if stored is None:
+            self._stats.misses += 1
+            return None
+        self._remember(key, stored.expires_at, stored.data)
+        self._stats.persistent_hits += 1
+        return [target.model_validate(item) for item in stored.data]
+
+    async def put(self, key: str, target: type[BaseModel], items: Sequence[BaseModel]) -> None:
+        """Cache ``items`` under ``key`` in both tiers for the TTL."""
+        now = self.clock()
+        expires_at = now + self.ttl
+        data = [item.model_dump(mode="json") for item in items]
+        self._remember(key, expires_at, data)
+        try:
+            async with self.session_factory() as session:
+                repository = CompletionCacheRepository(session)
+                await repository.delete_expired(now)
+                await repository.put(
+                    key, target=target.__name__, data=data, now=now, expires_at=expires_at
+                )
+                await session.commit()
+        except SQLAlchemyError:
+            logger.warning("completion_cache_write_failed", exc_info=True)
+
+    def _remember(self, key: str, expires_at: datetime, data: list[dict[str, Any]]) -> None:
+        self._memory[key] = (expires_at, data)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
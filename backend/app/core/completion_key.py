@@ -0,0 +1,53 @@
+"""Canonical keys of Marvin completion requests.
+
+Two requests with the same key get the same answer from the model, so the
+completion cache and the in-flight coalescer both use it. A key hashes what
+decides a completion: the target schema, the prompt, the draft and the
+number of completions. Drafts are normalised first (whitespace collapsed,
+case folded, empty fields dropped) so that "Milk" and " milk" share a key.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterable
+from typing import Any
+
+from pydantic import BaseModel
+
+
+def _normalise(value: Any) -> Any:
+    if isinstance(value, str):
+        return " ".join(value.split()).casefold()
+    if isinstance(value, dict):
+        items = ((key, _normalise(item)) for key, item in value.items())
+        return {key: item for key, item in items if item not in (None, "", [], {})}
+    if isinstance(value, list):
+        return [_normalise(item) for item in value]
+    return value
+
+
+def completion_key(
+    target: type[BaseModel],
+    prompt: str,
+    draft: BaseModel,
+    n_completions: int,
+    *,
+    exclude: Iterable[str] = (),
+    variant: int = 0,
+) -> str:
+    """Canonical hash of a completion request.
+
+    ``exclude`` names draft fields left out. ``variant`` tells apart
+    requests that ask for different variations of the same draft.
+    """
+    payload = {
+        "target": target.__name__,
+        "prompt": " ".join(prompt.split()),
+        "draft": _normalise(draft.model_dump(mode="json", exclude=set(exclude))),
+        "n": n_completions,
+        "variant": variant,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
@@ -0,0 +1,260 @@
+"""Background enrichment of ingredients saved without their AI-filled fields.
+
+``POST /api/v1/ingredients`` saves an ingredient the classifier does not
+know right away, marked ``enrichment_pending``, and queues an
+``enrichment_jobs`` row in the same transaction. A small pool of asyncio
+workers started with the app completes each queued draft with Marvin and
+patches the fields that are still empty (or still the ``other``
+placeholder category), so the write never waits for the model.
+
+Jobs are leased by moving their ``run_after`` forward; a job whose worker
+died is retried when the lease runs out, including after a restart. A
+failed completion is retried with exponential backoff until
+``max_attempts``, after which the ingredient keeps what the client sent.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from datetime import datetime, timedelta
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.completion_cache import CompletionCache
+from app.core.inflight import InflightCoalescer
+from app.core.ingredient_batcher import IngredientBatcher
+from app.core.ingredient_import import ENRICHMENT_PROMPT
+from app.enums import IngredientCategory
+from app.logging import get_logger
+from app.models import EnrichmentJob
+from app.repositories import EnrichmentJobRepository, IngredientRepository, SuggestionRepository
+from app.schemas.core.ingredient import Ingredient
+from app.schemas.requests.suggestion import IngredientSuggestionRequest
+from app.services import SuggestionService
+
+logger = get_logger(__name__)
+
+Completer = Callable[[Ingredient], Awaitable[list[Ingredient]]]
+
+# Longer than any model call; a job held past it is handed to another worker
+LEASE_SECONDS = 300
+# Upper bound of the retry delay
+MAX_BACKOFF_SECONDS = 3600
+# Fields a completion may fill in
+ENRICHED_FIELDS = ("category", "storage_location", "expiry_date", "notes")
+
+
+class EnrichmentStats(BaseModel):
+    """Queue depth and outcomes of background ingredient enrichment."""
+
+    enabled: bool = True
+    workers: int = 0
+    queued: int = 0
+    due: int = 0
+    attempted: int = 0
+    oldest_queued_seconds: float | None = None
+    in_progress: int = 0
+    enriched: int = 0
+    retried: int = 0
+    failed: int = 0
+
+
+def marvin_completer(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    cache: CompletionCache | None = None,
+    coalescer: InflightCoalescer | None = None,
+    batcher: IngredientBatcher | None = None,
+) -> Completer:
+    """Completer that asks Marvin through the suggestion service, like a manual create."""
+
+    async def complete(draft: Ingredient) -> list[Ingredient]:
+        async with session_factory() as session:
+            service = SuggestionService(SuggestionRepository(session, cache, coalescer, batcher))
+            return await service.complete_ingredient(
+                IngredientSuggestionRequest(
+                    ingredient=draft, prompt=ENRICHMENT_PROMPT, n_completions=1
+                )
+            )
+
+    return complete
+
+
+class EnrichmentQueue:
+    """Pool of asyncio workers draining the ``enrichment_jobs`` table."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        complete: Completer,
+        *,
+        workers: int = 2,
+        jobs_per_worker: int = 1,
+        max_attempts: int = 5,
+        backoff_seconds: float = 30.0,
+        poll_interval_seconds: float = 60.0,
+        clock: Callable[[], datetime] = datetime.utcnow,
+    ) -> None:
+        """Initialize the queue; call :meth:`start` from the application lifespan.
+
+        Each worker processes up to ``jobs_per_worker`` jobs at a time, so
+        their completions can share a batched Marvin call.
+        """
+        self.session_factory = session_factory
+        self.complete = complete
+        self.workers = workers
+        self.jobs_per_worker = jobs_per_worker
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.poll_interval = poll_interval_seconds
+        self.clock = clock
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._tasks: list[asyncio.Task[None]] = []
+        self._stats = EnrichmentStats(workers=workers)
+
+    async def start(self) -> None:
+        """Start the workers; jobs left over from the last run are picked up at the first poll."""
+        if not self._tasks:
+            self._stopping = False
+            self._tasks = [
+                asyncio.create_task(self._work(), name=f"menoo-enrichment-{number}")
+                for number in range(self.workers)
+            ]
+
+    async def stop(self) -> None:
+        """Stop the workers; a job in flight is retried once its lease runs out."""
+        # The flag ends a worker even if its cancellation lands mid-query and is lost
+        self._stopping = True
+        self._wakeup.set()
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+
+    async def notify(self) -> None:
+        """Wake idle workers after a job was committed (a coroutine, to run on the loop)."""
+        self._wakeup.set()
+
+    async def stats(self) -> EnrichmentStats:
+        """Current queue depth (from the table) and this worker's counts."""
+        now = self.clock()
+        async with self.session_factory() as session:
+            depth = await EnrichmentJobRepository(session).depth(now=now)
+        oldest = depth.pop("oldest")
+        return self._stats.model_copy(
+            update={
+                **depth,
+                "oldest_queued_seconds": (
+                    round((now - oldest).total_seconds(), 3) if oldest is not None else None
+                ),
+            }
+        )
+
+    async def run_once(self) -> bool:
+        """Claim and process one due job; False when none was due."""
+        now = self.clock()
+        async with self.session_factory() as session:
+            job = await EnrichmentJobRepository(session).claim(
+                now=now, lease_until=now + timedelta(seconds=LEASE_SECONDS)
+            )
+            await session.commit()
+        if job is None:
+            return False
+        self._stats.in_progress += 1
+        try:
+            await self._process(job)
+        finally:
+            self._stats.in_progress -= 1
+        return True
+
+    async def _work(self) -> None:
+        timeout = self.poll_interval
+        while True:
+            # Sleep until notified, the next job is due or the poll interval passes
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            if self._stopping:
+                return
+            self._wakeup.clear()
+            try:
+                while not self._stopping and any(
+                    await asyncio.gather(*(self.run_once() for _ in range(self.jobs_per_worker)))
+                ):
+                    pass
+                timeout = await self._until_next_job()
+            except Exception:
+                logger.exception("enrichment_worker_failed")
+                timeout = min(self.backoff_seconds, self.poll_interval)
+
+    async def _until_next_job(self) -> float:
+        """Seconds until the next queued job is due, at most the poll interval."""
+        async with self.session_factory() as session:
+            next_run = await EnrichmentJobRepository(session).next_run_after()
+        if next_run is None:
+            return self.poll_interval
+        return min(self.poll_interval, max((next_run - self.clock()).total_seconds(), 0.0))
+
+    async def _process(self, job: EnrichmentJob) -> None:
+        draft = Ingredient.model_validate(job.draft)
+        try:
+            completed = await self.complete(draft)
+            if not completed:
+                raise ValueError("Marvin returned no completion")
+        except Exception as exc:
+            await self._failed(job, exc)
+            return
+
+        async with self.session_factory() as session:
+            ingredient = await IngredientRepository(session).get_by_id(job.ingredient_id)
+            if ingredient is not None:
+                for field in ENRICHED_FIELDS:
+                    value = getattr(completed[0], field)
+                    current = getattr(ingredient, field)
+                    # Keep what the client sent or edited since
+                    placeholder = current is None or (
+                        field == "category" and current == IngredientCategory.OTHER
+                    )
+                    if value is not None and field not in job.draft and placeholder:
+                        setattr(ingredient, field, value)
+                ingredient.enrichment_pending = False
+            await EnrichmentJobRepository(session).delete(job.id)
+            await session.commit()
+        self._stats.enriched += 1
+        logger.debug("ingredient_enriched", ingredient_id=job.ingredient_id)
+
+    async def _failed(self, job: EnrichmentJob, exc: Exception) -> None:
+        error = str(exc)[:500] or type(exc).__name__
+        async with self.session_factory() as session:
+            jobs = EnrichmentJobRepository(session)
+            if job.attempts >= self.max_attempts:
+                ingredient = await IngredientRepository(session).get_by_id(job.ingredient_id)
+                if ingredient is not None:
+                    ingredient.enrichment_pending = False
+                await jobs.delete(job.id)
+                self._stats.failed += 1
+                logger.warning(
+                    "ingredient_enrichment_abandoned",
+                    ingredient_id=job.ingredient_id,
+                    attempts=job.attempts,
+                    error=error,
+                )
+            else:
+                delay = min(self.backoff_seconds * 2 ** (job.attempts - 1), MAX_BACKOFF_SECONDS)
+                await jobs.reschedule(
+                    job.id, run_after=self.clock() + timedelta(seconds=delay), error=error
+                )
+                self._stats.retried += 1
+                logger.info(
+                    "ingredient_enrichment_retry",
+                    ingredient_id=job.ingredient_id,
+                    attempts=job.attempts,
+                    delay_seconds=delay,
+                    error=error,
+                )
+            await session.commit()
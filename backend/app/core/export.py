@@ -0,0 +1,62 @@
+"""Streaming NDJSON export of recipes and ingredients.
+
+Rows are read from a server-side cursor a chunk at a time and serialized as
+they arrive, so an export holds one chunk of rows and one output buffer in
+memory whatever the size of the table. The whole export runs in one read
+transaction and is therefore a consistent snapshot.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterable, AsyncIterator
+from datetime import datetime
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.logging import get_logger
+from app.repositories import IngredientRepository, RecipeRepository
+from app.schemas.responses.ingredient import IngredientResponse
+from app.services import RecipeService
+
+logger = get_logger(__name__)
+
+# Bytes of NDJSON gathered before a chunk is sent
+FLUSH_BYTES = 64 * 1024
+
+
+async def _ndjson(rows: AsyncIterable[BaseModel], kind: str) -> AsyncIterator[bytes]:
+    """Encode rows one JSON object per line, sent in chunks of about FLUSH_BYTES."""
+    buffer = bytearray()
+    count = 0
+    async for row in rows:
+        buffer += row.model_dump_json().encode() + b"\n"
+        count += 1
+        if len(buffer) >= FLUSH_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+    logger.info("export_finished", kind=kind, rows=count)
+
+
+async def recipes_ndjson(
+    session_factory: async_sessionmaker[AsyncSession], *, since: datetime | None = None
+) -> AsyncIterator[bytes]:
+    """Stream recipes as NDJSON, each line a recipe detail with its ingredients."""
+    async with session_factory() as session:
+        recipes = RecipeRepository(session).stream(since=since)
+        rows = (RecipeService.build_detail(recipe) async for recipe in recipes)
+        async for chunk in _ndjson(rows, "recipes"):
+            yield chunk
+
+
+async def ingredients_ndjson(
+    session_factory: async_sessionmaker[AsyncSession], *, since: datetime | None = None
+) -> AsyncIterator[bytes]:
+    """Stream ingredients as NDJSON, one ingredient response per line."""
+    async with session_factory() as session:
+        ingredients = IngredientRepository(session).stream(since=since)
+        rows = (IngredientResponse.model_validate(item) async for item in ingredients)
+        async for chunk in _ndjson(rows, "ingredients"):
+            yield chunk
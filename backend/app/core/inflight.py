@@ -0,0 +1,69 @@
+"""Coalescing of identical in-flight Marvin completions.
+
+A double-click, or several clients adding the same ingredient, would each
+start their own model call for the same draft. The coalescer runs one call
+per completion key at a time: the first request starts it as a task, and
+every request that arrives with the same key while it runs awaits that task.
+
+The task is shielded from its waiters, so a waiter that is cancelled (a
+client that went away) leaves the others, and the call, running. An error
+reaches every waiter of that call and is not remembered: the next request
+starts a new call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from app.logging import get_logger
+
+logger = get_logger(__name__)
+
+ResultT = TypeVar("ResultT")
+
+
+class InflightStats(BaseModel):
+    """How many completions were started and how many joined one already running."""
+
+    started: int = 0
+    coalesced: int = 0
+    in_flight: int = 0
+
+
+class InflightCoalescer:
+    """Run at most one completion per key at a time and share its result."""
+
+    def __init__(self) -> None:
+        """Initialize an empty coalescer."""
+        self._tasks: dict[str, asyncio.Task[Any]] = {}
+        self._stats = InflightStats()
+
+    def stats(self) -> InflightStats:
+        """Current counts."""
+        return self._stats.model_copy(update={"in_flight": len(self._tasks)})
+
+    async def run(self, key: str, call: Callable[[], Awaitable[ResultT]]) -> ResultT:
+        """Await the running call for ``key``, or start ``call`` as that call.
+
+        Every waiter receives the same result object.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+            self._stats.started += 1
+        else:
+            self._stats.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finished(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # Retrieve the error even when every waiter has gone, so it is logged once
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("completion_failed", key=key[:12], error=str(task.exception()))
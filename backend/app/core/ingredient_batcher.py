@@ -0,0 +1,138 @@
+"""Micro-batching of ingredient completions into one Marvin call.
+
+Adding groceries one after another, importing a file or draining the
+enrichment queue asks Marvin to complete many single drafts, each paying a
+round trip and its own copy of the instructions and the output schema. The
+batcher holds a draft for at most ``window_ms``, or until
+``max_batch_size`` drafts with the same prompt are waiting, and completes
+the group with one call whose target is a list of ingredients. Each caller
+gets back the completion for its own draft.
+
+Errors are isolated per draft: when the batch call fails, or its answer has
+no completion for a draft, that draft is completed again on its own, so a
+draft the model chokes on only fails its own caller.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+
+from pydantic import BaseModel, computed_field
+
+from app.logging import get_logger
+from app.schemas.core.ingredient import Ingredient
+
+logger = get_logger(__name__)
+
+# Completes the drafts with one model call; a list of one is a plain single call
+BatchCall = Callable[[str, list[Ingredient]], Awaitable[list[Ingredient]]]
+Waiter = tuple[Ingredient, asyncio.Future[Ingredient | None]]
+
+
+class BatchStats(BaseModel):
+    """How many drafts were completed in how many model calls."""
+
+    enabled: bool = True
+    batches: int = 0
+    drafts: int = 0
+    largest_batch: int = 0
+    completed_alone: int = 0
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def mean_batch_size(self) -> float:
+        """Drafts per batched call."""
+        return round(self.drafts / self.batches, 2) if self.batches else 0.0
+
+
+class IngredientBatcher:
+    """Group concurrent ingredient drafts with the same prompt into one completion call."""
+
+    def __init__(self, *, window_ms: float = 50.0, max_batch_size: int = 10) -> None:
+        """Initialize an empty batcher."""
+        self.window = window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self._pending: dict[str, list[Waiter]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._stats = BatchStats()
+
+    def stats(self) -> BatchStats:
+        """Current counts."""
+        return self._stats.model_copy()
+
+    async def run(self, prompt: str, draft: Ingredient, call: BatchCall) -> Ingredient | None:
+        """Complete ``draft`` with the next batch for ``prompt``; None if Marvin had no answer."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Ingredient | None] = loop.create_future()
+        waiters = self._pending.setdefault(prompt, [])
+        waiters.append((draft, future))
+        if len(waiters) >= self.max_batch_size:
+            self._flush(prompt, call)
+        elif len(waiters) == 1:
+            self._timers[prompt] = loop.call_later(self.window, self._flush, prompt, call)
+        return await future
+
+    def _flush(self, prompt: str, call: BatchCall) -> None:
+        timer = self._timers.pop(prompt, None)
+        if timer is not None:
+            timer.cancel()
+        # Drafts whose caller went away are not sent
+        waiters = [waiter for waiter in self._pending.pop(prompt, []) if not waiter[1].done()]
+        if waiters:
+            task = asyncio.ensure_future(self._complete(prompt, waiters, call))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _complete(self, prompt: str, waiters: list[Waiter], call: BatchCall) -> None:
+        if len(waiters) == 1:
+            await self._complete_alone(prompt, waiters[0], call)
+            return
+
+        drafts = [draft for draft, _ in waiters]
+        self._stats.batches += 1
+        self._stats.drafts += len(drafts)
+        self._stats.largest_batch = max(self._stats.largest_batch, len(drafts))
+        try:
+            completions = await call(prompt, drafts)
+        except Exception as exc:
+            logger.warning("ingredient_batch_failed", size=len(drafts), error=str(exc))
+            completions = []
+
+        alone = []
+        for waiter, completion in zip(waiters, _match(drafts, completions), strict=True):
+            if completion is None:
+                alone.append(waiter)
+            elif not waiter[1].done():
+                waiter[1].set_result(completion)
+        self._stats.completed_alone += len(alone)
+        await asyncio.gather(*(self._complete_alone(prompt, waiter, call) for waiter in alone))
+
+    @staticmethod
+    async def _complete_alone(prompt: str, waiter: Waiter, call: BatchCall) -> None:
+        draft, future = waiter
+        try:
+            completions = await call(prompt, [draft])
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+            return
+        if not future.done():
+            future.set_result(completions[0] if completions else None)
+
+
+def _match(drafts: list[Ingredient], completions: list[Ingredient]) -> list[Ingredient | None]:
+    """Pair each draft with the completion of the same name, in order; None when missing."""
+    by_name: defaultdict[str, list[Ingredient]] = defaultdict(list)
+    for completion in completions:
+        by_name[_normalize(completion.name)].append(completion)
+    return [
+        by_name[name].pop(0) if by_name[name] else None
+        for name in map(_normalize, (draft.name for draft in drafts))
+    ]
+
+
+def _normalize(name: str) -> str:
+    return " ".join(name.casefold().split())
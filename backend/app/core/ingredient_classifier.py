@@ -0,0 +1,412 @@
+"""Rule-based ingredient classifier.
+
+Most pantry adds are everyday groceries whose category, storage location and
+shelf life are well known. The classifier answers those from a curated
+lexicon in microseconds, so ``POST /api/v1/ingredients`` only asks the model
+about names it does not recognise.
+
+A name is lower-cased, split into words and each word reduced to a crude
+singular stem ("tomatoes" -> "tomato", "berries" -> "berry"). The lexicon
+entry ending rightmost wins, longest first, since English puts the head noun
+last ("chicken stock" is a stock, "peanut butter" is not butter). Synonyms
+are aliases of an entry ("aubergine" is "eggplant"). Modifier words are
+understood without naming a food; some change where it is kept and for how
+long ("frozen", "dried", "canned"). A few, like "greens", name the food when
+they end the name, so "mustard greens" is not mustard.
+
+Confidence is the share of words the lexicon explains, lifted when the match
+is the head noun and halved when it is not. Below the threshold the caller
+falls back to the model.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import date, timedelta
+
+from pydantic import BaseModel, Field
+
+from app.enums import IngredientCategory
+from app.schemas.core.ingredient import Ingredient
+
+FRIDGE = "fridge"
+FREEZER = "freezer"
+PANTRY = "pantry"
+
+# Shelf life kept by anything stored in the freezer, whatever it is
+FREEZER_SHELF_LIFE_DAYS = 180
+
+C = IngredientCategory
+
+# Where a category is kept and for how many days, unless the entry says otherwise
+CATEGORY_STORAGE: dict[IngredientCategory, tuple[str, int]] = {
+    C.PROTEIN: (FRIDGE, 3),
+    C.VEGETABLE: (FRIDGE, 7),
+    C.FRUIT: (FRIDGE, 7),
+    C.GRAIN: (PANTRY, 365),
+    C.DAIRY: (FRIDGE, 7),
+    C.SPICE: (PANTRY, 730),
+    C.HERB: (FRIDGE, 7),
+    C.SAUCE: (PANTRY, 365),
+    C.CONDIMENT: (FRIDGE, 180),
+    C.FLAVOR_ENHANCER: (PANTRY, 730),
+    C.OIL_FAT: (PANTRY, 365),
+    C.SWEETENER: (PANTRY, 730),
+    C.LIQUID: (PANTRY, 365),
+    C.OTHER: (PANTRY, 365),
+}
+
+# Comma-separated entries per category
+LEXICON: dict[IngredientCategory, str] = {
+    C.PROTEIN: (
+        "chicken, beef, ground beef, pork, lamb, mutton, veal, turkey, duck, goose, venison, "
+        "rabbit, bacon, ham, sausage, chorizo, salami, pepperoni, prosciutto, pancetta, steak, "
+        "meatball, fish, salmon, tuna, cod, haddock, trout, mackerel, sardine, anchovy, tilapia, "
+        "halibut, sea bass, shrimp, crab, lobster, mussel, clam, oyster, scallop, squid, octopus, "
+        "egg, tofu, tempeh, seitan, lentil, chickpea, black bean, kidney bean, pinto bean, "
+        "cannellini bean, edamame"
+    ),
+    C.VEGETABLE: (
+        "tomato, cherry tomato, potato, sweet potato, onion, red onion, spring onion, shallot, "
+        "garlic, leek, carrot, celery, bell pepper, pepper, chili, jalapeno, cucumber, zucchini, "
+        "eggplant, squash, pumpkin, broccoli, cauliflower, cabbage, kale, spinach, lettuce, "
+        "arugula, chard, bok choy, brussels sprout, asparagus, green bean, pea, snow pea, corn, "
+        "mushroom, beet, radish, turnip, parsnip, rutabaga, artichoke, fennel, okra, ginger, "
+        "avocado, bean sprout, watercress, olive, mustard green"
+    ),
+    C.FRUIT: (
+        "apple, pear, banana, orange, lemon, lime, grapefruit, mandarin, clementine, grape, "
+        "strawberry, raspberry, blueberry, blackberry, cranberry, cherry, peach, nectarine, plum, "
+        "apricot, mango, pineapple, papaya, kiwi, melon, watermelon, pomegranate, fig, date, "
+        "raisin, prune, coconut, passion fruit, rhubarb"
+    ),
+    C.GRAIN: (
+        "rice, brown rice, basmati, jasmine rice, arborio, pasta, spaghetti, penne, fusilli, "
+        "macaroni, linguine, tagliatelle, lasagne, noodle, couscous, quinoa, bulgur, barley, oat, "
+        "oatmeal, flour, bread, baguette, tortilla, pita, cracker, cereal, polenta, cornmeal, "
+        "semolina, rye, millet, buckwheat, breadcrumb, cornstarch"
+    ),
+    C.DAIRY: (
+        "milk, cream, heavy cream, sour cream, butter, cheese, cheddar, mozzarella, parmesan, "
+        "feta, ricotta, mascarpone, gouda, brie, halloumi, cream cheese, cottage cheese, yogurt, "
+        "greek yogurt, kefir, buttermilk, creme fraiche, ghee, ice cream"
+    ),
+    C.SPICE: (
+        "salt, black pepper, peppercorn, cumin, paprika, turmeric, cinnamon, nutmeg, clove, "
+        "cardamom, coriander seed, chili powder, chili flake, cayenne, garlic powder, onion "
+        "powder, curry powder, garam masala, allspice, star anise, saffron, mustard seed, fennel "
+        "seed, vanilla, bay leaf"
+    ),
+    C.HERB: (
+        "basil, parsley, cilantro, mint, dill, thyme, rosemary, sage, oregano, tarragon, chive, "
+        "lemongrass, marjoram"
+    ),
+    C.SAUCE: (
+        "sauce, soy sauce, fish sauce, tomato sauce, pasta sauce, passata, tomato paste, pesto, "
+        "salsa, gravy, curry paste, tahini, hummus"
+    ),
+    C.CONDIMENT: (
+        "ketchup, mustard, mayonnaise, relish, pickle, vinegar, balsamic, peanut butter, jam, "
+        "chutney, horseradish, caper, sriracha"
+    ),
+    C.FLAVOR_ENHANCER: ("bouillon, msg, yeast extract, nutritional yeast, miso, dashi"),
+    C.OIL_FAT: (
+        "oil, olive oil, vegetable oil, sunflower oil, canola oil, sesame oil, coconut oil, lard, "
+        "margarine, shortening, dripping"
+    ),
+    C.SWEETENER: (
+        "sugar, brown sugar, powdered sugar, honey, maple syrup, syrup, molasses, agave, stevia, "
+        "chocolate, cocoa"
+    ),
+    C.LIQUID: (
+        "water, stock, broth, wine, beer, juice, coconut milk, almond milk, oat milk, soy milk, "
+        "rice milk, coffee, tea, sake, mirin"
+    ),
+    C.OTHER: (
+        "baking powder, baking soda, yeast, gelatin, almond, walnut, peanut, cashew, pecan, "
+        "hazelnut, pistachio, pine nut, sesame, chia, flaxseed, sunflower seed, pumpkin seed, nut"
+    ),
+}
+
+# Storage location and shelf life of entries that differ from their category
+ENTRY_STORAGE: dict[str, tuple[str, int]] = {
+    "egg": (FRIDGE, 28),
+    "bacon": (FRIDGE, 7),
+    "ham": (FRIDGE, 5),
+    "salami": (FRIDGE, 30),
+    "pepperoni": (FRIDGE, 30),
+    "chorizo": (FRIDGE, 30),
+    "prosciutto": (FRIDGE, 14),
+    "tofu": (FRIDGE, 7),
+    "tempeh": (FRIDGE, 10),
+    "lentil": (PANTRY, 365),
+    "potato": (PANTRY, 30),
+    "sweet potato": (PANTRY, 21),
+    "onion": (PANTRY, 30),
+    "red onion": (PANTRY, 30),
+    "shallot": (PANTRY, 30),
+    "garlic": (PANTRY, 60),
+    "squash": (PANTRY, 60),
+    "pumpkin": (PANTRY, 60),
+    "ginger": (FRIDGE, 21),
+    "carrot": (FRIDGE, 21),
+    "cabbage": (FRIDGE, 30),
+    "avocado": (PANTRY, 5),
+    "olive": (FRIDGE, 30),
+    "apple": (FRIDGE, 30),
+    "banana": (PANTRY, 5),
+    "orange": (PANTRY, 14),
+    "lemon": (FRIDGE, 21),
+    "lime": (FRIDGE, 21),
+    "mango": (PANTRY, 5),
+    "pineapple": (PANTRY, 5),
+    "melon": (PANTRY, 7),
+    "watermelon": (PANTRY, 7),
+    "coconut": (PANTRY, 30),
+    "date": (PANTRY, 180),
+    "raisin": (PANTRY, 180),
+    "prune": (PANTRY, 180),
+    "bread": (PANTRY, 5),
+    "baguette": (PANTRY, 2),
+    "tortilla": (PANTRY, 30),
+    "pita": (PANTRY, 7),
+    "cracker": (PANTRY, 180),
+    "cereal": (PANTRY, 180),
+    "cream": (FRIDGE, 10),
+    "heavy cream": (FRIDGE, 10),
+    "sour cream": (FRIDGE, 14),
+    "butter": (FRIDGE, 60),
+    "cheese": (FRIDGE, 30),
+    "cheddar": (FRIDGE, 30),
+    "parmesan": (FRIDGE, 90),
+    "gouda": (FRIDGE, 30),
+    "halloumi": (FRIDGE, 30),
+    "yogurt": (FRIDGE, 14),
+    "greek yogurt": (FRIDGE, 14),
+    "kefir": (FRIDGE, 14),
+    "ghee": (PANTRY, 180),
+    "ice cream": (FREEZER, FREEZER_SHELF_LIFE_DAYS),
+    "vanilla": (PANTRY, 1095),
+    "salt": (PANTRY, 1825),
+    "pesto": (FRIDGE, 7),
+    "salsa": (FRIDGE, 14),
+    "hummus": (FRIDGE, 7),
+    "gravy": (FRIDGE, 4),
+    "curry paste": (FRIDGE, 30),
+    "tomato paste": (FRIDGE, 14),
+    "soy sauce": (PANTRY, 730),
+    "fish sauce": (PANTRY, 730),
+    "mustard": (FRIDGE, 365),
+    "vinegar": (PANTRY, 1825),
+    "balsamic": (PANTRY, 1095),
+    "peanut butter": (PANTRY, 180),
+    "miso": (FRIDGE, 365),
+    "margarine": (FRIDGE, 60),
+    "lard": (FRIDGE, 90),
+    "honey": (PANTRY, 1825),
+    "chocolate": (PANTRY, 365),
+    "juice": (FRIDGE, 7),
+    "almond milk": (FRIDGE, 7),
+    "oat milk": (FRIDGE, 7),
+    "soy milk": (FRIDGE, 7),
+    "rice milk": (FRIDGE, 7),
+    "coconut milk": (PANTRY, 730),
+    "yeast": (FRIDGE, 120),
+    "nut": (PANTRY, 180),
+}
+
+# Aliases of lexicon entries
+SYNONYMS: dict[str, str] = {
+    "aubergine": "eggplant",
+    "courgette": "zucchini",
+    "coriander": "cilantro",
+    "scallion": "spring onion",
+    "green onion": "spring onion",
+    "capsicum": "bell pepper",
+    "rocket": "arugula",
+    "beetroot": "beet",
+    "swede": "rutabaga",
+    "maize": "corn",
+    "sweetcorn": "corn",
+    "mangetout": "snow pea",
+    "chilli": "chili",
+    "chile": "chili",
+    "chilli flake": "chili flake",
+    "red pepper flake": "chili flake",
+    "garbanzo": "chickpea",
+    "garlic clove": "garlic",
+    "cocoa powder": "cocoa",
+    "prawn": "shrimp",
+    "mince": "ground beef",
+    "hamburger": "ground beef",
+    "yoghurt": "yogurt",
+    "double cream": "heavy cream",
+    "whipping cream": "heavy cream",
+    "single cream": "cream",
+    "parmigiano": "parmesan",
+    "icing sugar": "powdered sugar",
+    "confectioners sugar": "powdered sugar",
+    "caster sugar": "sugar",
+    "granulated sugar": "sugar",
+    "cornflour": "cornstarch",
+    "corn starch": "cornstarch",
+    "bicarbonate of soda": "baking soda",
+    "bicarb": "baking soda",
+    "stock cube": "bouillon",
+    "spaghetti sauce": "pasta sauce",
+    "marinara": "pasta sauce",
+    "tomato puree": "tomato paste",
+    "mayo": "mayonnaise",
+    "catsup": "ketchup",
+    "bean curd": "tofu",
+    "sultana": "raisin",
+    "rapeseed oil": "canola oil",
+}
+
+# Words that change where a food is kept and for how long
+MODIFIERS: dict[str, tuple[str, int]] = {
+    "frozen": (FREEZER, FREEZER_SHELF_LIFE_DAYS),
+    "dried": (PANTRY, 365),
+    "dry": (PANTRY, 365),
+    "canned": (PANTRY, 730),
+    "tinned": (PANTRY, 730),
+    "jarred": (PANTRY, 365),
+}
+
+# Words understood without naming a food: preparation, size, colour, cut, packaging
+NEUTRAL_WORDS = (
+    "fresh, organic, raw, cooked, smoked, whole, ground, chopped, diced, sliced, minced, "
+    "grated, shredded, peeled, boneless, skinless, large, small, baby, ripe, red, green, "
+    "yellow, white, black, sweet, unsalted, salted, plain, free, range, extra, virgin, low, "
+    "fat, skimmed, semi, unsweetened, breast, thigh, drumstick, wing, leg, fillet, loin, chop, "
+    "rib, shoulder, seed, leaf, sprig, stick, floret, chunk, piece, slice, cube, bunch, head, "
+    "can, jar, bag, of, and"
+)
+
+# Neutral words that are the food itself when they end the name ("mustard greens")
+HEAD_NOUNS = "green"
+
+_WORD = re.compile(r"[a-z]+")
+_IRREGULAR = {"leaves": "leaf", "loaves": "loaf", "halves": "half"}
+
+
+def _stem(word: str) -> str:
+    """Crude singular of an English word; only has to be consistent, not correct."""
+    if word in _IRREGULAR:
+        return _IRREGULAR[word]
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 4 and word.endswith(("oes", "ches", "shes", "xes")):
+        return word[:-2]
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+def _words(text: str) -> tuple[str, ...]:
+    return tuple(_stem(word) for word in _WORD.findall(text.lower()))
+
+
+class Classification(BaseModel):
+    """What the lexicon says about an ingredient name."""
+
+    category: IngredientCategory
+    storage_location: str
+    shelf_life_days: int = Field(..., ge=0)
+    confidence: float = Field(..., ge=0, le=1)
+
+
+def _build_index() -> dict[tuple[str, ...], tuple[IngredientCategory, str, int]]:
+    index: dict[tuple[str, ...], tuple[IngredientCategory, str, int]] = {}
+    for category, entries in LEXICON.items():
+        for entry in (entry.strip() for entry in entries.split(",")):
+            storage, days = ENTRY_STORAGE.get(entry, CATEGORY_STORAGE[category])
+            index[_words(entry)] = (category, storage, days)
+    for alias, entry in SYNONYMS.items():
+        index[_words(alias)] = index[_words(entry)]
+    return index
+
+
+_INDEX = _build_index()
+# Longest lexicon entry or synonym, in words
+_MAX_WORDS = max(map(len, _INDEX))
+_MODIFIERS: dict[str, tuple[str, int] | None] = {
+    **{_stem(word.strip()): None for word in NEUTRAL_WORDS.split(",")},
+    **{_stem(word): effect for word, effect in MODIFIERS.items()},
+}
+_HEAD_NOUNS = frozenset(_stem(word.strip()) for word in HEAD_NOUNS.split(","))
+
+
+def _is_modifier(words: tuple[str, ...], position: int) -> bool:
+    word = words[position]
+    return word in _MODIFIERS and not (position == len(words) - 1 and word in _HEAD_NOUNS)
+
+
+def classify(name: str) -> Classification | None:
+    """Classify an ingredient name, or return None when no lexicon entry matches."""
+    words = _words(name)
+    # Rightmost entry first, then the longest one ending there
+    for end in range(len(words), 0, -1):
+        for start in range(max(0, end - _MAX_WORDS), end):
+            rule = _INDEX.get(words[start:end])
+            if rule is not None:
+                break
+        else:
+            continue
+        break
+    else:
+        return None
+
+    category, storage, days = rule
+    explained = (
+        end
+        - start
+        + sum(
+            1
+            for position, word in enumerate(words)
+            if not start <= position < end and (_is_modifier(words, position) or (word,) in _INDEX)
+        )
+    )
+    share = explained / len(words)
+    head = all(_is_modifier(words, position) for position in range(end, len(words)))
+    for word in words:
+        effect = _MODIFIERS.get(word)
+        if effect is not None:
+            storage, days = effect
+    return Classification(
+        category=category,
+        storage_location=storage,
+        shelf_life_days=days,
+        confidence=round((1 + share) / 2 if head else share / 2, 4),
+    )
+
+
+class IngredientClassifier:
+    """Fill in an ingredient draft from the lexicon when it is confident enough."""
+
+    def __init__(self, threshold: float = 0.7) -> None:
+        """Initialize the classifier; drafts classified below ``threshold`` are left alone."""
+        self.threshold = threshold
+
+    def complete(self, draft: Ingredient, *, today: date | None = None) -> Ingredient | None:
+        """Return the draft with category, storage and expiry filled, or None if unsure.
+
+        Fields the draft sets are kept. The expiry date follows the draft's
+        own storage location when that is the freezer.
+        """
+        classification = classify(draft.name)
+        if classification is None or classification.confidence < self.threshold:
+            return None
+        days = classification.shelf_life_days
+        if (draft.storage_location or "").strip().lower() == FREEZER:
+            days = max(days, FREEZER_SHELF_LIFE_DAYS)
+        filled = {
+            "category": classification.category,
+            "storage_location": classification.storage_location,
+            "expiry_date": (today or date.today()) + timedelta(days=days),
+        }
+        return draft.model_copy(
+            update={
+                field: value for field, value in filled.items() if getattr(draft, field) is None
+            }
+        )
@@ -0,0 +1,235 @@
+"""Streaming bulk import of ingredients from CSV or JSONL.
+
+The body is parsed as it arrives, one record at a time, so an import of any
+size only holds one batch in memory. Each row is validated against the core
+``Ingredient`` schema and upserted by name with the same rules as
+``POST /api/v1/ingredients``: quantities add up and the fields a row sets
+overwrite the stored ones. Every batch is one executemany in its own
+transaction, so a failed import keeps the batches already committed.
+
+AI enrichment is opt-in: it costs one model round trip per row.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import csv
+import json
+from collections import defaultdict
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from typing import Any
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.enums import ImportFormat, IngredientCategory
+from app.logging import get_logger
+from app.repositories import IngredientRepository
+from app.schemas.core.ingredient import Ingredient
+from app.schemas.requests.suggestion import IngredientSuggestionRequest
+from app.schemas.responses.ingredient import IngredientImportError, IngredientImportProgress
+from app.services import SuggestionService
+
+logger = get_logger(__name__)
+
+Enricher = Callable[[Ingredient], Awaitable[Ingredient]]
+
+ENRICHMENT_PROMPT = (
+    "Complete this ingredient with appropriate category, storage location, "
+    "expiry date based on the storage location (must be in the future), "
+    "and any relevant notes. Ensure the information is accurate and useful."
+)
+# Model calls in flight at once while enriching a batch
+ENRICHMENT_CONCURRENCY = 8
+
+
+async def _lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Decode UTF-8 chunks into lines, each ending in ``\\n`` except maybe the last."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        *complete, pending = (pending + decoder.decode(chunk)).split("\n")
+        for line in complete:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+async def _records(
+    chunks: AsyncIterable[bytes], fmt: ImportFormat
+) -> AsyncIterator[tuple[int, str]]:
+    """Yield ``(first line number, text)`` of each non-blank record.
+
+    A CSV record runs on over line breaks inside quotes, which is where its
+    count of quote characters is odd (escaped quotes come in pairs).
+    """
+    lines: list[str] = []
+    quotes = start = line_number = 0
+    async for line in _lines(chunks):
+        line_number += 1
+        if not lines:
+            if not line.strip():
+                continue
+            start = line_number
+        if fmt is ImportFormat.JSONL:
+            yield start, line
+            continue
+        lines.append(line)
+        quotes += line.count('"')
+        if quotes % 2 == 0:
+            yield start, "".join(lines)
+            lines, quotes = [], 0
+    if lines:
+        yield start, "".join(lines)
+
+
+def _describe(exc: Exception) -> str:
+    if isinstance(exc, ValidationError):
+        return "; ".join(
+            f"{'.'.join(map(str, error['loc'])) or 'row'}: {error['msg']}" for error in exc.errors()
+        )
+    return str(exc)
+
+
+def _combine(first: Ingredient, second: Ingredient) -> Ingredient:
+    """Merge two rows with the same name the way two upserts would."""
+    update = second.model_dump(include=second.model_fields_set - {"quantity"})
+    return first.model_copy(update={**update, "quantity": first.quantity + second.quantity})
+
+
+def ai_enricher(suggestions: SuggestionService) -> Enricher:
+    """Enricher that lets the model fill the fields a row leaves empty.
+
+    Fields the row sets are kept as they are. When the model returns nothing
+    or fails, the row is imported as it is, like a manual create.
+    """
+
+    async def enrich(draft: Ingredient) -> Ingredient:
+        request = IngredientSuggestionRequest(
+            ingredient=draft, prompt=ENRICHMENT_PROMPT, n_completions=1
+        )
+        try:
+            completed = await suggestions.complete_ingredient(request)
+        except Exception:
+            logger.warning("ingredient_enrichment_failed", name=draft.name, exc_info=True)
+            return draft
+        if not completed:
+            return draft
+        filled = {
+            field: value
+            for field, value in completed[0].model_dump(exclude={"name", "quantity"}).items()
+            if value is not None and field not in draft.model_fields_set
+        }
+        return draft.model_copy(update=filled)
+
+    return enrich
+
+
+async def _enrich_all(items: list[Ingredient], enrich: Enricher) -> list[Ingredient]:
+    limit = asyncio.Semaphore(ENRICHMENT_CONCURRENCY)
+
+    async def bounded(item: Ingredient) -> Ingredient:
+        async with limit:
+            return await enrich(item)
+
+    return list(await asyncio.gather(*(bounded(item) for item in items)))
+
+
+async def _upsert_batch(
+    session_factory: async_sessionmaker[AsyncSession], items: list[Ingredient]
+) -> None:
+    """Upsert one batch in one transaction, one executemany per set of merged fields."""
+    groups: dict[frozenset[str], list[dict[str, Any]]] = defaultdict(list)
+    for item in items:
+        values = item.model_dump()
+        # Only used for new ingredients: category is merged only when the row set it
+        values["category"] = values["category"] or IngredientCategory.OTHER
+        groups[frozenset(item.model_fields_set - {"quantity"})].append(values)
+    async with session_factory() as session:
+        repository = IngredientRepository(session)
+        for merge, rows in groups.items():
+            await repository.upsert_many(rows, merge=merge)
+        await session.commit()
+
+
+async def import_ingredients(
+    session_factory: async_sessionmaker[AsyncSession],
+    chunks: AsyncIterable[bytes],
+    *,
+    fmt: ImportFormat,
+    batch_size: int,
+    enrich: Enricher | None = None,
+) -> AsyncIterator[IngredientImportError | IngredientImportProgress]:
+    """Import ingredients from a CSV or JSONL byte stream, reporting as it goes.
+
+    Yields an error event for every skipped row, a progress event after
+    every committed batch and a final ``done`` event. One batch is written
+    while the next is parsed. CSV needs a header row
+    naming the ``Ingredient`` fields; empty cells count as not set. Rows
+    repeating a name within a batch are combined before the upsert.
+    """
+    progress = IngredientImportProgress()
+    batch: dict[str, Ingredient] = {}
+    batch_rows = 0
+    header: list[str] | None = None
+    writing: asyncio.Task[None] | None = None
+
+    async def write(items: list[Ingredient], rows: int) -> None:
+        if enrich is not None:
+            items = await _enrich_all(items, enrich)
+        await _upsert_batch(session_factory, items)
+        progress.imported += rows
+        progress.batches += 1
+
+    try:
+        async for line, record in _records(chunks, fmt):
+            try:
+                if fmt is ImportFormat.CSV:
+                    values = next(csv.reader([record]))
+                    if header is None:
+                        header = [name.strip().lower() for name in values]
+                        continue
+                    if len(values) > len(header):
+                        raise ValueError("Row has more fields than the header")
+                    raw: Any = {
+                        name: value.strip()
+                        for name, value in zip(header, values, strict=False)
+                        if value.strip()
+                    }
+                else:
+                    raw = json.loads(record)
+                    if not isinstance(raw, dict):
+                        raise ValueError("Expected a JSON object")
+                item = Ingredient.model_validate(raw)
+            except (ValueError, csv.Error) as exc:
+                progress.rows += 1
+                progress.failed += 1
+                yield IngredientImportError(line=line, error=_describe(exc))
+                continue
+
+            progress.rows += 1
+            batch_rows += 1
+            key = item.name.lower()
+            batch[key] = _combine(batch[key], item) if key in batch else item
+            if batch_rows >= batch_size:
+                if writing is not None:
+                    await writing
+                    yield progress.model_copy()
+                # The next batch is parsed while SQLite writes this one
+                writing = asyncio.create_task(write(list(batch.values()), batch_rows))
+                batch, batch_rows = {}, 0
+
+        if writing is not None:
+            await writing
+            yield progress.model_copy()
+        if batch:
+            await write(list(batch.values()), batch_rows)
+            yield progress.model_copy()
+    finally:
+        if writing is not None and not writing.done():
+            # The caller went away mid-batch; its transaction rolls back
+            writing.cancel()
+    logger.info("ingredient_import_finished", **progress.model_dump(exclude={"event"}))
+    yield progress.model_copy(update={"event": "done"})
@@ -2,30 +2,61 @@
 
 This module provides lazy initialization of the Marvin client to avoid
 side effects at import time and allow for proper testing isolation.
+
+Marvin is configured once per process: the first call prepares the
+environment, imports ``marvin`` and installs one shared OpenAI model (and
+with it one HTTP connection pool); later calls with the same settings
+only check that nothing changed. Processes that never call the AI never
+import ``marvin``.
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from app.config import BASE_DIR, get_settings
+from app.logging import get_logger
+
+if TYPE_CHECKING:
+    from pydantic_ai.models.openai import OpenAIChatModel
+
+logger = get_logger(__name__)
+
+# Settings Marvin was last configured with, and the model shared by every call
+_configured_with: tuple[str, Path | None, str | None] | None = None
+_shared_model: OpenAIChatModel | None = None
 
 
 def configure_marvin() -> None:
     """Configure Marvin with settings from the application config.
 
-    This function should be called lazily (e.g., in service __init__)
-    to avoid side effects at module import time.
+    This function should be called lazily (e.g., just before a Marvin call)
+    to avoid side effects at module import time. Only the first call per
+    process (or after the settings changed) does the work.
 
     Raises:
         ValueError: If OpenAI API key is not configured.
     """
+    global _configured_with
     settings = get_settings()
 
     if not settings.openai_api_key:
         raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable.")
 
+    configured_with = (
+        settings.openai_api_key,
+        settings.marvin_home_path,
+        settings.marvin_database_url,
+    )
+    if (
+        configured_with == _configured_with
+        and os.environ.get("OPENAI_API_KEY") == settings.openai_api_key
+    ):
+        return
+
     # Ensure OpenAI key is visible to Marvin
     if os.environ.get("OPENAI_API_KEY") != settings.openai_api_key:
         os.environ["OPENAI_API_KEY"] = settings.openai_api_key
@@ -73,3 +104,43 @@ def configure_marvin() -> None:
                 marvin.settings.openai.api_key = settings.openai_api_key  # type: ignore[attr-defined]
     except (AttributeError, TypeError):
         pass
+
+    _share_model(marvin, settings.openai_api_key)
+    _configured_with = configured_with
+
+
+def _share_model(marvin: Any, api_key: str) -> None:
+    """Make Marvin's default OpenAI model one shared instance instead of one per call."""
+    global _shared_model
+    shared = _shared_model
+    model_name: object = getattr(getattr(marvin, "defaults", None), "model", None)
+    if shared is not None and model_name is shared:
+        model_name = f"openai:{shared.model_name}"
+    if not isinstance(model_name, str) or not model_name.startswith("openai:"):
+        return
+    try:
+        from pydantic_ai.models.openai import OpenAIChatModel
+        from pydantic_ai.providers.openai import OpenAIProvider
+    except ImportError:  # pragma: no cover - pydantic-ai ships with marvin
+        return
+    _shared_model = OpenAIChatModel(
+        model_name.removeprefix("openai:"), provider=OpenAIProvider(api_key=api_key)
+    )
+    marvin.defaults.model = _shared_model
+
+
+async def warm_marvin(timeout_seconds: float = 5.0) -> None:
+    """Configure Marvin now and open a connection to the provider ahead of the first call.
+
+    Failures are logged, not raised: the first AI request then pays for them.
+    """
+    try:
+        configure_marvin()
+        shared = _shared_model
+        if shared is not None:
+            async with asyncio.timeout(timeout_seconds):
+                await shared.client.models.list()
+    except Exception as exc:
+        logger.warning("marvin_warm_up_failed", error=str(exc))
+    else:
+        logger.info("marvin_warmed_up")
@@ -0,0 +1,145 @@
+"""Startup schema management backed by the Alembic revision history.
+
+``create_all`` reflects every table on each boot. That is cheap on a laptop
+but measurable on a Raspberry Pi. The other two startup modes trust
+``migrations/versions`` instead:
+
+* ``check`` reads the ``alembic_version`` row and compares it with the
+  script heads, then skips DDL entirely when they match.
+* ``migrate`` upgrades to head when they differ. The upgrade runs under an
+  exclusive file lock so that several uvicorn workers starting together run
+  the migration once; the others wait, re-check and find nothing to do.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import BASE_DIR
+from app.logging import get_logger
+
+logger = get_logger(__name__)
+
+ALEMBIC_INI = BASE_DIR / "alembic.ini"
+MIGRATIONS_DIR = BASE_DIR / "migrations"
+
+
+class SchemaRevisionError(RuntimeError):
+    """Raised when the database is not at the Alembic head revision."""
+
+
+def alembic_config(database_url: str) -> Config:
+    """Build an Alembic config for ``database_url`` independent of the working directory."""
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    config.set_main_option("sqlalchemy.url", database_url.replace("%", "%%"))
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def head_revisions(config: Config) -> frozenset[str]:
+    """Return the head revisions of the migration scripts.
+
+    Resolving heads imports every script under ``migrations/versions``; the
+    result is cached per script location because it only changes on deploy.
+    """
+    return _script_heads(config.get_main_option("script_location"))
+
+
+@lru_cache
+def _script_heads(script_location: str) -> frozenset[str]:
+    return frozenset(ScriptDirectory(script_location).get_heads())
+
+
+def _current_revisions(connection: Connection) -> set[str]:
+    return set(MigrationContext.configure(connection).get_current_heads())
+
+
+async def current_revisions(engine: AsyncEngine) -> set[str]:
+    """Return the revisions stamped in ``alembic_version`` (empty if unversioned)."""
+    async with engine.connect() as conn:
+        return await conn.run_sync(_current_revisions)
+
+
+def migration_lock_path(database_url: str) -> Path:
+    """Lock file shared by every worker that opens ``database_url``.
+
+    SQLite databases lock next to the database file. Other backends use the
+    temp directory, which coordinates workers on one host only.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:"):
+        database = Path(url.database.removeprefix("file:")).expanduser().resolve()
+        return database.with_name(f"{database.name}.migrate.lock")
+    return Path(tempfile.gettempdir()) / "menoo-migrate.lock"
+
+
+def _acquire_file_lock(path: Path) -> int:
+    """Block until an exclusive lock on ``path`` is held; close the fd to release."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if sys.platform == "win32":
+            import msvcrt
+
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(fd, fcntl.LOCK_EX)
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
+async def check_schema(engine: AsyncEngine, database_url: str) -> None:
+    """Raise :class:`SchemaRevisionError` unless the database is at head."""
+    heads = head_revisions(alembic_config(database_url))
+    current = await current_revisions(engine)
+    if current != heads:
+        raise SchemaRevisionError(
+            f"Database schema is at {sorted(current) or 'no revision'}, "
+            f"expected {sorted(heads)}; run 'alembic upgrade head' "
+            "or start with DATABASE_SCHEMA_MODE=migrate"
+        )
+    logger.debug("schema_at_head", revisions=sorted(heads))
+
+
+async def migrate_schema(engine: AsyncEngine, database_url: str) -> bool:
+    """Upgrade the database to head under a file lock.
+
+    Returns ``True`` if this process ran the upgrade and ``False`` if the
+    database was already at head.
+    """
+    config = alembic_config(database_url)
+    heads = head_revisions(config)
+    if await current_revisions(engine) == heads:
+        return False
+
+    lock_path = migration_lock_path(database_url)
+    fd = await asyncio.to_thread(_acquire_file_lock, lock_path)
+    try:
+        # Re-check under the lock: another worker may have finished first
+        if await current_revisions(engine) == heads:
+            return False
+        logger.info("schema_migration_started", lock=str(lock_path))
+        # Alembic's env.py drives its own event loop, so upgrade from a worker thread
+        await asyncio.to_thread(command.upgrade, config, "heads")
+        logger.info("schema_migration_finished", revisions=sorted(heads))
+        return True
+    finally:
+        # Closing the descriptor releases the lock on every platform
+        os.close(fd)
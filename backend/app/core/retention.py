@@ -0,0 +1,186 @@
+"""Retention of soft-deleted rows.
+
+Soft-deleted ingredients and recipes stay in their tables (and indexes)
+forever unless purged. A purge moves rows deleted longer than the retention
+age into ``archived_rows`` and hard-deletes them, one bounded batch per
+transaction so the single SQLite writer is never held for long. Afterwards
+the tables are re-analysed and, on SQLite databases created with
+``auto_vacuum=INCREMENTAL``, freed pages are returned to the filesystem.
+
+The purge runs from the ``retention purge`` CLI command or, when
+``retention_enabled`` is set, from a background task started with the app.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from datetime import datetime, timedelta
+
+from pydantic import BaseModel
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.logging import get_logger
+from app.repositories import RetentionRepository
+
+logger = get_logger(__name__)
+
+PURGED_TABLES = ("recipes", "recipe_ingredients", "ingredients", "archived_rows")
+# SQLite's PRAGMA auto_vacuum value for INCREMENTAL
+AUTO_VACUUM_INCREMENTAL = 2
+
+
+class PurgeReport(BaseModel):
+    """What a retention run removed."""
+
+    recipes: int = 0
+    ingredients: int = 0
+    batches: int = 0
+    freed_pages: int = 0
+
+
+async def purge_soft_deleted(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    older_than: timedelta,
+    batch_size: int,
+    pause_ms: float = 0.0,
+    now: datetime | None = None,
+) -> PurgeReport:
+    """Archive and delete rows soft-deleted before ``now - older_than``.
+
+    Recipes go first: their ingredient associations are what keep deleted
+    ingredients referenced. Every batch commits on its own.
+    """
+    cutoff = (now or datetime.utcnow()) - older_than
+    report = PurgeReport()
+    for kind in ("recipes", "ingredients"):
+        while True:
+            async with session_factory() as session:
+                repo = RetentionRepository(session)
+                if kind == "recipes":
+                    purged = await repo.archive_expired_recipes(cutoff, limit=batch_size)
+                else:
+                    purged = await repo.archive_expired_ingredients(cutoff, limit=batch_size)
+                await session.commit()
+            if not purged:
+                break
+            setattr(report, kind, getattr(report, kind) + purged)
+            report.batches += 1
+            logger.debug("retention_batch_purged", table=kind, rows=purged)
+            if purged < batch_size:
+                break
+            await asyncio.sleep(pause_ms / 1000)
+    return report
+
+
+async def optimize_storage(engine: AsyncEngine, *, full_vacuum: bool = False) -> int:
+    """Refresh planner statistics and reclaim free pages; returns pages freed.
+
+    Incremental vacuum only works on SQLite databases whose ``auto_vacuum``
+    is ``INCREMENTAL``. ``full_vacuum`` switches an existing database over
+    with a one-off ``VACUUM`` that rewrites the whole file.
+    """
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for table in PURGED_TABLES:
+            await conn.execute(text(f"ANALYZE {table}"))
+        if engine.dialect.name != "sqlite":
+            # PostgreSQL's autovacuum reclaims dead tuples on its own
+            return 0
+
+        before = int((await conn.execute(text("PRAGMA freelist_count"))).scalar_one())
+        if full_vacuum:
+            await conn.execute(text("PRAGMA auto_vacuum=INCREMENTAL"))
+            await conn.execute(text("VACUUM"))
+        elif (await conn.execute(text("PRAGMA auto_vacuum"))).scalar_one() == (
+            AUTO_VACUUM_INCREMENTAL
+        ):
+            await conn.execute(text("PRAGMA incremental_vacuum"))
+        else:
+            logger.info("incremental_vacuum_unavailable", free_pages=before)
+        after = int((await conn.execute(text("PRAGMA freelist_count"))).scalar_one())
+    return max(before - after, 0)
+
+
+async def run_retention(
+    session_factory: async_sessionmaker[AsyncSession],
+    engine: AsyncEngine,
+    *,
+    retention_days: int,
+    batch_size: int,
+    pause_ms: float = 0.0,
+    full_vacuum: bool = False,
+) -> PurgeReport:
+    """Purge expired soft-deleted rows, then analyse and vacuum if anything went."""
+    report = await purge_soft_deleted(
+        session_factory,
+        older_than=timedelta(days=retention_days),
+        batch_size=batch_size,
+        pause_ms=pause_ms,
+    )
+    if report.batches or full_vacuum:
+        report.freed_pages = await optimize_storage(engine, full_vacuum=full_vacuum)
+    logger.info("retention_finished", **report.model_dump())
+    return report
+
+
+class RetentionJob:
+    """Asyncio task that runs :func:`run_retention` on an interval."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        engine: AsyncEngine,
+        *,
+        retention_days: int,
+        batch_size: int,
+        pause_ms: float,
+        interval_hours: float,
+    ) -> None:
+        """Initialize job; call :meth:`start` from the application lifespan."""
+        self._session_factory = session_factory
+        self._engine = engine
+        self._retention_days = retention_days
+        self._batch_size = batch_size
+        self._pause_ms = pause_ms
+        self._interval = interval_hours * 3600
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the job task is scheduled."""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start the job task; the first run begins right away."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="menoo-retention")
+
+    async def stop(self) -> None:
+        """Cancel the job task, abandoning (and rolling back) a batch in flight."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def run_once(self) -> PurgeReport:
+        """Run one retention pass."""
+        return await run_retention(
+            self._session_factory,
+            self._engine,
+            retention_days=self._retention_days,
+            batch_size=self._batch_size,
+            pause_ms=self._pause_ms,
+        )
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("retention_failed")
+            await asyncio.sleep(self._interval)
@@ -0,0 +1,100 @@
+"""Streaming response helpers: request-body-friendly streams and on-the-fly gzip."""
+
+from __future__ import annotations
+
+import itertools
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from litestar import Request
+from litestar.enums import MediaType
+from litestar.response import Stream
+from litestar.response.base import ASGIResponse
+from litestar.response.streaming import ASGIStreamingResponse
+from litestar.types import Receive, Send
+from litestar.utils.helpers import get_enum_string_value
+
+if TYPE_CHECKING:
+    from litestar import Litestar
+    from litestar.background_tasks import BackgroundTask, BackgroundTasks
+    from litestar.datastructures import Cookie
+    from litestar.types import TypeEncodersMap
+
+
+class _UploadStreamingResponse(ASGIStreamingResponse):
+    __slots__ = ()
+
+    async def send_body(self, send: Send, receive: Receive) -> None:  # noqa: ARG002
+        await self._stream(send)
+
+
+class UploadStream(Stream):
+    """:class:`~litestar.response.Stream` that leaves ``receive`` to the handler.
+
+    Litestar's stream listens for a client disconnect on ``receive`` while it
+    sends, which swallows the request body of a handler still reading it with
+    ``request.stream()``. That reader notices a disconnect itself.
+    """
+
+    def to_asgi_response(
+        self,
+        app: Litestar | None,  # noqa: ARG002
+        request: Request[Any, Any, Any],  # noqa: ARG002
+        *,
+        background: BackgroundTask | BackgroundTasks | None = None,
+        cookies: Iterable[Cookie] | None = None,
+        encoded_headers: Iterable[tuple[bytes, bytes]] | None = None,
+        headers: dict[str, str] | None = None,
+        is_head_response: bool = False,
+        media_type: MediaType | str | None = None,
+        status_code: int | None = None,
+        type_encoders: TypeEncodersMap | None = None,  # noqa: ARG002
+    ) -> ASGIResponse:
+        """Create the ASGI response, without the disconnect listener."""
+        iterator = self.iterator
+        if not isinstance(iterator, (Iterable, Iterator, AsyncIterable, AsyncIterator)):
+            iterator = iterator()
+        return _UploadStreamingResponse(
+            background=self.background or background,
+            content_length=0,
+            cookies=self.cookies if cookies is None else itertools.chain(self.cookies, cookies),
+            encoded_headers=encoded_headers,
+            encoding=self.encoding,
+            headers={**headers, **self.headers} if headers is not None else self.headers,
+            is_head_response=is_head_response,
+            iterator=iterator,
+            media_type=get_enum_string_value(media_type or self.media_type or MediaType.JSON),
+            status_code=self.status_code or status_code,
+        )
+
+
+async def gzip_chunks(chunks: AsyncIterable[bytes], level: int = 6) -> AsyncIterator[bytes]:
+    """Gzip a byte stream as it goes, yielding only non-empty compressed chunks."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    async for chunk in chunks:
+        if compressed := compressor.compress(chunk):
+            yield compressed
+    yield compressor.flush()
+
+
+def accepts_gzip(request: Request[Any, Any, Any]) -> bool:
+    """Whether the client lists gzip in Accept-Encoding with a non-zero weight."""
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() != "gzip":
+            continue
+        try:
+            return float(params.strip().removeprefix("q=") or 1) > 0
+        except ValueError:
+            return True
+    return False
+
+
+def ndjson_stream(request: Request[Any, Any, Any], chunks: AsyncIterable[bytes]) -> Stream:
+    """NDJSON streaming response, gzipped when the client accepts it."""
+    headers = {"Vary": "Accept-Encoding"}
+    if accepts_gzip(request):
+        chunks = gzip_chunks(chunks)
+        headers["Content-Encoding"] = "gzip"
+    return Stream(chunks, media_type="application/x-ndjson", headers=headers)
@@ -0,0 +1,141 @@
+"""Single-writer commit queue that group-commits concurrent writes.
+
+SQLite serialises writers on the database file lock and pays one commit (and,
+depending on ``synchronous``, one fsync) per transaction. When write coalescing
+is enabled, mutating service calls are handed to one writer task as work items.
+The task runs each item inside its own SAVEPOINT of one transaction and
+commits small, time- or size-bounded groups at once. Every caller still gets
+its own result or exception; a failing item only rolls back its SAVEPOINT.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+WriteOperation = Callable[[AsyncSession], Awaitable[Any]]
+
+
+class WriteQueue:
+    """Asyncio writer task that owns the write connection and batches commits."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        max_batch_size: int = 32,
+        max_delay_ms: float = 2.0,
+    ) -> None:
+        """Initialize queue; call :meth:`start` from the application lifespan."""
+        self._session_factory = session_factory
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay_ms / 1000
+        self._queue: asyncio.Queue[tuple[WriteOperation, asyncio.Future[Any]] | None] = (
+            asyncio.Queue()
+        )
+        self._task: asyncio.Task[None] | None = None
+        self.batches_committed = 0
+        self.items_committed = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the writer task is accepting work."""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start the writer task."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="menoo-write-queue")
+
+    async def stop(self) -> None:
+        """Drain queued work, commit it and stop the writer task."""
+        if self._task is None:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+    async def submit(self, operation: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        """Queue a write operation and wait for its group commit.
+
+        The operation receives the writer session. It may add, flush and query,
+        but must not commit or roll back; the queue does that for the group.
+        """
+        if not self.running:
+            raise RuntimeError("Write queue is not running")
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        await self._queue.put((operation, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = loop.time() + self._max_delay
+            while len(batch) < self._max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    next_item = await asyncio.wait_for(self._queue.get(), timeout)
+                except TimeoutError:
+                    break
+                if next_item is None:
+                    stopping = True
+                    break
+                batch.append(next_item)
+            await self._commit_batch(batch)
+
+    async def _commit_batch(self, batch: list[tuple[WriteOperation, asyncio.Future[Any]]]) -> None:
+        succeeded: list[tuple[asyncio.Future[Any], Any]] = []
+        try:
+            async with self._session_factory() as session:
+                await _begin(session)
+                for operation, future in batch:
+                    if future.cancelled():
+                        continue
+                    try:
+                        # SAVEPOINT per item so one failure doesn't roll back the group
+                        async with session.begin_nested():
+                            result = await operation(session)
+                    except Exception as exc:
+                        future.set_exception(exc)
+                    else:
+                        succeeded.append((future, result))
+                await session.commit()
+        except Exception as exc:
+            logger.exception("write_queue_commit_failed", batch_size=len(batch))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        self.batches_committed += 1
+        self.items_committed += len(succeeded)
+        for future, result in succeeded:
+            if not future.done():
+                future.set_result(result)
+
+
+async def _begin(session: AsyncSession) -> None:
+    """Open the group's transaction before its first SAVEPOINT.
+
+    pysqlite only emits BEGIN ahead of INSERT, UPDATE and DELETE, so a SAVEPOINT
+    would start the transaction itself and its RELEASE would commit it.
+    """
+    connection = await session.connection()
+    if connection.dialect.name == "sqlite":
+        await connection.exec_driver_sql("BEGIN")
@@ -4,8 +4,12 @@ from __future__ import annotations
 
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from typing import Any
+from pathlib import Path
+from typing import Any, Literal
 
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -17,36 +21,198 @@ from app.config import Settings
 from app.models.base import Base  # Import Base from models
 
 
+class SQLiteConnectionProfile(BaseModel):
+    """Per-connection SQLite PRAGMA settings.
+
+    SQLite scopes these PRAGMAs to a single connection, so the profile is applied
+    from an engine ``connect`` hook to every connection the pool opens.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    mmap_size: int  # bytes, 0 disables memory-mapped I/O
+    busy_timeout: int  # milliseconds to wait on a locked database
+    cache_size: int  # negative values are KiB, positive values are pages
+    temp_store: Literal["DEFAULT", "FILE", "MEMORY"]
+    synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"]
+    wal_autocheckpoint: int  # pages, 0 disables automatic checkpoints
+    foreign_keys: bool
+
+    def pragmas(self) -> list[str]:
+        """Return the PRAGMA statements for this profile."""
+        return [
+            f"PRAGMA mmap_size={self.mmap_size}",
+            f"PRAGMA busy_timeout={self.busy_timeout}",
+            f"PRAGMA cache_size={self.cache_size}",
+            f"PRAGMA temp_store={self.temp_store}",
+            f"PRAGMA synchronous={self.synchronous}",
+            f"PRAGMA wal_autocheckpoint={self.wal_autocheckpoint}",
+            f"PRAGMA foreign_keys={'ON' if self.foreign_keys else 'OFF'}",
+        ]
+
+    def apply(self, dbapi_connection: Any, _connection_record: Any) -> None:
+        """Apply the profile to a new DBAPI connection (engine ``connect`` hook)."""
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in self.pragmas():
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+CONNECTION_PROFILES: dict[str, SQLiteConnectionProfile] = {
+    # Small RAM, slow random writes: modest cache, long busy wait and fewer
+    # WAL checkpoints so the card sees larger, less frequent writes.
+    "raspberry-pi-sd": SQLiteConnectionProfile(
+        name="raspberry-pi-sd",
+        mmap_size=64 * 1024 * 1024,
+        busy_timeout=10_000,
+        cache_size=-16_000,
+        temp_store="MEMORY",
+        synchronous="NORMAL",
+        wal_autocheckpoint=4_000,
+        foreign_keys=True,
+    ),
+    "ssd": SQLiteConnectionProfile(
+        name="ssd",
+        mmap_size=256 * 1024 * 1024,
+        busy_timeout=5_000,
+        cache_size=-64_000,
+        temp_store="MEMORY",
+        synchronous="NORMAL",
+        wal_autocheckpoint=1_000,
+        foreign_keys=True,
+    ),
+    # Throwaway in-memory databases: durability is irrelevant.
+    "test-memory": SQLiteConnectionProfile(
+        name="test-memory",
+        mmap_size=0,
+        busy_timeout=1_000,
+        cache_size=-8_000,
+        temp_store="MEMORY",
+        synchronous="OFF",
+        wal_autocheckpoint=0,
+        foreign_keys=True,
+    ),
+}
+
+
+def get_connection_profile(name: str) -> SQLiteConnectionProfile | None:
+    """Look up a connection profile by name; ``"none"`` disables tuning."""
+    if name == "none":
+        return None
+    try:
+        return CONNECTION_PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown SQLite connection profile: {name}") from None
+
+
+def _enable_query_only(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Refuse writes on read pool connections even if the URI flag is ignored."""
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA query_only=ON")
+    finally:
+        cursor.close()
+
+
 class DatabaseManager:
-    """Manages database engine and session factory."""
+    """Manages database engines and session factories.
+
+    For file-backed SQLite databases the manager keeps two engines: a writer
+    limited to a single connection and a read-only pool opened with
+    ``mode=ro``. In WAL mode readers never wait on the writer, and writers
+    queue on the pool instead of failing with ``database is locked``. Other
+    databases (and in-memory SQLite) share one engine for both roles.
+    """
 
     def __init__(self, settings: Settings) -> None:
         """Initialize database manager."""
         self.settings = settings
         self._engine: AsyncEngine | None = None
+        self._read_engine: AsyncEngine | None = None
         self._session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._read_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+    @property
+    def is_sqlite(self) -> bool:
+        """Whether the configured database is SQLite."""
+        return "sqlite" in self.settings.database_url
+
+    @property
+    def is_in_memory(self) -> bool:
+        """Whether the database is in-memory SQLite, where all sessions share one connection."""
+        if not self.is_sqlite:
+            return False
+        url = make_url(self.settings.database_url)
+        return (url.database or "") in ("", ":memory:") or url.query.get("mode") == "memory"
+
+    @property
+    def uses_read_pool(self) -> bool:
+        """Whether reads go through a separate read-only SQLite pool."""
+        if not self.is_sqlite or self.settings.database_read_pool_size < 1:
+            return False
+        return not self.is_in_memory
+
+    def _apply_connection_profile(self, engine: AsyncEngine) -> None:
+        if not self.is_sqlite:
+            return
+        profile = get_connection_profile(self.settings.database_connection_profile)
+        if profile is not None:
+            event.listen(engine.sync_engine, "connect", profile.apply)
 
     def get_engine(self) -> AsyncEngine:
-        """Get or create async engine with SQLite optimizations."""
+        """Get or create the writer engine with SQLite optimizations."""
         if self._engine is None:
             connect_args: dict[str, Any] = {}
+            engine_args: dict[str, Any] = {}
 
-            if "sqlite" in self.settings.database_url:
+            if self.is_sqlite:
                 # SQLite-specific optimizations
                 connect_args = {
                     "check_same_thread": False,
                 }
 
+            if self.uses_read_pool:
+                # SQLite allows one writer at a time; queue on the pool, not the file lock
+                engine_args = {"pool_size": 1, "max_overflow": 0}
+
             self._engine = create_async_engine(
                 self.settings.database_url,
                 echo=self.settings.database_echo,
                 connect_args=connect_args,
                 pool_pre_ping=True,
+                **engine_args,
             )
+            self._apply_connection_profile(self._engine)
         return self._engine
 
+    def get_read_engine(self) -> AsyncEngine:
+        """Get or create the read-only engine (the writer engine if there is no read pool)."""
+        if not self.uses_read_pool:
+            return self.get_engine()
+        if self._read_engine is None:
+            url = make_url(self.settings.database_url)
+            database = Path(url.database or "").expanduser().resolve()
+            read_url = url.set(
+                database=f"file:{database}",
+                query={**url.query, "mode": "ro", "uri": "true"},
+            )
+            self._read_engine = create_async_engine(
+                read_url,
+                echo=self.settings.database_echo,
+                connect_args={"check_same_thread": False},
+                pool_pre_ping=True,
+                pool_size=self.settings.database_read_pool_size,
+                max_overflow=0,
+            )
+            self._apply_connection_profile(self._read_engine)
+            event.listen(self._read_engine.sync_engine, "connect", _enable_query_only)
+        return self._read_engine
+
     def get_session_factory(self) -> async_sessionmaker[AsyncSession]:
-        """Get or create session factory."""
+        """Get or create the writer session factory."""
         if self._session_factory is None:
             self._session_factory = async_sessionmaker(
                 bind=self.get_engine(),
@@ -55,30 +221,59 @@ class DatabaseManager:
             )
         return self._session_factory
 
+    def get_read_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Get or create the read-only session factory."""
+        if self._read_session_factory is None:
+            self._read_session_factory = async_sessionmaker(
+                bind=self.get_read_engine(),
+                class_=AsyncSession,
+                expire_on_commit=False,
+                autoflush=False,
+            )
+        return self._read_session_factory
+
     async def init_db(self) -> None:
-        """Initialize database with WAL mode for SQLite and create tables."""
+        """Initialize database with WAL mode for SQLite and prepare the schema.
+
+        ``database_schema_mode`` picks how: ``create_all`` (reflect and create
+        missing tables), ``check`` (compare the Alembic revision with head and
+        skip DDL) or ``migrate`` (upgrade to head under a file lock).
+        """
         from sqlalchemy import text
 
         engine = self.get_engine()
 
-        # Enable WAL mode for SQLite
-        if "sqlite" in self.settings.database_url:
+        # Enable WAL mode for SQLite. journal_mode is persisted in the database file;
+        # the per-connection PRAGMAs come from the connection profile hook.
+        # auto_vacuum only takes on a new, empty database (see app.core.retention).
+        if self.is_sqlite:
             async with engine.begin() as conn:
+                await conn.execute(text("PRAGMA auto_vacuum=INCREMENTAL"))
                 await conn.execute(text("PRAGMA journal_mode=WAL"))
-                await conn.execute(text("PRAGMA synchronous=NORMAL"))
-                await conn.execute(text("PRAGMA cache_size=-64000"))  # 64MB cache
-                await conn.execute(text("PRAGMA temp_store=MEMORY"))
 
-        # Create all tables
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+        mode = self.settings.database_schema_mode
+        if mode == "check":
+            from app.core.migrations import check_schema
+
+            await check_schema(engine, self.settings.database_url)
+        elif mode == "migrate":
+            from app.core.migrations import migrate_schema
+
+            await migrate_schema(engine, self.settings.database_url)
+        else:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
 
     async def close(self) -> None:
         """Close database connections."""
+        if self._read_engine is not None:
+            await self._read_engine.dispose()
+            self._read_engine = None
         if self._engine is not None:
             await self._engine.dispose()
             self._engine = None
-            self._session_factory = None
+        self._session_factory = None
+        self._read_session_factory = None
 
 
 # Global database manager instance
@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
+from typing import Any
 
+from litestar import Request
 from litestar.datastructures import State
+from litestar.di import Provide
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.completion_cache import BYPASS_HEADER, BYPASS_VALUE, CompletionCache
+from app.core.enrichment import EnrichmentQueue
+from app.core.inflight import InflightCoalescer
+from app.core.ingredient_batcher import IngredientBatcher
+from app.core.ingredient_classifier import IngredientClassifier
+from app.core.write_queue import WriteQueue
 from app.repositories import (
     IngredientRepository,
     RecipeIngredientRepository,
@@ -15,6 +24,9 @@ from app.repositories import (
 )
 from app.services import IngredientService, RecipeService, SuggestionService
 
+# Builds the suggestion service on demand, for handlers that need it only on some paths
+SuggestionServiceFactory = Callable[[], SuggestionService]
+
 
 # Layer 1: Database Session
 async def provide_db_session(state: State) -> AsyncGenerator[AsyncSession, None]:
@@ -28,6 +40,51 @@ async def provide_db_session(state: State) -> AsyncGenerator[AsyncSession, None]
             raise
 
 
+async def provide_read_db_session(state: State) -> AsyncGenerator[AsyncSession, None]:
+    """Provide read-only database session as dependency (never commits)."""
+    async with state.read_session_factory() as session:
+        yield session
+
+
+async def provide_write_queue(state: State) -> WriteQueue | None:
+    """Provide the group-commit write queue when write coalescing is enabled."""
+    return state.get("write_queue")
+
+
+async def provide_completion_cache(
+    state: State, request: Request[Any, Any, Any]
+) -> CompletionCache | None:
+    """Provide the Marvin completion cache, unless disabled or bypassed by the request."""
+    if request.headers.get(BYPASS_HEADER, "").lower() == BYPASS_VALUE:
+        return None
+    return state.get("completion_cache")
+
+
+async def provide_completion_coalescer(state: State) -> InflightCoalescer | None:
+    """Provide the coalescer shared by identical in-flight Marvin completions."""
+    return state.get("completion_coalescer")
+
+
+async def provide_ingredient_batcher(state: State) -> IngredientBatcher | None:
+    """Provide the batcher grouping concurrent ingredient completions, unless disabled."""
+    return state.get("ingredient_batcher")
+
+
+async def provide_ingredient_classifier(state: State) -> IngredientClassifier | None:
+    """Provide the local ingredient classifier, unless disabled."""
+    return state.get("ingredient_classifier")
+
+
+async def provide_enrichment_queue(state: State) -> EnrichmentQueue | None:
+    """Provide the background ingredient enrichment queue, unless disabled."""
+    return state.get("enrichment_queue")
+
+
+# Handler-level override that routes a read-only endpoint to the read pool.
+# Repositories and services are unchanged; they simply receive the read session.
+READ_ONLY_DEPENDENCIES = {"db_session": Provide(provide_read_db_session)}
+
+
 # Layer 2: Repositories
 async def provide_ingredient_repository(db_session: AsyncSession) -> IngredientRepository:
     """Provide ingredient repository."""
@@ -46,17 +103,25 @@ async def provide_recipe_ingredient_repository(
     return RecipeIngredientRepository(db_session)
 
 
-async def provide_suggestion_repository(db_session: AsyncSession) -> SuggestionRepository:
+async def provide_suggestion_repository(
+    db_session: AsyncSession,
+    completion_cache: CompletionCache | None,
+    completion_coalescer: InflightCoalescer | None,
+    ingredient_batcher: IngredientBatcher | None,
+) -> SuggestionRepository:
     """Provide suggestion repository."""
-    return SuggestionRepository(db_session)
+    return SuggestionRepository(
+        db_session, completion_cache, completion_coalescer, ingredient_batcher
+    )
 
 
 # Layer 3: Services
 async def provide_ingredient_service(
     ingredient_repository: IngredientRepository,
+    write_queue: WriteQueue | None,
 ) -> IngredientService:
     """Provide ingredient service."""
-    return IngredientService(ingredient_repository)
+    return IngredientService(ingredient_repository, write_queue)
 
 
 async def provide_suggestion_service(
@@ -66,14 +131,34 @@ async def provide_suggestion_service(
     return SuggestionService(suggestion_repository)
 
 
+async def provide_suggestion_service_factory(
+    db_session: AsyncSession,
+    completion_cache: CompletionCache | None,
+    completion_coalescer: InflightCoalescer | None,
+    ingredient_batcher: IngredientBatcher | None,
+) -> SuggestionServiceFactory:
+    """Provide a factory for the suggestion service, so it is only built when used."""
+
+    def build() -> SuggestionService:
+        return SuggestionService(
+            SuggestionRepository(
+                db_session, completion_cache, completion_coalescer, ingredient_batcher
+            )
+        )
+
+    return build
+
+
 async def provide_recipe_service(
     recipe_repository: RecipeRepository,
     recipe_ingredient_repository: RecipeIngredientRepository,
     ingredient_repository: IngredientRepository,
+    write_queue: WriteQueue | None,
 ) -> RecipeService:
     """Provide recipe service."""
     return RecipeService(
         recipe_repository,
         recipe_ingredient_repository,
         ingredient_repository,
+        write_queue,
     )
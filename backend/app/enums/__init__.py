@@ -1,5 +1,7 @@
 """Shared enumeration definitions for the backend."""
 
+from .bitmask import enum_bit, enum_mask
+from .pagination import ListView, TotalMode
 from .recipe import (
     AllergenType,
     CookingMethod,
@@ -12,6 +14,7 @@ from .recipe import (
     TemperatureLevel,
     ThermalTreatment,
 )
+from .transfer import ImportFormat
 
 __all__ = [
     "MechanicalTreatment",
@@ -24,4 +27,9 @@ __all__ = [
     "AllergenType",
     "IngredientCategory",
     "StorageType",
+    "TotalMode",
+    "ListView",
+    "ImportFormat",
+    "enum_bit",
+    "enum_mask",
 ]
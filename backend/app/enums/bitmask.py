@@ -0,0 +1,29 @@
+"""Bitmask encoding of enum lists for indexed filtering.
+
+Each member owns the bit at its position in the enum definition, so a list
+of members is one integer and "has any / all / none of" filters become
+bitwise tests. Stored masks depend on that order: add new members at the
+end of an enum and never reorder or remove existing ones.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from enum import Enum
+
+
+def enum_bit(member: Enum) -> int:
+    """The single bit of ``member``."""
+    return 1 << list(type(member)).index(member)
+
+
+def enum_mask(enum: type[Enum], values: Iterable[str | Enum] | None) -> int:
+    """OR of the bits of ``values``; strings are member values, unknown ones are ignored."""
+    mask = 0
+    for value in values or ():
+        try:
+            member = value if isinstance(value, enum) else enum(value)
+        except ValueError:
+            continue
+        mask |= enum_bit(member)
+    return mask
@@ -0,0 +1,20 @@
+"""Enumerations for list endpoints."""
+
+from __future__ import annotations
+
+from enum import Enum
+
+
+class TotalMode(str, Enum):
+    """How a list endpoint computes its ``total``."""
+
+    NONE = "none"  # skip counting; total is null
+    EXACT = "exact"  # exact count in the page query (scalar subquery)
+    ESTIMATE = "estimate"  # planner statistics when available, else exact
+
+
+class ListView(str, Enum):
+    """How much of each row a list endpoint returns."""
+
+    FULL = "full"  # every field, including nested ingredients
+    SUMMARY = "summary"  # identifying and filterable fields only
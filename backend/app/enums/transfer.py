@@ -0,0 +1,12 @@
+"""Enumerations for bulk import and export."""
+
+from __future__ import annotations
+
+from enum import Enum
+
+
+class ImportFormat(str, Enum):
+    """File format of a bulk import."""
+
+    CSV = "csv"  # header row, then one row per record
+    JSONL = "jsonl"  # one JSON object per line
@@ -8,11 +8,26 @@ from contextlib import asynccontextmanager
 from litestar import Litestar
 
 from app.config import get_settings
+from app.core.completion_cache import CompletionCache
+from app.core.enrichment import EnrichmentQueue, marvin_completer
+from app.core.inflight import InflightCoalescer
+from app.core.ingredient_batcher import IngredientBatcher
+from app.core.ingredient_classifier import IngredientClassifier
+from app.core.marvin_config import warm_marvin
+from app.core.retention import RetentionJob
+from app.core.write_queue import WriteQueue
 from app.database import get_db_manager
 from app.logging import configure_logging, get_logger
 
 # Import models to register them with Base.metadata
-from app.models import ingredient, recipe, recipe_ingredient  # noqa: F401
+from app.models import (  # noqa: F401
+    archive,
+    completion_cache,
+    enrichment_job,
+    ingredient,
+    recipe,
+    recipe_ingredient,
+)
 
 logger = get_logger(__name__)
 
@@ -30,8 +45,89 @@ async def lifespan(app: Litestar) -> AsyncGenerator[None, None]:
     db_manager = get_db_manager(settings)
     await db_manager.init_db()
 
-    # Store session factory in app state
+    # Store session factories in app state (writer and read-only pool)
     app.state.session_factory = db_manager.get_session_factory()
+    app.state.read_session_factory = db_manager.get_read_session_factory()
+
+    # Optional single-writer group commit for concurrent mutations
+    write_queue: WriteQueue | None = None
+    if settings.database_write_coalescing:
+        write_queue = WriteQueue(
+            db_manager.get_session_factory(),
+            max_batch_size=settings.database_write_batch_size,
+            max_delay_ms=settings.database_write_batch_window_ms,
+        )
+        await write_queue.start()
+    app.state.write_queue = write_queue
+
+    # Marvin is configured on the first AI call; warming does it (and connects) now
+    if settings.marvin_warm_on_startup and settings.openai_api_key:
+        await warm_marvin()
+
+    # Marvin completion cache (in-memory LRU over the completion_cache table)
+    app.state.completion_cache = (
+        CompletionCache(
+            db_manager.get_session_factory(),
+            ttl_seconds=settings.marvin_cache_ttl_seconds,
+            max_entries=settings.marvin_cache_max_entries,
+        )
+        if settings.marvin_cache_enabled
+        else None
+    )
+    # Identical concurrent completions share one Marvin call
+    app.state.completion_coalescer = InflightCoalescer()
+    # Concurrent single ingredient completions share one Marvin call
+    app.state.ingredient_batcher = (
+        IngredientBatcher(
+            window_ms=settings.marvin_batch_window_ms,
+            max_batch_size=settings.marvin_batch_max_size,
+        )
+        if settings.marvin_batch_enabled
+        else None
+    )
+    # Well-known ingredients are completed from a lexicon, without Marvin
+    app.state.ingredient_classifier = (
+        IngredientClassifier(settings.ingredient_classifier_threshold)
+        if settings.ingredient_classifier_enabled
+        else None
+    )
+
+    # Ingredients the classifier does not know are completed in the background.
+    # Not on in-memory SQLite: its single shared connection cannot host the
+    # workers' transactions next to the requests'
+    enrichment_queue: EnrichmentQueue | None = None
+    if settings.ingredient_enrichment_background and not db_manager.is_in_memory:
+        enrichment_queue = EnrichmentQueue(
+            db_manager.get_session_factory(),
+            marvin_completer(
+                db_manager.get_session_factory(),
+                cache=app.state.completion_cache,
+                coalescer=app.state.completion_coalescer,
+                batcher=app.state.ingredient_batcher,
+            ),
+            workers=settings.ingredient_enrichment_workers,
+            # Claim enough jobs at once for their drafts to fill a batch
+            jobs_per_worker=(
+                settings.marvin_batch_max_size if settings.marvin_batch_enabled else 1
+            ),
+            max_attempts=settings.ingredient_enrichment_max_attempts,
+            backoff_seconds=settings.ingredient_enrichment_backoff_seconds,
+        )
+        await enrichment_queue.start()
+    app.state.enrichment_queue = enrichment_queue
+
+    # Optional background purge of long soft-deleted rows
+    retention_job: RetentionJob | None = None
+    if settings.retention_enabled:
+        retention_job = RetentionJob(
+            db_manager.get_session_factory(),
+            db_manager.get_engine(),
+            retention_days=settings.retention_days,
+            batch_size=settings.retention_batch_size,
+            pause_ms=settings.retention_batch_pause_ms,
+            interval_hours=settings.retention_interval_hours,
+        )
+        await retention_job.start()
 
     logger.info("application_started")
 
@@ -40,5 +136,11 @@ async def lifespan(app: Litestar) -> AsyncGenerator[None, None]:
     finally:
         # Cleanup
         logger.info("shutting_down_application")
+        if retention_job is not None:
+            await retention_job.stop()
+        if enrichment_queue is not None:
+            await enrichment_queue.stop()
+        if write_queue is not None:
+            await write_queue.stop()
         await db_manager.close()
         logger.info("application_stopped")
@@ -12,10 +12,16 @@ from litestar.response import Response
 from litestar.static_files import create_static_files_router
 from litestar.status_codes import HTTP_404_NOT_FOUND, HTTP_422_UNPROCESSABLE_ENTITY
 
+from app.cli import MenooCLIPlugin
 from app.config import get_settings
 from app.controllers import ingredients, recipes, suggestions
 from app.dependencies import (
+    provide_completion_cache,
+    provide_completion_coalescer,
     provide_db_session,
+    provide_enrichment_queue,
+    provide_ingredient_batcher,
+    provide_ingredient_classifier,
     provide_ingredient_repository,
     provide_ingredient_service,
     provide_recipe_ingredient_repository,
@@ -23,6 +29,8 @@ from app.dependencies import (
     provide_recipe_service,
     provide_suggestion_repository,
     provide_suggestion_service,
+    provide_suggestion_service_factory,
+    provide_write_queue,
 )
 from app.events import lifespan
 
@@ -105,6 +113,12 @@ def create_app() -> Litestar:
         dependencies={
             # Layer 1: Database
             "db_session": Provide(provide_db_session),
+            "write_queue": Provide(provide_write_queue),
+            "completion_cache": Provide(provide_completion_cache),
+            "completion_coalescer": Provide(provide_completion_coalescer),
+            "ingredient_batcher": Provide(provide_ingredient_batcher),
+            "ingredient_classifier": Provide(provide_ingredient_classifier),
+            "enrichment_queue": Provide(provide_enrichment_queue),
             # Layer 2: Repositories
             "ingredient_repository": Provide(provide_ingredient_repository),
             "recipe_repository": Provide(provide_recipe_repository),
@@ -114,11 +128,12 @@ def create_app() -> Litestar:
             "ingredient_service": Provide(provide_ingredient_service),
             "recipe_service": Provide(provide_recipe_service),
             "suggestion_service": Provide(provide_suggestion_service),
+            "suggestion_service_factory": Provide(provide_suggestion_service_factory),
         },
         cors_config=cors_config,
         openapi_config=openapi_config,
         lifespan=[lifespan],
-        plugins=[PydanticPlugin()],
+        plugins=[PydanticPlugin(), MenooCLIPlugin()],
         exception_handlers={
             ValidationException: validation_exception_handler,
             ValueError: value_error_handler,
@@ -1,16 +1,34 @@
 """Models package."""
 
-from app.models.base import Base, IDMixin, SoftDeleteMixin, TimestampMixin
+from app.models.archive import ArchivedRow
+from app.models.base import (
+    Base,
+    IDMixin,
+    SoftDeleteMixin,
+    TimestampMixin,
+    deleted_index,
+    live_index,
+)
+from app.models.completion_cache import CompletionCacheEntry
+from app.models.enrichment_job import EnrichmentJob
 from app.models.ingredient import Ingredient
 from app.models.recipe import Recipe
 from app.models.recipe_ingredient import RecipeIngredient
+from app.models.search import INGREDIENT_FTS_TABLE, RECIPE_FTS_TABLE
 
 __all__ = [
     "Base",
     "IDMixin",
     "TimestampMixin",
     "SoftDeleteMixin",
+    "deleted_index",
+    "live_index",
     "Ingredient",
     "Recipe",
     "RecipeIngredient",
+    "ArchivedRow",
+    "CompletionCacheEntry",
+    "EnrichmentJob",
+    "INGREDIENT_FTS_TABLE",
+    "RECIPE_FTS_TABLE",
 ]
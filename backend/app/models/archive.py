@@ -0,0 +1,32 @@
+"""Archive of purged soft-deleted rows."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, IDMixin
+
+
+class ArchivedRow(Base, IDMixin):
+    """A purged row kept as one JSON document.
+
+    Recipes carry their ingredient associations in ``data["ingredients"]``.
+    """
+
+    __tablename__ = "archived_rows"
+
+    table_name: Mapped[str] = mapped_column(String(50), nullable=False)
+    row_id: Mapped[int] = mapped_column(nullable=False)
+    deleted_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    archived_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    data: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+
+    __table_args__ = (Index("idx_archived_row_table_row", "table_name", "row_id"),)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<ArchivedRow(table={self.table_name}, row_id={self.row_id})>"
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import DateTime, Integer
+from sqlalchemy import DateTime, Index, Integer
 from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column
 
 
@@ -49,3 +50,30 @@ class SoftDeleteMixin:
     def is_deleted(cls) -> Mapped[bool]:
         """Soft delete flag."""
         return mapped_column(default=False, nullable=False)
+
+    @declared_attr
+    def deleted_at(cls) -> Mapped[datetime | None]:
+        """When the row was soft-deleted; the retention job purges by it."""
+        return mapped_column(DateTime, nullable=True)
+
+    def mark_deleted(self) -> None:
+        """Soft-delete this row now."""
+        self.is_deleted = True
+        self.deleted_at = datetime.utcnow()
+
+
+def live_index(name: str, model: type[SoftDeleteMixin], *expressions: Any) -> Index:
+    """Partial index over the rows that are not soft-deleted.
+
+    The predicate is the ``is_deleted IS false`` term every repository query
+    carries, so both SQLite and PostgreSQL can prove the index applies while
+    deleted rows take no index space.
+    """
+    live = model.is_deleted.is_(False)
+    return Index(name, *expressions, sqlite_where=live, postgresql_where=live)
+
+
+def deleted_index(name: str, model: type[SoftDeleteMixin], *expressions: Any) -> Index:
+    """Partial index over soft-deleted rows only (see :func:`live_index`)."""
+    deleted = model.is_deleted.is_(True)
+    return Index(name, *expressions, sqlite_where=deleted, postgresql_where=deleted)
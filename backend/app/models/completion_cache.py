@@ -0,0 +1,29 @@
+"""Persistent tier of the Marvin completion cache."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class CompletionCacheEntry(Base):
+    """Completions Marvin returned for one request, stored as JSON until ``expires_at``."""
+
+    __tablename__ = "completion_cache"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    target: Mapped[str] = mapped_column(String(50), nullable=False)
+    data: Mapped[list[dict[str, Any]]] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    __table_args__ = (Index("idx_completion_cache_expires_at", "expires_at"),)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<CompletionCacheEntry(target={self.target}, key={self.key[:12]})>"
@@ -0,0 +1,40 @@
+"""Queue of ingredients waiting for their AI-filled fields."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, IDMixin
+
+
+class EnrichmentJob(Base, IDMixin):
+    """One ingredient to complete with Marvin once ``run_after`` has passed.
+
+    ``draft`` holds the fields the client sent, which the completion keeps.
+    A worker leases a job by moving ``run_after`` forward, so a job held by a
+    worker that died is picked up again when the lease runs out.
+    """
+
+    __tablename__ = "enrichment_jobs"
+
+    ingredient_id: Mapped[int] = mapped_column(
+        ForeignKey("ingredients.id", ondelete="CASCADE"), unique=True, nullable=False
+    )
+    draft: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    run_after: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (Index("idx_enrichment_jobs_run_after", "run_after"),)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"<EnrichmentJob(id={self.id}, ingredient_id={self.ingredient_id}, "
+            f"attempts={self.attempts})>"
+        )
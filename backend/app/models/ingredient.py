@@ -5,11 +5,18 @@ from __future__ import annotations
 from datetime import date
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Date, Index, Numeric, String, Text
+from sqlalchemy import Boolean, Date, Index, Numeric, String, Text, false, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.enums import IngredientCategory
-from app.models.base import Base, IDMixin, SoftDeleteMixin, TimestampMixin
+from app.models.base import (
+    Base,
+    IDMixin,
+    SoftDeleteMixin,
+    TimestampMixin,
+    deleted_index,
+    live_index,
+)
 
 if TYPE_CHECKING:
     from app.models.recipe_ingredient import RecipeIngredient
@@ -26,6 +33,10 @@ class Ingredient(Base, IDMixin, TimestampMixin, SoftDeleteMixin):
     quantity: Mapped[float | None] = mapped_column(Numeric(12, 3), nullable=True)
     expiry_date: Mapped[date | None] = mapped_column(Date, nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Saved before its AI-filled fields; an enrichment job will patch them in
+    enrichment_pending: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default=false(), nullable=False
+    )
 
     # Relationships
     recipe_associations: Mapped[list[RecipeIngredient]] = relationship(
@@ -42,10 +53,32 @@ class Ingredient(Base, IDMixin, TimestampMixin, SoftDeleteMixin):
         )
 
 
-# Create composite index for common queries
-Index(
-    "idx_ingredient_category_location_deleted",
+# Live-row lookups; each filter index ends in (name, id) so a filtered list
+# page is read in order instead of sorted
+live_index("idx_ingredient_live_name_id", Ingredient, Ingredient.name, Ingredient.id)
+live_index(
+    "idx_ingredient_live_category",
+    Ingredient,
     Ingredient.category,
+    Ingredient.name,
+    Ingredient.id,
+)
+live_index(
+    "idx_ingredient_live_storage_location",
+    Ingredient,
     Ingredient.storage_location,
-    Ingredient.is_deleted,
+    Ingredient.name,
+    Ingredient.id,
 )
+live_index("idx_ingredient_live_expiry_date", Ingredient, Ingredient.expiry_date)
+
+# One ingredient per name regardless of case; the conflict target of the create upsert
+Index("uq_ingredient_lower_name", func.lower(Ingredient.name), unique=True)
+
+# Case-insensitive name lookups and autocomplete prefix ranges; covers (id, name)
+live_index(
+    "idx_ingredient_live_lower_name", Ingredient, func.lower(Ingredient.name), Ingredient.name
+)
+
+# Retention purge candidates, oldest deletion first
+deleted_index("idx_ingredient_deleted_at", Ingredient, Ingredient.deleted_at)
@@ -2,16 +2,48 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-from sqlalchemy import JSON, Float, Index, Numeric, String, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-
-from app.models.base import Base, IDMixin, SoftDeleteMixin, TimestampMixin
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import JSON, Float, Integer, Numeric, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
+
+from app.enums import AllergenType, CuisineType, DietaryRequirement, MealType, enum_mask
+from app.models.base import (
+    Base,
+    IDMixin,
+    SoftDeleteMixin,
+    TimestampMixin,
+    deleted_index,
+    live_index,
+)
 
 if TYPE_CHECKING:
     from app.models.recipe_ingredient import RecipeIngredient
 
+# Enum list column -> (bitmask column, enum); the masks are what list filters query
+TAG_MASKS: dict[str, tuple[str, type[Enum]]] = {
+    "cuisine_types": ("cuisine_mask", CuisineType),
+    "meal_types": ("meal_mask", MealType),
+    "dietary_requirements": ("dietary_mask", DietaryRequirement),
+    "contains_allergens": ("allergen_mask", AllergenType),
+}
+
+
+def _mask_column(list_column: str) -> Mapped[int]:
+    """Bitmask column kept in sync with the enum list column ``list_column``.
+
+    ORM writes set it through :meth:`Recipe._sync_tag_mask`; the column
+    default derives it from the row being inserted so Core bulk inserts
+    that bypass the ORM get it too.
+    """
+    enum = TAG_MASKS[list_column][1]
+
+    def default(context: Any) -> int:
+        return enum_mask(enum, context.get_current_parameters().get(list_column))
+
+    return mapped_column(Integer, default=default, server_default="0", nullable=False)
+
 
 class Recipe(Base, IDMixin, TimestampMixin, SoftDeleteMixin):
     """Recipe model."""
@@ -32,6 +64,11 @@ class Recipe(Base, IDMixin, TimestampMixin, SoftDeleteMixin):
     contains_allergens: Mapped[list[str]] = mapped_column(JSON, default=list, nullable=False)
     allergen_warnings: Mapped[str | None] = mapped_column(Text, nullable=True)
 
+    cuisine_mask: Mapped[int] = _mask_column("cuisine_types")
+    meal_mask: Mapped[int] = _mask_column("meal_types")
+    dietary_mask: Mapped[int] = _mask_column("dietary_requirements")
+    allergen_mask: Mapped[int] = _mask_column("contains_allergens")
+
     timing: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
     prep_time_minutes: Mapped[int | None] = mapped_column(nullable=True)
     cook_time_minutes: Mapped[int | None] = mapped_column(nullable=True)
@@ -66,6 +103,13 @@ class Recipe(Base, IDMixin, TimestampMixin, SoftDeleteMixin):
         lazy="selectin",
     )
 
+    @validates(*TAG_MASKS)
+    def _sync_tag_mask(self, key: str, values: list[str] | None) -> list[str] | None:
+        """Recompute the bitmask column whenever an enum list is assigned."""
+        mask_column, enum = TAG_MASKS[key]
+        setattr(self, mask_column, enum_mask(enum, values))
+        return values
+
     @property
     def ingredients(self) -> list[dict]:
         """Return full ingredient preparation specs for serialization."""
@@ -95,6 +139,24 @@ class Recipe(Base, IDMixin, TimestampMixin, SoftDeleteMixin):
         return f"<Recipe(id={self.id}, name={self.name})>"
 
 
-# Indexes for common queries
-Index("idx_recipe_method_deleted", Recipe.cooking_method, Recipe.is_deleted)
-Index("idx_recipe_author_deleted", Recipe.author, Recipe.is_deleted)
+# Live-row lookups; each filter index ends in (name, id) so a filtered list
+# page is read in order instead of sorted. The plain (name, id) index also
+# carries the tag masks, so tag-filtered pages and their counts are tested
+# inside the index; is_deleted is a column too because SQLite only treats a
+# partial index as covering when its predicate columns are in it
+live_index(
+    "idx_recipe_live_tags",
+    Recipe,
+    Recipe.name,
+    Recipe.id,
+    Recipe.cuisine_mask,
+    Recipe.meal_mask,
+    Recipe.dietary_mask,
+    Recipe.allergen_mask,
+    Recipe.is_deleted,
+)
+live_index("idx_recipe_live_cooking_method", Recipe, Recipe.cooking_method, Recipe.name, Recipe.id)
+live_index("idx_recipe_live_author", Recipe, Recipe.author, Recipe.name, Recipe.id)
+
+# Retention purge candidates, oldest deletion first
+deleted_index("idx_recipe_deleted_at", Recipe, Recipe.deleted_at)
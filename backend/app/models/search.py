@@ -0,0 +1,151 @@
+"""Full-text search structures that live outside the ORM tables.
+
+SQLite gets FTS5 external-content tables kept in sync by triggers; the index
+stores only tokens, the text stays in the base table:
+
+* ``recipes_fts`` tokenizes the recipe text columns into (stemmed) words.
+* ``ingredients_fts`` tokenizes ingredient names into trigrams, which serve
+  substring and typo-tolerant lookups.
+
+PostgreSQL gets a generated, weighted ``tsvector`` column with a GIN index on
+recipes and a ``pg_trgm`` GIN index on ingredient names.
+
+These are created with ``Base.metadata.create_all`` via metadata events (and
+by the Alembic migration of the same shape), so databases created before the
+index existed are backfilled on their next boot.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import event, inspect, text
+from sqlalchemy.engine import Connection
+
+from app.models.base import Base
+
+RECIPE_FTS_TABLE = "recipes_fts"
+# Column order matters: bm25() weights and snippet() column indexes follow it
+RECIPE_FTS_COLUMNS = ("name", "description", "instructions", "tags")
+RECIPE_FTS_WEIGHTS = (10.0, 4.0, 1.0, 6.0)
+INGREDIENT_FTS_TABLE = "ingredients_fts"
+
+SQLITE_RECIPE_FTS_DDL = (
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {RECIPE_FTS_TABLE} USING fts5(
+        name, description, instructions, tags,
+        content='recipes', content_rowid='id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS recipes_fts_ai AFTER INSERT ON recipes BEGIN
+        INSERT INTO {RECIPE_FTS_TABLE}(rowid, name, description, instructions, tags)
+        VALUES (new.id, new.name, new.description, new.instructions, new.tags);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS recipes_fts_ad AFTER DELETE ON recipes BEGIN
+        INSERT INTO {RECIPE_FTS_TABLE}({RECIPE_FTS_TABLE}, rowid, name, description,
+                                       instructions, tags)
+        VALUES ('delete', old.id, old.name, old.description, old.instructions, old.tags);
+    END
+    """,
+    # Only the indexed columns re-index a row; soft deletes and timestamp bumps don't
+    f"""
+    CREATE TRIGGER IF NOT EXISTS recipes_fts_au
+    AFTER UPDATE OF name, description, instructions, tags ON recipes BEGIN
+        INSERT INTO {RECIPE_FTS_TABLE}({RECIPE_FTS_TABLE}, rowid, name, description,
+                                       instructions, tags)
+        VALUES ('delete', old.id, old.name, old.description, old.instructions, old.tags);
+        INSERT INTO {RECIPE_FTS_TABLE}(rowid, name, description, instructions, tags)
+        VALUES (new.id, new.name, new.description, new.instructions, new.tags);
+    END
+    """,
+)
+
+POSTGRES_RECIPE_SEARCH_DDL = (
+    """
+    ALTER TABLE recipes ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(name, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(tags::text, '')), 'B')
+        || setweight(to_tsvector('english', coalesce(description, '')), 'C')
+        || setweight(to_tsvector('english', coalesce(instructions, '')), 'D')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_recipe_search_vector ON recipes USING GIN (search_vector)",
+)
+
+
+SQLITE_INGREDIENT_FTS_DDL = (
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {INGREDIENT_FTS_TABLE} USING fts5(
+        name, content='ingredients', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS ingredients_fts_ai AFTER INSERT ON ingredients BEGIN
+        INSERT INTO {INGREDIENT_FTS_TABLE}(rowid, name) VALUES (new.id, new.name);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS ingredients_fts_ad AFTER DELETE ON ingredients BEGIN
+        INSERT INTO {INGREDIENT_FTS_TABLE}({INGREDIENT_FTS_TABLE}, rowid, name)
+        VALUES ('delete', old.id, old.name);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS ingredients_fts_au AFTER UPDATE OF name ON ingredients BEGIN
+        INSERT INTO {INGREDIENT_FTS_TABLE}({INGREDIENT_FTS_TABLE}, rowid, name)
+        VALUES ('delete', old.id, old.name);
+        INSERT INTO {INGREDIENT_FTS_TABLE}(rowid, name) VALUES (new.id, new.name);
+    END
+    """,
+)
+
+POSTGRES_INGREDIENT_TRGM_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS idx_ingredient_name_trgm "
+    "ON ingredients USING GIN (name gin_trgm_ops)",
+)
+
+
+def _create_fts(connection: Connection, table: str, ddl: tuple[str, ...]) -> None:
+    exists = inspect(connection).has_table(table)
+    for statement in ddl:
+        connection.execute(text(statement))
+    if not exists:
+        # Index rows that were already in the base table
+        connection.execute(text(f"INSERT INTO {table}({table}) VALUES ('rebuild')"))
+
+
+def create_search_indexes(connection: Connection) -> None:
+    """Create the search indexes for the connection's dialect if they are missing."""
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        _create_fts(connection, RECIPE_FTS_TABLE, SQLITE_RECIPE_FTS_DDL)
+        _create_fts(connection, INGREDIENT_FTS_TABLE, SQLITE_INGREDIENT_FTS_DDL)
+    elif dialect == "postgresql":
+        for statement in (*POSTGRES_RECIPE_SEARCH_DDL, *POSTGRES_INGREDIENT_TRGM_DDL):
+            connection.execute(text(statement))
+
+
+def drop_search_indexes(connection: Connection) -> None:
+    """Drop the SQLite FTS tables (triggers and PostgreSQL indexes go with their tables)."""
+    if connection.dialect.name == "sqlite":
+        for table in (RECIPE_FTS_TABLE, INGREDIENT_FTS_TABLE):
+            connection.execute(text(f"DROP TABLE IF EXISTS {table}"))
+
+
+def _after_create(_target: Any, connection: Connection, **_kw: Any) -> None:
+    create_search_indexes(connection)
+
+
+def _before_drop(_target: Any, connection: Connection, **_kw: Any) -> None:
+    drop_search_indexes(connection)
+
+
+# Metadata-level events fire on every create_all, not only when recipes is new
+event.listen(Base.metadata, "after_create", _after_create)
+event.listen(Base.metadata, "before_drop", _before_drop)
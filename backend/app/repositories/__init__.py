@@ -1,13 +1,19 @@
 """Repositories package."""
 
+from app.repositories.completion_cache_repository import CompletionCacheRepository
+from app.repositories.enrichment_job_repository import EnrichmentJobRepository
 from app.repositories.ingredient_repository import IngredientRepository
 from app.repositories.recipe_ingredient_repository import RecipeIngredientRepository
 from app.repositories.recipe_repository import RecipeRepository
+from app.repositories.retention_repository import RetentionRepository
 from app.repositories.suggestion_repository import SuggestionRepository
 
 __all__ = [
+    "CompletionCacheRepository",
+    "EnrichmentJobRepository",
     "IngredientRepository",
     "RecipeRepository",
     "RecipeIngredientRepository",
+    "RetentionRepository",
     "SuggestionRepository",
 ]
@@ -0,0 +1,67 @@
+"""Completion cache repository: the persistent tier of the Marvin cache."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import CompletionCacheEntry
+
+
+class CompletionCacheRepository:
+    """Repository for cached Marvin completions."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with database session."""
+        self.session = session
+
+    async def get(self, key: str, *, now: datetime) -> CompletionCacheEntry | None:
+        """Return the entry stored under ``key`` unless it expired before ``now``."""
+        result = await self.session.execute(
+            select(CompletionCacheEntry).where(
+                CompletionCacheEntry.key == key, CompletionCacheEntry.expires_at > now
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def put(
+        self,
+        key: str,
+        *,
+        target: str,
+        data: list[dict[str, Any]],
+        now: datetime,
+        expires_at: datetime,
+    ) -> None:
+        """Store ``data`` under ``key``, replacing what was there."""
+        values = {
+            "key": key,
+            "target": target,
+            "data": data,
+            "created_at": now,
+            "expires_at": expires_at,
+        }
+        dialect = self.session.bind.dialect.name if self.session.bind is not None else ""
+        insert = pg_insert if dialect == "postgresql" else sqlite_insert
+        statement = insert(CompletionCacheEntry).values(values)
+        await self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[CompletionCacheEntry.key],
+                set_={name: statement.excluded[name] for name in values if name != "key"},
+            )
+        )
+
+    async def delete_expired(self, now: datetime) -> int:
+        """Delete entries that expired before ``now``; returns how many."""
+        result = cast(
+            CursorResult[Any],
+            await self.session.execute(
+                delete(CompletionCacheEntry).where(CompletionCacheEntry.expires_at <= now)
+            ),
+        )
+        return result.rowcount or 0
@@ -0,0 +1,99 @@
+"""Enrichment job repository: the table-backed queue of ingredients to complete."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import EnrichmentJob
+
+
+class EnrichmentJobRepository:
+    """Repository for queued ingredient enrichment jobs."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with database session."""
+        self.session = session
+
+    async def enqueue(self, ingredient_id: int, draft: dict[str, Any], *, now: datetime) -> None:
+        """Queue ``ingredient_id``, or restart its job with the newer ``draft``."""
+        values = {
+            "ingredient_id": ingredient_id,
+            "draft": draft,
+            "attempts": 0,
+            "run_after": now,
+            "last_error": None,
+            "created_at": now,
+        }
+        dialect = self.session.bind.dialect.name if self.session.bind is not None else ""
+        insert = pg_insert if dialect == "postgresql" else sqlite_insert
+        statement = insert(EnrichmentJob).values(values)
+        await self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[EnrichmentJob.ingredient_id],
+                set_={name: statement.excluded[name] for name in values if name != "ingredient_id"},
+            )
+        )
+
+    async def claim(self, *, now: datetime, lease_until: datetime) -> EnrichmentJob | None:
+        """Lease the job that has been due longest, counting the attempt; None if none is due.
+
+        The lease is a conditional update of ``run_after``, so of two workers
+        racing for the same job only one gets it.
+        """
+        while True:
+            job = await self.session.scalar(
+                select(EnrichmentJob)
+                .where(EnrichmentJob.run_after <= now)
+                .order_by(EnrichmentJob.run_after, EnrichmentJob.id)
+                .limit(1)
+            )
+            if job is None:
+                return None
+            result = cast(
+                CursorResult[Any],
+                await self.session.execute(
+                    update(EnrichmentJob)
+                    .where(EnrichmentJob.id == job.id, EnrichmentJob.run_after == job.run_after)
+                    .values(run_after=lease_until, attempts=EnrichmentJob.attempts + 1)
+                    .execution_options(synchronize_session=False)
+                ),
+            )
+            if result.rowcount == 1:
+                await self.session.refresh(job)
+                return job
+
+    async def reschedule(self, job_id: int, *, run_after: datetime, error: str) -> None:
+        """Put a failed job back in the queue until ``run_after``."""
+        await self.session.execute(
+            update(EnrichmentJob)
+            .where(EnrichmentJob.id == job_id)
+            .values(run_after=run_after, last_error=error)
+        )
+
+    async def delete(self, job_id: int) -> None:
+        """Remove a finished or abandoned job."""
+        await self.session.execute(delete(EnrichmentJob).where(EnrichmentJob.id == job_id))
+
+    async def next_run_after(self) -> datetime | None:
+        """When the next job becomes due (or came due), or None for an empty queue."""
+        return await self.session.scalar(select(func.min(EnrichmentJob.run_after)))
+
+    async def depth(self, *, now: datetime) -> dict[str, Any]:
+        """Queued, due and already attempted job counts, and when the oldest was queued."""
+        row = (
+            await self.session.execute(
+                select(
+                    func.count(),
+                    func.count().filter(EnrichmentJob.run_after <= now),
+                    func.count().filter(EnrichmentJob.attempts > 0),
+                    func.min(EnrichmentJob.created_at),
+                ).select_from(EnrichmentJob)
+            )
+        ).one()
+        return {"queued": row[0], "due": row[1], "attempted": row[2], "oldest": row[3]}
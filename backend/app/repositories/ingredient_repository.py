@@ -2,14 +2,135 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
-from datetime import date
+import builtins
+from collections.abc import AsyncIterator, Iterable, Sequence
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import (
+    and_,
+    bindparam,
+    case,
+    column,
+    func,
+    literal,
+    literal_column,
+    select,
+    table,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement, Executable
 
-from app.enums import IngredientCategory
-from app.models import Ingredient
+from app.enums import IngredientCategory, TotalMode
+from app.models import INGREDIENT_FTS_TABLE, Ingredient
+from app.repositories.pagination import fetch_page
+from app.repositories.search import (
+    LIKE_ESCAPE,
+    WORD_SIMILARITY_THRESHOLD,
+    fts5_fuzzy_match,
+    fts5_string,
+    like_escape,
+    prefix_upper_bound,
+    unindexed,
+    word_similarity,
+)
+
+# Trigram candidates re-scored in Python for typo-tolerant matches
+SIMILAR_NAME_CANDIDATES = 200
+
+
+@lru_cache
+def _upsert_statement(
+    dialect: str,
+    columns: tuple[str, ...],
+    merge: frozenset[str],
+    *,
+    borrow_category: bool,
+    returning: bool = True,
+) -> Executable:
+    """Create-or-merge upsert with every value bound, built once per column set.
+
+    Building and compiling the statement costs more than running it, and the
+    service always passes the same columns. Without ``returning`` the
+    statement can run as a plain executemany.
+    """
+    values: dict[str, Any] = {name: bindparam(name) for name in columns}
+    if borrow_category:
+        # NOT NULL is checked before the conflict, so a merge that leaves the
+        # category out borrows the existing row's
+        values["category"] = (
+            select(Ingredient.category)
+            .where(func.lower(Ingredient.name) == func.lower(bindparam("name")))
+            .scalar_subquery()
+        )
+    insert = pg_insert if dialect == "postgresql" else sqlite_insert
+    statement = insert(Ingredient).values(**values)
+    excluded = statement.excluded
+    updates: dict[str, Any] = {name: excluded[name] for name in merge}
+    revived = Ingredient.is_deleted.is_(True)
+    # A revived row starts over: fields the caller left out don't keep the deleted row's values
+    for name in set(columns) - merge - {"name", "quantity"}:
+        updates[name] = case((revived, excluded[name]), else_=getattr(Ingredient, name))
+    updates["quantity"] = case(
+        (revived, excluded.quantity),
+        else_=func.coalesce(Ingredient.quantity, 0) + func.coalesce(excluded.quantity, 0),
+    )
+    updates["is_deleted"] = False
+    updates["deleted_at"] = None
+    # Core upserts don't run the ORM's onupdate hooks
+    updates["updated_at"] = bindparam("merged_at")
+    statement = statement.on_conflict_do_update(
+        index_elements=[func.lower(Ingredient.name)], set_=updates
+    )
+    return statement.returning(Ingredient) if returning else statement
+
+
+@lru_cache
+def _autocomplete_query(dialect: str, *, substring: bool) -> Executable:
+    """Autocomplete statement, built once per dialect since it runs on every keystroke.
+
+    Names starting with the prefix come from a covering range scan on
+    ``lower(name)``. With ``substring``, names containing the prefix follow in
+    the same round trip; SQLite stops reading that arm once the page is full.
+    """
+    lower_name = func.lower(Ingredient.name)
+    starts_with = lower_name.like(bindparam("prefix_pattern"), escape=LIKE_ESCAPE)
+    prefixed = (
+        select(Ingredient.id, Ingredient.name)
+        .where(
+            Ingredient.is_deleted.is_(False),
+            lower_name >= bindparam("prefix"),
+            lower_name < bindparam("prefix_end"),
+            starts_with,
+        )
+        .order_by(lower_name)
+        .limit(bindparam("limit"))
+    )
+    if not substring:
+        return prefixed
+
+    if dialect == "sqlite":
+        fts = table(INGREDIENT_FTS_TABLE, column("rowid"))
+        contains = Ingredient.id.in_(
+            select(fts.c.rowid).where(
+                literal_column(INGREDIENT_FTS_TABLE).op("MATCH")(bindparam("fragment_match"))
+            )
+        )
+    else:
+        contains = lower_name.like(bindparam("fragment_pattern"), escape=LIKE_ESCAPE)
+    containing = (
+        select(Ingredient.id, Ingredient.name)
+        .where(unindexed(Ingredient.is_deleted, dialect).is_(False), contains, ~starts_with)
+        .order_by(func.length(Ingredient.name), lower_name)
+        .limit(bindparam("limit"))
+    )
+    return union_all(select(prefixed.subquery()), select(containing.subquery())).limit(
+        bindparam("limit")
+    )
 
 
 class IngredientRepository:
@@ -26,6 +147,48 @@ class IngredientRepository:
         await self.session.refresh(ingredient)
         return ingredient
 
+    async def upsert_by_name(self, values: dict[str, Any], *, merge: Iterable[str]) -> Ingredient:
+        """Insert an ingredient, or merge it into the one with the same name (any case).
+
+        A single ``INSERT ... ON CONFLICT (lower(name)) DO UPDATE ... RETURNING``
+        statement: quantities add up and the columns in ``merge`` take the new
+        values. A soft-deleted row with that name is revived with the new
+        quantity instead of adding to stock that was thrown away, and its
+        other columns are reset to the new values too.
+        """
+        statement = _upsert_statement(
+            self._dialect(),
+            tuple(sorted(values)),
+            frozenset(merge),
+            borrow_category=values.get("category") is None,
+        )
+        result = await self.session.scalars(
+            statement,
+            {**values, "merged_at": datetime.utcnow()},
+            execution_options={"populate_existing": True},
+        )
+        ingredient: Ingredient = result.one()
+        return ingredient
+
+    async def upsert_many(self, rows: Sequence[dict[str, Any]], *, merge: Iterable[str]) -> None:
+        """Run :meth:`upsert_by_name` for many rows as one executemany.
+
+        Every row needs the same keys, including a ``category`` (used only
+        for new ingredients unless it is in ``merge``). Names should be
+        unique within ``rows``; nothing is returned or loaded.
+        """
+        if not rows:
+            return
+        statement = _upsert_statement(
+            self._dialect(),
+            tuple(sorted(rows[0])),
+            frozenset(merge),
+            borrow_category=False,
+            returning=False,
+        )
+        merged_at = datetime.utcnow()
+        await self.session.execute(statement, [{**row, "merged_at": merged_at} for row in rows])
+
     async def get_by_id(self, ingredient_id: int) -> Ingredient | None:
         """Get ingredient by ID."""
         result = await self.session.execute(
@@ -35,6 +198,25 @@ class IngredientRepository:
         )
         return result.scalar_one_or_none()
 
+    async def stream(
+        self, *, since: datetime | None = None, chunk_size: int = 1000
+    ) -> AsyncIterator[Ingredient]:
+        """Yield every live ingredient in id order as rows arrive.
+
+        Rows are fetched ``chunk_size`` at a time from a server-side cursor.
+        With ``since``, ingredients updated at or after it are yielded
+        instead, soft-deleted ones included.
+        """
+        condition = Ingredient.updated_at >= since if since else Ingredient.is_deleted.is_(False)
+        query = (
+            select(Ingredient)
+            .where(condition)
+            .order_by(Ingredient.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        async for ingredient in await self.session.stream_scalars(query):
+            yield ingredient
+
     async def get_by_name(self, name: str) -> Ingredient | None:
         """Get ingredient by name."""
         result = await self.session.execute(
@@ -56,10 +238,17 @@ class IngredientRepository:
         name_contains: str | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[Sequence[Ingredient], int]:
-        """List ingredients with optional filters and pagination."""
+        after: tuple[str, int] | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Ingredient], int | None]:
+        """List ingredients with optional filters and pagination.
+
+        Rows are ordered by ``(name, id)``. Pass ``after`` (the key of the last
+        row seen) for keyset pagination; ``skip`` is the legacy offset mode.
+        ``total_mode`` picks how (and whether) the total is computed.
+        """
         # Build query conditions
-        conditions = [Ingredient.is_deleted.is_(False)]
+        conditions: list[ColumnElement[bool]] = [Ingredient.is_deleted.is_(False)]
 
         if category:
             conditions.append(Ingredient.category == category)
@@ -71,25 +260,104 @@ class IngredientRepository:
             conditions.append(Ingredient.expiry_date <= expiring_before)
 
         if name_contains:
-            conditions.append(Ingredient.name.ilike(f"%{name_contains}%"))
-
-        # Count total
-        count_query = select(func.count()).select_from(Ingredient).where(and_(*conditions))
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar_one()
+            if self._trigram_indexed(name_contains):
+                # Let the trigram lookup drive the query, not the soft-delete index
+                conditions[0] = unindexed(Ingredient.is_deleted, self._dialect()).is_(False)
+            conditions.append(self._name_contains(name_contains))
 
-        # Get paginated results
-        query = (
-            select(Ingredient)
-            .where(and_(*conditions))
-            .order_by(Ingredient.name)
-            .offset(skip)
-            .limit(limit)
+        return await fetch_page(
+            self.session,
+            Ingredient,
+            conditions,
+            skip=skip,
+            limit=limit,
+            after=after,
+            total_mode=total_mode,
+            filtered=len(conditions) > 1,
         )
-        result = await self.session.execute(query)
-        ingredients = result.scalars().all()
 
-        return ingredients, total
+    def _dialect(self) -> str:
+        return self.session.bind.dialect.name if self.session.bind is not None else ""
+
+    def _trigram_indexed(self, fragment: str) -> bool:
+        """Whether ``fragment`` is looked up in the SQLite trigram index."""
+        return self._dialect() == "sqlite" and len(fragment) >= 3
+
+    def _name_contains(self, fragment: str) -> ColumnElement[bool]:
+        """Case-insensitive substring filter on the name.
+
+        On SQLite fragments of three or more characters are looked up in the
+        trigram index; PostgreSQL serves ``ILIKE`` from its pg_trgm index.
+        """
+        if self._trigram_indexed(fragment):
+            fts = table(INGREDIENT_FTS_TABLE, column("rowid"))
+            matches = select(fts.c.rowid).where(
+                literal_column(INGREDIENT_FTS_TABLE).op("MATCH")(fts5_string(fragment))
+            )
+            return Ingredient.id.in_(matches)
+        return Ingredient.name.ilike(f"%{fragment}%")
+
+    async def autocomplete(self, prefix: str, *, limit: int = 10) -> builtins.list[tuple[int, str]]:
+        """Return ``(id, name)`` of ingredients matching a half-typed name.
+
+        Names starting with ``prefix`` come first (an index range scan on
+        ``lower(name)``), then names containing it, then, only if nothing
+        matched, names with similar trigrams so typos still find something.
+        """
+        folded = prefix.strip().lower()
+        if not folded:
+            return []
+        substring = len(folded) >= 3
+        params = {
+            "prefix": folded,
+            "prefix_end": prefix_upper_bound(folded),
+            "prefix_pattern": like_escape(folded) + "%",
+            "limit": limit,
+        }
+        if substring:
+            params["fragment_pattern"] = f"%{like_escape(folded)}%"
+            params["fragment_match"] = fts5_string(folded)
+
+        query = _autocomplete_query(self._dialect(), substring=substring)
+        matches = [(row.id, row.name) for row in await self.session.execute(query, params)]
+        if matches or not substring:
+            return matches
+        return await self._similar_names(folded, limit=limit)
+
+    async def _similar_names(self, name: str, *, limit: int) -> builtins.list[tuple[int, str]]:
+        """Names that contain most of the trigrams of ``name``, best first."""
+        live = Ingredient.is_deleted.is_(False)
+        if self._dialect() == "postgresql":
+            similarity = func.word_similarity(name, Ingredient.name)
+            result = await self.session.execute(
+                select(Ingredient.id, Ingredient.name)
+                .where(literal(name).op("<%")(Ingredient.name), live)
+                .order_by(similarity.desc(), func.length(Ingredient.name), Ingredient.name)
+                .limit(limit)
+            )
+            return [(row.id, row.name) for row in result]
+
+        if self._dialect() == "sqlite":
+            fts = table(INGREDIENT_FTS_TABLE, column("rowid"))
+            candidates = (
+                select(fts.c.rowid)
+                .where(literal_column(INGREDIENT_FTS_TABLE).op("MATCH")(fts5_fuzzy_match(name)))
+                .limit(SIMILAR_NAME_CANDIDATES)
+            )
+            query = select(Ingredient.id, Ingredient.name).where(
+                Ingredient.id.in_(candidates),
+                unindexed(Ingredient.is_deleted, self._dialect()).is_(False),
+            )
+        else:
+            query = select(Ingredient.id, Ingredient.name).where(live)
+
+        scored = [
+            (word_similarity(name, row.name), row.name, row.id)
+            for row in await self.session.execute(query)
+        ]
+        scored = [entry for entry in scored if entry[0] >= WORD_SIMILARITY_THRESHOLD]
+        scored.sort(key=lambda entry: (-entry[0], len(entry[1]), entry[1]))
+        return [(row_id, row_name) for _, row_name, row_id in scored[:limit]]
 
     async def update(self, ingredient: Ingredient) -> Ingredient:
         """Update an ingredient."""
@@ -99,10 +367,10 @@ class IngredientRepository:
 
     async def soft_delete(self, ingredient: Ingredient) -> None:
         """Soft delete an ingredient."""
-        ingredient.is_deleted = True
+        ingredient.mark_deleted()
         await self.session.flush()
 
-    async def get_by_ids(self, ingredient_ids: list[int]) -> Sequence[Ingredient]:
+    async def get_by_ids(self, ingredient_ids: builtins.list[int]) -> Sequence[Ingredient]:
         """Get multiple ingredients by IDs."""
         result = await self.session.execute(
             select(Ingredient).where(
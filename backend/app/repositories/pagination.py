@@ -0,0 +1,196 @@
+"""Pagination helpers shared by the list repositories.
+
+List queries are ordered by ``(name, id)``. A cursor is the opaque, URL-safe
+encoding of the last row's ``(name, id)``; the next page starts strictly after
+that key, so each page is an index seek instead of an ``OFFSET`` scan.
+
+Totals are computed according to :class:`~app.enums.TotalMode`: not at all,
+exactly (a ``count(*)`` scalar subquery on the page query itself) or from
+planner statistics. A ``count(*) OVER ()`` window would also be one query, but
+SQLite materialises the whole partition for it, which is ~25x slower than a
+scalar subquery that counts from the covering index.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from typing import Any, Protocol, TypeVar
+
+from sqlalchemy import Select, and_, func, select, text, tuple_
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
+from sqlalchemy.sql.base import ExecutableOption
+
+from app.enums import TotalMode
+from app.logging import get_logger
+
+logger = get_logger(__name__)
+
+M = TypeVar("M")
+
+
+class NamedRow(Protocol):
+    """Row that can be keyset-paginated by ``(name, id)``."""
+
+    @property
+    def id(self) -> int: ...
+
+    @property
+    def name(self) -> str: ...
+
+
+def encode_cursor(name: str, row_id: int) -> str:
+    """Encode a ``(name, id)`` key as an opaque cursor."""
+    raw = json.dumps([name, row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    """Decode a cursor produced by :func:`encode_cursor`."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        name, row_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(name, str) or not isinstance(row_id, int):
+        raise ValueError("Invalid cursor")
+    return name, row_id
+
+
+def next_cursor(items: Sequence[NamedRow], page_size: int) -> str | None:
+    """Cursor for the page after ``items``, or ``None`` if it was the last page."""
+    if len(items) < page_size or not items:
+        return None
+    last = items[-1]
+    return encode_cursor(last.name, last.id)
+
+
+def has_next_page(
+    *, page: int, page_size: int, total: int | None, exact: bool, full_page: bool
+) -> bool:
+    """Whether another page follows.
+
+    Offset pages with an exact total compare against it; otherwise a full page
+    is assumed to have a successor.
+    """
+    if exact and total is not None:
+        return page * page_size < total
+    return full_page
+
+
+async def fetch_page(
+    session: AsyncSession,
+    model: type[M],
+    conditions: Sequence[ColumnElement[bool]],
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    after: tuple[str, int] | None = None,
+    total_mode: TotalMode = TotalMode.EXACT,
+    filtered: bool = True,
+    options: Sequence[ExecutableOption] = (),
+) -> tuple[list[M], int | None]:
+    """Fetch one ``(name, id)``-ordered page of ``model`` and its total.
+
+    ``conditions`` are the list filters (the total ignores ``skip`` and ``after``).
+    ``filtered`` says whether they go beyond the soft-delete check, which
+    decides whether table statistics can stand in for an estimate.
+    ``options`` are loader options for the page query, e.g. a column projection.
+    """
+    entity: Any = model
+    page_conditions = list(conditions)
+    if after is not None:
+        page_conditions.append(tuple_(entity.name, entity.id) > tuple_(*after))
+    query = (
+        select(entity)
+        .where(and_(*page_conditions))
+        .order_by(entity.name, entity.id)
+        .offset(skip)
+        .limit(limit)
+        .options(*options)
+    )
+
+    if total_mode is TotalMode.EXACT:
+        # Uncorrelated, so it is evaluated once and ignores OFFSET and the cursor
+        total_column = _count_query(model, conditions).correlate(None).scalar_subquery()
+        rows = (await session.execute(query.add_columns(total_column))).all()
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
+        # An empty page carries no count; only a page past the end needs one
+        if skip or after is not None:
+            return [], await count_rows(session, model, conditions)
+        return [], 0
+
+    items = list((await session.execute(query)).scalars().all())
+    if total_mode is TotalMode.ESTIMATE:
+        return items, await estimate_rows(session, model, conditions, filtered=filtered)
+    return items, None
+
+
+async def count_rows(
+    session: AsyncSession, model: type[Any], conditions: Sequence[ColumnElement[bool]]
+) -> int:
+    """Exact ``count(*)`` of ``model`` rows matching ``conditions``."""
+    return int((await session.execute(_count_query(model, conditions))).scalar_one())
+
+
+def _count_query(model: type[Any], conditions: Sequence[ColumnElement[bool]]) -> Select[Any]:
+    return select(func.count()).select_from(model).where(and_(*conditions))
+
+
+async def estimate_rows(
+    session: AsyncSession,
+    model: type[Any],
+    conditions: Sequence[ColumnElement[bool]],
+    *,
+    filtered: bool,
+) -> int:
+    """Approximate row count from planner statistics, falling back to an exact count.
+
+    SQLite reads ``sqlite_stat1`` (written by ``ANALYZE``) for unfiltered lists.
+    PostgreSQL uses ``pg_class.reltuples`` for unfiltered lists and the
+    planner's row estimate (``EXPLAIN``) for filtered ones.
+    """
+    dialect = session.bind.dialect.name if session.bind is not None else ""
+    table = model.__tablename__
+    estimate: int | None = None
+    try:
+        # SAVEPOINT so a failed statistics query doesn't abort the caller's transaction
+        async with session.begin_nested():
+            if dialect == "sqlite" and not filtered:
+                result = await session.execute(
+                    text("SELECT stat FROM sqlite_stat1 WHERE tbl = :table"), {"table": table}
+                )
+                # Every stat row starts with the row count of its table or index
+                counts = [int(stat.split()[0]) for stat in result.scalars()]
+                estimate = max(counts) if counts else None
+            elif dialect == "postgresql" and not filtered:
+                result = await session.execute(
+                    text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table)"),
+                    {"table": table},
+                )
+                reltuples = result.scalar_one_or_none()
+                estimate = int(reltuples) if reltuples is not None and reltuples >= 0 else None
+            elif dialect == "postgresql":
+                compiled = (
+                    select(model)
+                    .where(and_(*conditions))
+                    .compile(
+                        dialect=session.get_bind().dialect, compile_kwargs={"literal_binds": True}
+                    )
+                )
+                connection = await session.connection()
+                result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+                estimate = int(result.scalar_one()[0]["Plan"]["Plan Rows"])
+    except (DBAPIError, NotImplementedError, KeyError, ValueError):
+        # No statistics yet (e.g. ANALYZE never ran) or an unrenderable filter
+        logger.debug("row_estimate_unavailable", table=table, dialect=dialect)
+        estimate = None
+
+    if estimate is None:
+        return await count_rows(session, model, conditions)
+    return estimate
@@ -3,12 +3,35 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from decimal import Decimal
+from typing import Any
 
-from sqlalchemy import and_, delete, select
+from sqlalchemy import and_, delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import RecipeIngredient
 
+# Columns an update may change; rows whose values all match are not rewritten
+SYNCED_COLUMNS = (
+    "quantity",
+    "unit",
+    "is_optional",
+    "note",
+    "order_in_recipe",
+    "preparation_details",
+)
+
+
+def _differs(current: Any, wanted: dict[str, Any]) -> bool:
+    for column in SYNCED_COLUMNS:
+        value = wanted.get(column)
+        if column == "quantity" and value is not None:
+            # Numeric(12, 3) reads back as Decimal("2.000") for a requested 2
+            value = Decimal(str(value))
+        if getattr(current, column) != value:
+            return True
+    return False
+
 
 class RecipeIngredientRepository:
     """Repository for recipe-ingredient associations."""
@@ -77,28 +100,52 @@ class RecipeIngredientRepository:
         )
         await self.session.flush()
 
-    async def upsert_recipe_ingredients(
-        self, recipe_id: int, ingredient_data: list[dict]
-    ) -> list[RecipeIngredient]:
-        """
-        Upsert recipe ingredients.
+    async def bulk_create(self, recipe_id: int, ingredient_data: list[dict[str, Any]]) -> None:
+        """Insert associations for a new recipe in one executemany.
 
-        Removes existing associations and creates new ones based on provided data.
+        The inserted rows are not loaded into the session; read the recipe
+        back (e.g. ``RecipeRepository.get_detail``) to get them.
         """
-        # Delete existing associations
-        await self.delete_by_recipe(recipe_id)
+        await self.insert_many([{**data, "recipe_id": recipe_id} for data in ingredient_data])
 
-        # Create new associations
-        associations = []
-        for data in ingredient_data:
-            association = RecipeIngredient(recipe_id=recipe_id, **data)
-            self.session.add(association)
-            associations.append(association)
+    async def insert_many(self, rows: list[dict[str, Any]]) -> None:
+        """Insert association rows (each with its ``recipe_id``) in one executemany."""
+        if rows:
+            await self.session.execute(insert(RecipeIngredient), rows)
 
-        await self.session.flush()
+    async def upsert_recipe_ingredients(
+        self, recipe_id: int, ingredient_data: list[dict[str, Any]]
+    ) -> None:
+        """Make a recipe's associations match ``ingredient_data``, keyed by ingredient.
 
-        # Refresh all associations
-        for association in associations:
-            await self.session.refresh(association)
+        Existing rows are diffed against the wanted ones: dropped ingredients
+        are deleted, new ones inserted and changed ones updated in place, each
+        as a single statement. Unchanged rows are not touched and keep their ids.
+        """
+        current = await self.session.execute(
+            select(RecipeIngredient.id, RecipeIngredient.ingredient_id)
+            .add_columns(*(getattr(RecipeIngredient, column) for column in SYNCED_COLUMNS))
+            .where(RecipeIngredient.recipe_id == recipe_id)
+        )
+        existing = {row.ingredient_id: row for row in current}
+        wanted = {data["ingredient_id"]: data for data in ingredient_data}
+
+        removed = [row.id for key, row in existing.items() if key not in wanted]
+        if removed:
+            await self.session.execute(
+                delete(RecipeIngredient).where(RecipeIngredient.id.in_(removed)),
+                execution_options={"synchronize_session": False},
+            )
 
-        return associations
+        changed = [
+            {"id": existing[key].id, **{column: data.get(column) for column in SYNCED_COLUMNS}}
+            for key, data in wanted.items()
+            if key in existing and _differs(existing[key], data)
+        ]
+        if changed:
+            # ORM bulk UPDATE by primary key: one executemany
+            await self.session.execute(update(RecipeIngredient), changed)
+
+        await self.bulk_create(
+            recipe_id, [data for key, data in wanted.items() if key not in existing]
+        )
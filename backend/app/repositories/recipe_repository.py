@@ -2,13 +2,74 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import builtins
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import (
+    Select,
+    and_,
+    column,
+    func,
+    literal,
+    literal_column,
+    null,
+    or_,
+    select,
+    table,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload
+from sqlalchemy.sql import ColumnElement
+from sqlalchemy.sql.base import ExecutableOption
 
-from app.models import Recipe, RecipeIngredient
+from app.enums import (
+    AllergenType,
+    CuisineType,
+    DietaryRequirement,
+    MealType,
+    TotalMode,
+    enum_mask,
+)
+from app.models import RECIPE_FTS_TABLE, Recipe, RecipeIngredient
+from app.models.search import RECIPE_FTS_WEIGHTS
+from app.repositories.pagination import fetch_page
+from app.repositories.search import (
+    HIGHLIGHT_END,
+    HIGHLIGHT_START,
+    fts5_match,
+    search_terms,
+    unindexed,
+)
+
+# Columns of a summary list row. Long text and nested JSON stay deferred and
+# the ingredient associations are not loaded; touching either raises instead
+# of quietly issuing a query per row.
+SUMMARY_COLUMNS = (
+    Recipe.name,
+    Recipe.author,
+    Recipe.cooking_method,
+    Recipe.cuisine_types,
+    Recipe.meal_types,
+    Recipe.dietary_requirements,
+    Recipe.contains_allergens,
+    Recipe.prep_time_minutes,
+    Recipe.cook_time_minutes,
+    Recipe.servings,
+    Recipe.tags,
+    Recipe.created_at,
+    Recipe.updated_at,
+)
+
+
+def _load_options(summary: bool) -> tuple[ExecutableOption, ...]:
+    if not summary:
+        return ()
+    return (
+        load_only(*SUMMARY_COLUMNS, raiseload=True),
+        raiseload(Recipe.ingredient_associations),
+    )
 
 
 class RecipeRepository:
@@ -25,6 +86,16 @@ class RecipeRepository:
         await self.session.refresh(recipe)
         return recipe
 
+    async def create_many(self, recipes: Sequence[Recipe]) -> None:
+        """Insert recipes with one flush, assigning their ids.
+
+        The flush batches into one ``INSERT .. RETURNING`` where the dialect
+        can order the returned rows (PostgreSQL); SQLite gets one cheap
+        ``INSERT`` per recipe inside the same transaction.
+        """
+        self.session.add_all(recipes)
+        await self.session.flush()
+
     async def get_by_id(self, recipe_id: int, load_ingredients: bool = False) -> Recipe | None:
         """Get recipe by ID, optionally loading ingredients."""
         query = select(Recipe).where(and_(Recipe.id == recipe_id, Recipe.is_deleted.is_(False)))
@@ -39,18 +110,83 @@ class RecipeRepository:
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
-    async def list(
-        self,
+    @staticmethod
+    def _detail_query(*conditions: ColumnElement[bool]) -> Select[Recipe]:
+        return (
+            select(Recipe)
+            .where(and_(Recipe.is_deleted.is_(False), *conditions))
+            .options(
+                joinedload(Recipe.ingredient_associations).joinedload(
+                    RecipeIngredient.ingredient, innerjoin=True
+                )
+            )
+            .execution_options(populate_existing=True)
+        )
+
+    async def get_detail(self, recipe_id: int) -> Recipe | None:
+        """Get a recipe with its ingredient associations and ingredients in one query.
+
+        Rows already in the session are refreshed from the result, so this also
+        reads back a recipe just written in the same transaction.
+        """
+        result = await self.session.execute(self._detail_query(Recipe.id == recipe_id))
+        return result.unique().scalar_one_or_none()
+
+    async def get_details(self, recipe_ids: Sequence[int]) -> list[Recipe]:
+        """Get many recipes like :meth:`get_detail`, with a single ``IN`` query.
+
+        Missing and deleted recipes are left out; rows come back in id order.
+        """
+        if not recipe_ids:
+            return []
+        result = await self.session.execute(
+            self._detail_query(Recipe.id.in_(recipe_ids)).order_by(Recipe.id)
+        )
+        return list(result.unique().scalars().all())
+
+    async def stream(
+        self, *, since: datetime | None = None, chunk_size: int = 500
+    ) -> AsyncIterator[Recipe]:
+        """Yield every live recipe with its ingredients, in id order, as rows arrive.
+
+        Rows are fetched ``chunk_size`` at a time from a server-side cursor,
+        each chunk's ingredients with one more query, so memory stays flat
+        however large the table. With ``since``, recipes updated at or after
+        it are yielded instead, soft-deleted ones included.
+        """
+        condition = Recipe.updated_at >= since if since else Recipe.is_deleted.is_(False)
+        query = (
+            select(Recipe)
+            .where(condition)
+            .order_by(Recipe.id)
+            .options(
+                selectinload(Recipe.ingredient_associations).selectinload(
+                    RecipeIngredient.ingredient
+                )
+            )
+            .execution_options(yield_per=chunk_size)
+        )
+        async for recipe in await self.session.stream_scalars(query):
+            yield recipe
+
+    @staticmethod
+    def _filter_conditions(
         *,
         max_prep_time_minutes: int | None = None,
         max_cook_time_minutes: int | None = None,
         cuisine: str | None = None,
         name_contains: str | None = None,
-        skip: int = 0,
-        limit: int = 100,
-    ) -> tuple[Sequence[Recipe], int]:
-        """List recipes with optional filters and pagination."""
-        conditions = [Recipe.is_deleted.is_(False)]
+        cooking_method: str | None = None,
+        author: str | None = None,
+        meal_types: Sequence[str] = (),
+        dietary: Sequence[str] = (),
+        exclude_allergens: Sequence[str] = (),
+        ids: Sequence[int] = (),
+    ) -> list[ColumnElement[bool]]:
+        conditions: list[ColumnElement[bool]] = [Recipe.is_deleted.is_(False)]
+
+        if ids:
+            conditions.append(Recipe.id.in_(ids))
 
         if max_prep_time_minutes is not None:
             conditions.append(Recipe.prep_time_minutes <= max_prep_time_minutes)
@@ -58,20 +194,182 @@ class RecipeRepository:
         if max_cook_time_minutes is not None:
             conditions.append(Recipe.cook_time_minutes <= max_cook_time_minutes)
 
+        # Enum lists are matched on their bitmask columns, not the JSON lists
         if cuisine:
-            conditions.append(Recipe.cuisine_types.contains([cuisine]))
+            conditions.append(
+                Recipe.cuisine_mask.bitwise_and(enum_mask(CuisineType, [cuisine])) != 0
+            )
 
         if name_contains:
             conditions.append(Recipe.name.ilike(f"%{name_contains}%"))
 
-        count_query = select(func.count()).select_from(Recipe).where(and_(*conditions))
-        total = (await self.session.execute(count_query)).scalar_one()
+        if cooking_method:
+            conditions.append(Recipe.cooking_method == cooking_method)
 
-        query = (
-            select(Recipe).where(and_(*conditions)).order_by(Recipe.name).offset(skip).limit(limit)
+        if author:
+            conditions.append(Recipe.author == author)
+
+        # Any of the meal types
+        if mask := enum_mask(MealType, meal_types):
+            conditions.append(Recipe.meal_mask.bitwise_and(mask) != 0)
+
+        # All of the dietary requirements
+        if mask := enum_mask(DietaryRequirement, dietary):
+            conditions.append(Recipe.dietary_mask.bitwise_and(mask) == mask)
+
+        # None of the allergens
+        if mask := enum_mask(AllergenType, exclude_allergens):
+            conditions.append(Recipe.allergen_mask.bitwise_and(mask) == 0)
+
+        return conditions
+
+    async def list(
+        self,
+        *,
+        max_prep_time_minutes: int | None = None,
+        max_cook_time_minutes: int | None = None,
+        cuisine: str | None = None,
+        name_contains: str | None = None,
+        cooking_method: str | None = None,
+        author: str | None = None,
+        meal_types: Sequence[str] = (),
+        dietary: Sequence[str] = (),
+        exclude_allergens: Sequence[str] = (),
+        ids: Sequence[int] = (),
+        skip: int = 0,
+        limit: int = 100,
+        after: tuple[str, int] | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+        summary: bool = False,
+    ) -> tuple[Sequence[Recipe], int | None]:
+        """List recipes with optional filters and pagination.
+
+        Rows are ordered by ``(name, id)``. ``meal_types`` matches recipes with
+        any of the meal types, ``dietary`` those meeting all of the
+        requirements and ``exclude_allergens`` those containing none of the
+        allergens; ``ids`` restricts the list to those recipes. Pass ``after``
+        (the key of the last row seen) for keyset pagination; ``skip`` is the
+        legacy offset mode.
+        ``total_mode`` picks how (and whether) the total is computed.
+        ``summary`` loads only :data:`SUMMARY_COLUMNS`, without ingredients.
+        """
+        conditions = self._filter_conditions(
+            max_prep_time_minutes=max_prep_time_minutes,
+            max_cook_time_minutes=max_cook_time_minutes,
+            cuisine=cuisine,
+            name_contains=name_contains,
+            cooking_method=cooking_method,
+            author=author,
+            meal_types=meal_types,
+            dietary=dietary,
+            exclude_allergens=exclude_allergens,
+            ids=ids,
+        )
+
+        return await fetch_page(
+            self.session,
+            Recipe,
+            conditions,
+            skip=skip,
+            limit=limit,
+            after=after,
+            total_mode=total_mode,
+            filtered=len(conditions) > 1,
+            options=_load_options(summary),
+        )
+
+    async def search(
+        self,
+        query: str,
+        *,
+        max_prep_time_minutes: int | None = None,
+        max_cook_time_minutes: int | None = None,
+        cuisine: str | None = None,
+        name_contains: str | None = None,
+        cooking_method: str | None = None,
+        author: str | None = None,
+        meal_types: Sequence[str] = (),
+        dietary: Sequence[str] = (),
+        exclude_allergens: Sequence[str] = (),
+        ids: Sequence[int] = (),
+        skip: int = 0,
+        limit: int = 100,
+        total_mode: TotalMode = TotalMode.EXACT,
+        summary: bool = False,
+    ) -> tuple[builtins.list[tuple[Recipe, float, str | None]], int | None]:
+        """Full-text search over name, description, instructions and tags.
+
+        Returns ``(recipe, rank, snippet)`` rows, best match first; a higher rank
+        is a better match and the snippet marks matched words with ``<mark>``.
+        Uses FTS5 on SQLite and the ``search_vector`` column on PostgreSQL.
+        ``summary`` loads recipes the way :meth:`list` does.
+        """
+        conditions = self._filter_conditions(
+            max_prep_time_minutes=max_prep_time_minutes,
+            max_cook_time_minutes=max_cook_time_minutes,
+            cuisine=cuisine,
+            name_contains=name_contains,
+            cooking_method=cooking_method,
+            author=author,
+            meal_types=meal_types,
+            dietary=dietary,
+            exclude_allergens=exclude_allergens,
+            ids=ids,
+        )
+        dialect = self.session.bind.dialect.name if self.session.bind is not None else ""
+
+        if dialect == "sqlite":
+            fts = table(RECIPE_FTS_TABLE, column("rowid"))
+            fts_ref: ColumnElement[Any] = literal_column(RECIPE_FTS_TABLE)
+            conditions[0] = unindexed(Recipe.is_deleted, dialect).is_(False)
+            conditions.append(fts_ref.op("MATCH")(fts5_match(query)))
+            # bm25() is lower-is-better; negate so rank sorts the same way on every backend
+            rank: ColumnElement[Any] = -func.bm25(fts_ref, *RECIPE_FTS_WEIGHTS)
+            snippet: ColumnElement[Any] = func.snippet(
+                fts_ref, -1, HIGHLIGHT_START, HIGHLIGHT_END, "…", 16
+            )
+            source: Any = fts.join(Recipe, Recipe.id == fts.c.rowid)
+        elif dialect == "postgresql":
+            tsquery = func.websearch_to_tsquery("english", query)
+            vector: ColumnElement[Any] = literal_column("recipes.search_vector")
+            conditions.append(vector.op("@@")(tsquery))
+            rank = func.ts_rank_cd(vector, tsquery)
+            snippet = func.ts_headline(
+                "english",
+                func.concat_ws(" ", Recipe.description, Recipe.instructions),
+                tsquery,
+                f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, MaxWords=24, MinWords=8",
+            )
+            source = Recipe
+        else:
+            for term in search_terms(query):
+                conditions.append(
+                    or_(Recipe.name.ilike(f"%{term}%"), Recipe.description.ilike(f"%{term}%"))
+                )
+            rank = literal(0.0)
+            snippet = null()
+            source = Recipe
+
+        page_query = (
+            select(Recipe, rank.label("rank"), snippet.label("snippet"))
+            .select_from(source)
+            .where(and_(*conditions))
+            .order_by(rank.desc(), Recipe.id)
+            .offset(skip)
+            .limit(limit)
+            .options(*_load_options(summary))
         )
-        recipes = (await self.session.execute(query)).scalars().all()
-        return recipes, total
+        rows = (await self.session.execute(page_query)).all()
+        matches = [(row[0], row[1], row[2]) for row in rows]
+        if total_mode is TotalMode.NONE:
+            return matches, None
+
+        # Counted separately: there are no statistics to estimate a match count
+        # from, and a short first page already is the count
+        if not skip and len(matches) < limit:
+            return matches, len(matches)
+        count_query = select(func.count()).select_from(source).where(and_(*conditions))
+        return matches, (await self.session.execute(count_query)).scalar_one()
 
     async def update(self, recipe: Recipe) -> Recipe:
         """Update a recipe."""
@@ -81,7 +379,7 @@ class RecipeRepository:
 
     async def soft_delete(self, recipe: Recipe) -> None:
         """Soft delete a recipe."""
-        recipe.is_deleted = True
+        recipe.mark_deleted()
         await self.session.flush()
 
     async def hard_delete(self, recipe: Recipe) -> None:
@@ -90,7 +388,7 @@ class RecipeRepository:
         await self.session.flush()
 
     async def get_recipes_with_ingredients(
-        self, ingredient_ids: list[int], min_match_count: int = 1
+        self, ingredient_ids: builtins.list[int], min_match_count: int = 1
     ) -> Sequence[Recipe]:
         """Get recipes that contain at least min_match_count of the given ingredients."""
         # This query finds recipes that have at least min_match_count matching ingredients
@@ -0,0 +1,117 @@
+"""Retention repository: archive and purge long soft-deleted rows."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from pydantic_core import to_jsonable_python
+from sqlalchemy import and_, delete, exists, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models import ArchivedRow, Ingredient, Recipe, RecipeIngredient
+
+
+def _row_data(row: Any) -> dict[str, Any]:
+    """Column values of an ORM row as JSON-safe data."""
+    values = {attr.key: getattr(row, attr.key) for attr in inspect(row).mapper.column_attrs}
+    data: dict[str, Any] = to_jsonable_python(values)
+    return data
+
+
+class RetentionRepository:
+    """Repository that moves expired soft-deleted rows into ``archived_rows``."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with database session."""
+        self.session = session
+
+    async def archive_expired_recipes(self, cutoff: datetime, *, limit: int) -> int:
+        """Archive and delete up to ``limit`` recipes soft-deleted before ``cutoff``.
+
+        Each archived recipe keeps its ingredient associations; the association
+        rows are deleted with it. Returns the number of recipes purged.
+        """
+        expired = and_(Recipe.is_deleted.is_(True), Recipe.deleted_at < cutoff)
+        result = await self.session.execute(
+            select(Recipe)
+            .where(expired)
+            .order_by(Recipe.deleted_at, Recipe.id)
+            .limit(limit)
+            .options(selectinload(Recipe.ingredient_associations))
+            .with_for_update()
+        )
+        recipes = result.scalars().all()
+        if not recipes:
+            return 0
+
+        archived_at = datetime.utcnow()
+        self.session.add_all(
+            ArchivedRow(
+                table_name=Recipe.__tablename__,
+                row_id=recipe.id,
+                deleted_at=recipe.deleted_at,
+                archived_at=archived_at,
+                data={
+                    **_row_data(recipe),
+                    "ingredients": [_row_data(a) for a in recipe.ingredient_associations],
+                },
+            )
+            for recipe in recipes
+        )
+        await self.session.flush()
+        ids = [recipe.id for recipe in recipes]
+        await self.session.execute(
+            delete(RecipeIngredient).where(RecipeIngredient.recipe_id.in_(ids))
+        )
+        await self.session.execute(delete(Recipe).where(Recipe.id.in_(ids)))
+        # The bulk deletes bypassed the identity map; don't flush stale objects later
+        self.session.expunge_all()
+        return len(ids)
+
+    async def archive_expired_ingredients(self, cutoff: datetime, *, limit: int) -> int:
+        """Archive and delete up to ``limit`` ingredients soft-deleted before ``cutoff``.
+
+        Ingredients still used by any recipe, even a deleted one inside the
+        retention window, are kept until that recipe is purged.
+        """
+        expired = and_(
+            Ingredient.is_deleted.is_(True),
+            Ingredient.deleted_at < cutoff,
+            ~exists().where(RecipeIngredient.ingredient_id == Ingredient.id),
+        )
+        result = await self.session.execute(
+            select(Ingredient)
+            .where(expired)
+            .order_by(Ingredient.deleted_at, Ingredient.id)
+            .limit(limit)
+            .with_for_update()
+        )
+        ingredients = result.scalars().all()
+        if not ingredients:
+            return 0
+
+        archived_at = datetime.utcnow()
+        self.session.add_all(
+            ArchivedRow(
+                table_name=Ingredient.__tablename__,
+                row_id=ingredient.id,
+                deleted_at=ingredient.deleted_at,
+                archived_at=archived_at,
+                data=_row_data(ingredient),
+            )
+            for ingredient in ingredients
+        )
+        await self.session.flush()
+        ids = [ingredient.id for ingredient in ingredients]
+        await self.session.execute(delete(Ingredient).where(Ingredient.id.in_(ids)))
+        self.session.expunge_all()
+        return len(ids)
+
+    async def list_archived(self, table_name: str) -> list[ArchivedRow]:
+        """Archived rows of ``table_name``, oldest archive first."""
+        result = await self.session.execute(
+            select(ArchivedRow).where(ArchivedRow.table_name == table_name).order_by(ArchivedRow.id)
+        )
+        return list(result.scalars().all())
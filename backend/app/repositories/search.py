@@ -0,0 +1,117 @@
+"""Helpers for building full-text and trigram search queries from user input."""
+
+from __future__ import annotations
+
+import re
+from typing import TypeVar
+
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql import ColumnElement
+from sqlalchemy.sql.expression import UnaryExpression
+from sqlalchemy.sql.operators import custom_op
+
+T = TypeVar("T")
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+LIKE_ESCAPE = "/"
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+
+# Same default cut-off as pg_trgm's word_similarity_threshold
+WORD_SIMILARITY_THRESHOLD = 0.6
+
+
+def search_terms(query: str) -> list[str]:
+    """Split free text into search words, dropping FTS operators and punctuation."""
+    return _WORD.findall(query.lower())
+
+
+def fts5_match(query: str) -> str:
+    """Build an FTS5 MATCH expression that ANDs every word of ``query``.
+
+    Words are quoted so user input can never be parsed as FTS5 syntax, and the
+    last word is a prefix match so results keep up with a half-typed query.
+    """
+    terms = search_terms(query)
+    if not terms:
+        raise ValueError("Search query must contain at least one word")
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def fts5_string(value: str) -> str:
+    """Quote ``value`` as a single FTS5 string (a substring match under ``trigram``)."""
+    return '"' + value.replace('"', '""') + '"'
+
+
+def trigrams(value: str) -> set[str]:
+    """Lower-cased three-character windows of ``value``, as the FTS5 trigram tokenizer sees it."""
+    folded = value.lower()
+    return {folded[i : i + 3] for i in range(len(folded) - 2)}
+
+
+def fts5_fuzzy_match(value: str) -> str:
+    """FTS5 MATCH expression (``trigram`` tokenizer) for names within one typo of ``value``.
+
+    ``value`` is cut into pieces; a single edit breaks at most one of them, so
+    any real match contains all but one piece verbatim. Three pieces need two
+    of them to match, which keeps the candidate set small even when a piece
+    is common. Values too short to cut match on any of their trigrams.
+    """
+    folded = value.lower()
+    if len(folded) < 3:
+        raise ValueError("Value must be at least three characters long")
+    if len(folded) < 6:
+        return " OR ".join(fts5_string(gram) for gram in sorted(trigrams(folded)))
+    if len(folded) < 9:
+        middle = len(folded) // 2
+        return f"{fts5_string(folded[:middle])} OR {fts5_string(folded[middle:])}"
+    third = len(folded) // 3
+    pieces = [fts5_string(p) for p in (folded[:third], folded[third:-third], folded[-third:])]
+    pairs = [(0, 1), (0, 2), (1, 2)]
+    return " OR ".join(f"({pieces[a]} AND {pieces[b]})" for a, b in pairs)
+
+
+def word_similarity(query: str, value: str) -> float:
+    """Share of the trigrams of ``query`` that occur in ``value`` (0.0 to 1.0).
+
+    Like pg_trgm's ``word_similarity``, a half-typed query scores high against
+    a longer name that contains it.
+    """
+    query_grams = trigrams(query)
+    if not query_grams:
+        return 0.0
+    return len(query_grams & trigrams(value)) / len(query_grams)
+
+
+def like_escape(value: str) -> str:
+    """Escape ``LIKE`` wildcards in ``value`` (use with ``escape=LIKE_ESCAPE``)."""
+    for char in (LIKE_ESCAPE, "%", "_"):
+        value = value.replace(char, LIKE_ESCAPE + char)
+    return value
+
+
+def prefix_upper_bound(prefix: str) -> str:
+    """Smallest string greater than every string starting with ``prefix``.
+
+    ``prefix <= value < prefix_upper_bound(prefix)`` is an index range scan.
+    """
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def unindexed(
+    column: ColumnElement[T] | InstrumentedAttribute[T], dialect: str
+) -> ColumnElement[T]:
+    """Stop SQLite from choosing an index on ``column`` (its unary ``+`` idiom).
+
+    Used on the soft-delete flag so the full-text MATCH drives the join; the
+    planner otherwise walks the ``is_deleted`` index and probes the full-text
+    index once per row. Other dialects get ``column`` unchanged.
+    """
+    expression = column.expression if isinstance(column, InstrumentedAttribute) else column
+    if dialect != "sqlite":
+        return expression
+    return UnaryExpression(expression, operator=custom_op("+"), type_=expression.type)
@@ -2,34 +2,68 @@
 
 from __future__ import annotations
 
-import marvin
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, TypeVar, cast
+
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.completion_key import completion_key
 from app.core.marvin_config import configure_marvin
 from app.schemas.core.ingredient import Ingredient
 from app.schemas.core.recipe import Recipe
 
+if TYPE_CHECKING:
+    from app.core.completion_cache import CompletionCache
+    from app.core.inflight import InflightCoalescer
+    from app.core.ingredient_batcher import IngredientBatcher
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Stock on hand does not change what an ingredient is, so it is not part of
+# the completion key; shared completions get the draft's quantity back
+INGREDIENT_UNKEYED_FIELDS = frozenset({"quantity"})
+
+# Appended to the prompt when several ingredient drafts share one call
+BATCH_INSTRUCTIONS = (
+    "The context holds several ingredient drafts. Complete each draft on its own as "
+    "instructed above and return one ingredient per draft, in the same order, "
+    "keeping each draft's name."
+)
+
 
 class SuggestionRepository:
     """Repository for Marvin API communication."""
 
-    def __init__(self, session: AsyncSession) -> None:
-        """Initialize repository with database session and configure Marvin."""
+    def __init__(
+        self,
+        session: AsyncSession,
+        cache: CompletionCache | None = None,
+        coalescer: InflightCoalescer | None = None,
+        batcher: IngredientBatcher | None = None,
+    ) -> None:
+        """Initialize repository with database session.
+
+        With a ``cache``, identical completion requests are answered from it;
+        with a ``coalescer``, identical concurrent requests share one call;
+        with a ``batcher``, single ingredient completions that miss both are
+        grouped into one call.
+        """
         self.session = session
-        configure_marvin()
+        self.cache = cache
+        self.coalescer = coalescer
+        self.batcher = batcher
 
-    async def generate_recipe(self, prompt: str, n_completions: int, draft: Recipe) -> list[Recipe]:
+    async def generate_recipe(
+        self, prompt: str, n_completions: int, draft: Recipe, *, variant: int = 0
+    ) -> list[Recipe]:
         """Generate recipe completions using Marvin API.
 
         Accepts a partial Recipe model and returns completed Recipe instances populated by Marvin.
         The same Recipe model is used for both partial (draft) and complete (populated) data.
+        Calls with different ``variant`` numbers are separate requests, never shared.
         """
-        return await marvin.generate_async(
-            target=Recipe,
-            n=n_completions,
-            instructions=prompt,
-            context=draft.model_dump(),
-        )
+        return await self._generate(Recipe, prompt, n_completions, draft, variant=variant)
 
     async def generate_ingredient(
         self, prompt: str, n_completions: int, draft: Ingredient
@@ -40,8 +74,88 @@ class SuggestionRepository:
         The same Ingredient model is used for both partial (draft) and complete (populated) data.
         Only name and quantity fields are populated - no additional hydration.
         """
+        return await self._generate(
+            Ingredient, prompt, n_completions, draft, unkeyed=INGREDIENT_UNKEYED_FIELDS
+        )
+
+    async def _generate(
+        self,
+        target: type[ModelT],
+        prompt: str,
+        n_completions: int,
+        draft: ModelT,
+        *,
+        unkeyed: Iterable[str] = (),
+        variant: int = 0,
+    ) -> list[ModelT]:
+        """Ask Marvin for completions of ``draft`` through the coalescer and the cache.
+
+        The completion key ignores case and whitespace, so each caller gets
+        its own copy of the completions, with the draft's own spelling of
+        the name and its ``unkeyed`` fields.
+        """
+        if self.cache is None and self.coalescer is None:
+            return await self._ask(target, prompt, n_completions, draft)
+
+        key = completion_key(target, prompt, draft, n_completions, exclude=unkeyed, variant=variant)
+        if self.coalescer is None:
+            completions = await self._complete(key, target, prompt, n_completions, draft)
+        else:
+            completions = await self.coalescer.run(
+                key, lambda: self._complete(key, target, prompt, n_completions, draft)
+            )
+        own = draft.model_dump(include={"name", *unkeyed} & draft.model_fields_set)
+        return [completion.model_copy(update=own, deep=True) for completion in completions]
+
+    async def _complete(
+        self, key: str, target: type[ModelT], prompt: str, n_completions: int, draft: ModelT
+    ) -> list[ModelT]:
+        """Completions from the cache, or from Marvin and then cached."""
+        if self.cache is not None:
+            cached = await self.cache.get(key, target)
+            if cached is not None:
+                return cached
+        completions = await self._ask(target, prompt, n_completions, draft)
+        if self.cache is not None and completions:
+            await self.cache.put(key, target, completions)
+        return completions
+
+    async def _ask(
+        self, target: type[ModelT], prompt: str, n_completions: int, draft: ModelT
+    ) -> list[ModelT]:
+        """Ask Marvin, in a batch with other drafts when this is a single ingredient completion."""
+        if self.batcher is None or target is not Ingredient or n_completions != 1:
+            return await self._marvin(target, prompt, n_completions, draft)
+        completion = await self.batcher.run(prompt, cast(Ingredient, draft), self._marvin_batch)
+        return [cast(ModelT, completion)] if completion is not None else []
+
+    @classmethod
+    async def _marvin_batch(cls, prompt: str, drafts: list[Ingredient]) -> list[Ingredient]:
+        """Complete ``drafts`` with one call; a single draft is asked for like before."""
+        if len(drafts) == 1:
+            return await cls._marvin(Ingredient, prompt, 1, drafts[0])
+        configure_marvin()
+        # Imported on first call: importing marvin takes longer than starting the app
+        import marvin
+
+        batches: list[list[Ingredient]] = await marvin.generate_async(
+            target=list[Ingredient],
+            n=1,
+            instructions=f"{prompt}\n\n{BATCH_INSTRUCTIONS}",
+            context={"drafts": [draft.model_dump() for draft in drafts]},
+        )
+        return batches[0] if batches else []
+
+    @staticmethod
+    async def _marvin(
+        target: type[ModelT], prompt: str, n_completions: int, draft: ModelT
+    ) -> list[ModelT]:
+        # Configured on first use, so requests that never reach Marvin need no API key
+        configure_marvin()
+        import marvin
+
         return await marvin.generate_async(
-            target=Ingredient,
+            target=target,
             n=n_completions,
             instructions=prompt,
             context=draft.model_dump(),
@@ -13,11 +13,13 @@ from app.schemas.core.recipe import (
 
 # Request schemas - REST API request wrappers
 from app.schemas.requests import (
+    ExportRequest,
     IngredientCreateRequest,
     IngredientListRequest,
     IngredientPatch,
     IngredientSuggestionRequest,
     IngredientUpdateRequest,
+    RecipeBatchCreateRequest,
     RecipeCreateRequest,
     RecipeListRequest,
     RecipeUpdateRequest,
@@ -29,9 +31,14 @@ from app.schemas.responses import (
     IngredientListResponse,
     IngredientResponse,
     IngredientSuggestionResponse,
+    RecipeBatchCreateResponse,
+    RecipeBatchItemResult,
     RecipeDetail,
     RecipeListResponse,
     RecipeResponse,
+    RecipeSearchResult,
+    RecipeSummary,
+    RecipeSummarySearchResult,
     SuggestionResponse,
 )
 
@@ -49,11 +56,13 @@ __all__ = [
     "RecipeTiming",
     "StorageInstructions",
     # Request schemas
+    "ExportRequest",
     "IngredientCreateRequest",
     "IngredientListRequest",
     "IngredientPatch",
     "IngredientSuggestionRequest",
     "IngredientUpdateRequest",
+    "RecipeBatchCreateRequest",
     "RecipeCreateRequest",
     "RecipeListRequest",
     "RecipeUpdateRequest",
@@ -63,8 +72,13 @@ __all__ = [
     "IngredientListResponse",
     "IngredientSuggestionResponse",
     "RecipeResponse",
+    "RecipeBatchCreateResponse",
+    "RecipeBatchItemResult",
     "RecipeDetail",
     "RecipeListResponse",
+    "RecipeSearchResult",
+    "RecipeSummary",
+    "RecipeSummarySearchResult",
     "RecipeIngredientRead",
     "SuggestionResponse",
 ]
@@ -1,12 +1,16 @@
 """Request schemas - REST API request wrappers."""
 
+from app.schemas.requests.export import ExportRequest
 from app.schemas.requests.ingredient import (
+    IngredientAutocompleteRequest,
     IngredientCreateRequest,
+    IngredientImportRequest,
     IngredientListRequest,
     IngredientPatch,
     IngredientUpdateRequest,
 )
 from app.schemas.requests.recipe import (
+    RecipeBatchCreateRequest,
     RecipeCreateRequest,
     RecipeListRequest,
     RecipeUpdateRequest,
@@ -17,11 +21,15 @@ from app.schemas.requests.suggestion import (
 )
 
 __all__ = [
+    "ExportRequest",
+    "IngredientAutocompleteRequest",
     "IngredientCreateRequest",
+    "IngredientImportRequest",
     "IngredientListRequest",
     "IngredientPatch",
     "IngredientUpdateRequest",
     "IngredientSuggestionRequest",
+    "RecipeBatchCreateRequest",
     "RecipeCreateRequest",
     "RecipeListRequest",
     "RecipeUpdateRequest",
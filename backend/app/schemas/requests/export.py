@@ -0,0 +1,27 @@
+"""Export request schemas - options of the NDJSON export endpoints."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from pydantic import BaseModel, Field, field_validator
+
+
+class ExportRequest(BaseModel):
+    """Options of a streaming NDJSON export."""
+
+    since: datetime | None = Field(
+        default=None,
+        description=(
+            "Only rows updated at or after this time, soft-deleted ones included; "
+            "without it, every live row"
+        ),
+    )
+
+    @field_validator("since")
+    @classmethod
+    def to_naive_utc(cls, value: datetime | None) -> datetime | None:
+        """Store times are naive UTC, so an offset is converted and dropped."""
+        if value is not None and value.tzinfo is not None:
+            return value.astimezone(UTC).replace(tzinfo=None)
+        return value
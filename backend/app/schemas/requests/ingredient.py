@@ -7,7 +7,7 @@ from decimal import Decimal
 
 from pydantic import BaseModel, Field
 
-from app.enums import IngredientCategory
+from app.enums import ImportFormat, IngredientCategory, TotalMode
 from app.schemas.core.ingredient import Ingredient
 
 
@@ -58,3 +58,31 @@ class IngredientListRequest(BaseModel):
     name_contains: str | None = Field(default=None, description="Search by name (partial match)")
     page: int = Field(default=1, ge=1, description="Page number")
     page_size: int = Field(default=100, ge=1, le=1000, description="Number of items per page")
+    cursor: str | None = Field(
+        default=None,
+        description="Opaque next_cursor from a previous page; when set, page is ignored",
+    )
+    total: TotalMode = Field(
+        default=TotalMode.EXACT,
+        description="Total count: none (skip), exact, or estimate (from planner statistics)",
+    )
+
+
+class IngredientAutocompleteRequest(BaseModel):
+    """Request for ingredient name suggestions while the user types."""
+
+    prefix: str = Field(..., min_length=1, max_length=100, description="Text typed so far")
+    limit: int = Field(default=10, ge=1, le=50, description="Maximum number of suggestions")
+
+
+class IngredientImportRequest(BaseModel):
+    """Options of a bulk ingredient import; the rows are the request body."""
+
+    format: ImportFormat = Field(default=ImportFormat.CSV, description="Body format")
+    enrich: bool = Field(
+        default=False,
+        description="Complete each row with AI before saving (one model call per row)",
+    )
+    batch_size: int = Field(
+        default=1000, ge=1, le=10_000, description="Rows upserted per transaction"
+    )
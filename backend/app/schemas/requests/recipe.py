@@ -4,7 +4,15 @@ from __future__ import annotations
 
 from pydantic import BaseModel, Field
 
-from app.enums import CuisineType
+from app.enums import (
+    AllergenType,
+    CookingMethod,
+    CuisineType,
+    DietaryRequirement,
+    ListView,
+    MealType,
+    TotalMode,
+)
 from app.schemas.core.recipe import Recipe
 
 
@@ -28,6 +36,14 @@ class RecipeUpdateRequest(BaseModel):
     recipe: Recipe = Field(..., description="Partial recipe data for update")
 
 
+class RecipeBatchCreateRequest(BaseModel):
+    """Request to create several recipes in one transaction."""
+
+    recipes: list[Recipe] = Field(
+        ..., min_length=1, max_length=500, description="Recipes to create, in order"
+    )
+
+
 class RecipeListRequest(BaseModel):
     """Request to list recipes with optional filters and pagination."""
 
@@ -39,5 +55,40 @@ class RecipeListRequest(BaseModel):
         default=None, ge=0, description="Maximum cook time in minutes"
     )
     name_contains: str | None = Field(default=None, description="Search by name (partial match)")
+    cooking_method: CookingMethod | None = Field(
+        default=None, description="Filter by overall cooking method"
+    )
+    author: str | None = Field(default=None, max_length=100, description="Filter by author")
+    meal_types: list[MealType] = Field(
+        default_factory=list, description="Only recipes for any of these meal types"
+    )
+    dietary: list[DietaryRequirement] = Field(
+        default_factory=list, description="Only recipes meeting all of these requirements"
+    )
+    exclude_allergens: list[AllergenType] = Field(
+        default_factory=list, description="Only recipes containing none of these allergens"
+    )
+    ids: list[int] = Field(
+        default_factory=list, max_length=1000, description="Only recipes with these IDs"
+    )
+    q: str | None = Field(
+        default=None,
+        min_length=1,
+        max_length=200,
+        description="Full-text search over name, description, instructions and tags; "
+        "results are ordered by relevance",
+    )
     page: int = Field(default=1, ge=1, description="Page number")
     page_size: int = Field(default=100, ge=1, le=1000, description="Number of items per page")
+    cursor: str | None = Field(
+        default=None,
+        description="Opaque next_cursor from a previous page; when set, page is ignored",
+    )
+    total: TotalMode = Field(
+        default=TotalMode.EXACT,
+        description="Total count: none (skip), exact, or estimate (from planner statistics)",
+    )
+    view: ListView = Field(
+        default=ListView.FULL,
+        description="Row shape: full recipes with ingredients, or summary rows",
+    )
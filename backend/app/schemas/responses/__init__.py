@@ -1,21 +1,47 @@
 """Response schemas - REST API response wrappers."""
 
 from app.schemas.responses.ingredient import (
+    IngredientImportError,
+    IngredientImportProgress,
     IngredientListResponse,
+    IngredientNameMatch,
     IngredientResponse,
 )
-from app.schemas.responses.recipe import RecipeDetail, RecipeListResponse, RecipeResponse
+from app.schemas.responses.recipe import (
+    RecipeBatchCreateResponse,
+    RecipeBatchItemResult,
+    RecipeDetail,
+    RecipeListResponse,
+    RecipeResponse,
+    RecipeSearchResult,
+    RecipeSummary,
+    RecipeSummarySearchResult,
+)
 from app.schemas.responses.suggestion import (
     IngredientSuggestionResponse,
+    RecipeSuggestionError,
+    RecipeSuggestionEvent,
+    RecipeSuggestionSummary,
     SuggestionResponse,
 )
 
 __all__ = [
     "IngredientResponse",
     "IngredientListResponse",
+    "IngredientNameMatch",
+    "IngredientImportError",
+    "IngredientImportProgress",
     "IngredientSuggestionResponse",
     "RecipeResponse",
+    "RecipeBatchCreateResponse",
+    "RecipeBatchItemResult",
     "RecipeDetail",
     "RecipeListResponse",
+    "RecipeSearchResult",
+    "RecipeSummary",
+    "RecipeSummarySearchResult",
+    "RecipeSuggestionError",
+    "RecipeSuggestionEvent",
+    "RecipeSuggestionSummary",
     "SuggestionResponse",
 ]
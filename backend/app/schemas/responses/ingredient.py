@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Literal
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
+from app.enums import TotalMode
 from app.schemas.core.ingredient import Ingredient
 
 
@@ -23,13 +25,43 @@ class IngredientResponse(Ingredient):
     created_at: datetime
     updated_at: datetime
     is_deleted: bool
+    enrichment_pending: bool = Field(
+        False, description="AI-filled fields are still being completed in the background"
+    )
 
 
 class IngredientListResponse(BaseModel):
     """Paginated list of ingredients."""
 
     items: list[IngredientResponse]
-    total: int
+    total: int | None = Field(None, description="Total matching items (null when not counted)")
+    total_mode: TotalMode = TotalMode.EXACT
     page: int
     page_size: int
     has_next: bool
+    next_cursor: str | None = None
+
+
+class IngredientNameMatch(BaseModel):
+    """Ingredient name suggested by autocomplete."""
+
+    id: int
+    name: str
+
+
+class IngredientImportError(BaseModel):
+    """A row an import skipped."""
+
+    event: Literal["error"] = "error"
+    line: int = Field(..., description="Line of the row in the body (1-based)")
+    error: str
+
+
+class IngredientImportProgress(BaseModel):
+    """Running totals of an import, sent after every batch and once at the end."""
+
+    event: Literal["progress", "done"] = "progress"
+    rows: int = Field(0, description="Rows read so far")
+    imported: int = Field(0, description="Rows upserted so far")
+    failed: int = Field(0, description="Rows skipped as invalid")
+    batches: int = Field(0, description="Transactions committed")
@@ -6,6 +6,15 @@ from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.enums import (
+    AllergenType,
+    CookingMethod,
+    CuisineType,
+    DietaryRequirement,
+    ListView,
+    MealType,
+    TotalMode,
+)
 from app.schemas.core.recipe import IngredientPreparation, Recipe
 
 
@@ -25,6 +34,45 @@ class RecipeResponse(Recipe):
     is_deleted: bool
 
 
+class RecipeSearchResult(RecipeResponse):
+    """Recipe matched by a full-text search, with its relevance."""
+
+    rank: float = Field(0.0, description="Relevance score; higher is a better match")
+    snippet: str | None = Field(
+        None, description="Matching text excerpt with matched words wrapped in <mark>"
+    )
+
+
+class RecipeSummary(BaseModel):
+    """Recipe list row without long text, nested details or ingredients."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    author: str | None = None
+    cooking_method: CookingMethod | None = None
+    cuisine_types: list[CuisineType] = Field(default_factory=list)
+    meal_types: list[MealType] = Field(default_factory=list)
+    dietary_requirements: list[DietaryRequirement] = Field(default_factory=list)
+    contains_allergens: list[AllergenType] = Field(default_factory=list)
+    prep_time_minutes: int | None = None
+    cook_time_minutes: int | None = None
+    servings: int = 1
+    tags: list[str] = Field(default_factory=list)
+    created_at: datetime
+    updated_at: datetime
+
+
+class RecipeSummarySearchResult(RecipeSummary):
+    """Summary of a recipe matched by a full-text search, with its relevance."""
+
+    rank: float = Field(0.0, description="Relevance score; higher is a better match")
+    snippet: str | None = Field(
+        None, description="Matching text excerpt with matched words wrapped in <mark>"
+    )
+
+
 class RecipeIngredientRead(IngredientPreparation):
     """Schema for reading a recipe ingredient with ingredient metadata."""
 
@@ -49,11 +97,30 @@ class RecipeDetail(RecipeResponse):
     )
 
 
+class RecipeBatchItemResult(BaseModel):
+    """Outcome of one recipe in a batch create."""
+
+    index: int = Field(..., description="Position of the recipe in the request")
+    recipe: RecipeDetail | None = Field(None, description="Created recipe, when it succeeded")
+    error: str | None = Field(None, description="Why the recipe was not created")
+
+
+class RecipeBatchCreateResponse(BaseModel):
+    """Per-item results of a batch create."""
+
+    items: list[RecipeBatchItemResult]
+    created: int
+    failed: int
+
+
 class RecipeListResponse(BaseModel):
     """Paginated list of recipes."""
 
-    items: list[RecipeResponse]
-    total: int
+    items: list[RecipeSearchResult | RecipeResponse | RecipeSummarySearchResult | RecipeSummary]
+    view: ListView = ListView.FULL
+    total: int | None = Field(None, description="Total matching items (null when not counted)")
+    total_mode: TotalMode = TotalMode.EXACT
     page: int
     page_size: int
     has_next: bool
+    next_cursor: str | None = None
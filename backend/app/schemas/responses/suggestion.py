@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 from app.schemas.core.ingredient import Ingredient
@@ -30,3 +32,29 @@ class IngredientSuggestionResponse(BaseModel):
         ...,
         description="AI-completed ingredients returned by Marvin",
     )
+
+
+class RecipeSuggestionEvent(BaseModel):
+    """One recipe variation, sent as soon as it is completed."""
+
+    event: Literal["recipe"] = "recipe"
+    index: int = Field(..., description="Which variation this is (0-based)")
+    recipe: Recipe
+
+
+class RecipeSuggestionError(BaseModel):
+    """A recipe variation that failed; the other variations still arrive."""
+
+    event: Literal["error"] = "error"
+    index: int = Field(..., description="Which variation failed (0-based)")
+    error: str
+
+
+class RecipeSuggestionSummary(BaseModel):
+    """Final event of a streamed suggestion."""
+
+    event: Literal["done"] = "done"
+    completed: int = Field(0, description="Variations sent")
+    failed: int = Field(0, description="Variations that failed")
+    first_ms: float | None = Field(None, description="Time to the first variation")
+    total_ms: float = Field(0.0, description="Time to the last variation")
@@ -2,46 +2,73 @@
 
 from __future__ import annotations
 
-from decimal import Decimal
+from datetime import datetime
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.write_queue import WriteQueue
+from app.enums import IngredientCategory
 from app.models import Ingredient
-from app.repositories import IngredientRepository
+from app.repositories import EnrichmentJobRepository, IngredientRepository
+from app.repositories.pagination import decode_cursor
 from app.schemas.core.ingredient import Ingredient as IngredientSchema
-from app.schemas.requests.ingredient import IngredientListRequest, IngredientPatch
+from app.schemas.requests.ingredient import (
+    IngredientAutocompleteRequest,
+    IngredientListRequest,
+    IngredientPatch,
+)
 
 
 class IngredientService:
     """Service for ingredient business logic."""
 
-    def __init__(self, repository: IngredientRepository) -> None:
-        """Initialize service with ingredient repository."""
+    def __init__(
+        self,
+        repository: IngredientRepository,
+        write_queue: WriteQueue | None = None,
+    ) -> None:
+        """Initialize service with ingredient repository and optional write queue."""
         self.repository = repository
-
-    async def create_ingredient(self, data: IngredientSchema) -> Ingredient:
-        """Create a new ingredient or add quantity to existing one."""
-        # Check if ingredient with same name already exists
-        existing = await self.repository.get_by_name(data.name)
-        if existing:
-            # Convert SQLAlchemy model to Pydantic model
-            existing_schema = IngredientSchema.model_validate(existing, from_attributes=True)
-
-            # Merge with new data using model_copy
-            merged = existing_schema.model_copy(update=data.model_dump(exclude_unset=True))
-
-            # Handle quantity addition
-            existing_quantity = existing_schema.quantity or Decimal("0")
-            new_quantity = data.quantity or Decimal("0")
-            merged.quantity = existing_quantity + new_quantity
-
-            # Apply merged data back to SQLAlchemy model
-            for key, value in merged.model_dump(exclude_unset=True).items():
-                setattr(existing, key, value)
-
-            return await self.repository.update(existing)
-
-        # Create ingredient from Pydantic model
-        ingredient = Ingredient(**data.model_dump())
-        return await self.repository.create(ingredient)
+        self.write_queue = write_queue
+
+    def _bind(self, session: AsyncSession) -> IngredientService:
+        """Return a queue-less copy of this service bound to the writer session."""
+        return IngredientService(IngredientRepository(session))
+
+    async def create_ingredient(
+        self, data: IngredientSchema, *, enrich_later: bool = False
+    ) -> Ingredient:
+        """Create a new ingredient or add quantity to existing one.
+
+        Matching is case-insensitive and done by one atomic upsert, so
+        concurrent creates of the same name merge instead of conflicting.
+        With ``enrich_later``, an ingredient saved without a category, storage
+        location or expiry date is marked ``enrichment_pending`` and queued,
+        in the same transaction, for a background worker to complete.
+        """
+        if self.write_queue is not None:
+            return await self.write_queue.submit(
+                lambda session: self._bind(session).create_ingredient(
+                    data, enrich_later=enrich_later
+                )
+            )
+
+        # Fields the caller set overwrite an existing ingredient's; quantity adds up
+        merge = data.model_dump(exclude_unset=True).keys() - {"quantity"}
+        values = data.model_dump()
+        if enrich_later and values["category"] is None:
+            # Placeholder for a new ingredient until the enrichment fills it in
+            values["category"] = IngredientCategory.OTHER
+        ingredient = await self.repository.upsert_by_name(values, merge=merge)
+        if enrich_later and _needs_enrichment(ingredient, merge):
+            ingredient.enrichment_pending = True
+            await EnrichmentJobRepository(self.repository.session).enqueue(
+                ingredient.id,
+                data.model_dump(mode="json", include={"name", "quantity", *merge}),
+                now=datetime.utcnow(),
+            )
+            await self.repository.session.flush()
+        return ingredient
 
     async def get_ingredient(self, ingredient_id: int) -> Ingredient:
         """Get ingredient by ID."""
@@ -53,23 +80,35 @@ class IngredientService:
     async def list_ingredients(
         self,
         request: IngredientListRequest,
-    ) -> list[Ingredient]:
-        """List ingredients with filters and pagination."""
-        skip = (request.page - 1) * request.page_size
+    ) -> tuple[list[Ingredient], int | None]:
+        """List ingredients with filters and pagination (cursor takes precedence over page)."""
+        after = decode_cursor(request.cursor) if request.cursor else None
+        skip = 0 if after else (request.page - 1) * request.page_size
 
         # Get filter data and convert pagination params
-        filter_data = request.model_dump(exclude={"page", "page_size"})
+        filter_data = request.model_dump(exclude={"page", "page_size", "cursor", "total"})
 
-        ingredients, _ = await self.repository.list(
+        ingredients, total = await self.repository.list(
             **filter_data,
             skip=skip,
             limit=request.page_size,
+            after=after,
+            total_mode=request.total,
         )
 
-        return list(ingredients)
+        return list(ingredients), total
+
+    async def autocomplete(self, request: IngredientAutocompleteRequest) -> list[tuple[int, str]]:
+        """Suggest ``(id, name)`` pairs for a half-typed ingredient name."""
+        return await self.repository.autocomplete(request.prefix, limit=request.limit)
 
     async def update_ingredient(self, ingredient_id: int, data: IngredientPatch) -> Ingredient:
         """Update an ingredient with partial data."""
+        if self.write_queue is not None:
+            return await self.write_queue.submit(
+                lambda session: self._bind(session).update_ingredient(ingredient_id, data)
+            )
+
         ingredient = await self.get_ingredient(ingredient_id)
 
         # Update fields with provided data
@@ -80,5 +119,20 @@ class IngredientService:
 
     async def delete_ingredient(self, ingredient_id: int) -> None:
         """Soft delete an ingredient."""
+        if self.write_queue is not None:
+            await self.write_queue.submit(
+                lambda session: self._bind(session).delete_ingredient(ingredient_id)
+            )
+            return
+
         ingredient = await self.get_ingredient(ingredient_id)
         await self.repository.soft_delete(ingredient)
+
+
+def _needs_enrichment(ingredient: Ingredient, set_fields: set[str]) -> bool:
+    """Whether a saved ingredient still lacks fields the enrichment would fill."""
+    return (
+        ingredient.storage_location is None
+        or ingredient.expiry_date is None
+        or (ingredient.category == IngredientCategory.OTHER and "category" not in set_fields)
+    )
@@ -3,7 +3,12 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from typing import Any
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.write_queue import WriteQueue
+from app.enums import ListView
 from app.models import Recipe as RecipeModel
 from app.models import RecipeIngredient
 from app.repositories import (
@@ -11,8 +16,10 @@ from app.repositories import (
     RecipeIngredientRepository,
     RecipeRepository,
 )
+from app.repositories.pagination import decode_cursor
 from app.schemas import (
     Recipe,
+    RecipeDetail,
     RecipeIngredientRead,
 )
 from app.schemas.core.recipe import IngredientPreparation
@@ -27,39 +34,83 @@ class RecipeService:
         recipe_repo: RecipeRepository,
         recipe_ingredient_repo: RecipeIngredientRepository,
         ingredient_repo: IngredientRepository,
+        write_queue: WriteQueue | None = None,
     ) -> None:
-        """Initialize service with repositories."""
+        """Initialize service with repositories and optional write queue."""
         self.recipe_repo = recipe_repo
         self.recipe_ingredient_repo = recipe_ingredient_repo
         self.ingredient_repo = ingredient_repo
+        self.write_queue = write_queue
+
+    def _bind(self, session: AsyncSession) -> RecipeService:
+        """Return a queue-less copy of this service bound to the writer session."""
+        return RecipeService(
+            RecipeRepository(session),
+            RecipeIngredientRepository(session),
+            IngredientRepository(session),
+        )
 
     async def create_recipe(self, data: Recipe) -> RecipeModel:
         """Create a new recipe with ingredients."""
-        await self._validate_ingredients_exist(data.ingredients)
-
-        # Use model_dump to serialize Pydantic model to dict, excluding ingredients
-        recipe_dict = data.model_dump(mode="json", exclude={"ingredients"})
+        if self.write_queue is not None:
+            return await self.write_queue.submit(
+                lambda session: self._bind(session).create_recipe(data)
+            )
 
-        # Extract timing fields to top-level columns for SQLAlchemy model
-        timing = recipe_dict.pop("timing", {})
-        recipe_dict.update(
-            {
-                "prep_time_minutes": timing.get("prep_time_minutes"),
-                "cook_time_minutes": timing.get("cook_time_minutes"),
-                "marinating_time_minutes": timing.get("marinating_time_minutes"),
-                "resting_time_minutes": timing.get("resting_time_minutes"),
-                "inactive_time_minutes": timing.get("inactive_time_minutes"),
-                "total_active_time_minutes": timing.get("total_active_time_minutes"),
-                "timing": timing,  # Keep full timing dict for JSON column
-            }
-        )
+        await self._validate_ingredients_exist(data.ingredients)
 
-        recipe = await self.recipe_repo.create(RecipeModel(**recipe_dict))
+        recipe = await self.recipe_repo.create(self._to_model(data))
 
         if data.ingredients:
             await self._persist_ingredients(recipe.id, data.ingredients)
 
-        return await self.recipe_repo.get_by_id(recipe.id, load_ingredients=True) or recipe
+        return await self.recipe_repo.get_detail(recipe.id) or recipe
+
+    async def create_recipes(self, items: list[Recipe]) -> list[RecipeModel | str]:
+        """Create many recipes in one transaction.
+
+        Every referenced ingredient is checked with one query, recipes are
+        inserted with one flush, their associations with one executemany and
+        the results are read back with one joined query.
+        Items that fail validation are skipped, not fatal: the result holds,
+        in input order, either the created recipe (loaded with its
+        ingredients) or the error message for that item.
+        """
+        if self.write_queue is not None:
+            return await self.write_queue.submit(
+                lambda session: self._bind(session).create_recipes(items)
+            )
+
+        referenced = {ing.ingredient_id for item in items for ing in item.ingredients}
+        known = {ing.id for ing in await self.ingredient_repo.get_by_ids(list(referenced))}
+
+        results: list[RecipeModel | str] = []
+        created: list[tuple[RecipeModel, Recipe]] = []
+        for item in items:
+            try:
+                if not item.name or not item.instructions:
+                    raise ValueError("Recipe name and instructions are required")
+                self._check_ingredients(item.ingredients, known)
+            except ValueError as exc:
+                results.append(str(exc))
+                continue
+            recipe = self._to_model(item)
+            results.append(recipe)
+            created.append((recipe, item))
+
+        await self.recipe_repo.create_many([recipe for recipe, _ in created])
+        await self.recipe_ingredient_repo.insert_many(
+            [
+                {**self._serialize_ingredient_payload(ing), "recipe_id": recipe.id}
+                for recipe, item in created
+                for ing in item.ingredients
+            ]
+        )
+        loaded = {
+            recipe.id: recipe
+            for recipe in await self.recipe_repo.get_details([r.id for r, _ in created])
+        }
+        return [loaded[r.id] if isinstance(r, RecipeModel) else r for r in results]
 
     async def get_recipe(self, recipe_id: int, load_ingredients: bool = True) -> RecipeModel:
         """Get recipe by ID."""
@@ -71,21 +122,66 @@ class RecipeService:
     async def list_recipes(
         self,
         request: RecipeListRequest,
-    ) -> tuple[list[RecipeModel], int]:
-        """List recipes with filters and pagination."""
-        skip = (request.page - 1) * request.page_size
+    ) -> tuple[list[RecipeModel], int | None]:
+        """List recipes with filters and pagination (cursor takes precedence over page)."""
+        after = decode_cursor(request.cursor) if request.cursor else None
+        skip = 0 if after else (request.page - 1) * request.page_size
         recipes, total = await self.recipe_repo.list(
             max_prep_time_minutes=request.max_prep_time_minutes,
             max_cook_time_minutes=request.max_cook_time_minutes,
             cuisine=request.cuisine.value if request.cuisine else None,
             name_contains=request.name_contains,
+            cooking_method=request.cooking_method.value if request.cooking_method else None,
+            author=request.author,
+            meal_types=[meal.value for meal in request.meal_types],
+            dietary=[requirement.value for requirement in request.dietary],
+            exclude_allergens=[allergen.value for allergen in request.exclude_allergens],
+            ids=request.ids,
             skip=skip,
             limit=request.page_size,
+            after=after,
+            total_mode=request.total,
+            summary=request.view is ListView.SUMMARY,
         )
         return list(recipes), total
 
+    async def search_recipes(
+        self,
+        request: RecipeListRequest,
+    ) -> tuple[list[tuple[RecipeModel, float, str | None]], int | None]:
+        """Full-text search recipes by ``request.q``, best match first.
+
+        Results are relevance-ordered, so only page-based pagination applies.
+        """
+        if not request.q:
+            raise ValueError("Search query is required")
+        if request.cursor:
+            raise ValueError("Cursor pagination is not supported with a search query")
+        return await self.recipe_repo.search(
+            request.q,
+            max_prep_time_minutes=request.max_prep_time_minutes,
+            max_cook_time_minutes=request.max_cook_time_minutes,
+            cuisine=request.cuisine.value if request.cuisine else None,
+            name_contains=request.name_contains,
+            cooking_method=request.cooking_method.value if request.cooking_method else None,
+            author=request.author,
+            meal_types=[meal.value for meal in request.meal_types],
+            dietary=[requirement.value for requirement in request.dietary],
+            exclude_allergens=[allergen.value for allergen in request.exclude_allergens],
+            ids=request.ids,
+            skip=(request.page - 1) * request.page_size,
+            limit=request.page_size,
+            total_mode=request.total,
+            summary=request.view is ListView.SUMMARY,
+        )
+
     async def update_recipe(self, recipe_id: int, data: Recipe) -> RecipeModel:
         """Update a recipe and optionally its ingredients."""
+        if self.write_queue is not None:
+            return await self.write_queue.submit(
+                lambda session: self._bind(session).update_recipe(recipe_id, data)
+            )
+
         recipe = await self.get_recipe(recipe_id, load_ingredients=False)
 
         self._apply_recipe_updates(recipe, data)
@@ -96,35 +192,65 @@ class RecipeService:
             serialized = [self._serialize_ingredient_payload(ing) for ing in data.ingredients]
             await self.recipe_ingredient_repo.upsert_recipe_ingredients(recipe.id, serialized)
 
-        return await self.recipe_repo.get_by_id(recipe.id, load_ingredients=True) or recipe
+        return await self.recipe_repo.get_detail(recipe.id) or recipe
 
     async def delete_recipe(self, recipe_id: int) -> None:
         """Soft delete a recipe."""
+        if self.write_queue is not None:
+            await self.write_queue.submit(
+                lambda session: self._bind(session).delete_recipe(recipe_id)
+            )
+            return
+
         recipe = await self.get_recipe(recipe_id, load_ingredients=False)
         await self.recipe_repo.soft_delete(recipe)
 
+    async def get_recipe_detail(self, recipe_id: int) -> RecipeDetail:
+        """Get a recipe with its ingredients, loaded in a single query."""
+        recipe = await self.recipe_repo.get_detail(recipe_id)
+        if not recipe:
+            raise ValueError(f"Recipe with ID {recipe_id} not found")
+        return self.build_detail(recipe)
+
     async def get_recipe_ingredients(self, recipe_id: int) -> list[RecipeIngredientRead]:
         """Get all ingredients for a recipe with details."""
-        recipe = await self.get_recipe(recipe_id, load_ingredients=True)
+        return (await self.get_recipe_detail(recipe_id)).ingredients
 
-        ingredients: list[RecipeIngredientRead] = []
-        for assoc in recipe.ingredient_associations:
-            payload = dict(assoc.preparation_details or {})
-            payload.update(
-                {
-                    "id": assoc.id,
-                    "ingredient_id": assoc.ingredient_id,
-                    "ingredient_name": assoc.ingredient.name,
-                }
-            )
-            payload.setdefault("order_in_recipe", assoc.order_in_recipe)
-            payload.setdefault("is_optional", assoc.is_optional)
-            if "quantity" not in payload and assoc.quantity is not None:
-                payload["quantity"] = float(assoc.quantity)
-            if "unit" not in payload:
-                payload["unit"] = assoc.unit
-            ingredients.append(RecipeIngredientRead.model_validate(payload))
-        return ingredients
+    @classmethod
+    def build_detail(cls, recipe: RecipeModel) -> RecipeDetail:
+        """Assemble a detail response from a recipe loaded by ``get_detail``.
+
+        Reads only the already loaded object graph; no queries are issued.
+        """
+        # Recipe.ingredients holds bare preparation specs; the detail lists
+        # them with ids and ingredient names, so it is filled from the graph
+        fields = {
+            name: getattr(recipe, name)
+            for name in RecipeDetail.model_fields
+            if name not in ("ingredients", "missing_ingredients") and hasattr(recipe, name)
+        }
+        fields["ingredients"] = [
+            cls._ingredient_read(assoc) for assoc in recipe.ingredient_associations
+        ]
+        return RecipeDetail.model_validate(fields)
+
+    @staticmethod
+    def _ingredient_read(assoc: RecipeIngredient) -> RecipeIngredientRead:
+        payload = dict(assoc.preparation_details or {})
+        payload.update(
+            {
+                "id": assoc.id,
+                "ingredient_id": assoc.ingredient_id,
+                "ingredient_name": assoc.ingredient.name,
+            }
+        )
+        payload.setdefault("order_in_recipe", assoc.order_in_recipe)
+        payload.setdefault("is_optional", assoc.is_optional)
+        if "quantity" not in payload and assoc.quantity is not None:
+            payload["quantity"] = float(assoc.quantity)
+        if "unit" not in payload:
+            payload["unit"] = assoc.unit
+        return RecipeIngredientRead.model_validate(payload)
 
     async def calculate_missing_ingredients(
         self,
@@ -152,9 +278,40 @@ class RecipeService:
             return
         ingredient_ids = [ing.ingredient_id for ing in ingredients]
         existing_ingredients = await self.ingredient_repo.get_by_ids(ingredient_ids)
-        if len(existing_ingredients) != len(set(ingredient_ids)):
+        self._check_ingredients(ingredients, {ing.id for ing in existing_ingredients})
+
+    @staticmethod
+    def _check_ingredients(
+        ingredients: Iterable[IngredientPreparation], known_ids: set[int]
+    ) -> None:
+        """Raise if an ingredient is listed twice or is not among ``known_ids``."""
+        ingredient_ids = [ing.ingredient_id for ing in ingredients]
+        if len(ingredient_ids) != len(set(ingredient_ids)):
+            raise ValueError("Each ingredient can only be listed once per recipe")
+        if not known_ids.issuperset(ingredient_ids):
             raise ValueError("One or more ingredient IDs are invalid")
 
+    @staticmethod
+    def _to_model(data: Recipe) -> RecipeModel:
+        """Build a new recipe row from the core schema."""
+        # Use model_dump to serialize Pydantic model to dict, excluding ingredients
+        recipe_dict = data.model_dump(mode="json", exclude={"ingredients"})
+
+        # Extract timing fields to top-level columns for SQLAlchemy model
+        timing = recipe_dict.pop("timing", {})
+        recipe_dict.update(
+            {
+                "prep_time_minutes": timing.get("prep_time_minutes"),
+                "cook_time_minutes": timing.get("cook_time_minutes"),
+                "marinating_time_minutes": timing.get("marinating_time_minutes"),
+                "resting_time_minutes": timing.get("resting_time_minutes"),
+                "inactive_time_minutes": timing.get("inactive_time_minutes"),
+                "total_active_time_minutes": timing.get("total_active_time_minutes"),
+                "timing": timing,  # Keep full timing dict for JSON column
+            }
+        )
+        return RecipeModel(**recipe_dict)
+
     def _apply_recipe_updates(self, recipe: RecipeModel, data: Recipe) -> None:
         """Apply partial updates to recipe instance."""
         # Get non-None fields from Pydantic model, excluding ingredients
@@ -183,13 +340,12 @@ class RecipeService:
         recipe_id: int,
         ingredients: Iterable[IngredientPreparation],
     ) -> None:
-        """Persist ingredient associations for a recipe."""
-        for ing in ingredients:
-            payload = self._serialize_ingredient_payload(ing)
-            association = RecipeIngredient(recipe_id=recipe_id, **payload)
-            await self.recipe_ingredient_repo.create(association)
+        """Persist ingredient associations for a new recipe."""
+        await self.recipe_ingredient_repo.bulk_create(
+            recipe_id, [self._serialize_ingredient_payload(ing) for ing in ingredients]
+        )
 
-    def _serialize_ingredient_payload(self, ingredient: IngredientPreparation) -> dict:
+    def _serialize_ingredient_payload(self, ingredient: IngredientPreparation) -> dict[str, Any]:
         """Convert an ingredient preparation into persistence payload."""
         detail_json = ingredient.model_dump(mode="json")
         return {
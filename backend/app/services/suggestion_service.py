@@ -2,10 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import AsyncIterator
+
+from app.logging import get_logger
 from app.repositories import SuggestionRepository
 from app.schemas.core.ingredient import Ingredient
 from app.schemas.core.recipe import Recipe
 from app.schemas.requests.suggestion import IngredientSuggestionRequest, SuggestionRequest
+from app.schemas.responses.suggestion import (
+    RecipeSuggestionError,
+    RecipeSuggestionEvent,
+    RecipeSuggestionSummary,
+)
+
+logger = get_logger(__name__)
 
 DEFAULT_COMPLETION_PROMPT = (
     "Complete this partially specified recipe with coherent instructions, ingredient quantities, "
@@ -42,6 +54,53 @@ class SuggestionService:
             draft=request.recipe,
         )
 
+    async def stream_recipe_completions(
+        self, request: SuggestionRequest
+    ) -> AsyncIterator[RecipeSuggestionEvent | RecipeSuggestionError | RecipeSuggestionSummary]:
+        """Complete a recipe draft ``n_completions`` times, yielding each variation when ready.
+
+        Every variation is its own Marvin call and all run at once, so the
+        first event arrives after the fastest one. A failed variation is
+        reported and the others continue; a summary event comes last.
+        Leaving early stops waiting for the calls still running.
+        """
+        prompt = request.prompt or DEFAULT_COMPLETION_PROMPT
+        started = time.perf_counter()
+        summary = RecipeSuggestionSummary()
+        pending = {
+            asyncio.ensure_future(
+                self.suggestion_repo.generate_recipe(
+                    prompt=prompt, n_completions=1, draft=request.recipe, variant=index
+                )
+            ): index
+            for index in range(request.n_completions)
+        }
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = pending.pop(task)
+                    try:
+                        recipes = task.result()
+                    except Exception as exc:
+                        logger.warning("recipe_variation_failed", index=index, exc_info=True)
+                        summary.failed += 1
+                        yield RecipeSuggestionError(index=index, error=str(exc))
+                        continue
+                    if not recipes:
+                        summary.failed += 1
+                        yield RecipeSuggestionError(index=index, error="No recipe was returned")
+                        continue
+                    if summary.first_ms is None:
+                        summary.first_ms = round((time.perf_counter() - started) * 1000, 1)
+                    summary.completed += 1
+                    yield RecipeSuggestionEvent(index=index, recipe=recipes[0])
+        finally:
+            for task in pending:
+                task.cancel()
+        summary.total_ms = round((time.perf_counter() - started) * 1000, 1)
+        yield summary
+
     async def complete_ingredient(
         self, request: IngredientSuggestionRequest
     ) -> list[Ingredient]:
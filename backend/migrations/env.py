@@ -16,16 +16,27 @@ from app.models.base import Base
 # Alembic Config object
 config = context.config
 
-# Interpret the config file for Python logging
-if config.config_file_name is not None:
+# Interpret the config file for Python logging (the app configures its own at startup)
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
     fileConfig(config.config_file_name)
 
 # Model metadata for autogenerate support
 target_metadata = Base.metadata
 
-# Get database URL from settings
-settings = get_settings()
-config.set_main_option("sqlalchemy.url", settings.database_url)
+# Get database URL from settings unless the caller (e.g. startup migration) set one
+if not config.get_main_option("sqlalchemy.url"):
+    config.set_main_option("sqlalchemy.url", get_settings().database_url.replace("%", "%%"))
+
+
+# Search structures managed by hand-written DDL (see app.models.search)
+UNMANAGED_NAMES = {"search_vector", "idx_recipe_search_vector", "idx_ingredient_name_trgm"}
+
+
+def include_name(name: str | None, type_: str, _parent_names: dict) -> bool:
+    """Keep FTS shadow tables and search columns out of autogenerate."""
+    if type_ == "table" and name and "_fts" in name:
+        return False
+    return name not in UNMANAGED_NAMES
 
 
 def run_migrations_offline() -> None:
@@ -36,6 +47,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_name=include_name,
     )
 
     with context.begin_transaction():
@@ -44,7 +56,9 @@ def run_migrations_offline() -> None:
 
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations with connection."""
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection, target_metadata=target_metadata, include_name=include_name
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -24,6 +24,12 @@ def upgrade() -> None:
     bind = op.get_bind()
     conn = bind  # synchronous connection for execute()
     inspector = inspect(bind)
+    # Only legacy databases (recipes.prep_time) need adopting; fresh ones are
+    # created at the current shape by 20251116_initial_schema.
+    if "recipes" not in inspector.get_table_names() or "prep_time" not in {
+        col["name"] for col in inspector.get_columns("recipes")
+    }:
+        return
     existing_ingredient_cols = {col["name"] for col in inspector.get_columns("ingredients")}
     is_sqlite = bind.dialect.name == "sqlite"
 
@@ -19,6 +19,11 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade database schema."""
+    # Databases created by Base.metadata.create_all (or adopted by b8f5bf5b6e64)
+    # already have these tables; only stamp them.
+    if sa.inspect(op.get_bind()).has_table("ingredients"):
+        return
+
     # Table: ingredients
     op.create_table(
         "ingredients",
@@ -89,8 +94,8 @@ def upgrade() -> None:
     op.create_index("ix_recipes_name", "recipes", ["name"], unique=False)
     op.create_index("ix_recipes_author", "recipes", ["author"], unique=False)
     op.create_index("ix_recipes_cooking_method", "recipes", ["cooking_method"], unique=False)
-    op.create_index("idx_recipe_method_deleted", "recipes", ["cooking_method", "is_deleted"], False)
-    op.create_index("idx_recipe_author_deleted", "recipes", ["author", "is_deleted"], False)
+    op.create_index("idx_recipe_method_deleted", "recipes", ["cooking_method", "is_deleted"])
+    op.create_index("idx_recipe_author_deleted", "recipes", ["author", "is_deleted"])
 
     # Table: recipe_ingredients
     op.create_table(
@@ -109,11 +114,11 @@ def upgrade() -> None:
         sa.UniqueConstraint("recipe_id", "ingredient_id", name="uq_recipe_ingredient"),
     )
     op.create_index(
-        "idx_recipe_ingredient_pair", "recipe_ingredients", ["recipe_id", "ingredient_id"], False
+        "idx_recipe_ingredient_pair", "recipe_ingredients", ["recipe_id", "ingredient_id"]
     )
-    op.create_index("ix_recipe_ingredients_recipe_id", "recipe_ingredients", ["recipe_id"], False)
+    op.create_index("ix_recipe_ingredients_recipe_id", "recipe_ingredients", ["recipe_id"])
     op.create_index(
-        "ix_recipe_ingredients_ingredient_id", "recipe_ingredients", ["ingredient_id"], False
+        "ix_recipe_ingredients_ingredient_id", "recipe_ingredients", ["ingredient_id"]
     )
 
 
@@ -0,0 +1,45 @@
+"""persistent Marvin completion cache
+
+Revision ID: 20261017_completion_cache
+Revises: 20261017_tag_masks
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_completion_cache"
+down_revision: str | Sequence[str] | None = "20261017_tag_masks"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_table(
+        "completion_cache",
+        sa.Column("key", sa.String(length=64), nullable=False),
+        sa.Column("target", sa.String(length=50), nullable=False),
+        sa.Column("data", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_completion_cache_expires_at",
+        "completion_cache",
+        ["expires_at"],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index("idx_completion_cache_expires_at", table_name="completion_cache")
+    op.drop_table("completion_cache")
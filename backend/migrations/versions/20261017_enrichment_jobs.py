@@ -0,0 +1,61 @@
+"""background ingredient enrichment queue
+
+Revision ID: 20261017_enrichment_jobs
+Revises: 20261017_completion_cache
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_enrichment_jobs"
+down_revision: str | Sequence[str] | None = "20261017_completion_cache"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    existing = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("ingredients")}
+    # create_all databases may already have it; SQLite has no ADD COLUMN IF NOT EXISTS
+    if "enrichment_pending" not in existing:
+        op.add_column(
+            "ingredients",
+            sa.Column(
+                "enrichment_pending", sa.Boolean(), server_default=sa.false(), nullable=False
+            ),
+        )
+    op.create_table(
+        "enrichment_jobs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("ingredient_id", sa.Integer(), nullable=False),
+        sa.Column("draft", sa.JSON(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("run_after", sa.DateTime(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["ingredient_id"], ["ingredients.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("ingredient_id"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_enrichment_jobs_run_after",
+        "enrichment_jobs",
+        ["run_after"],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index("idx_enrichment_jobs_run_after", table_name="enrichment_jobs")
+    op.drop_table("enrichment_jobs")
+    # Native DROP COLUMN (SQLite 3.35+); batch mode would recreate the table
+    # and lose its triggers and expression indexes
+    op.drop_column("ingredients", "enrichment_pending")
@@ -0,0 +1,79 @@
+"""ingredient name trigram search
+
+Revision ID: 20261017_ingredient_trgm
+Revises: 20261017_recipe_fts
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_ingredient_trgm"
+down_revision: str | Sequence[str] | None = "20261017_recipe_fts"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SQLITE_UPGRADE = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS ingredients_fts USING fts5(
+        name, content='ingredients', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS ingredients_fts_ai AFTER INSERT ON ingredients BEGIN
+        INSERT INTO ingredients_fts(rowid, name) VALUES (new.id, new.name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS ingredients_fts_ad AFTER DELETE ON ingredients BEGIN
+        INSERT INTO ingredients_fts(ingredients_fts, rowid, name)
+        VALUES ('delete', old.id, old.name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS ingredients_fts_au AFTER UPDATE OF name ON ingredients BEGIN
+        INSERT INTO ingredients_fts(ingredients_fts, rowid, name)
+        VALUES ('delete', old.id, old.name);
+        INSERT INTO ingredients_fts(rowid, name) VALUES (new.id, new.name);
+    END
+    """,
+    # Index ingredients that already exist
+    "INSERT INTO ingredients_fts(ingredients_fts) VALUES ('rebuild')",
+)
+
+POSTGRES_UPGRADE = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS idx_ingredient_name_trgm "
+    "ON ingredients USING GIN (name gin_trgm_ops)",
+)
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_index(
+        "idx_ingredient_deleted_lower_name",
+        "ingredients",
+        ["is_deleted", sa.text("lower(name)"), "name"],
+        unique=False,
+        if_not_exists=True,
+    )
+    dialect = op.get_bind().dialect.name
+    statements = {"sqlite": SQLITE_UPGRADE, "postgresql": POSTGRES_UPGRADE}.get(dialect, ())
+    for statement in statements:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for trigger in ("ingredients_fts_au", "ingredients_fts_ad", "ingredients_fts_ai"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS ingredients_fts")
+    elif dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS idx_ingredient_name_trgm")
+    op.drop_index("idx_ingredient_deleted_lower_name", table_name="ingredients")
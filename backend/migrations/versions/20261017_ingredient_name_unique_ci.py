@@ -0,0 +1,60 @@
+"""case-insensitive unique ingredient names
+
+Revision ID: 20261017_ingredient_name_ci
+Revises: 20261017_ingredient_trgm
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_ingredient_name_ci"
+down_revision: str | Sequence[str] | None = "20261017_ingredient_trgm"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    bind = op.get_bind()
+    live_duplicates = bind.execute(
+        sa.text(
+            "SELECT lower(name) FROM ingredients WHERE NOT is_deleted "
+            "GROUP BY lower(name) HAVING count(*) > 1"
+        )
+    ).scalars()
+    names = sorted(live_duplicates)
+    if names:
+        raise RuntimeError(
+            "Ingredients differing only in case must be merged before upgrading: "
+            + ", ".join(names)
+        )
+
+    # Deleted rows may share a name with a newer row; keep them apart by renaming
+    op.execute(
+        """
+        UPDATE ingredients SET name = substr(name, 1, 80) || ' (deleted ' || id || ')'
+        WHERE is_deleted AND EXISTS (
+            SELECT 1 FROM ingredients AS other
+            WHERE lower(other.name) = lower(ingredients.name)
+              AND other.id <> ingredients.id
+              AND (NOT other.is_deleted OR other.id > ingredients.id)
+        )
+        """
+    )
+    op.create_index(
+        "uq_ingredient_lower_name",
+        "ingredients",
+        [sa.text("lower(name)")],
+        unique=True,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index("uq_ingredient_lower_name", table_name="ingredients")
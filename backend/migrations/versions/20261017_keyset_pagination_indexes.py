@@ -0,0 +1,41 @@
+"""keyset pagination indexes
+
+Revision ID: 20261017_keyset_indexes
+Revises: 20261017_merge_heads
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_keyset_indexes"
+down_revision: str | Sequence[str] | None = "20261017_merge_heads"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_index(
+        "idx_ingredient_deleted_name_id",
+        "ingredients",
+        ["is_deleted", "name", "id"],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_recipe_deleted_name_id",
+        "recipes",
+        ["is_deleted", "name", "id"],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index("idx_recipe_deleted_name_id", table_name="recipes")
+    op.drop_index("idx_ingredient_deleted_name_id", table_name="ingredients")
@@ -0,0 +1,72 @@
+"""partial indexes over live rows
+
+Revision ID: 20261017_live_indexes
+Revises: 20261017_ingredient_name_ci
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_live_indexes"
+down_revision: str | Sequence[str] | None = "20261017_ingredient_name_ci"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (name, table, columns); each replaces an index that carried is_deleted as a column
+LIVE_INDEXES = (
+    ("idx_ingredient_live_name_id", "ingredients", ["name", "id"]),
+    ("idx_ingredient_live_category", "ingredients", ["category", "name", "id"]),
+    ("idx_ingredient_live_storage_location", "ingredients", ["storage_location", "name", "id"]),
+    ("idx_ingredient_live_expiry_date", "ingredients", ["expiry_date"]),
+    ("idx_ingredient_live_lower_name", "ingredients", [sa.text("lower(name)"), "name"]),
+    ("idx_recipe_live_name_id", "recipes", ["name", "id"]),
+    ("idx_recipe_live_cooking_method", "recipes", ["cooking_method", "name", "id"]),
+    ("idx_recipe_live_author", "recipes", ["author", "name", "id"]),
+)
+
+REPLACED_INDEXES = (
+    ("idx_ingredient_deleted_name_id", "ingredients", ["is_deleted", "name", "id"]),
+    (
+        "idx_ingredient_category_location_deleted",
+        "ingredients",
+        ["category", "storage_location", "is_deleted"],
+    ),
+    (
+        "idx_ingredient_deleted_lower_name",
+        "ingredients",
+        ["is_deleted", sa.text("lower(name)"), "name"],
+    ),
+    ("idx_recipe_deleted_name_id", "recipes", ["is_deleted", "name", "id"]),
+    ("idx_recipe_method_deleted", "recipes", ["cooking_method", "is_deleted"]),
+    ("idx_recipe_author_deleted", "recipes", ["author", "is_deleted"]),
+)
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Same predicate text the queries render, so the planner can match it
+    for name, table, columns in LIVE_INDEXES:
+        op.create_index(
+            name,
+            table,
+            columns,
+            unique=False,
+            if_not_exists=True,
+            sqlite_where=sa.text("is_deleted IS 0"),
+            postgresql_where=sa.text("is_deleted IS false"),
+        )
+    for name, table, _ in REPLACED_INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    for name, table, columns in REPLACED_INDEXES:
+        op.create_index(name, table, columns, unique=False, if_not_exists=True)
+    for name, table, _ in LIVE_INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
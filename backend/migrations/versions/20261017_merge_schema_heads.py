@@ -0,0 +1,23 @@
+"""merge legacy adoption and initial schema heads
+
+Revision ID: 20261017_merge_heads
+Revises: b8f5bf5b6e64, 20251116_initial_schema
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_merge_heads"
+down_revision: str | Sequence[str] | None = ("b8f5bf5b6e64", "20251116_initial_schema")
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
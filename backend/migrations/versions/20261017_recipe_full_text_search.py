@@ -0,0 +1,83 @@
+"""recipe full-text search
+
+Revision ID: 20261017_recipe_fts
+Revises: 20261017_keyset_indexes
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_recipe_fts"
+down_revision: str | Sequence[str] | None = "20261017_keyset_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SQLITE_UPGRADE = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS recipes_fts USING fts5(
+        name, description, instructions, tags,
+        content='recipes', content_rowid='id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS recipes_fts_ai AFTER INSERT ON recipes BEGIN
+        INSERT INTO recipes_fts(rowid, name, description, instructions, tags)
+        VALUES (new.id, new.name, new.description, new.instructions, new.tags);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS recipes_fts_ad AFTER DELETE ON recipes BEGIN
+        INSERT INTO recipes_fts(recipes_fts, rowid, name, description, instructions, tags)
+        VALUES ('delete', old.id, old.name, old.description, old.instructions, old.tags);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS recipes_fts_au
+    AFTER UPDATE OF name, description, instructions, tags ON recipes BEGIN
+        INSERT INTO recipes_fts(recipes_fts, rowid, name, description, instructions, tags)
+        VALUES ('delete', old.id, old.name, old.description, old.instructions, old.tags);
+        INSERT INTO recipes_fts(rowid, name, description, instructions, tags)
+        VALUES (new.id, new.name, new.description, new.instructions, new.tags);
+    END
+    """,
+    # Index recipes that already exist
+    "INSERT INTO recipes_fts(recipes_fts) VALUES ('rebuild')",
+)
+
+POSTGRES_UPGRADE = (
+    """
+    ALTER TABLE recipes ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(name, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(tags::text, '')), 'B')
+        || setweight(to_tsvector('english', coalesce(description, '')), 'C')
+        || setweight(to_tsvector('english', coalesce(instructions, '')), 'D')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_recipe_search_vector ON recipes USING GIN (search_vector)",
+)
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    dialect = op.get_bind().dialect.name
+    statements = {"sqlite": SQLITE_UPGRADE, "postgresql": POSTGRES_UPGRADE}.get(dialect, ())
+    for statement in statements:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for trigger in ("recipes_fts_au", "recipes_fts_ad", "recipes_fts_ai"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS recipes_fts")
+    elif dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS idx_recipe_search_vector")
+        op.execute("ALTER TABLE recipes DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,137 @@
+"""recipe tag bitmask columns
+
+Revision ID: 20261017_tag_masks
+Revises: 20261017_retention
+Create Date: 2026-10-17
+
+"""
+
+import json
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_tag_masks"
+down_revision: str | Sequence[str] | None = "20261017_retention"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Enum values in definition order as of this revision; bit i is value i
+TAG_MASKS = {
+    "cuisine_mask": (
+        "cuisine_types",
+        (
+            "italian", "indian", "japanese", "chinese", "french", "mexican", "thai",
+            "mediterranean", "american", "middle_eastern", "korean", "vietnamese", "greek",
+            "spanish", "turkish", "moroccan", "ethiopian", "fusion", "other",
+        ),
+    ),
+    "meal_mask": (
+        "meal_types",
+        (
+            "breakfast", "brunch", "lunch", "dinner", "snack", "appetizer", "side_dish",
+            "main_course", "dessert", "beverage",
+        ),
+    ),
+    "dietary_mask": (
+        "dietary_requirements",
+        (
+            "vegetarian", "vegan", "pescatarian", "gluten_free", "dairy_free", "nut_free",
+            "soy_free", "egg_free", "kosher", "halal", "low_carb", "keto", "paleo", "whole30",
+            "low_sodium", "low_fat", "low_calorie",
+        ),
+    ),
+    "allergen_mask": (
+        "contains_allergens",
+        ("nuts", "dairy", "shellfish", "fish", "eggs", "soy", "wheat", "sesame"),
+    ),
+}  # fmt: skip
+MASK_COLUMNS = list(TAG_MASKS)
+TAGS_INDEX_COLUMNS = ["name", "id", *MASK_COLUMNS, "is_deleted"]
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _mask(values: object, members: tuple[str, ...]) -> int:
+    if isinstance(values, str):
+        values = json.loads(values)
+    mask = 0
+    for value in values or ():
+        if value in members:
+            mask |= 1 << members.index(value)
+    return mask
+
+
+def _backfill() -> None:
+    bind = op.get_bind()
+    list_columns = ", ".join(column for column, _ in TAG_MASKS.values())
+    update = sa.text(
+        "UPDATE recipes SET "
+        + ", ".join(f"{mask} = :{mask}" for mask in MASK_COLUMNS)
+        + " WHERE id = :id"
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                f"SELECT id, {list_columns} FROM recipes WHERE id > :last_id ORDER BY id LIMIT :n"
+            ),
+            {"last_id": last_id, "n": BACKFILL_BATCH_SIZE},
+        ).all()
+        if not rows:
+            return
+        bind.execute(
+            update,
+            [
+                {
+                    "id": row[0],
+                    **{
+                        mask: _mask(row[i + 1], members)
+                        for i, (mask, (_, members)) in enumerate(TAG_MASKS.items())
+                    },
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    existing = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("recipes")}
+    for mask in MASK_COLUMNS:
+        # create_all databases may already have it; SQLite has no ADD COLUMN IF NOT EXISTS
+        if mask not in existing:
+            op.add_column(
+                "recipes", sa.Column(mask, sa.Integer(), server_default="0", nullable=False)
+            )
+    _backfill()
+
+    op.drop_index("idx_recipe_live_name_id", table_name="recipes", if_exists=True)
+    op.create_index(
+        "idx_recipe_live_tags",
+        "recipes",
+        TAGS_INDEX_COLUMNS,
+        unique=False,
+        if_not_exists=True,
+        sqlite_where=sa.text("is_deleted IS 0"),
+        postgresql_where=sa.text("is_deleted IS false"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index("idx_recipe_live_tags", table_name="recipes")
+    op.create_index(
+        "idx_recipe_live_name_id",
+        "recipes",
+        ["name", "id"],
+        unique=False,
+        sqlite_where=sa.text("is_deleted IS 0"),
+        postgresql_where=sa.text("is_deleted IS false"),
+    )
+    for mask in MASK_COLUMNS:
+        # Native DROP COLUMN (SQLite 3.35+); batch mode would recreate the table
+        # and lose its triggers and expression indexes
+        op.drop_column("recipes", mask)
@@ -0,0 +1,75 @@
+"""soft-delete timestamps and purge archive
+
+Revision ID: 20261017_retention
+Revises: 20261017_live_indexes
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_retention"
+down_revision: str | Sequence[str] | None = "20261017_live_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SOFT_DELETE_TABLES = (
+    ("ingredients", "idx_ingredient_deleted_at"),
+    ("recipes", "idx_recipe_deleted_at"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    inspector = sa.inspect(op.get_bind())
+    for table, index in SOFT_DELETE_TABLES:
+        # create_all databases may already have it; SQLite has no ADD COLUMN IF NOT EXISTS
+        if "deleted_at" not in {column["name"] for column in inspector.get_columns(table)}:
+            op.add_column(table, sa.Column("deleted_at", sa.DateTime(), nullable=True))
+        # Deleted rows are not edited afterwards, so their last update is the deletion
+        op.execute(
+            f"UPDATE {table} SET deleted_at = updated_at WHERE is_deleted AND deleted_at IS NULL"
+        )
+        op.create_index(
+            index,
+            table,
+            ["deleted_at"],
+            unique=False,
+            if_not_exists=True,
+            sqlite_where=sa.text("is_deleted IS 1"),
+            postgresql_where=sa.text("is_deleted IS true"),
+        )
+
+    op.create_table(
+        "archived_rows",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("table_name", sa.String(length=50), nullable=False),
+        sa.Column("row_id", sa.Integer(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.Column("archived_at", sa.DateTime(), nullable=False),
+        sa.Column("data", sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_archived_row_table_row",
+        "archived_rows",
+        ["table_name", "row_id"],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index("idx_archived_row_table_row", table_name="archived_rows")
+    op.drop_table("archived_rows")
+    for table, index in SOFT_DELETE_TABLES:
+        op.drop_index(index, table_name=table)
+        # Native DROP COLUMN (SQLite 3.35+); batch mode would recreate the table
+        # and lose its triggers and expression indexes
+        op.drop_column(table, "deleted_at")
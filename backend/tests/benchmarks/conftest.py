@@ -0,0 +1,45 @@
+"""Benchmark fixtures.
+
+Benchmarks run against file-backed SQLite databases under ``tmp_path`` so that
+connection pooling, WAL and PRAGMA effects are measured the way production sees
+them. Row counts are kept small by default; set ``MENOO_BENCH_SCALE`` to multiply
+them (e.g. ``MENOO_BENCH_SCALE=50 pytest tests/benchmarks --benchmark-only``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Callable, Coroutine, Iterator
+from typing import Any
+
+import pytest
+
+from app.config import Settings
+
+BENCH_SCALE = int(os.environ.get("MENOO_BENCH_SCALE", "1"))
+
+
+def scaled(rows: int) -> int:
+    """Scale a default row count by ``MENOO_BENCH_SCALE``."""
+    return rows * BENCH_SCALE
+
+
+@pytest.fixture
+def run() -> Iterator[Callable[[Coroutine[Any, Any, Any]], Any]]:
+    """Run coroutines on a dedicated event loop (pytest-benchmark is synchronous)."""
+    loop = asyncio.new_event_loop()
+    try:
+        yield loop.run_until_complete
+    finally:
+        loop.close()
+
+
+@pytest.fixture
+def bench_settings(tmp_path) -> Callable[..., Settings]:
+    """Build settings pointing at a file-backed SQLite database under tmp_path."""
+
+    def factory(name: str = "bench.db", **overrides: Any) -> Settings:
+        return Settings(database_url=f"sqlite+aiosqlite:///{tmp_path / name}", **overrides)
+
+    return factory
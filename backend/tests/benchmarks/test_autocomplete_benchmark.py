@@ -0,0 +1,77 @@
+"""Benchmark ingredient autocomplete against an ``ILIKE`` scan.
+
+Autocomplete runs on every keystroke, so per-call latency is what matters.
+Prefix input is a covering index range scan, substrings go through the FTS5
+trigram index and typos add one trigram candidate query. Run with
+``MENOO_BENCH_SCALE=10`` for 100k ingredients.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from app.config import Settings
+from app.database import DatabaseManager
+from app.models import Ingredient
+from app.repositories import IngredientRepository
+from tests.benchmarks.conftest import scaled
+from tests.fixtures.seeding import seed_ingredients
+
+ROWS = scaled(10_000)
+LIMIT = 10
+# Seeded names are "Ingredient 0000000" .. in index order
+INPUTS = {
+    "prefix": "ingredient 00012",
+    "substring": "0001234",
+    "typo": "ingrdient 0001234",
+}
+
+
+@pytest.fixture(scope="module")
+def autocomplete_manager(tmp_path_factory):
+    """Seed ingredients once for every input."""
+    path = tmp_path_factory.mktemp("autocomplete") / "bench.db"
+    manager = DatabaseManager(Settings(database_url=f"sqlite+aiosqlite:///{path}"))
+    loop = asyncio.new_event_loop()
+
+    async def setup() -> None:
+        await manager.init_db()
+        async with manager.get_session_factory()() as session:
+            await seed_ingredients(session, ROWS)
+
+    loop.run_until_complete(setup())
+    loop.run_until_complete(manager.close())
+    loop.close()
+    return manager
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("kind", INPUTS)
+@pytest.mark.parametrize("strategy", ["ilike", "autocomplete"])
+def test_autocomplete_latency(benchmark, run, autocomplete_manager, strategy, kind):
+    """Suggest names for one keystroke on a warm read-only session."""
+    benchmark.group = f"autocomplete: {kind}"
+    text = INPUTS[kind]
+
+    async def suggest(session) -> int:
+        if strategy == "autocomplete":
+            return len(await IngredientRepository(session).autocomplete(text, limit=LIMIT))
+        result = await session.execute(
+            select(Ingredient.id, Ingredient.name)
+            .where(Ingredient.is_deleted.is_(False), Ingredient.name.ilike(f"%{text}%"))
+            .order_by(Ingredient.name)
+            .limit(LIMIT)
+        )
+        return len(result.all())
+
+    session = autocomplete_manager.get_read_session_factory()()
+    try:
+        found = benchmark.pedantic(lambda: run(suggest(session)), rounds=200, warmup_rounds=5)
+    finally:
+        run(session.close())
+        run(autocomplete_manager.close())
+    # ILIKE has no typo tolerance; everything else finds at least the target
+    assert found >= (0 if strategy == "ilike" and kind == "typo" else 1)
@@ -0,0 +1,26 @@
+"""Benchmark cold-start schema preparation for each startup schema mode."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.database import DatabaseManager
+
+MODES = ["create_all", "check", "migrate"]
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("mode", MODES)
+def test_cold_start(benchmark, run, bench_settings, mode):
+    """Open a fresh manager on an up-to-date database, prepare the schema and close it."""
+    benchmark.group = "cold-start: init_db"
+    setup = DatabaseManager(bench_settings(database_schema_mode="migrate"))
+    run(setup.init_db())
+    run(setup.close())
+
+    async def cold_start() -> None:
+        manager = DatabaseManager(bench_settings(database_schema_mode=mode))
+        await manager.init_db()
+        await manager.close()
+
+    benchmark.pedantic(lambda: run(cold_start()), rounds=30, warmup_rounds=2)
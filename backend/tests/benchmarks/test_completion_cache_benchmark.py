@@ -0,0 +1,59 @@
+"""Benchmark ingredient completions with and without the completion cache.
+
+Marvin is replaced by a coroutine that sleeps ``MODEL_LATENCY_MS``, a
+conservative stand-in for an OpenAI round trip, so the numbers show what a
+hit saves. Each round completes ``NAMES`` drafts that a pantry sees over
+and over. ``memory`` answers from the worker's LRU; ``persistent`` starts
+each round with an empty LRU, as a fresh worker would, and reads the table.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import marvin
+import pytest
+
+from app.core.completion_cache import CompletionCache
+from app.database import DatabaseManager
+from app.repositories import SuggestionRepository, suggestion_repository
+from app.schemas.core.ingredient import Ingredient
+
+MODEL_LATENCY_MS = 300
+NAMES = ["Milk", "Eggs", "Butter", "Flour", "Sugar"]
+PROMPT = "Complete this ingredient."
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("mode", ["uncached", "memory", "persistent"])
+def test_repeated_ingredient_completions(benchmark, run, bench_settings, monkeypatch, mode):
+    """Complete the same NAMES drafts once per round."""
+    benchmark.group = f"ingredient completion: {len(NAMES)} repeated drafts"
+
+    async def generate_async(*, target, n, instructions, context):
+        await asyncio.sleep(MODEL_LATENCY_MS / 1000)
+        return [target(**{**context, "category": "dairy", "storage_location": "fridge"})]
+
+    monkeypatch.setattr(suggestion_repository, "configure_marvin", lambda: None)
+    monkeypatch.setattr(marvin, "generate_async", generate_async)
+    manager = DatabaseManager(bench_settings())
+    factory = manager.get_session_factory()
+    run(manager.init_db())
+    caches = [CompletionCache(factory, ttl_seconds=3600)]
+
+    async def complete_all() -> int:
+        if mode == "persistent":
+            caches.append(CompletionCache(factory, ttl_seconds=3600))
+        cache = caches[-1]
+        async with factory() as session:
+            repo = SuggestionRepository(session, None if mode == "uncached" else cache)
+            for name in NAMES:
+                await repo.generate_ingredient(PROMPT, 1, Ingredient(name=name, quantity=1))
+        return len(NAMES)
+
+    try:
+        rounds = 1 if mode == "uncached" else 20
+        assert benchmark.pedantic(lambda: run(complete_all()), rounds=rounds, warmup_rounds=1)
+    finally:
+        run(manager.close())
+    benchmark.extra_info.update(caches[-1].stats().model_dump())
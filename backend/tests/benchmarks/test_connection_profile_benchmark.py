@@ -0,0 +1,64 @@
+"""Benchmark list and detail latency with and without the connection-profile hook."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.database import DatabaseManager
+from app.repositories import IngredientRepository, RecipeRepository
+from tests.benchmarks.conftest import scaled
+from tests.fixtures.seeding import seed_ingredients, seed_recipes
+
+PROFILES = ["none", "raspberry-pi-sd", "ssd"]
+
+
+@pytest.fixture
+def seeded_manager(run, bench_settings, request):
+    """Seed a file database once and reopen it with the requested profile."""
+    seed = DatabaseManager(bench_settings(database_connection_profile="none"))
+
+    async def setup() -> None:
+        await seed.init_db()
+        async with seed.get_session_factory()() as session:
+            await seed_ingredients(session, scaled(2_000))
+            await seed_recipes(
+                session, scaled(1_000), ingredients_per_recipe=10, ingredient_count=scaled(2_000)
+            )
+        await seed.close()
+
+    run(setup())
+    manager = DatabaseManager(bench_settings(database_connection_profile=request.param))
+    yield manager
+    run(manager.close())
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("seeded_manager", PROFILES, indirect=True)
+def test_list_latency(benchmark, run, seeded_manager):
+    """Page through ingredients filtered by category."""
+    benchmark.group = "connection-profile: list"
+    factory = seeded_manager.get_session_factory()
+
+    async def list_page() -> int:
+        async with factory() as session:
+            items, _ = await IngredientRepository(session).list(
+                storage_location="fridge", skip=200, limit=100
+            )
+            return len(items)
+
+    assert benchmark.pedantic(lambda: run(list_page()), rounds=50, warmup_rounds=2) == 100
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("seeded_manager", PROFILES, indirect=True)
+def test_detail_latency(benchmark, run, seeded_manager):
+    """Load a recipe with its ingredient graph."""
+    benchmark.group = "connection-profile: detail"
+    factory = seeded_manager.get_session_factory()
+
+    async def load_detail() -> int:
+        async with factory() as session:
+            recipe = await RecipeRepository(session).get_by_id(42, load_ingredients=True)
+            return len(recipe.ingredient_associations)
+
+    assert benchmark.pedantic(lambda: run(load_detail()), rounds=50, warmup_rounds=2) == 10
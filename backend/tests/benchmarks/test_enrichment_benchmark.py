@@ -0,0 +1,59 @@
+"""Benchmark ``POST /api/v1/ingredients`` with inline vs background enrichment.
+
+Marvin is replaced by a coroutine that takes ``MODEL_LATENCY_MS``. Every
+round creates an ingredient the local classifier does not know, so it needs
+the model. ``inline`` completes it before saving (background enrichment
+off); ``background`` saves it at once and queues the completion.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+
+import marvin
+import pytest
+from litestar.testing import TestClient
+
+from app import database as app_database
+from app.config import get_settings
+from app.main import create_app
+from app.repositories import suggestion_repository
+
+MODEL_LATENCY_MS = 300
+INGREDIENTS_URL = "/api/v1/ingredients"
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("mode", ["inline", "background"])
+def test_create_unknown_ingredient(benchmark, tmp_path, mode):
+    """Create one unknown ingredient per round and time the response."""
+    benchmark.group = f"ingredient create: model takes {MODEL_LATENCY_MS} ms"
+    names = (f"House spice blend {number}" for number in itertools.count())
+
+    async def generate_async(*, target, n, instructions, context):
+        await asyncio.sleep(MODEL_LATENCY_MS / 1000)
+        return [target(**{**context, "category": "spice", "storage_location": "pantry"})]
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(suggestion_repository, "configure_marvin", lambda: None)
+        patch.setattr(marvin, "generate_async", generate_async)
+        patch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'bench.db'}")
+        patch.setenv("INGREDIENT_ENRICHMENT_BACKGROUND", str(mode == "background").lower())
+        get_settings.cache_clear()
+        app_database._db_manager = None
+        try:
+            with TestClient(app=create_app()) as client:
+
+                def create() -> dict:
+                    payload = {"ingredient": {"name": next(names), "quantity": 100}}
+                    response = client.post(INGREDIENTS_URL, json=payload)
+                    assert response.status_code == 201
+                    return response.json()
+
+                created = benchmark.pedantic(create, rounds=10, warmup_rounds=1)
+        finally:
+            get_settings.cache_clear()
+            app_database._db_manager = None
+
+    assert created["enrichment_pending"] is (mode == "background")
@@ -0,0 +1,82 @@
+"""Benchmark reading every recipe by paging vs the NDJSON export stream.
+
+``paged`` walks ``GET /api/v1/recipes`` with the largest page (1000) and the
+cursor, ``export`` reads ``GET /api/v1/recipes/export`` as it streams. Both
+go through the HTTP stack. Memory is not measured here: the test client
+buffers whole responses, so it would only see the client's copy.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from litestar.testing import TestClient
+
+from app import database as app_database
+from app.config import Settings, get_settings
+from app.database import DatabaseManager
+from app.main import create_app
+from tests.benchmarks.conftest import scaled
+from tests.fixtures.seeding import seed_ingredients, seed_recipes
+
+ROWS = scaled(3_000)
+INGREDIENTS = 200
+RECIPES_URL = "/api/v1/recipes"
+
+
+@pytest.fixture(scope="module")
+def client(tmp_path_factory):
+    """App client on a database of recipes with eight ingredients each."""
+    url = f"sqlite+aiosqlite:///{tmp_path_factory.mktemp('export') / 'bench.db'}"
+    manager = DatabaseManager(Settings(database_url=url))
+    loop = asyncio.new_event_loop()
+
+    async def setup() -> None:
+        await manager.init_db()
+        async with manager.get_session_factory()() as session:
+            await seed_ingredients(session, INGREDIENTS)
+            await seed_recipes(
+                session, ROWS, ingredients_per_recipe=8, ingredient_count=INGREDIENTS
+            )
+
+    loop.run_until_complete(setup())
+    loop.run_until_complete(manager.close())
+    loop.close()
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("DATABASE_URL", url)
+        get_settings.cache_clear()
+        app_database._db_manager = None
+        try:
+            with TestClient(app=create_app()) as client:
+                yield client
+        finally:
+            get_settings.cache_clear()
+            app_database._db_manager = None
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("mode", ["paged", "export"])
+def test_read_all_recipes(benchmark, client, mode):
+    """Read all ROWS recipes through pages of 1000 or through the export stream."""
+    benchmark.group = f"recipe read all: {ROWS} rows"
+
+    def paged() -> int:
+        count, cursor = 0, None
+        while True:
+            params = {"page_size": 1000, "total": "none"}
+            if cursor:
+                params["cursor"] = cursor
+            page = client.get(RECIPES_URL, params=params).json()
+            count += len(page["items"])
+            cursor = page["next_cursor"]
+            if not cursor:
+                return count
+
+    def export() -> int:
+        with client.stream("GET", f"{RECIPES_URL}/export") as response:
+            return sum(1 for _ in response.iter_lines())
+
+    read = paged if mode == "paged" else export
+    assert benchmark.pedantic(read, rounds=5, warmup_rounds=1) == ROWS
@@ -0,0 +1,66 @@
+"""Benchmark concurrent identical completions with and without coalescing.
+
+``CLIENTS`` requests complete the same ingredient draft at once. Marvin is
+replaced by a coroutine that sleeps ``MODEL_LATENCY_MS`` and, like an API
+account's rate limit, runs at most ``MODEL_CONCURRENCY`` calls at a time.
+Both modes use the completion cache, which cannot help requests that all
+miss together. The number of model calls per round is recorded in the
+benchmark's ``extra_info`` as ``model_calls``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import marvin
+import pytest
+
+from app.core.completion_cache import CompletionCache
+from app.core.inflight import InflightCoalescer
+from app.database import DatabaseManager
+from app.repositories import SuggestionRepository, suggestion_repository
+from app.schemas.core.ingredient import Ingredient
+
+CLIENTS = 20
+MODEL_LATENCY_MS = 100
+MODEL_CONCURRENCY = 4
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("mode", ["cache", "cache+coalesce"])
+def test_concurrent_identical_completions(benchmark, run, bench_settings, monkeypatch, mode):
+    """Complete one fresh draft from CLIENTS concurrent requests."""
+    benchmark.group = f"concurrent completion: {CLIENTS} identical requests"
+    calls: list[str] = []
+    limit: list[asyncio.Semaphore] = []
+
+    async def generate_async(*, target, n, instructions, context):
+        calls.append(context["name"])
+        async with limit[0]:
+            await asyncio.sleep(MODEL_LATENCY_MS / 1000)
+        return [target(**{**context, "category": "dairy"})]
+
+    monkeypatch.setattr(suggestion_repository, "configure_marvin", lambda: None)
+    monkeypatch.setattr(marvin, "generate_async", generate_async)
+    manager = DatabaseManager(bench_settings())
+    factory = manager.get_session_factory()
+    run(manager.init_db())
+    cache = CompletionCache(factory, ttl_seconds=3600)
+    coalescer = InflightCoalescer() if mode == "cache+coalesce" else None
+    rounds = iter(range(1_000))
+
+    async def burst() -> int:
+        limit[:] = [asyncio.Semaphore(MODEL_CONCURRENCY)]
+        draft = Ingredient(name=f"Oat milk {next(rounds)}", quantity=1)
+        async with factory() as session:
+            repo = SuggestionRepository(session, cache, coalescer)
+            results = await asyncio.gather(
+                *(repo.generate_ingredient("Complete.", 1, draft) for _ in range(CLIENTS))
+            )
+        return len(results)
+
+    try:
+        assert benchmark.pedantic(lambda: run(burst()), rounds=5, warmup_rounds=0) == CLIENTS
+    finally:
+        run(manager.close())
+    benchmark.extra_info["model_calls"] = len(calls) // 5
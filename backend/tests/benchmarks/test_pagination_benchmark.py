@@ -0,0 +1,91 @@
+"""Benchmark offset vs keyset pagination and the cost of each total mode.
+
+Offset pages get slower the deeper they are; keyset pages should stay flat.
+Run with ``MENOO_BENCH_SCALE=10`` to page through 100k ingredients.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+from app.config import Settings
+from app.database import DatabaseManager
+from app.enums import TotalMode
+from app.repositories import IngredientRepository
+from tests.benchmarks.conftest import scaled
+from tests.fixtures.seeding import ingredient_row, seed_ingredients
+
+ROWS = scaled(10_000)
+PAGE_SIZE = 50
+DEPTHS = {"first": 0.0, "middle": 0.5, "last": 0.99}
+
+
+@pytest.fixture(scope="module")
+def paged_manager(tmp_path_factory):
+    """Seed ingredients once for every depth/mode combination."""
+    path = tmp_path_factory.mktemp("pagination") / "bench.db"
+    manager = DatabaseManager(Settings(database_url=f"sqlite+aiosqlite:///{path}"))
+    loop = asyncio.new_event_loop()
+
+    async def setup() -> None:
+        await manager.init_db()
+        async with manager.get_session_factory()() as session:
+            await seed_ingredients(session, ROWS)
+            await session.execute(text("ANALYZE"))
+
+    loop.run_until_complete(setup())
+    loop.run_until_complete(manager.close())
+    loop.close()
+    return manager
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("depth", DEPTHS)
+@pytest.mark.parametrize("mode", ["offset", "cursor"])
+def test_page_latency(benchmark, run, paged_manager, mode, depth):
+    """Fetch one page starting ``depth`` of the way through the table."""
+    benchmark.group = f"pagination: {depth} page"
+    factory = paged_manager.get_session_factory()
+    start = int(ROWS * DEPTHS[depth])
+    # Seeded names sort in index order and ids are index + 1
+    after = (ingredient_row(start - 1)["name"], start) if start else None
+
+    async def page() -> int:
+        async with factory() as session:
+            repo = IngredientRepository(session)
+            if mode == "offset":
+                items, _ = await repo.list(skip=start, limit=PAGE_SIZE, total_mode=TotalMode.NONE)
+            else:
+                items, _ = await repo.list(after=after, limit=PAGE_SIZE, total_mode=TotalMode.NONE)
+            return len(items)
+
+    try:
+        assert benchmark.pedantic(lambda: run(page()), rounds=50, warmup_rounds=2) == min(
+            PAGE_SIZE, ROWS - start
+        )
+    finally:
+        run(paged_manager.close())
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("total_mode", list(TotalMode), ids=lambda mode: mode.value)
+def test_total_mode_latency(benchmark, run, paged_manager, total_mode):
+    """Fetch the first unfiltered page with each total mode."""
+    benchmark.group = "pagination: total mode"
+    factory = paged_manager.get_session_factory()
+
+    async def page() -> int | None:
+        async with factory() as session:
+            _, total = await IngredientRepository(session).list(
+                limit=PAGE_SIZE, total_mode=total_mode
+            )
+            return total
+
+    try:
+        total = benchmark.pedantic(lambda: run(page()), rounds=50, warmup_rounds=2)
+        assert total == (None if total_mode is TotalMode.NONE else ROWS)
+    finally:
+        run(paged_manager.close())
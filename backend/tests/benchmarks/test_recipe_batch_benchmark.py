@@ -0,0 +1,111 @@
+"""Benchmark one-recipe-per-request vs the batch endpoints.
+
+Each round creates (or fetches) ``BATCH`` recipes through the HTTP stack,
+either with one request per recipe or with a single ``POST /batch`` /
+``GET ?ids=`` request, so the numbers include routing, validation, the
+transaction per request and JSON encoding.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+
+import pytest
+from litestar.testing import TestClient
+
+from app import database as app_database
+from app.config import Settings, get_settings
+from app.database import DatabaseManager
+from app.main import create_app
+from tests.benchmarks.conftest import scaled
+from tests.fixtures.seeding import seed_ingredients
+
+BATCH = scaled(50)
+INGREDIENTS = 200
+INGREDIENTS_PER_RECIPE = 6
+RECIPES_URL = "/api/v1/recipes"
+
+_names = itertools.count()
+
+
+def _recipes(count: int) -> list[dict]:
+    recipes = []
+    for _ in range(count):
+        n = next(_names)
+        first = n % (INGREDIENTS - INGREDIENTS_PER_RECIPE)
+        recipes.append(
+            {
+                "name": f"Batch Recipe {n}",
+                "instructions": "Mix and cook.",
+                "ingredients": [
+                    {"ingredient_id": first + k + 1, "quantity": 1, "unit": "g"}
+                    for k in range(INGREDIENTS_PER_RECIPE)
+                ],
+            }
+        )
+    return recipes
+
+
+@pytest.fixture(scope="module")
+def client(tmp_path_factory):
+    """App client on a file database seeded with ingredients."""
+    url = f"sqlite+aiosqlite:///{tmp_path_factory.mktemp('batch') / 'bench.db'}"
+    manager = DatabaseManager(Settings(database_url=url))
+    loop = asyncio.new_event_loop()
+
+    async def setup() -> None:
+        await manager.init_db()
+        async with manager.get_session_factory()() as session:
+            await seed_ingredients(session, INGREDIENTS)
+
+    loop.run_until_complete(setup())
+    loop.run_until_complete(manager.close())
+    loop.close()
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("DATABASE_URL", url)
+        get_settings.cache_clear()
+        app_database._db_manager = None
+        try:
+            with TestClient(app=create_app()) as client:
+                yield client
+        finally:
+            get_settings.cache_clear()
+            app_database._db_manager = None
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("mode", ["per_item", "batch"])
+def test_create_recipes_throughput(benchmark, client, mode):
+    """Create BATCH recipes with one request each or with one batch request."""
+    benchmark.group = f"recipe create: {BATCH} recipes"
+
+    def create() -> int:
+        recipes = _recipes(BATCH)
+        if mode == "batch":
+            response = client.post(f"{RECIPES_URL}/batch", json={"recipes": recipes})
+            assert response.status_code == 201
+            return response.json()["created"]
+        for recipe in recipes:
+            assert client.post(RECIPES_URL, json={"recipe": recipe}).status_code == 201
+        return len(recipes)
+
+    assert benchmark.pedantic(create, rounds=5, warmup_rounds=1) == BATCH
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("mode", ["per_item", "batch"])
+def test_fetch_recipes_throughput(benchmark, client, mode):
+    """Fetch BATCH recipes with one request each or with one ``ids`` request."""
+    benchmark.group = f"recipe fetch: {BATCH} recipes"
+    created = client.post(f"{RECIPES_URL}/batch", json={"recipes": _recipes(BATCH)}).json()
+    ids = [item["recipe"]["id"] for item in created["items"]]
+
+    def fetch() -> int:
+        if mode == "batch":
+            params = {"ids": ",".join(map(str, ids)), "page_size": BATCH, "total": "none"}
+            return len(client.get(RECIPES_URL, params=params).json()["items"])
+        return sum(client.get(f"{RECIPES_URL}/{i}").status_code == 200 for i in ids)
+
+    assert benchmark.pedantic(fetch, rounds=5, warmup_rounds=1) == BATCH
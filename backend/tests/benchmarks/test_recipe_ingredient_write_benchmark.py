@@ -0,0 +1,123 @@
+"""Benchmark writing recipe ingredient associations: per row vs bulk.
+
+The per-row paths are what the service did before: an ``add``/``flush``/
+``refresh`` per association on create, and delete-all, re-insert and refresh
+each row on update. The bulk paths insert with one executemany and, on
+update, diff against the existing rows so only changed ones are written.
+Every round writes a recipe with ``INGREDIENTS`` associations and commits.
+"""
+
+from __future__ import annotations
+
+import itertools
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import delete
+
+from app.database import DatabaseManager
+from app.models import Ingredient, Recipe, RecipeIngredient
+from app.repositories import RecipeIngredientRepository
+
+INGREDIENTS = 32
+# Ingredients whose quantity an update round changes
+CHANGED_PER_UPDATE = 3
+
+
+def _payloads(ingredient_ids: list[int], round_: int = 0) -> list[dict]:
+    return [
+        {
+            "ingredient_id": ingredient_id,
+            "quantity": Decimal(1 + (round_ if i < CHANGED_PER_UPDATE else 0)),
+            "unit": "g",
+            "is_optional": False,
+            "note": None,
+            "order_in_recipe": i + 1,
+            "preparation_details": {"ingredient_id": ingredient_id, "unit": "g"},
+        }
+        for i, ingredient_id in enumerate(ingredient_ids)
+    ]
+
+
+async def _per_row_create(session, recipe_id: int, payloads: list[dict]) -> None:
+    for payload in payloads:
+        association = RecipeIngredient(recipe_id=recipe_id, **payload)
+        session.add(association)
+        await session.flush()
+        await session.refresh(association)
+
+
+async def _per_row_update(session, recipe_id: int, payloads: list[dict]) -> None:
+    await session.execute(delete(RecipeIngredient).where(RecipeIngredient.recipe_id == recipe_id))
+    associations = [RecipeIngredient(recipe_id=recipe_id, **payload) for payload in payloads]
+    session.add_all(associations)
+    await session.flush()
+    for association in associations:
+        await session.refresh(association)
+
+
+@pytest.fixture
+def seeded(run, bench_settings):
+    """Manager, ingredient ids and one recipe that already has its associations."""
+    manager = DatabaseManager(bench_settings())
+
+    async def setup() -> tuple[list[int], int]:
+        await manager.init_db()
+        async with manager.get_session_factory()() as session:
+            ingredients = [
+                Ingredient(name=f"Item {i}", category="vegetable") for i in range(INGREDIENTS)
+            ]
+            recipe = Recipe(name="Stew", instructions="Simmer.")
+            session.add_all([recipe, *ingredients])
+            await session.flush()
+            ids = [ingredient.id for ingredient in ingredients]
+            await RecipeIngredientRepository(session).bulk_create(recipe.id, _payloads(ids))
+            await session.commit()
+            return ids, recipe.id
+
+    ingredient_ids, recipe_id = run(setup())
+    yield manager, ingredient_ids, recipe_id
+    run(manager.close())
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("strategy", ["per-row", "bulk"])
+def test_create_recipe_associations(benchmark, run, seeded, strategy):
+    """Create a recipe with its associations."""
+    benchmark.group = f"recipe ingredients: create with {INGREDIENTS}"
+    manager, ingredient_ids, _ = seeded
+    payloads = _payloads(ingredient_ids)
+
+    async def create() -> None:
+        async with manager.get_session_factory()() as session:
+            recipe = Recipe(name="Soup", instructions="Simmer.")
+            session.add(recipe)
+            await session.flush()
+            if strategy == "bulk":
+                await RecipeIngredientRepository(session).bulk_create(recipe.id, payloads)
+            else:
+                await _per_row_create(session, recipe.id, payloads)
+            await session.commit()
+
+    benchmark.pedantic(lambda: run(create()), rounds=30, warmup_rounds=2)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("strategy", ["per-row", "bulk"])
+def test_update_recipe_associations(benchmark, run, seeded, strategy):
+    """Change a few quantities of an existing recipe's associations."""
+    benchmark.group = f"recipe ingredients: update {CHANGED_PER_UPDATE} of {INGREDIENTS}"
+    manager, ingredient_ids, recipe_id = seeded
+    rounds = itertools.count(1)
+
+    async def update() -> None:
+        payloads = _payloads(ingredient_ids, next(rounds))
+        async with manager.get_session_factory()() as session:
+            if strategy == "bulk":
+                repo = RecipeIngredientRepository(session)
+                await repo.upsert_recipe_ingredients(recipe_id, payloads)
+            else:
+                await _per_row_update(session, recipe_id, payloads)
+            await session.commit()
+
+    benchmark.pedantic(lambda: run(update()), rounds=30, warmup_rounds=2)
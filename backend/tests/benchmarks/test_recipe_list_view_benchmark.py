@@ -0,0 +1,72 @@
+"""Benchmark ``GET /api/v1/recipes`` with ``view=full`` vs ``view=summary``.
+
+Each request fetches a 1000-row page through the HTTP stack, so the numbers
+include loading, validation and JSON encoding. The payload size of each view
+is recorded in the benchmark's ``extra_info``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from litestar.testing import TestClient
+
+from app import database as app_database
+from app.config import Settings, get_settings
+from app.database import DatabaseManager
+from app.main import create_app
+from tests.benchmarks.conftest import scaled
+from tests.fixtures.seeding import seed_ingredients, seed_recipes
+
+ROWS = scaled(2_000)
+INGREDIENTS = 200
+PAGE_SIZE = 1000
+
+
+@pytest.fixture(scope="module")
+def client(tmp_path_factory):
+    """App client on a database of recipes with eight ingredients each."""
+    url = f"sqlite+aiosqlite:///{tmp_path_factory.mktemp('list_view') / 'bench.db'}"
+    manager = DatabaseManager(Settings(database_url=url))
+    loop = asyncio.new_event_loop()
+
+    async def setup() -> None:
+        await manager.init_db()
+        async with manager.get_session_factory()() as session:
+            await seed_ingredients(session, INGREDIENTS)
+            await seed_recipes(
+                session, ROWS, ingredients_per_recipe=8, ingredient_count=INGREDIENTS
+            )
+
+    loop.run_until_complete(setup())
+    loop.run_until_complete(manager.close())
+    loop.close()
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("DATABASE_URL", url)
+        get_settings.cache_clear()
+        app_database._db_manager = None
+        try:
+            with TestClient(app=create_app()) as client:
+                yield client
+        finally:
+            get_settings.cache_clear()
+            app_database._db_manager = None
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("view", ["full", "summary"])
+def test_list_view_latency(benchmark, client, view):
+    """Fetch one 1000-row page of recipes in each view."""
+    benchmark.group = f"recipe list: page_size={PAGE_SIZE}"
+    params = {"page_size": PAGE_SIZE, "view": view, "total": "none"}
+
+    def page() -> int:
+        response = client.get("/api/v1/recipes/", params=params)
+        assert response.status_code == 200
+        return len(response.content)
+
+    payload_bytes = benchmark.pedantic(page, rounds=10, warmup_rounds=1)
+    benchmark.extra_info["payload_bytes"] = payload_bytes
+    assert len(client.get("/api/v1/recipes/", params=params).json()["items"]) == PAGE_SIZE
@@ -0,0 +1,130 @@
+"""Benchmark recipe tag filters: JSON list scans vs bitmask columns.
+
+The JSON variant tests each recipe's enum lists with ``json_each`` (what an
+indexless containment filter has to do); the mask variant is what
+``RecipeRepository.list`` runs, answered from the covering
+``idx_recipe_live_tags`` index. Both fetch the same page and exact total
+through ``fetch_page``. Run with ``MENOO_BENCH_SCALE=10`` for 100k recipes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+
+import pytest
+from sqlalchemy import ColumnElement, text
+
+from app.config import Settings
+from app.database import DatabaseManager
+from app.enums import TotalMode
+from app.models import Recipe
+from app.repositories import RecipeRepository
+from app.repositories.pagination import fetch_page
+from tests.benchmarks.conftest import scaled
+from tests.fixtures.seeding import seed_recipes
+
+ROWS = scaled(10_000)
+PAGE_SIZE = 50
+FILTERS = {
+    "cuisine": {"cuisine": "thai"},
+    "combined": {
+        "meal_types": ["lunch", "dinner"],
+        "dietary": ["vegan"],
+        "exclude_allergens": ["nuts"],
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def tagged_manager(tmp_path_factory):
+    """Seed recipes once for every filter/storage combination."""
+    path = tmp_path_factory.mktemp("tag_filters") / "bench.db"
+    manager = DatabaseManager(Settings(database_url=f"sqlite+aiosqlite:///{path}"))
+    loop = asyncio.new_event_loop()
+
+    async def setup() -> None:
+        await manager.init_db()
+        async with manager.get_session_factory()() as session:
+            await seed_recipes(session, ROWS)
+            await session.execute(text("ANALYZE"))
+
+    loop.run_until_complete(setup())
+    loop.run_until_complete(manager.close())
+    loop.close()
+    return manager
+
+
+def _json_any(column: str, values: Sequence[str], *, negate: bool = False) -> ColumnElement[bool]:
+    placeholders = ", ".join(f"'{value}'" for value in values)
+    return text(
+        f"{'NOT ' if negate else ''}EXISTS "
+        f"(SELECT 1 FROM json_each(recipes.{column}) WHERE value IN ({placeholders}))"
+    )
+
+
+def _json_conditions(filters: dict) -> list[ColumnElement[bool]]:
+    """The same filters as JSON list scans."""
+    conditions: list[ColumnElement[bool]] = [Recipe.is_deleted.is_(False)]
+    if cuisine := filters.get("cuisine"):
+        conditions.append(_json_any("cuisine_types", [cuisine]))
+    if meal_types := filters.get("meal_types"):
+        conditions.append(_json_any("meal_types", meal_types))
+    for requirement in filters.get("dietary", ()):
+        conditions.append(_json_any("dietary_requirements", [requirement]))
+    if allergens := filters.get("exclude_allergens"):
+        conditions.append(_json_any("contains_allergens", allergens, negate=True))
+    return conditions
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("filters", FILTERS)
+@pytest.mark.parametrize("storage", ["json", "mask"])
+def test_tag_filter_latency(benchmark, run, tagged_manager, storage, filters):
+    """Fetch the first filtered page with its exact total."""
+    benchmark.group = f"tag filter: {filters}"
+    factory = tagged_manager.get_session_factory()
+
+    async def page() -> tuple[int, int | None]:
+        async with factory() as session:
+            if storage == "json":
+                items, total = await fetch_page(
+                    session,
+                    Recipe,
+                    _json_conditions(FILTERS[filters]),
+                    limit=PAGE_SIZE,
+                    total_mode=TotalMode.EXACT,
+                )
+            else:
+                items, total = await RecipeRepository(session).list(
+                    **FILTERS[filters], limit=PAGE_SIZE, total_mode=TotalMode.EXACT
+                )
+            return len(items), total
+
+    try:
+        count, total = benchmark.pedantic(lambda: run(page()), rounds=20, warmup_rounds=2)
+        assert count == PAGE_SIZE
+        assert total
+    finally:
+        run(tagged_manager.close())
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("filters", FILTERS)
+def test_json_and_mask_filters_agree(run, tagged_manager, filters):
+    """Should select the same recipes either way."""
+    factory = tagged_manager.get_session_factory()
+
+    async def both() -> tuple[list[int], list[int]]:
+        async with factory() as session:
+            json_items, _ = await fetch_page(
+                session, Recipe, _json_conditions(FILTERS[filters]), limit=ROWS
+            )
+            mask_items, _ = await RecipeRepository(session).list(**FILTERS[filters], limit=ROWS)
+            return [r.id for r in json_items], [r.id for r in mask_items]
+
+    try:
+        json_ids, mask_ids = run(both())
+        assert json_ids == mask_ids
+    finally:
+        run(tagged_manager.close())
@@ -0,0 +1,80 @@
+"""Benchmark FTS5 recipe search against a LIKE scan over the same text.
+
+``%term%`` patterns cannot use an index, so the scan reads every recipe; the
+FTS5 query reads only the posting lists for its terms. Run with
+``MENOO_BENCH_SCALE=10`` to search 100k recipes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from sqlalchemy import and_, func, or_, select
+
+from app.config import Settings
+from app.database import DatabaseManager
+from app.enums import TotalMode
+from app.models import Recipe
+from app.repositories import RecipeRepository
+from tests.benchmarks.conftest import scaled
+from tests.fixtures.seeding import seed_recipes
+
+ROWS = scaled(10_000)
+PAGE_SIZE = 20
+QUERY = "smoky chickpea"
+
+
+@pytest.fixture(scope="module")
+def search_manager(tmp_path_factory):
+    """Seed recipes once for both search strategies."""
+    path = tmp_path_factory.mktemp("search") / "bench.db"
+    manager = DatabaseManager(Settings(database_url=f"sqlite+aiosqlite:///{path}"))
+    loop = asyncio.new_event_loop()
+
+    async def setup() -> None:
+        await manager.init_db()
+        async with manager.get_session_factory()() as session:
+            await seed_recipes(session, ROWS)
+
+    loop.run_until_complete(setup())
+    loop.run_until_complete(manager.close())
+    loop.close()
+    return manager
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("strategy", ["like", "fts"])
+def test_search_latency(benchmark, run, search_manager, strategy):
+    """Find the first page of recipes mentioning every query word, with a total."""
+    benchmark.group = "recipe search"
+    factory = search_manager.get_session_factory()
+
+    async def search() -> int:
+        async with factory() as session:
+            if strategy == "fts":
+                rows, total = await RecipeRepository(session).search(
+                    QUERY, limit=PAGE_SIZE, total_mode=TotalMode.EXACT
+                )
+                return len(rows) if total else 0
+            conditions = [Recipe.is_deleted.is_(False)]
+            for term in QUERY.split():
+                conditions.append(
+                    or_(
+                        Recipe.name.ilike(f"%{term}%"),
+                        Recipe.description.ilike(f"%{term}%"),
+                        Recipe.instructions.ilike(f"%{term}%"),
+                    )
+                )
+            result = await session.execute(
+                select(Recipe).where(and_(*conditions)).order_by(Recipe.id).limit(PAGE_SIZE)
+            )
+            total = await session.execute(
+                select(func.count()).select_from(Recipe).where(and_(*conditions))
+            )
+            return len(result.scalars().all()) if total.scalar_one() else 0
+
+    try:
+        assert benchmark.pedantic(lambda: run(search()), rounds=20, warmup_rounds=2) == PAGE_SIZE
+    finally:
+        run(search_manager.close())
@@ -0,0 +1,56 @@
+"""Benchmark time to the first recipe: one blocking call vs streamed variations.
+
+Marvin is replaced by a coroutine whose completions take ``LATENCIES_MS``:
+a single call for all ``n`` variations takes as long as the slowest one,
+while the stream runs one call per variation. ``blocking`` times
+``complete_recipe`` (what ``POST /recipes`` waits for); ``stream-first``
+times the first event of ``stream_recipe_completions``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+
+import marvin
+import pytest
+
+from app.database import DatabaseManager
+from app.repositories import SuggestionRepository, suggestion_repository
+from app.schemas import Recipe, SuggestionRequest
+from app.services import SuggestionService
+
+LATENCIES_MS = [120, 200, 280, 360, 440]
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("mode", ["blocking", "stream-first"])
+def test_time_to_first_recipe(benchmark, run, bench_settings, monkeypatch, mode):
+    """Ask for len(LATENCIES_MS) variations and stop at the first recipe."""
+    benchmark.group = f"recipe suggestion: first of {len(LATENCIES_MS)} variations"
+    latencies = itertools.cycle(LATENCIES_MS)
+
+    async def generate_async(*, target, n, instructions, context):
+        await asyncio.sleep(max(next(latencies) for _ in range(n)) / 1000)
+        return [Recipe(name="Soup", instructions="Simmer.") for _ in range(n)]
+
+    monkeypatch.setattr(suggestion_repository, "configure_marvin", lambda: None)
+    monkeypatch.setattr(marvin, "generate_async", generate_async)
+    manager = DatabaseManager(bench_settings())
+    request = SuggestionRequest(recipe=Recipe(name="Soup"), n_completions=len(LATENCIES_MS))
+
+    async def first_recipe() -> Recipe:
+        async with manager.get_session_factory()() as session:
+            service = SuggestionService(SuggestionRepository(session))
+            if mode == "blocking":
+                return (await service.complete_recipe(request))[0]
+            events = service.stream_recipe_completions(request)
+            try:
+                return (await anext(events)).recipe
+            finally:
+                await events.aclose()
+
+    try:
+        benchmark.pedantic(lambda: run(first_recipe()), rounds=5, warmup_rounds=1)
+    finally:
+        run(manager.close())
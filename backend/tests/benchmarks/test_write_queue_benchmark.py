@@ -0,0 +1,55 @@
+"""Benchmark concurrent ingredient creates with and without write coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+
+import pytest
+
+from app.core.write_queue import WriteQueue
+from app.database import DatabaseManager
+from app.repositories import IngredientRepository
+from app.schemas.core.ingredient import Ingredient as IngredientSchema
+from app.services import IngredientService
+from tests.benchmarks.conftest import scaled
+
+CONCURRENT_WRITERS = 32
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("coalescing", [False, True], ids=["per-request", "group-commit"])
+def test_concurrent_creates(benchmark, run, bench_settings, coalescing):
+    """Create ingredients from concurrent callers, one session per caller."""
+    benchmark.group = "write-queue: concurrent creates"
+    manager = DatabaseManager(bench_settings())
+    factory = manager.get_session_factory()
+    queue = WriteQueue(factory) if coalescing else None
+    counter = itertools.count()
+
+    async def setup() -> None:
+        await manager.init_db()
+        if queue is not None:
+            await queue.start()
+
+    async def create_one() -> None:
+        async with factory() as session:
+            service = IngredientService(IngredientRepository(session), queue)
+            await service.create_ingredient(
+                IngredientSchema(name=f"Bench {next(counter)}", category="grain", quantity=1)
+            )
+            await session.commit()
+
+    async def burst() -> None:
+        await asyncio.gather(*(create_one() for _ in range(scaled(CONCURRENT_WRITERS))))
+
+    async def teardown() -> None:
+        if queue is not None:
+            await queue.stop()
+        await manager.close()
+
+    run(setup())
+    try:
+        benchmark.pedantic(lambda: run(burst()), rounds=20, warmup_rounds=1)
+    finally:
+        run(teardown())
@@ -128,16 +128,17 @@ def live_suggestion_service(db_session):
 
     Skips test if OPENAI_API_KEY is not configured.
     """
+    from app.core.marvin_config import configure_marvin
     from app.repositories import SuggestionRepository
     from app.services import SuggestionService
 
     try:
-        suggestion_repo = SuggestionRepository(db_session)
+        configure_marvin()
     except ValueError as e:
         if "OpenAI API key" in str(e):
             pytest.skip("OPENAI_API_KEY is not configured; skipping live Marvin test.")
         raise
-    return SuggestionService(suggestion_repo)
+    return SuggestionService(SuggestionRepository(db_session))
 
 
 @pytest.fixture
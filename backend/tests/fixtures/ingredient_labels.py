@@ -0,0 +1,177 @@
+"""Hand-labelled grocery names for measuring the ingredient classifier.
+
+Names are written the way people type them into a pantry list: plurals,
+brands of phrasing, preparation words and a few dishes and oddities that a
+lexicon should not claim to know.
+"""
+
+from __future__ import annotations
+
+from app.enums import IngredientCategory as C
+
+LABELLED_INGREDIENTS: list[tuple[str, C]] = [
+    # Protein
+    ("Chicken breasts", C.PROTEIN),
+    ("Boneless skinless chicken thighs", C.PROTEIN),
+    ("Minced beef", C.PROTEIN),
+    ("Pork chops", C.PROTEIN),
+    ("Lamb shoulder", C.PROTEIN),
+    ("Smoked salmon", C.PROTEIN),
+    ("Tuna steaks", C.PROTEIN),
+    ("Cod fillets", C.PROTEIN),
+    ("King prawns", C.PROTEIN),
+    ("Free-range eggs", C.PROTEIN),
+    ("Firm tofu", C.PROTEIN),
+    ("Red lentils", C.PROTEIN),
+    ("Canned chickpeas", C.PROTEIN),
+    ("Black beans", C.PROTEIN),
+    ("Streaky bacon", C.PROTEIN),
+    ("Italian sausages", C.PROTEIN),
+    ("Turkey mince", C.PROTEIN),
+    ("Mussels", C.PROTEIN),
+    # Vegetable
+    ("Cherry tomatoes", C.VEGETABLE),
+    ("Tomatoes", C.VEGETABLE),
+    ("Maris Piper potatoes", C.VEGETABLE),
+    ("Sweet potatoes", C.VEGETABLE),
+    ("Red onions", C.VEGETABLE),
+    ("Garlic", C.VEGETABLE),
+    ("Carrots", C.VEGETABLE),
+    ("Celery sticks", C.VEGETABLE),
+    ("Red bell pepper", C.VEGETABLE),
+    ("Courgettes", C.VEGETABLE),
+    ("Aubergine", C.VEGETABLE),
+    ("Broccoli florets", C.VEGETABLE),
+    ("Baby spinach", C.VEGETABLE),
+    ("Iceberg lettuce", C.VEGETABLE),
+    ("Frozen peas", C.VEGETABLE),
+    ("Sweetcorn", C.VEGETABLE),
+    ("Chestnut mushrooms", C.VEGETABLE),
+    ("Spring onions", C.VEGETABLE),
+    ("Fresh ginger", C.VEGETABLE),
+    ("Avocados", C.VEGETABLE),
+    ("Green beans", C.VEGETABLE),
+    ("Butternut squash", C.VEGETABLE),
+    ("Leeks", C.VEGETABLE),
+    ("Kale", C.VEGETABLE),
+    ("Beetroot", C.VEGETABLE),
+    ("Jalapenos", C.VEGETABLE),
+    ("Mustard greens", C.VEGETABLE),
+    # Fruit
+    ("Bananas", C.FRUIT),
+    ("Granny Smith apples", C.FRUIT),
+    ("Lemons", C.FRUIT),
+    ("Limes", C.FRUIT),
+    ("Strawberries", C.FRUIT),
+    ("Frozen blueberries", C.FRUIT),
+    ("Raspberries", C.FRUIT),
+    ("Seedless grapes", C.FRUIT),
+    ("Oranges", C.FRUIT),
+    ("Ripe mango", C.FRUIT),
+    ("Dried apricots", C.FRUIT),
+    ("Medjool dates", C.FRUIT),
+    ("Raisins", C.FRUIT),
+    ("Pineapple chunks", C.FRUIT),
+    # Grain
+    ("Basmati rice", C.GRAIN),
+    ("Arborio rice", C.GRAIN),
+    ("Spaghetti", C.GRAIN),
+    ("Penne pasta", C.GRAIN),
+    ("Rolled oats", C.GRAIN),
+    ("Plain flour", C.GRAIN),
+    ("Wholemeal bread", C.GRAIN),
+    ("Flour tortillas", C.GRAIN),
+    ("Couscous", C.GRAIN),
+    ("Quinoa", C.GRAIN),
+    ("Egg noodles", C.GRAIN),
+    ("Panko breadcrumbs", C.GRAIN),
+    ("Cornflour", C.GRAIN),
+    # Dairy
+    ("Whole milk", C.DAIRY),
+    ("Semi-skimmed milk", C.DAIRY),
+    ("Unsalted butter", C.DAIRY),
+    ("Mature cheddar", C.DAIRY),
+    ("Parmesan cheese", C.DAIRY),
+    ("Mozzarella", C.DAIRY),
+    ("Feta", C.DAIRY),
+    ("Greek yoghurt", C.DAIRY),
+    ("Double cream", C.DAIRY),
+    ("Sour cream", C.DAIRY),
+    ("Cream cheese", C.DAIRY),
+    ("Vanilla ice cream", C.DAIRY),
+    # Spice
+    ("Sea salt", C.SPICE),
+    ("Black peppercorns", C.SPICE),
+    ("Ground cumin", C.SPICE),
+    ("Smoked paprika", C.SPICE),
+    ("Ground cinnamon", C.SPICE),
+    ("Chilli flakes", C.SPICE),
+    ("Garam masala", C.SPICE),
+    ("Bay leaves", C.SPICE),
+    ("Turmeric", C.SPICE),
+    # Herb
+    ("Fresh basil", C.HERB),
+    ("Flat-leaf parsley", C.HERB),
+    ("Coriander", C.HERB),
+    ("Fresh thyme", C.HERB),
+    ("Rosemary sprigs", C.HERB),
+    ("Mint leaves", C.HERB),
+    ("Dried oregano", C.HERB),
+    # Sauce
+    ("Soy sauce", C.SAUCE),
+    ("Tomato passata", C.SAUCE),
+    ("Tomato puree", C.SAUCE),
+    ("Green pesto", C.SAUCE),
+    ("Fish sauce", C.SAUCE),
+    ("Hummus", C.SAUCE),
+    ("Thai red curry paste", C.SAUCE),
+    # Condiment
+    ("Ketchup", C.CONDIMENT),
+    ("Dijon mustard", C.CONDIMENT),
+    ("Mayo", C.CONDIMENT),
+    ("Balsamic vinegar", C.CONDIMENT),
+    ("Crunchy peanut butter", C.CONDIMENT),
+    ("Strawberry jam", C.CONDIMENT),
+    ("Capers", C.CONDIMENT),
+    # Flavor enhancer
+    ("Chicken stock cubes", C.FLAVOR_ENHANCER),
+    ("White miso", C.FLAVOR_ENHANCER),
+    ("Nutritional yeast", C.FLAVOR_ENHANCER),
+    # Oil and fat
+    ("Extra virgin olive oil", C.OIL_FAT),
+    ("Vegetable oil", C.OIL_FAT),
+    ("Toasted sesame oil", C.OIL_FAT),
+    ("Coconut oil", C.OIL_FAT),
+    # Sweetener
+    ("Caster sugar", C.SWEETENER),
+    ("Light brown sugar", C.SWEETENER),
+    ("Runny honey", C.SWEETENER),
+    ("Maple syrup", C.SWEETENER),
+    ("Dark chocolate", C.SWEETENER),
+    # Liquid
+    ("Vegetable stock", C.LIQUID),
+    ("Coconut milk", C.LIQUID),
+    ("Red wine", C.LIQUID),
+    ("Orange juice", C.LIQUID),
+    ("Oat milk", C.LIQUID),
+    ("Rice milk", C.LIQUID),
+    # Other
+    ("Baking powder", C.OTHER),
+    ("Bicarbonate of soda", C.OTHER),
+    ("Fast action dried yeast", C.OTHER),
+    ("Flaked almonds", C.OTHER),
+    ("Walnuts", C.OTHER),
+    ("Pine nuts", C.OTHER),
+    ("Sesame seeds", C.OTHER),
+    # Dishes and oddities the lexicon should leave to the model
+    ("Tomato soup", C.SAUCE),
+    ("Chicken kiev", C.PROTEIN),
+    ("Kimchi", C.CONDIMENT),
+    ("Gochujang", C.SAUCE),
+    ("Za'atar", C.SPICE),
+    ("Grandma's spice mix", C.SPICE),
+    ("Quorn pieces", C.PROTEIN),
+    ("Sauerkraut", C.CONDIMENT),
+    ("Harissa", C.SAUCE),
+    ("Paneer", C.DAIRY),
+]
@@ -0,0 +1,52 @@
+"""Statement-count harness for asserting how many queries a code path issues.
+
+Listens on every engine, so it sees statements from the writer and the
+read-only pool alike::
+
+    with count_queries() as queries:
+        await client.get("/api/v1/recipes/1")
+    assert queries.selects == 1
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryLog:
+    """Statements executed while a :func:`count_queries` block was active."""
+
+    def __init__(self) -> None:
+        """Start with an empty log."""
+        self.statements: list[str] = []
+
+    @property
+    def selects(self) -> int:
+        """Number of SELECT statements."""
+        return sum(1 for statement in self.statements if statement.lstrip().startswith("SELECT"))
+
+    def __len__(self) -> int:
+        """Number of statements of any kind."""
+        return len(self.statements)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryLog]:
+    """Record the SQL statements executed on any engine inside the block."""
+    log = QueryLog()
+
+    def record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        # Connection setup PRAGMAs are not part of the code path under test
+        if not statement.startswith("PRAGMA"):
+            log.statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", record)
+    try:
+        yield log
+    finally:
+        event.remove(Engine, "before_cursor_execute", record)
@@ -0,0 +1,117 @@
+"""Bulk seeding helpers for benchmarks and large-table tests.
+
+Rows are inserted with Core ``insert()`` executemany batches so seeding 100k
+rows takes seconds instead of minutes; the data is deterministic per index.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.enums import (
+    AllergenType,
+    CookingMethod,
+    CuisineType,
+    DietaryRequirement,
+    IngredientCategory,
+    MealType,
+)
+from app.models import Ingredient, Recipe, RecipeIngredient
+
+SEED_BATCH_SIZE = 5_000
+
+_CATEGORIES = list(IngredientCategory)
+_CUISINES = list(CuisineType)
+_MEALS = list(MealType)
+_METHODS = list(CookingMethod)
+_DIETS = list(DietaryRequirement)
+_ALLERGENS = list(AllergenType)
+_LOCATIONS = ["fridge", "freezer", "pantry", "cupboard", "counter"]
+# Word pools for recipe text so full-text search has realistic selectivity
+_DISHES = ["stew", "curry", "salad", "soup", "risotto", "tart", "pie", "noodles", "roast"]
+_FLAVOURS = ["smoky", "tangy", "spicy", "herby", "creamy", "zesty", "garlicky", "sweet"]
+_MAINS = ["chickpea", "lentil", "salmon", "chicken", "mushroom", "aubergine", "tofu", "beef"]
+
+
+async def _insert_batched(session: AsyncSession, model: Any, rows: list[dict[str, Any]]) -> None:
+    for start in range(0, len(rows), SEED_BATCH_SIZE):
+        await session.execute(insert(model), rows[start : start + SEED_BATCH_SIZE])
+
+
+def ingredient_row(index: int) -> dict[str, Any]:
+    """Deterministic ingredient row for ``index``."""
+    return {
+        "name": f"Ingredient {index:07d}",
+        "category": _CATEGORIES[index % len(_CATEGORIES)].value,
+        "storage_location": _LOCATIONS[index % len(_LOCATIONS)],
+        "quantity": (index % 500) + 1,
+        "notes": None,
+    }
+
+
+def recipe_row(index: int) -> dict[str, Any]:
+    """Deterministic recipe row for ``index``."""
+    return {
+        "name": f"Recipe {index:07d}",
+        "description": (
+            f"A {_FLAVOURS[index % len(_FLAVOURS)]} {_MAINS[index % len(_MAINS)]} "
+            f"{_DISHES[index % len(_DISHES)]}, generated recipe number {index}"
+        ),
+        "instructions": f"Prepare the {_MAINS[(index // 7) % len(_MAINS)]}. "
+        + "Combine everything. " * 20,
+        "author": f"Author {index % 97}",
+        "cuisine_types": [_CUISINES[index % len(_CUISINES)].value],
+        "meal_types": [_MEALS[index % len(_MEALS)].value],
+        "cooking_method": _METHODS[index % len(_METHODS)].value,
+        # Two requirements and up to two allergens per recipe, in varying combinations
+        "dietary_requirements": sorted(
+            {_DIETS[index % len(_DIETS)].value, _DIETS[(index // 5) % len(_DIETS)].value}
+        ),
+        "contains_allergens": sorted(
+            {_ALLERGENS[index % len(_ALLERGENS)].value, _ALLERGENS[(index // 3) % 4].value}
+        ),
+        "prep_time_minutes": index % 60,
+        "cook_time_minutes": index % 120,
+        "timing": {"prep_time_minutes": index % 60, "cook_time_minutes": index % 120},
+        "servings": (index % 8) + 1,
+        "tags": ["generated", f"batch-{index % 10}"],
+        "notes": "Some notes " * 10,
+    }
+
+
+async def seed_ingredients(session: AsyncSession, count: int) -> None:
+    """Insert ``count`` ingredients and commit."""
+    await _insert_batched(session, Ingredient, [ingredient_row(i) for i in range(count)])
+    await session.commit()
+
+
+async def seed_recipes(
+    session: AsyncSession,
+    count: int,
+    ingredients_per_recipe: int = 0,
+    ingredient_count: int | None = None,
+) -> None:
+    """Insert ``count`` recipes, optionally linking each to existing ingredients.
+
+    Ingredient IDs are assumed to be ``1..ingredient_count`` (as created by
+    :func:`seed_ingredients` on an empty table).
+    """
+    await _insert_batched(session, Recipe, [recipe_row(i) for i in range(count)])
+    if ingredients_per_recipe and ingredient_count:
+        associations = [
+            {
+                "recipe_id": recipe_id,
+                "ingredient_id": ((recipe_id * 7 + offset) % ingredient_count) + 1,
+                "quantity": 100,
+                "unit": "g",
+                "order_in_recipe": offset + 1,
+                "preparation_details": {},
+            }
+            for recipe_id in range(1, count + 1)
+            for offset in range(min(ingredients_per_recipe, ingredient_count))
+        ]
+        await _insert_batched(session, RecipeIngredient, associations)
+    await session.commit()
@@ -1,19 +1,53 @@
 """Integration tests for ingredient endpoints."""
 
+import asyncio
+import json
+import sys
+from collections.abc import AsyncGenerator, Generator
+from datetime import date
+
+import marvin
 import pytest
 from litestar.status_codes import (
     HTTP_200_OK,
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
+    HTTP_400_BAD_REQUEST,
     HTTP_404_NOT_FOUND,
     HTTP_422_UNPROCESSABLE_ENTITY,
 )
+from litestar.testing import AsyncTestClient
 
+from app import database as app_database
+from app.config import get_settings
+from app.main import create_app
+from app.repositories import suggestion_repository
 from tests.fixtures.factories import ingredient_payload_factory
 
 INGREDIENTS_URL = "/api/v1/ingredients"
 
 
+@pytest.fixture
+async def file_client(tmp_path, monkeypatch) -> AsyncGenerator[AsyncTestClient, None]:
+    """Client for an app on a file database, where background enrichment runs."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'api.db'}")
+    get_settings.cache_clear()
+    app_database._db_manager = None
+    async with AsyncTestClient(app=create_app(), base_url="http://test") as client:
+        yield client
+    get_settings.cache_clear()
+    app_database._db_manager = None
+
+
+@pytest.fixture
+def no_api_key(monkeypatch) -> Generator[None, None, None]:
+    """Settings without an OpenAI API key, whatever the environment provides."""
+    monkeypatch.setenv("OPENAI_API_KEY", "")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
 class TestIngredientList:
     """Test GET /api/v1/ingredients endpoint."""
 
@@ -24,7 +58,9 @@ class TestIngredientList:
 
         assert response.status_code == HTTP_200_OK
         data = response.json()
-        assert isinstance(data, list)
+        assert data["items"] == []
+        assert data["total"] == 0
+        assert data["has_next"] is False
 
     @pytest.mark.integration
     async def test_list_with_pagination(self, test_client):
@@ -40,7 +76,28 @@ class TestIngredientList:
         assert response.status_code == HTTP_200_OK
         data = response.json()
         # Backend applies pagination; with page_size=2 we expect 2 items
-        assert len(data) == 2
+        assert len(data["items"]) == 2
+        assert data["total"] == 3
+        assert data["has_next"] is True
+
+
+class TestIngredientAutocomplete:
+    """Test GET /api/v1/ingredients/autocomplete endpoint."""
+
+    @pytest.mark.integration
+    async def test_autocomplete_empty_database(self, test_client):
+        """Should return an empty suggestion list."""
+        response = await test_client.get(f"{INGREDIENTS_URL}/autocomplete?prefix=tom&limit=5")
+
+        assert response.status_code == HTTP_200_OK
+        assert response.json() == []
+
+    @pytest.mark.integration
+    async def test_autocomplete_requires_prefix(self, test_client):
+        """Should reject a missing prefix."""
+        response = await test_client.get(f"{INGREDIENTS_URL}/autocomplete")
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
 
 
 class TestIngredientCreate:
@@ -60,6 +117,92 @@ class TestIngredientCreate:
         assert data["storage_location"] == "fridge"
         assert "id" in data
 
+    @pytest.mark.integration
+    async def test_create_known_ingredient_without_ai(self, test_client, monkeypatch):
+        """Should complete a well-known ingredient locally without calling Marvin."""
+        calls = []
+
+        async def generate_async(**kwargs):
+            calls.append(kwargs)
+            raise AssertionError("Marvin should not be called")
+
+        monkeypatch.setattr(suggestion_repository, "configure_marvin", lambda: None)
+        monkeypatch.setattr(marvin, "generate_async", generate_async)
+        payload = {"ingredient": {"name": "Frozen peas", "quantity": 500}}
+
+        response = await test_client.post(INGREDIENTS_URL, json=payload)
+
+        assert response.status_code == HTTP_201_CREATED
+        data = response.json()
+        assert (data["category"], data["storage_location"]) == ("vegetable", "freezer")
+        assert date.fromisoformat(data["expiry_date"]) > date.today()
+        assert calls == []
+
+    @pytest.mark.integration
+    async def test_create_known_ingredient_without_api_key(self, no_api_key, test_client):
+        """Should not need an OpenAI API key when the classifier completes the ingredient."""
+        payload = {"ingredient": {"name": "Milk", "quantity": 1000}}
+
+        response = await test_client.post(INGREDIENTS_URL, json=payload)
+
+        assert response.status_code == HTTP_201_CREATED
+        assert response.json()["category"] == "dairy"
+
+    @pytest.mark.integration
+    async def test_create_known_ingredient_does_not_import_marvin(
+        self, no_api_key, test_client, monkeypatch
+    ):
+        """Should complete a classifier-known ingredient without importing Marvin."""
+        monkeypatch.setitem(sys.modules, "marvin", None)
+        payload = {"ingredient": {"name": "Butter", "quantity": 250}}
+
+        response = await test_client.post(INGREDIENTS_URL, json=payload)
+
+        assert response.status_code == HTTP_201_CREATED
+        assert sys.modules["marvin"] is None
+
+    @pytest.mark.integration
+    async def test_create_unknown_ingredient_enriches_in_background(self, file_client, monkeypatch):
+        """Should save an unknown ingredient at once and fill in its fields afterwards."""
+
+        async def generate_async(*, target, n, instructions, context):
+            return [target(**{**context, "category": "condiment", "storage_location": "fridge"})]
+
+        monkeypatch.setattr(suggestion_repository, "configure_marvin", lambda: None)
+        monkeypatch.setattr(marvin, "generate_async", generate_async)
+        payload = {"ingredient": {"name": "Kimchi", "quantity": 300}}
+
+        response = await file_client.post(INGREDIENTS_URL, json=payload)
+
+        assert response.status_code == HTTP_201_CREATED
+        created = response.json()
+        assert (created["category"], created["enrichment_pending"]) == ("other", True)
+        for _ in range(100):
+            enriched = (await file_client.get(f"{INGREDIENTS_URL}/{created['id']}")).json()
+            if not enriched["enrichment_pending"]:
+                break
+            await asyncio.sleep(0.02)
+        assert (enriched["category"], enriched["storage_location"], enriched["quantity"]) == (
+            "condiment",
+            "fridge",
+            300,
+        )
+        stats = (await file_client.get("/api/v1/suggestions/enrichment")).json()
+        assert (stats["queued"], stats["enriched"]) == (0, 1)
+
+    @pytest.mark.integration
+    async def test_create_unknown_ingredient_queues_without_api_key(self, no_api_key, file_client):
+        """Should save an unknown ingredient for later enrichment without an OpenAI API key."""
+        payload = {"ingredient": {"name": "Zorblax", "quantity": 2}}
+
+        response = await file_client.post(INGREDIENTS_URL, json=payload)
+
+        assert response.status_code == HTTP_201_CREATED
+        created = response.json()
+        assert created["enrichment_pending"] is True
+        saved = await file_client.get(f"{INGREDIENTS_URL}/{created['id']}")
+        assert (saved.status_code, saved.json()["name"]) == (HTTP_200_OK, "Zorblax")
+
     @pytest.mark.integration
     async def test_create_duplicate_name_adds_quantity(self, test_client):
         """Should add quantity to existing ingredient with same name."""
@@ -206,7 +349,7 @@ class TestIngredientFilters:
         response = await test_client.get(f"{INGREDIENTS_URL}?storage_location=fridge")
 
         assert response.status_code == HTTP_200_OK
-        data = response.json()
+        data = response.json()["items"]
         # Filter should return only matching items
         if data:  # If there are results, they should all match
             assert all(item["storage_location"] == "fridge" for item in data)
@@ -229,8 +372,83 @@ class TestIngredientFilters:
         response = await test_client.get(f"{INGREDIENTS_URL}?name_contains=tomato")
 
         assert response.status_code == HTTP_200_OK
-        data = response.json()
+        data = response.json()["items"]
         # Filter should return only matching items
         if data:  # If there are results, they should all match
             assert all("tomato" in item["name"].lower() for item in data)
         # If empty, that's also valid (means no matches)
+
+
+class TestIngredientImport:
+    """Test POST /api/v1/ingredients/import endpoint."""
+
+    @pytest.mark.integration
+    async def test_import_streams_ndjson_progress(self, test_client):
+        """Should upsert CSV rows without AI and report progress as NDJSON."""
+        body = "name,quantity,category\nRice,1000,grain\nBeans,500,\nBad,-5,\n"
+
+        response = await test_client.post(
+            f"{INGREDIENTS_URL}/import?batch_size=1", content=body.encode()
+        )
+
+        assert response.status_code == HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = [json.loads(line) for line in response.text.splitlines()]
+        assert [event["event"] for event in events].count("progress") == 2
+        assert [event["line"] for event in events if event["event"] == "error"] == [4]
+        assert events[-1] == {
+            "event": "done",
+            "rows": 3,
+            "imported": 2,
+            "failed": 1,
+            "batches": 2,
+        }
+        listed = await test_client.get(INGREDIENTS_URL)
+        assert sorted(i["name"] for i in listed.json()["items"]) == ["Beans", "Rice"]
+
+    @pytest.mark.integration
+    async def test_import_rejects_unknown_format(self, test_client):
+        """Should return 400 before reading the body for an unknown format."""
+        response = await test_client.post(f"{INGREDIENTS_URL}/import?format=xml", content=b"")
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+
+    @pytest.mark.integration
+    async def test_import_enrich_requires_api_key(self, no_api_key, test_client):
+        """Should return 400 before reading the body when enrich has no API key."""
+        response = await test_client.post(
+            f"{INGREDIENTS_URL}/import?enrich=true", content=b"name,quantity\nRice,1\n"
+        )
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert "OpenAI API key" in response.json()["detail"]
+
+
+class TestIngredientExport:
+    """Test GET /api/v1/ingredients/export endpoint."""
+
+    @pytest.mark.integration
+    async def test_export_streams_ndjson(self, test_client):
+        """Should write every live ingredient, one per line, in id order."""
+        body = "name,quantity,category\nRice,1000,grain\nBeans,500,protein\nSalt,5,spice\n"
+        await test_client.post(f"{INGREDIENTS_URL}/import", content=body.encode())
+        listed = (await test_client.get(INGREDIENTS_URL)).json()["items"]
+        salt = next(i for i in listed if i["name"] == "Salt")
+        await test_client.delete(f"{INGREDIENTS_URL}/{salt['id']}")
+
+        response = await test_client.get(f"{INGREDIENTS_URL}/export")
+
+        assert response.status_code == HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [(i["name"], i["category"]) for i in lines] == [
+            ("Rice", "grain"),
+            ("Beans", "protein"),
+        ]
+
+    @pytest.mark.integration
+    async def test_export_rejects_bad_since(self, test_client):
+        """Should return 400 for a since that is not a date-time."""
+        response = await test_client.get(f"{INGREDIENTS_URL}/export", params={"since": "soon"})
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
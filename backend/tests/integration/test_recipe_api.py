@@ -0,0 +1,236 @@
+"""Integration tests for recipe endpoints."""
+
+import json
+from collections.abc import AsyncGenerator
+
+import pytest
+from litestar.status_codes import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_404_NOT_FOUND,
+    HTTP_422_UNPROCESSABLE_ENTITY,
+)
+from litestar.testing import AsyncTestClient
+
+from app import database as app_database
+from app.config import get_settings
+from app.main import create_app
+from app.models import Ingredient
+from tests.fixtures.queries import count_queries
+
+RECIPES_URL = "/api/v1/recipes"
+
+
+@pytest.fixture
+async def file_client(tmp_path, monkeypatch) -> AsyncGenerator[AsyncTestClient, None]:
+    """Client for an app on a file database, so writes are visible to later requests."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'api.db'}")
+    get_settings.cache_clear()
+    app_database._db_manager = None
+    async with AsyncTestClient(app=create_app(), base_url="http://test") as client:
+        yield client
+    get_settings.cache_clear()
+    app_database._db_manager = None
+
+
+async def _add_ingredients(*names: str) -> list[Ingredient]:
+    # Inserted directly: creating ingredients over the API runs AI enrichment
+    async with app_database._db_manager.get_session_factory()() as session:
+        rows = [Ingredient(name=name, category="vegetable") for name in names]
+        session.add_all(rows)
+        await session.commit()
+    return rows
+
+
+async def _create_recipe(client: AsyncTestClient, *ingredient_names: str) -> dict:
+    rows = await _add_ingredients(*ingredient_names)
+    ingredients = [
+        {"ingredient_id": row.id, "quantity": order, "unit": "g", "order_in_recipe": order}
+        for order, row in enumerate(rows, start=1)
+    ]
+    response = await client.post(
+        RECIPES_URL,
+        json={"recipe": {"name": "Soup", "instructions": "Simmer.", "ingredients": ingredients}},
+    )
+    assert response.status_code == HTTP_201_CREATED, response.text
+    return response.json()
+
+
+class TestRecipeDetail:
+    """Test the recipe detail endpoints and the queries they issue."""
+
+    @pytest.mark.integration
+    async def test_get_recipe_is_one_select(self, file_client):
+        """Should assemble the detail with ingredient names from a single SELECT."""
+        recipe = await _create_recipe(file_client, "Leek", "Potato", "Cream")
+
+        with count_queries() as queries:
+            response = await file_client.get(f"{RECIPES_URL}/{recipe['id']}")
+
+        assert response.status_code == HTTP_200_OK
+        data = response.json()
+        assert [i["ingredient_name"] for i in data["ingredients"]] == ["Leek", "Potato", "Cream"]
+        assert data["missing_ingredients"] == []
+        assert queries.selects == 1
+
+    @pytest.mark.integration
+    async def test_get_ingredients_is_one_select(self, file_client):
+        """Should list a recipe's ingredients from the same single query."""
+        recipe = await _create_recipe(file_client, "Rice", "Saffron")
+
+        with count_queries() as queries:
+            response = await file_client.get(f"{RECIPES_URL}/{recipe['id']}/ingredients")
+
+        assert [i["ingredient_name"] for i in response.json()] == ["Rice", "Saffron"]
+        assert queries.selects == 1
+
+    @pytest.mark.integration
+    async def test_create_returns_ingredient_details(self, file_client):
+        """Should return the created recipe with named ingredients."""
+        recipe = await _create_recipe(file_client, "Onion")
+
+        assert recipe["ingredients"][0]["ingredient_name"] == "Onion"
+        assert recipe["ingredients"][0]["id"] > 0
+
+    @pytest.mark.integration
+    async def test_update_reads_back_once(self, file_client):
+        """Should read the updated recipe back with one joined SELECT, not a second fetch."""
+        recipe = await _create_recipe(file_client, "Carrot", "Ginger")
+
+        with count_queries() as queries:
+            response = await file_client.patch(
+                f"{RECIPES_URL}/{recipe['id']}",
+                json={"recipe": {"name": "Carrot Soup", "ingredients": recipe["ingredients"][:1]}},
+            )
+
+        assert response.status_code == HTTP_200_OK
+        data = response.json()
+        assert data["name"] == "Carrot Soup"
+        assert [i["ingredient_name"] for i in data["ingredients"]] == ["Carrot"]
+        readbacks = [s for s in queries.statements if "JOIN ingredients" in s]
+        assert len(readbacks) == 1
+
+    @pytest.mark.integration
+    async def test_get_missing_recipe(self, file_client):
+        """Should return 404 for an unknown recipe."""
+        response = await file_client.get(f"{RECIPES_URL}/999")
+
+        assert response.status_code == HTTP_404_NOT_FOUND
+
+
+class TestRecipeBatch:
+    """Test creating and fetching recipes in batches."""
+
+    @pytest.mark.integration
+    async def test_batch_create_reports_each_item(self, file_client):
+        """Should create the valid recipes and report why the others failed."""
+        leek, potato = await _add_ingredients("Leek", "Potato")
+        soup = [
+            {"ingredient_id": leek.id, "quantity": 2, "unit": "pcs"},
+            {"ingredient_id": potato.id, "quantity": 300, "unit": "g"},
+        ]
+        recipes = [
+            {"name": "Leek Soup", "instructions": "Simmer.", "ingredients": soup},
+            {
+                "name": "Ghost",
+                "instructions": "Boo.",
+                "ingredients": [{"ingredient_id": 999, "quantity": 1, "unit": "g"}],
+            },
+            {"name": "Plain Potato", "instructions": "Boil.", "ingredients": soup[1:]},
+        ]
+
+        with count_queries() as queries:
+            response = await file_client.post(f"{RECIPES_URL}/batch", json={"recipes": recipes})
+
+        assert response.status_code == HTTP_201_CREATED, response.text
+        data = response.json()
+        assert (data["created"], data["failed"]) == (2, 1)
+        first, failed, last = data["items"]
+        assert [i["ingredient_name"] for i in first["recipe"]["ingredients"]] == ["Leek", "Potato"]
+        assert failed == {
+            "index": 1,
+            "recipe": None,
+            "error": "One or more ingredient IDs are invalid",
+        }
+        assert last["recipe"]["name"] == "Plain Potato"
+        # One ingredient check, the recipe inserts, one association executemany
+        # and one joined read-back
+        assert queries.selects == 2
+        assert sum(s.startswith("INSERT INTO recipe_ingredients") for s in queries.statements) == 1
+
+    @pytest.mark.integration
+    async def test_batch_create_rejects_empty_batch(self, file_client):
+        """Should reject a batch with no recipes."""
+        response = await file_client.post(f"{RECIPES_URL}/batch", json={"recipes": []})
+
+        assert response.status_code == HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.mark.integration
+    async def test_list_by_ids(self, file_client):
+        """Should fetch exactly the requested recipes, in comma or repeated form."""
+        ids = [(await _create_recipe(file_client, f"Bean {n}"))["id"] for n in range(3)]
+
+        with count_queries() as queries:
+            response = await file_client.get(
+                RECIPES_URL, params={"ids": f"{ids[0]},{ids[2]}", "total": "none"}
+            )
+        repeated = await file_client.get(
+            RECIPES_URL, params=[("ids", str(ids[1])), ("ids", str(ids[2]))]
+        )
+
+        assert sorted(r["id"] for r in response.json()["items"]) == [ids[0], ids[2]]
+        assert queries.selects == 2  # the page and its ingredients
+        assert sorted(r["id"] for r in repeated.json()["items"]) == ids[1:]
+
+
+class TestRecipeExport:
+    """Test GET /api/v1/recipes/export."""
+
+    @pytest.mark.integration
+    async def test_export_streams_live_recipes(self, file_client):
+        """Should write one recipe detail per line, skipping deleted recipes."""
+        kept = await _create_recipe(file_client, "Leek", "Potato")
+        dropped = await _create_recipe(file_client, "Kale")
+        await file_client.delete(f"{RECIPES_URL}/{dropped['id']}")
+
+        with count_queries() as queries:
+            response = await file_client.get(f"{RECIPES_URL}/export")
+
+        assert response.status_code == HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["id"] for line in lines] == [kept["id"]]
+        assert [i["ingredient_name"] for i in lines[0]["ingredients"]] == ["Leek", "Potato"]
+        assert queries.selects == 3  # recipes, their links and the linked ingredients
+
+    @pytest.mark.integration
+    async def test_export_since_includes_deletions(self, file_client):
+        """Should return recipes changed since the given time, deleted ones flagged."""
+        recipe = await _create_recipe(file_client, "Kale")
+        await file_client.delete(f"{RECIPES_URL}/{recipe['id']}")
+
+        changed = await file_client.get(
+            f"{RECIPES_URL}/export", params={"since": "2000-01-01T00:00:00+02:00"}
+        )
+        later = await file_client.get(f"{RECIPES_URL}/export", params={"since": "2999-01-01"})
+
+        (line,) = [json.loads(line) for line in changed.text.splitlines()]
+        assert (line["id"], line["is_deleted"]) == (recipe["id"], True)
+        assert later.text == ""
+
+    @pytest.mark.integration
+    async def test_export_gzip(self, file_client):
+        """Should gzip the stream when the client accepts it."""
+        await _create_recipe(file_client, "Leek")
+
+        response = await file_client.get(
+            f"{RECIPES_URL}/export", headers={"Accept-Encoding": "gzip"}
+        )
+        plain = await file_client.get(
+            f"{RECIPES_URL}/export", headers={"Accept-Encoding": "gzip;q=0"}
+        )
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-encoding" not in plain.headers
+        assert response.text == plain.text
+        assert len(response.text.splitlines()) == 1
@@ -1,7 +1,12 @@
 """Integration tests for suggestion endpoints."""
 
+import json
+
+import marvin
 import pytest
 
+from app.repositories import suggestion_repository
+
 SUGGESTIONS_URL = "/api/v1/suggestions"
 
 
@@ -39,3 +44,63 @@ def mock_marvin_recipe():
             ),
         ],
     )
+
+
+class TestCompletionStats:
+    """Test the completion cache and coalescer statistics endpoints."""
+
+    @pytest.mark.integration
+    async def test_reports_cache_stats(self, test_client):
+        """Should report the enabled cache with no lookups yet."""
+        response = await test_client.get(f"{SUGGESTIONS_URL}/cache")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "enabled": True,
+            "memory_hits": 0,
+            "persistent_hits": 0,
+            "misses": 0,
+            "memory_entries": 0,
+            "hit_ratio": 0.0,
+        }
+
+    @pytest.mark.integration
+    async def test_reports_inflight_stats(self, test_client):
+        """Should report the coalescer with nothing started yet."""
+        response = await test_client.get(f"{SUGGESTIONS_URL}/inflight")
+
+        assert response.status_code == 200
+        assert response.json() == {"started": 0, "coalesced": 0, "in_flight": 0}
+
+
+class TestRecipeSuggestionStream:
+    """Test POST /api/v1/suggestions/recipes/stream endpoint."""
+
+    @pytest.mark.integration
+    async def test_streams_each_variation_as_an_event(
+        self, test_client, mock_marvin_recipe, monkeypatch
+    ):
+        """Should send one recipe event per variation, then a done event."""
+
+        async def generate_async(*, target, n, instructions, context):
+            return [mock_marvin_recipe]
+
+        monkeypatch.setattr(suggestion_repository, "configure_marvin", lambda: None)
+        monkeypatch.setattr(marvin, "generate_async", generate_async)
+
+        response = await test_client.post(
+            f"{SUGGESTIONS_URL}/recipes/stream",
+            json={"recipe": {"name": "Pasta"}, "n_completions": 3},
+        )
+
+        assert response.status_code == 201
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            (block.split("\r\n")[0], json.loads(block.split("data: ", 1)[1]))
+            for block in response.text.strip().split("\r\n\r\n")
+        ]
+        assert [name for name, _ in events] == ["event: recipe"] * 3 + ["event: done"]
+        assert sorted(data["index"] for _, data in events[:3]) == [0, 1, 2]
+        assert events[0][1]["recipe"]["name"] == "Pasta"  # the draft's own name is kept
+        assert events[0][1]["recipe"]["servings"] == 4
+        assert events[-1][1]["completed"] == 3
@@ -0,0 +1,190 @@
+"""Unit tests for the Marvin completion cache."""
+
+from __future__ import annotations
+
+import sys
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import marvin
+import pytest
+
+from app.config import Settings, get_settings
+from app.core.completion_cache import CompletionCache
+from app.core.completion_key import completion_key
+from app.database import DatabaseManager
+from app.enums import IngredientCategory
+from app.repositories import SuggestionRepository, suggestion_repository
+from app.schemas.core.ingredient import Ingredient
+
+NOW = datetime(2026, 10, 17, 12, 0)
+PROMPT = "Complete this ingredient."
+
+
+class Clock:
+    """Settable stand-in for datetime.utcnow."""
+
+    def __init__(self) -> None:
+        self.now = NOW
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+async def manager(tmp_path):
+    """File-backed database manager with tables created."""
+    manager = DatabaseManager(Settings(database_url=f"sqlite+aiosqlite:///{tmp_path / 'cache.db'}"))
+    await manager.init_db()
+    yield manager
+    await manager.close()
+
+
+@pytest.fixture
+def clock() -> Clock:
+    """Clock the cache reads its time from."""
+    return Clock()
+
+
+def _cache(manager, clock, **kwargs) -> CompletionCache:
+    return CompletionCache(
+        manager.get_session_factory(),
+        ttl_seconds=kwargs.pop("ttl_seconds", 60),
+        clock=clock,
+        **kwargs,
+    )
+
+
+def _milk(**kwargs) -> Ingredient:
+    return Ingredient(**{"name": "Milk", "quantity": 1000, **kwargs})
+
+
+def _key(draft: Ingredient, n: int = 1, prompt: str = PROMPT) -> str:
+    return completion_key(Ingredient, prompt, draft, n, exclude={"quantity"})
+
+
+class TestKey:
+    """Test which requests share a cache entry."""
+
+    @pytest.mark.unit
+    def test_normalises_the_draft(self):
+        """Should ignore case, surrounding whitespace and the excluded fields."""
+        assert _key(_milk()) == _key(_milk(name="  milk ", quantity=5))
+        assert _key(_milk()) == _key(_milk(notes=""))
+
+    @pytest.mark.unit
+    def test_separates_what_changes_the_answer(self):
+        """Should differ by draft content, prompt and number of completions."""
+        keys = {
+            _key(_milk()),
+            _key(_milk(name="Oat milk")),
+            _key(_milk(storage_location="fridge")),
+            _key(_milk(), n=2),
+            _key(_milk(), prompt="Something else."),
+        }
+        assert len(keys) == 5
+
+
+class TestTiers:
+    """Test the in-memory and persistent tiers."""
+
+    @pytest.mark.unit
+    async def test_memory_then_persistent_hit(self, manager, clock):
+        """Should answer from memory, and from the table in a fresh worker."""
+        completed = _milk(category=IngredientCategory.DAIRY, storage_location="fridge")
+        cache = _cache(manager, clock)
+        assert await cache.get(_key(_milk()), Ingredient) is None
+        await cache.put(_key(_milk()), Ingredient, [completed])
+
+        assert await cache.get(_key(_milk()), Ingredient) == [completed]
+        other_worker = _cache(manager, clock)
+        assert await other_worker.get(_key(_milk()), Ingredient) == [completed]
+        assert await other_worker.get(_key(_milk()), Ingredient) == [completed]
+
+        assert cache.stats().model_dump(include={"memory_hits", "misses"}) == {
+            "memory_hits": 1,
+            "misses": 1,
+        }
+        stats = other_worker.stats()
+        assert (stats.memory_hits, stats.persistent_hits, stats.hit_ratio) == (1, 1, 1.0)
+
+    @pytest.mark.unit
+    async def test_entries_expire_after_ttl(self, manager, clock):
+        """Should miss in both tiers once the TTL has passed."""
+        cache = _cache(manager, clock, ttl_seconds=60)
+        await cache.put(_key(_milk()), Ingredient, [_milk()])
+
+        clock.now = NOW + timedelta(seconds=61)
+
+        assert await cache.get(_key(_milk()), Ingredient) is None
+        assert await _cache(manager, clock).get(_key(_milk()), Ingredient) is None
+
+    @pytest.mark.unit
+    async def test_memory_tier_is_bounded(self, manager, clock):
+        """Should evict the least recently used entry from memory only."""
+        cache = _cache(manager, clock, max_entries=2)
+        for name in ("Milk", "Eggs", "Flour"):
+            await cache.put(_key(_milk(name=name)), Ingredient, [_milk(name=name)])
+
+        assert cache.stats().memory_entries == 2
+        assert await cache.get(_key(_milk()), Ingredient) == [_milk()]
+        assert cache.stats().persistent_hits == 1
+
+    @pytest.mark.unit
+    async def test_returns_copies(self, manager, clock):
+        """Should not let a caller's changes leak into the cached completion."""
+        cache = _cache(manager, clock)
+        await cache.put(_key(_milk()), Ingredient, [_milk()])
+
+        (first,) = await cache.get(_key(_milk()), Ingredient)
+        first.category = IngredientCategory.OTHER
+
+        (second,) = await cache.get(_key(_milk()), Ingredient)
+        assert second.category is None
+
+
+class TestSuggestionRepository:
+    """Test completions going through the cache."""
+
+    @pytest.mark.unit
+    async def test_repeated_ingredient_calls_marvin_once(self, manager, clock, monkeypatch):
+        """Should reuse the completion, keeping the draft's own name and quantity."""
+        calls = []
+
+        async def generate_async(*, target, n, instructions, context):
+            calls.append(context)
+            return [target(**{**context, "category": "dairy", "storage_location": "fridge"})]
+
+        monkeypatch.setattr(suggestion_repository, "configure_marvin", lambda: None)
+        monkeypatch.setattr(marvin, "generate_async", generate_async)
+        async with manager.get_session_factory()() as session:
+            repo = SuggestionRepository(session, _cache(manager, clock))
+
+            await repo.generate_ingredient(PROMPT, 1, _milk())
+            (again,) = await repo.generate_ingredient(PROMPT, 1, _milk(name="MILK", quantity=250))
+
+        assert len(calls) == 1
+        assert (again.name, again.quantity, again.category, again.storage_location) == (
+            "MILK",
+            Decimal("250"),
+            IngredientCategory.DAIRY,
+            "fridge",
+        )
+
+    @pytest.mark.unit
+    async def test_cached_completion_needs_no_api_key(self, manager, clock, monkeypatch):
+        """Should answer from the cache without configuring or importing Marvin."""
+        cache = _cache(manager, clock)
+        await cache.put(_key(_milk()), Ingredient, [_milk(category="dairy")])
+        monkeypatch.setenv("OPENAI_API_KEY", "")
+        get_settings.cache_clear()
+        monkeypatch.setitem(sys.modules, "marvin", None)
+        try:
+            async with manager.get_session_factory()() as session:
+                repo = SuggestionRepository(session, cache)
+
+                (completion,) = await repo.generate_ingredient(PROMPT, 1, _milk())
+        finally:
+            get_settings.cache_clear()
+
+        assert completion.category == IngredientCategory.DAIRY
@@ -0,0 +1,255 @@
+"""Unit tests for background ingredient enrichment."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.config import Settings
+from app.core.enrichment import EnrichmentQueue
+from app.database import DatabaseManager
+from app.enums import IngredientCategory
+from app.models import EnrichmentJob
+from app.repositories import IngredientRepository
+from app.schemas.core.ingredient import Ingredient
+from app.services import IngredientService
+
+NOW = datetime(2026, 10, 17, 12, 0)
+
+
+class Clock:
+    """Settable stand-in for datetime.utcnow."""
+
+    def __init__(self) -> None:
+        self.now = NOW
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class FakeMarvin:
+    """Completer that fails a set number of times, then fills every field."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.drafts: list[Ingredient] = []
+
+    async def __call__(self, draft: Ingredient) -> list[Ingredient]:
+        self.drafts.append(draft)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("model unavailable")
+        return [
+            draft.model_copy(
+                update={
+                    "category": IngredientCategory.CONDIMENT,
+                    "storage_location": "fridge",
+                    "expiry_date": date(2027, 1, 1),
+                    "notes": "Fermented cabbage",
+                }
+            )
+        ]
+
+
+@pytest.fixture
+async def manager(tmp_path):
+    """File-backed database manager with tables created."""
+    manager = DatabaseManager(Settings(database_url=f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}"))
+    await manager.init_db()
+    yield manager
+    await manager.close()
+
+
+@pytest.fixture
+def clock() -> Clock:
+    """Clock the queue reads its time from."""
+    return Clock()
+
+
+async def _create(manager, draft: Ingredient):
+    async with manager.get_session_factory()() as session:
+        ingredient = await IngredientService(IngredientRepository(session)).create_ingredient(
+            draft, enrich_later=True
+        )
+        await session.commit()
+    return ingredient
+
+
+async def _reload(manager, ingredient_id: int):
+    async with manager.get_session_factory()() as session:
+        ingredient = await IngredientRepository(session).get_by_id(ingredient_id)
+        jobs = (await session.scalars(select(EnrichmentJob))).all()
+    return ingredient, jobs
+
+
+class TestEnqueue:
+    """Test saving ingredients for later enrichment."""
+
+    @pytest.mark.unit
+    async def test_saves_draft_and_queues_job(self, manager):
+        """Should save at once with a placeholder category and queue the client's fields."""
+        ingredient = await _create(manager, Ingredient(name="Kimchi", quantity=300, notes="Jar"))
+
+        assert (ingredient.category, ingredient.enrichment_pending) == (
+            IngredientCategory.OTHER,
+            True,
+        )
+        _, (job,) = await _reload(manager, ingredient.id)
+        assert job.draft == {"name": "Kimchi", "quantity": 300.0, "notes": "Jar"}
+
+    @pytest.mark.unit
+    async def test_complete_ingredient_is_not_queued(self, manager):
+        """Should not queue a draft that already has every field."""
+        draft = Ingredient(
+            name="Kimchi",
+            quantity=300,
+            category=IngredientCategory.CONDIMENT,
+            storage_location="fridge",
+            expiry_date=date(2027, 1, 1),
+        )
+
+        ingredient = await _create(manager, draft)
+
+        assert ingredient.enrichment_pending is False
+        assert (await _reload(manager, ingredient.id))[1] == []
+
+
+class TestWorker:
+    """Test processing queued jobs."""
+
+    @pytest.mark.unit
+    async def test_fills_missing_fields_only(self, manager, clock):
+        """Should patch the empty fields, keep the client's and clear the job."""
+        ingredient = await _create(manager, Ingredient(name="Kimchi", quantity=300, notes="Jar"))
+        marvin = FakeMarvin()
+        queue = EnrichmentQueue(manager.get_session_factory(), marvin, clock=clock)
+
+        assert await queue.run_once() is True
+        assert await queue.run_once() is False
+
+        enriched, jobs = await _reload(manager, ingredient.id)
+        assert (enriched.category, enriched.storage_location, enriched.notes) == (
+            IngredientCategory.CONDIMENT,
+            "fridge",
+            "Jar",
+        )
+        assert enriched.enrichment_pending is False
+        assert jobs == []
+        assert marvin.drafts[0].model_fields_set == {"name", "quantity", "notes"}
+        stats = await queue.stats()
+        assert (stats.queued, stats.enriched, stats.failed) == (0, 1, 0)
+
+    @pytest.mark.unit
+    async def test_retries_with_backoff_then_gives_up(self, manager, clock):
+        """Should double the delay per failure and stop after max_attempts."""
+        ingredient = await _create(manager, Ingredient(name="Kimchi", quantity=300))
+        queue = EnrichmentQueue(
+            manager.get_session_factory(),
+            FakeMarvin(failures=3),
+            max_attempts=3,
+            backoff_seconds=30,
+            clock=clock,
+        )
+
+        assert await queue.run_once() is True
+        _, (job,) = await _reload(manager, ingredient.id)
+        assert (job.attempts, job.run_after, job.last_error) == (
+            1,
+            NOW + timedelta(seconds=30),
+            "model unavailable",
+        )
+        assert await queue.run_once() is False
+
+        clock.now = job.run_after
+        await queue.run_once()
+        _, (job,) = await _reload(manager, ingredient.id)
+        assert job.run_after == clock.now + timedelta(seconds=60)
+
+        clock.now = job.run_after
+        await queue.run_once()
+        abandoned, jobs = await _reload(manager, ingredient.id)
+        assert (abandoned.category, abandoned.enrichment_pending, jobs) == (
+            IngredientCategory.OTHER,
+            False,
+            [],
+        )
+        stats = await queue.stats()
+        assert (stats.retried, stats.failed) == (2, 1)
+
+    @pytest.mark.unit
+    async def test_leased_job_is_not_claimed_twice(self, manager, clock):
+        """Should hand a job to one worker until its lease runs out."""
+        await _create(manager, Ingredient(name="Kimchi", quantity=300))
+        gate = asyncio.Event()
+
+        async def slow_marvin(draft: Ingredient) -> list[Ingredient]:
+            await gate.wait()
+            return await FakeMarvin()(draft)
+
+        queue = EnrichmentQueue(manager.get_session_factory(), slow_marvin, clock=clock)
+        first = asyncio.create_task(queue.run_once())
+        await asyncio.sleep(0.05)
+
+        assert await queue.run_once() is False
+        assert (await queue.stats()).in_progress == 1
+        gate.set()
+        assert await first is True
+
+    @pytest.mark.unit
+    async def test_workers_drain_queue_when_notified(self, manager):
+        """Should enrich queued ingredients in the background after a notify."""
+        ingredients = [
+            await _create(manager, Ingredient(name=name, quantity=1))
+            for name in ("Kimchi", "Gochujang", "Harissa")
+        ]
+        queue = EnrichmentQueue(manager.get_session_factory(), FakeMarvin(), workers=2)
+        await queue.start()
+        try:
+            await queue.notify()
+            for _ in range(100):
+                if (await queue.stats()).queued == 0:
+                    break
+                await asyncio.sleep(0.02)
+        finally:
+            await queue.stop()
+
+        for ingredient in ingredients:
+            enriched, _ = await _reload(manager, ingredient.id)
+            assert enriched.enrichment_pending is False
+        assert (await queue.stats()).enriched == 3
+
+    @pytest.mark.unit
+    async def test_worker_completes_claimed_jobs_together(self, manager):
+        """Should run up to jobs_per_worker completions at once, so they can share a batch."""
+        names = ["Kimchi", "Gochujang", "Harissa"]
+        for name in names:
+            await _create(manager, Ingredient(name=name, quantity=1))
+        arrived: list[str] = []
+        all_arrived = asyncio.Event()
+
+        async def concurrent_marvin(draft: Ingredient) -> list[Ingredient]:
+            arrived.append(draft.name)
+            if len(arrived) == len(names):
+                all_arrived.set()
+            # Completes only once every claimed draft is in flight; a serial worker times out
+            await asyncio.wait_for(all_arrived.wait(), timeout=5)
+            return await FakeMarvin()(draft)
+
+        queue = EnrichmentQueue(
+            manager.get_session_factory(), concurrent_marvin, workers=1, jobs_per_worker=3
+        )
+        await queue.start()
+        try:
+            await queue.notify()
+            for _ in range(100):
+                if (await queue.stats()).queued == 0:
+                    break
+                await asyncio.sleep(0.02)
+        finally:
+            await queue.stop()
+
+        assert sorted(arrived) == sorted(names)
+        assert (await queue.stats()).enriched == 3
@@ -0,0 +1,73 @@
+"""Unit tests for the streaming NDJSON export."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+import pytest
+
+from app.config import Settings
+from app.core import export
+from app.core.export import ingredients_ndjson
+from app.core.streaming import gzip_chunks
+from app.database import DatabaseManager
+from app.models import Ingredient
+from app.schemas.requests.export import ExportRequest
+
+
+@pytest.fixture
+async def manager(tmp_path):
+    """File-backed database manager with tables created."""
+    manager = DatabaseManager(
+        Settings(database_url=f"sqlite+aiosqlite:///{tmp_path / 'export.db'}")
+    )
+    await manager.init_db()
+    yield manager
+    await manager.close()
+
+
+async def _collect(chunks: AsyncIterator[bytes]) -> list[bytes]:
+    return [chunk async for chunk in chunks]
+
+
+class TestExport:
+    """Test how rows are read and encoded."""
+
+    @pytest.mark.unit
+    async def test_chunks_end_on_line_boundaries(self, manager, monkeypatch):
+        """Should flush whole lines once the buffer passes FLUSH_BYTES."""
+        monkeypatch.setattr(export, "FLUSH_BYTES", 200)
+        async with manager.get_session_factory()() as session:
+            session.add_all(
+                Ingredient(name=f"Item {i}", category="other", quantity=1) for i in range(10)
+            )
+            await session.commit()
+
+        chunks = await _collect(ingredients_ndjson(manager.get_session_factory()))
+
+        assert len(chunks) > 1
+        assert all(chunk.endswith(b"\n") for chunk in chunks)
+        names = [json.loads(line)["name"] for line in b"".join(chunks).splitlines()]
+        assert names == [f"Item {i}" for i in range(10)]
+
+    @pytest.mark.unit
+    def test_since_is_compared_in_utc(self):
+        """Should turn an offset since into the naive UTC the tables store."""
+        request = ExportRequest.model_validate({"since": "2026-10-17T12:00:00+02:00"})
+
+        assert request.since == datetime(2026, 10, 17, 10, 0)
+
+    @pytest.mark.unit
+    async def test_gzip_chunks_round_trip(self):
+        """Should produce one gzip member that decompresses to the input."""
+
+        async def chunks() -> AsyncIterator[bytes]:
+            for i in range(100):
+                yield f'{{"row": {i}}}\n'.encode()
+
+        compressed = b"".join(await _collect(gzip_chunks(chunks())))
+
+        assert gzip.decompress(compressed).count(b"\n") == 100
@@ -0,0 +1,111 @@
+"""Unit tests for coalescing identical in-flight completions."""
+
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+
+import marvin
+import pytest
+
+from app.core.inflight import InflightCoalescer
+from app.repositories import SuggestionRepository, suggestion_repository
+from app.schemas.core.ingredient import Ingredient
+
+
+class Call:
+    """Completion call that finishes when the test releases it."""
+
+    def __init__(self, result: object = "done") -> None:
+        self.result = result
+        self.started = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> object:
+        self.started += 1
+        await self.release.wait()
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+class TestCoalescer:
+    """Test sharing one call between concurrent waiters."""
+
+    @pytest.mark.unit
+    async def test_waiters_share_one_call(self):
+        """Should start one call per key and hand its result to every waiter."""
+        coalescer, call, other = InflightCoalescer(), Call(), Call("other")
+        waiters = [asyncio.create_task(coalescer.run("milk", call)) for _ in range(3)]
+        waiters.append(asyncio.create_task(coalescer.run("eggs", other)))
+        await asyncio.sleep(0)
+        assert coalescer.stats().in_flight == 2
+
+        call.release.set()
+        other.release.set()
+
+        assert await asyncio.gather(*waiters) == ["done", "done", "done", "other"]
+        assert (call.started, other.started) == (1, 1)
+        assert coalescer.stats().model_dump() == {"started": 2, "coalesced": 2, "in_flight": 0}
+
+    @pytest.mark.unit
+    async def test_cancelled_waiter_leaves_others_running(self):
+        """Should keep the call going for the remaining waiters, even the first one."""
+        coalescer, call = InflightCoalescer(), Call()
+        first = asyncio.create_task(coalescer.run("milk", call))
+        second = asyncio.create_task(coalescer.run("milk", call))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        call.release.set()
+
+        assert await second == "done"
+        assert first.cancelled()
+
+    @pytest.mark.unit
+    async def test_error_reaches_every_waiter_and_is_not_kept(self):
+        """Should raise the call's error in each waiter and start afresh next time."""
+        coalescer, failing = InflightCoalescer(), Call(RuntimeError("model down"))
+        waiters = [asyncio.create_task(coalescer.run("milk", failing)) for _ in range(2)]
+        await asyncio.sleep(0)
+        failing.release.set()
+
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+
+        assert [str(result) for result in results] == ["model down", "model down"]
+        retry = Call()
+        retry.release.set()
+        assert await coalescer.run("milk", retry) == "done"
+        assert retry.started == 1
+
+
+class TestSuggestionRepository:
+    """Test concurrent completions through the repository."""
+
+    @pytest.mark.unit
+    async def test_concurrent_drafts_call_marvin_once(self, db_session, monkeypatch):
+        """Should give each caller its own copy, with its own quantity."""
+        calls = []
+
+        async def generate_async(*, target, n, instructions, context):
+            calls.append(context)
+            await asyncio.sleep(0.01)
+            return [target(**{**context, "category": "dairy"})]
+
+        monkeypatch.setattr(suggestion_repository, "configure_marvin", lambda: None)
+        monkeypatch.setattr(marvin, "generate_async", generate_async)
+        repo = SuggestionRepository(db_session, coalescer=InflightCoalescer())
+
+        results = await asyncio.gather(
+            repo.generate_ingredient("Complete.", 1, Ingredient(name="Milk", quantity=1000)),
+            repo.generate_ingredient("Complete.", 1, Ingredient(name="milk", quantity=250)),
+        )
+
+        assert len(calls) == 1
+        (first,), (second,) = results
+        assert first is not second
+        assert [(r.name, r.quantity) for r in (first, second)] == [
+            ("Milk", Decimal("1000")),
+            ("milk", Decimal("250")),
+        ]
@@ -0,0 +1,151 @@
+"""Unit tests for micro-batching ingredient completions."""
+
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+
+import marvin
+import pytest
+
+from app.core.ingredient_batcher import IngredientBatcher
+from app.enums import IngredientCategory
+from app.repositories import SuggestionRepository, suggestion_repository
+from app.schemas.core.ingredient import Ingredient
+
+
+class BatchCall:
+    """Batch call that completes every draft, except those it is told to drop or fail on."""
+
+    def __init__(self, *, drop: str | None = None, poison: str | None = None) -> None:
+        self.drop = drop
+        self.poison = poison
+        self.batches: list[list[str]] = []
+
+    async def __call__(self, prompt: str, drafts: list[Ingredient]) -> list[Ingredient]:
+        names = [draft.name for draft in drafts]
+        self.batches.append(names)
+        await asyncio.sleep(0)
+        if self.poison in names:
+            raise ValueError(f"cannot complete {self.poison}")
+        return [
+            draft.model_copy(update={"name": draft.name.upper(), "notes": prompt})
+            for draft in reversed(drafts)
+            if len(drafts) == 1 or draft.name != self.drop
+        ]
+
+
+def _drafts(*names: str) -> list[Ingredient]:
+    return [Ingredient(name=name, quantity=1) for name in names]
+
+
+class TestBatcher:
+    """Test grouping drafts and fanning completions back out."""
+
+    @pytest.mark.unit
+    async def test_concurrent_drafts_share_one_call(self):
+        """Should send drafts with the same prompt together and give each caller its own."""
+        batcher, call = IngredientBatcher(window_ms=10), BatchCall()
+
+        results = await asyncio.gather(
+            *(batcher.run("Complete.", draft, call) for draft in _drafts("Kimchi", "Harissa")),
+            batcher.run("Other.", _drafts("Paneer")[0], call),
+        )
+
+        assert [(result.name, result.notes) for result in results] == [
+            ("KIMCHI", "Complete."),
+            ("HARISSA", "Complete."),
+            ("PANEER", "Other."),
+        ]
+        assert sorted(call.batches) == [["Kimchi", "Harissa"], ["Paneer"]]
+        stats = batcher.stats()
+        assert (stats.batches, stats.drafts, stats.mean_batch_size) == (1, 2, 2.0)
+
+    @pytest.mark.unit
+    async def test_full_batch_is_sent_without_waiting(self):
+        """Should not wait out the window once max_batch_size drafts are waiting."""
+        batcher, call = IngredientBatcher(window_ms=60_000, max_batch_size=3), BatchCall()
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.run("Complete.", d, call) for d in _drafts("A", "B", "C"))),
+            timeout=1,
+        )
+
+        assert [result.name for result in results] == ["A", "B", "C"]
+        assert call.batches == [["A", "B", "C"]]
+
+    @pytest.mark.unit
+    async def test_missing_completion_is_retried_alone(self):
+        """Should complete a draft the batch answer left out with its own call."""
+        batcher, call = IngredientBatcher(window_ms=10), BatchCall(drop="Harissa")
+
+        results = await asyncio.gather(
+            *(batcher.run("Complete.", d, call) for d in _drafts("Kimchi", "Harissa"))
+        )
+
+        assert [result.name for result in results] == ["KIMCHI", "HARISSA"]
+        assert call.batches == [["Kimchi", "Harissa"], ["Harissa"]]
+        assert batcher.stats().completed_alone == 1
+
+    @pytest.mark.unit
+    async def test_failing_draft_only_fails_its_caller(self):
+        """Should retry a failed batch draft by draft and raise only for the bad one."""
+        batcher, call = IngredientBatcher(window_ms=10), BatchCall(poison="Gochujang")
+
+        results = await asyncio.gather(
+            *(batcher.run("Complete.", d, call) for d in _drafts("Kimchi", "Gochujang", "Paneer")),
+            return_exceptions=True,
+        )
+
+        assert results[0].name == "KIMCHI"
+        assert str(results[1]) == "cannot complete Gochujang"
+        assert results[2].name == "PANEER"
+        assert batcher.stats().completed_alone == 3
+
+    @pytest.mark.unit
+    async def test_cancelled_caller_is_not_sent(self):
+        """Should leave out the draft of a caller that went away before the flush."""
+        batcher, call = IngredientBatcher(window_ms=20), BatchCall()
+        gone = asyncio.create_task(batcher.run("Complete.", _drafts("Kimchi")[0], call))
+        staying = asyncio.create_task(batcher.run("Complete.", _drafts("Paneer")[0], call))
+        await asyncio.sleep(0)
+
+        gone.cancel()
+
+        assert (await staying).name == "PANEER"
+        assert call.batches == [["Paneer"]]
+
+
+class TestSuggestionRepository:
+    """Test batched completions through the repository."""
+
+    @pytest.mark.unit
+    async def test_drafts_share_one_marvin_call(self, db_session, monkeypatch):
+        """Should ask for a list of ingredients once and keep each caller's own fields."""
+        calls = []
+
+        async def generate_async(*, target, n, instructions, context):
+            calls.append((target, instructions))
+            return [
+                [
+                    Ingredient(**{**draft, "category": IngredientCategory.CONDIMENT})
+                    for draft in context["drafts"]
+                ]
+            ]
+
+        monkeypatch.setattr(suggestion_repository, "configure_marvin", lambda: None)
+        monkeypatch.setattr(marvin, "generate_async", generate_async)
+        repo = SuggestionRepository(db_session, batcher=IngredientBatcher(window_ms=10))
+
+        results = await asyncio.gather(
+            repo.generate_ingredient("Complete.", 1, Ingredient(name="Kimchi", quantity=300)),
+            repo.generate_ingredient("Complete.", 1, Ingredient(name="Harissa", quantity=90)),
+        )
+
+        ((target, instructions),) = calls
+        assert target == list[Ingredient]
+        assert instructions.startswith("Complete.\n\n")
+        assert [(r.name, r.quantity, r.category) for (r,) in results] == [
+            ("Kimchi", Decimal("300"), IngredientCategory.CONDIMENT),
+            ("Harissa", Decimal("90"), IngredientCategory.CONDIMENT),
+        ]
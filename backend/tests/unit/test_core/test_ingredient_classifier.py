@@ -0,0 +1,110 @@
+"""Unit tests for the rule-based ingredient classifier."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+
+from app.core.ingredient_classifier import (
+    ENTRY_STORAGE,
+    FREEZER,
+    FREEZER_SHELF_LIFE_DAYS,
+    LEXICON,
+    SYNONYMS,
+    IngredientClassifier,
+    classify,
+)
+from app.enums import IngredientCategory
+from app.schemas.core.ingredient import Ingredient
+
+TODAY = date(2026, 10, 17)
+
+
+class TestClassify:
+    """Test what the lexicon makes of a name."""
+
+    @pytest.mark.unit
+    def test_tables_are_consistent(self):
+        """Should only override and alias entries that exist."""
+        entries = {entry.strip() for text in LEXICON.values() for entry in text.split(",")}
+        assert set(ENTRY_STORAGE) <= entries
+        assert set(SYNONYMS.values()) <= entries
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("name", "category"),
+        [
+            ("Tomatoes", IngredientCategory.VEGETABLE),
+            ("Blueberries", IngredientCategory.FRUIT),
+            ("Courgette", IngredientCategory.VEGETABLE),
+            ("Chicken stock", IngredientCategory.LIQUID),
+            ("Peanut butter", IngredientCategory.CONDIMENT),
+            ("Boneless chicken thighs", IngredientCategory.PROTEIN),
+            ("Extra-virgin olive oil", IngredientCategory.OIL_FAT),
+            ("Mustard greens", IngredientCategory.VEGETABLE),
+            ("Rice milk", IngredientCategory.LIQUID),
+        ],
+    )
+    def test_head_noun_decides(self, name, category):
+        """Should stem, resolve synonyms and classify by the last food named."""
+        classification = classify(name)
+
+        assert classification is not None
+        assert (classification.category, classification.confidence) == (category, 1.0)
+
+    @pytest.mark.unit
+    def test_modifiers_change_storage(self):
+        """Should keep frozen and dried foods where they belong."""
+        assert classify("Peas").model_dump(include={"storage_location", "shelf_life_days"}) == {
+            "storage_location": "fridge",
+            "shelf_life_days": 7,
+        }
+        assert classify("Frozen peas").storage_location == FREEZER
+        assert classify("Dried apricots").storage_location == "pantry"
+
+    @pytest.mark.unit
+    def test_confidence_drops_with_unknown_words(self):
+        """Should be unsure of unknown words, and more so when they are the head noun."""
+        assert classify("Heirloom tomatoes").confidence == 0.75
+        assert classify("Tomato soup").confidence == 0.25
+        assert classify("Turnip greens").confidence == 0.25
+        assert classify("Item1") is None
+
+
+class TestIngredientClassifier:
+    """Test completing drafts."""
+
+    @pytest.mark.unit
+    def test_fills_missing_fields(self):
+        """Should set category, storage location and an expiry date from the shelf life."""
+        completed = IngredientClassifier().complete(
+            Ingredient(name="Eggs", quantity=600), today=TODAY
+        )
+
+        assert completed is not None
+        assert completed.model_dump(exclude={"notes"}) == {
+            "name": "Eggs",
+            "quantity": 600,
+            "category": IngredientCategory.PROTEIN,
+            "storage_location": "fridge",
+            "expiry_date": TODAY + timedelta(days=28),
+        }
+
+    @pytest.mark.unit
+    def test_keeps_fields_the_draft_sets(self):
+        """Should not overwrite the draft, and follow it into the freezer."""
+        draft = Ingredient(name="Salmon fillets", quantity=400, storage_location="Freezer")
+
+        completed = IngredientClassifier().complete(draft, today=TODAY)
+
+        assert completed.storage_location == "Freezer"
+        assert completed.expiry_date == TODAY + timedelta(days=FREEZER_SHELF_LIFE_DAYS)
+
+    @pytest.mark.unit
+    def test_defers_below_threshold(self):
+        """Should return None for names it is not confident about."""
+        classifier = IngredientClassifier(threshold=0.8)
+
+        assert classifier.complete(Ingredient(name="Heirloom tomatoes", quantity=1)) is None
+        assert classifier.complete(Ingredient(name="Kimchi", quantity=1)) is None
@@ -0,0 +1,190 @@
+"""Unit tests for the streaming ingredient import."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from decimal import Decimal
+
+import pytest
+from click import Group
+from click.testing import CliRunner
+from sqlalchemy import select
+
+from app import cli
+from app.config import Settings, get_settings
+from app.core.ingredient_import import ai_enricher, import_ingredients
+from app.database import DatabaseManager
+from app.enums import ImportFormat, IngredientCategory
+from app.models import Ingredient
+from app.schemas.core.ingredient import Ingredient as IngredientSchema
+
+
+@pytest.fixture
+async def manager(tmp_path):
+    """File-backed database manager with tables created."""
+    manager = DatabaseManager(
+        Settings(database_url=f"sqlite+aiosqlite:///{tmp_path / 'import.db'}")
+    )
+    await manager.init_db()
+    yield manager
+    await manager.close()
+
+
+async def _chunks(body: str, size: int = 7) -> AsyncIterator[bytes]:
+    """The body in small chunks, so records and characters straddle chunk borders."""
+    data = body.encode()
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def _import(manager, body: str, fmt=ImportFormat.CSV, **kwargs) -> list:
+    events = import_ingredients(
+        manager.get_session_factory(),
+        _chunks(body),
+        fmt=fmt,
+        batch_size=kwargs.pop("batch_size", 100),
+        **kwargs,
+    )
+    return [event async for event in events]
+
+
+async def _rows(manager) -> dict[str, Ingredient]:
+    async with manager.get_session_factory()() as session:
+        result = await session.execute(select(Ingredient))
+        return {row.name: row for row in result.scalars()}
+
+
+class TestImportParsing:
+    """Test reading CSV and JSONL bodies."""
+
+    @pytest.mark.unit
+    async def test_csv_with_quoted_newlines_and_bom(self, manager):
+        """Should keep a quoted line break inside its field and skip the BOM."""
+        body = (
+            "\ufeffName,Quantity,Category,Notes\n"
+            'Tomato,100,vegetable,"ripe,\nred"\n'
+            "\n"
+            "Crème fraîche,200,dairy,\n"
+        )
+
+        events = await _import(manager, body)
+
+        assert events[-1].model_dump() == {
+            "event": "done",
+            "rows": 2,
+            "imported": 2,
+            "failed": 0,
+            "batches": 1,
+        }
+        rows = await _rows(manager)
+        assert rows["Tomato"].notes == "ripe,\nred"
+        assert rows["Crème fraîche"].category == IngredientCategory.DAIRY
+
+    @pytest.mark.unit
+    async def test_reports_invalid_rows_and_continues(self, manager):
+        """Should skip rows failing validation, naming their line and field."""
+        body = "name,quantity\nSalt,5\nPepper,-1\nOil,1,extra\nRice,2\n"
+
+        events = await _import(manager, body)
+
+        errors = [(e.line, e.error) for e in events if e.event == "error"]
+        assert errors == [
+            (3, "quantity: Input should be greater than or equal to 0"),
+            (4, "Row has more fields than the header"),
+        ]
+        assert (events[-1].imported, events[-1].failed) == (2, 2)
+        assert sorted(await _rows(manager)) == ["Rice", "Salt"]
+
+    @pytest.mark.unit
+    async def test_jsonl(self, manager):
+        """Should read one object per line and report lines that are not objects."""
+        body = '{"name": "Leek", "quantity": 3, "category": "vegetable"}\n[1]\n{"name": "Lime"'
+
+        events = await _import(manager, body, fmt=ImportFormat.JSONL)
+
+        assert [e.line for e in events if e.event == "error"] == [2, 3]
+        assert list(await _rows(manager)) == ["Leek"]
+
+
+class TestImportUpsert:
+    """Test how imported rows merge with stored ingredients."""
+
+    @pytest.mark.unit
+    async def test_merges_like_create(self, manager):
+        """Should add quantities, keep fields a row leaves empty and default new categories."""
+        async with manager.get_session_factory()() as session:
+            session.add(Ingredient(name="Flour", category="grain", quantity=100, notes="00"))
+            await session.commit()
+        body = "name,quantity,category,notes\nflour,50,,\nFLOUR,25,,sifted\nMystery,1,,\n"
+
+        await _import(manager, body)
+
+        rows = await _rows(manager)
+        assert rows["FLOUR"].quantity == Decimal("175")
+        assert rows["FLOUR"].category == IngredientCategory.GRAIN
+        assert rows["FLOUR"].notes == "sifted"
+        assert rows["Mystery"].category == IngredientCategory.OTHER
+
+    @pytest.mark.unit
+    async def test_reports_progress_per_batch(self, manager):
+        """Should commit and report after every batch_size rows."""
+        body = "name,quantity\n" + "".join(f"Item {i},1\n" for i in range(5))
+
+        events = await _import(manager, body, batch_size=2)
+
+        assert [(e.event, e.imported, e.batches) for e in events] == [
+            ("progress", 2, 1),
+            ("progress", 4, 2),
+            ("progress", 5, 3),
+            ("done", 5, 3),
+        ]
+
+    @pytest.mark.unit
+    async def test_enricher_fills_only_empty_fields(self, manager):
+        """Should take the model's values only where the row set nothing."""
+
+        class Suggestions:
+            async def complete_ingredient(self, request):
+                return [
+                    IngredientSchema(
+                        name="ignored",
+                        quantity=0,
+                        category=IngredientCategory.HERB,
+                        storage_location="fridge",
+                        notes="model notes",
+                    )
+                ]
+
+        body = "name,quantity,notes\nBasil,10,from the garden\n"
+
+        await _import(manager, body, enrich=ai_enricher(Suggestions()))
+
+        basil = (await _rows(manager))["Basil"]
+        assert (basil.quantity, basil.category, basil.storage_location, basil.notes) == (
+            Decimal("10"),
+            IngredientCategory.HERB,
+            "fridge",
+            "from the garden",
+        )
+
+
+class TestCli:
+    """Test the import CLI command."""
+
+    @pytest.mark.unit
+    def test_import_command(self, tmp_path, monkeypatch):
+        """Should import a file and print NDJSON progress."""
+        monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'cli.db'}")
+        get_settings.cache_clear()
+        path = tmp_path / "pantry.jsonl"
+        path.write_text('{"name": "Oats", "quantity": 500}\n{"name": "Milk", "quantity": 1}\n')
+        group = Group()
+        cli.MenooCLIPlugin().on_cli_init(group)
+
+        try:
+            result = CliRunner().invoke(group, ["ingredients", "import", str(path)])
+        finally:
+            get_settings.cache_clear()
+
+        assert result.exit_code == 0, result.output
+        assert '"event":"done","rows":2,"imported":2' in result.output
@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import os
+import subprocess
 import sys
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+from pydantic_ai.models.openai import OpenAIChatModel
 
+from app.core import marvin_config
 from app.core.marvin_config import configure_marvin
 
 
@@ -178,3 +182,71 @@ class TestConfigureMarvin:
                         sys.modules["marvin"] = original_marvin
                     elif "marvin" in sys.modules:
                         del sys.modules["marvin"]
+
+
+class TestConfigureOnce:
+    """Test configuring Marvin once per process."""
+
+    @pytest.fixture
+    def fake_marvin(self, monkeypatch, tmp_path):
+        """Fresh module state, settings with a key and a stand-in marvin module."""
+        monkeypatch.setattr(marvin_config, "_configured_with", None)
+        monkeypatch.setattr(marvin_config, "_shared_model", None)
+        settings = MagicMock(
+            openai_api_key="sk-test-key-123",
+            marvin_home_path=tmp_path / "marvin",
+            marvin_database_url=None,
+        )
+        monkeypatch.setattr(marvin_config, "get_settings", lambda: settings)
+        monkeypatch.setenv("OPENAI_API_KEY", "")
+        fake = SimpleNamespace(
+            settings=SimpleNamespace(home_path=None, database_url=None),
+            defaults=SimpleNamespace(model="openai:gpt-4o-mini"),
+        )
+        monkeypatch.setitem(sys.modules, "marvin", fake)
+        return fake, settings
+
+    @pytest.mark.unit
+    def test_later_calls_skip_configuration(self, fake_marvin):
+        """Should configure on the first call and only check the settings afterwards."""
+        fake, _ = fake_marvin
+        configure_marvin()
+        fake.settings.home_path = "untouched"
+
+        configure_marvin()
+
+        assert fake.settings.home_path == "untouched"
+
+    @pytest.mark.unit
+    def test_changed_key_configures_again(self, fake_marvin):
+        """Should redo the configuration when the API key changes."""
+        fake, settings = fake_marvin
+        configure_marvin()
+        fake.settings.home_path = "stale"
+
+        settings.openai_api_key = "sk-other-key"
+        configure_marvin()
+
+        assert os.environ["OPENAI_API_KEY"] == "sk-other-key"
+        assert fake.settings.home_path == settings.marvin_home_path.resolve()
+
+    @pytest.mark.unit
+    def test_default_model_is_shared(self, fake_marvin):
+        """Should replace the default model name with one shared OpenAI model."""
+        fake, settings = fake_marvin
+        configure_marvin()
+        model = fake.defaults.model
+
+        settings.openai_api_key = "sk-other-key"
+        configure_marvin()
+
+        assert isinstance(model, OpenAIChatModel)
+        assert model.model_name == "gpt-4o-mini"
+        assert fake.defaults.model is not model
+        assert fake.defaults.model.model_name == "gpt-4o-mini"
+
+    @pytest.mark.unit
+    def test_app_import_does_not_import_marvin(self):
+        """Should leave importing marvin to the first AI call."""
+        code = "import sys, app.main; sys.exit('marvin' in sys.modules)"
+        assert subprocess.run([sys.executable, "-c", code], check=False).returncode == 0
@@ -0,0 +1,208 @@
+"""Unit tests for archiving and purging soft-deleted rows."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+from click import Group
+from click.testing import CliRunner
+from sqlalchemy import func, select, text
+
+from app import cli
+from app.config import Settings, get_settings
+from app.core.retention import optimize_storage, purge_soft_deleted
+from app.database import DatabaseManager
+from app.models import Ingredient, Recipe, RecipeIngredient
+from app.repositories import IngredientRepository, RetentionRepository
+from tests.fixtures.factories import recipe_factory
+
+NOW = datetime(2026, 10, 17, 12, 0)
+OLD = NOW - timedelta(days=90)
+RECENT = NOW - timedelta(days=2)
+
+
+@pytest.fixture
+async def manager(tmp_path):
+    """File-backed database manager with tables created."""
+    manager = DatabaseManager(
+        Settings(database_url=f"sqlite+aiosqlite:///{tmp_path / 'retention.db'}")
+    )
+    await manager.init_db()
+    yield manager
+    await manager.close()
+
+
+async def _add_ingredient(session, name: str, deleted_at: datetime | None = None) -> Ingredient:
+    ingredient = Ingredient(
+        name=name, category="vegetable", is_deleted=deleted_at is not None, deleted_at=deleted_at
+    )
+    session.add(ingredient)
+    await session.flush()
+    return ingredient
+
+
+async def _add_recipe(
+    session, name: str, ingredients: list[Ingredient], deleted_at: datetime | None = None
+) -> Recipe:
+    data = recipe_factory(name=name)
+    data.pop("ingredients", None)
+    recipe = Recipe(**data, is_deleted=deleted_at is not None, deleted_at=deleted_at)
+    session.add(recipe)
+    await session.flush()
+    session.add_all(
+        RecipeIngredient(recipe_id=recipe.id, ingredient_id=i.id, quantity=1, unit="g")
+        for i in ingredients
+    )
+    await session.flush()
+    return recipe
+
+
+async def _names(session, model) -> list[str]:
+    return list((await session.execute(select(model.name).order_by(model.name))).scalars())
+
+
+async def _purge(manager: DatabaseManager, batch_size: int = 100):
+    return await purge_soft_deleted(
+        manager.get_session_factory(),
+        older_than=timedelta(days=30),
+        batch_size=batch_size,
+        now=NOW,
+    )
+
+
+class TestPurge:
+    """Test which rows are archived and deleted."""
+
+    @pytest.mark.unit
+    async def test_purges_only_rows_deleted_before_cutoff(self, manager):
+        """Should keep live and recently deleted rows."""
+        async with manager.get_session_factory()() as session:
+            onion = await _add_ingredient(session, "Onion")
+            await _add_recipe(session, "Old Soup", [onion], deleted_at=OLD)
+            await _add_recipe(session, "Recent Soup", [onion], deleted_at=RECENT)
+            await _add_recipe(session, "Live Soup", [onion])
+            await _add_ingredient(session, "Old Leek", deleted_at=OLD)
+            await _add_ingredient(session, "Recent Leek", deleted_at=RECENT)
+            await session.commit()
+
+        report = await _purge(manager)
+
+        assert (report.recipes, report.ingredients) == (1, 1)
+        async with manager.get_session_factory()() as session:
+            assert await _names(session, Recipe) == ["Live Soup", "Recent Soup"]
+            assert await _names(session, Ingredient) == ["Onion", "Recent Leek"]
+            links = (await session.execute(select(func.count(RecipeIngredient.id)))).scalar()
+            assert links == 2
+
+    @pytest.mark.unit
+    async def test_archives_recipe_with_associations(self, manager):
+        """Should keep a JSON copy of the recipe and its ingredient links."""
+        async with manager.get_session_factory()() as session:
+            garlic = await _add_ingredient(session, "Garlic")
+            recipe = await _add_recipe(session, "Old Soup", [garlic], deleted_at=OLD)
+            recipe_id = recipe.id
+            await session.commit()
+
+        await _purge(manager)
+
+        async with manager.get_session_factory()() as session:
+            (archived,) = await RetentionRepository(session).list_archived("recipes")
+        assert archived.row_id == recipe_id
+        assert archived.deleted_at == OLD
+        assert archived.data["name"] == "Old Soup"
+        assert [link["ingredient_id"] for link in archived.data["ingredients"]] == [garlic.id]
+
+    @pytest.mark.unit
+    async def test_keeps_ingredient_used_by_unexpired_recipe(self, manager):
+        """Should wait for every recipe using a deleted ingredient to be purged."""
+        async with manager.get_session_factory()() as session:
+            old_leek = await _add_ingredient(session, "Old Leek", deleted_at=OLD)
+            old_chive = await _add_ingredient(session, "Old Chive", deleted_at=OLD)
+            await _add_recipe(session, "Recent Soup", [old_leek], deleted_at=RECENT)
+            await _add_recipe(session, "Old Soup", [old_chive], deleted_at=OLD)
+            await session.commit()
+
+        report = await _purge(manager)
+
+        assert (report.recipes, report.ingredients) == (1, 1)
+        async with manager.get_session_factory()() as session:
+            assert await _names(session, Ingredient) == ["Old Leek"]
+
+    @pytest.mark.unit
+    async def test_purges_in_bounded_batches(self, manager):
+        """Should commit at most batch_size rows per transaction."""
+        async with manager.get_session_factory()() as session:
+            for i in range(5):
+                await _add_ingredient(session, f"Old {i}", deleted_at=OLD)
+            await session.commit()
+
+        report = await _purge(manager, batch_size=2)
+
+        assert report.ingredients == 5
+        assert report.batches == 3
+
+    @pytest.mark.unit
+    async def test_soft_delete_records_time_and_revive_clears_it(self, manager):
+        """Should stamp deleted_at on delete and clear it when the name is re-created."""
+        async with manager.get_session_factory()() as session:
+            repo = IngredientRepository(session)
+            ingredient = await _add_ingredient(session, "Basil")
+            await repo.soft_delete(ingredient)
+            assert ingredient.deleted_at is not None
+
+            revived = await repo.upsert_by_name(
+                {"name": "Basil", "category": "herb", "quantity": 1}, merge=["category"]
+            )
+            assert revived.is_deleted is False
+            assert revived.deleted_at is None
+
+
+class TestStorage:
+    """Test ANALYZE and incremental vacuum after a purge."""
+
+    @pytest.mark.unit
+    async def test_incremental_vacuum_frees_pages(self, manager):
+        """Should hand freed pages back on a database created with auto_vacuum."""
+        async with manager.get_session_factory()() as session:
+            session.add_all(
+                Ingredient(
+                    name=f"Old {i}",
+                    category="other",
+                    notes="x" * 2000,
+                    deleted_at=OLD,
+                    is_deleted=True,
+                )
+                for i in range(200)
+            )
+            await session.commit()
+        await _purge(manager)
+
+        freed = await optimize_storage(manager.get_engine())
+
+        assert freed > 0
+        async with manager.get_engine().connect() as conn:
+            stats = await conn.execute(text("SELECT count(*) FROM sqlite_stat1"))
+            assert stats.scalar_one() > 0
+
+
+class TestCli:
+    """Test the retention CLI command."""
+
+    @pytest.mark.unit
+    def test_purge_command(self, tmp_path, monkeypatch):
+        """Should run a purge against the configured database and report it."""
+        monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'cli.db'}")
+        get_settings.cache_clear()
+        group = Group()
+        cli.MenooCLIPlugin().on_cli_init(group)
+
+        try:
+            result = CliRunner().invoke(
+                group, ["retention", "purge", "--older-than-days", "7", "--batch-size", "10"]
+            )
+        finally:
+            get_settings.cache_clear()
+
+        assert result.exit_code == 0, result.output
+        assert "Purged 0 recipes and 0 ingredients in 0 batches" in result.output
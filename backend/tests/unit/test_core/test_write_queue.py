@@ -0,0 +1,124 @@
+"""Unit tests for the group-commit write queue."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from contextlib import closing
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+
+from app.config import Settings
+from app.core.write_queue import WriteQueue
+from app.database import DatabaseManager
+from app.models import Ingredient
+from app.repositories import IngredientRepository
+from app.schemas.core.ingredient import Ingredient as IngredientSchema
+from app.schemas.requests.ingredient import IngredientPatch
+from app.services import IngredientService
+
+
+@pytest.fixture
+async def manager(tmp_path):
+    """File-backed database manager with tables created."""
+    manager = DatabaseManager(Settings(database_url=f"sqlite+aiosqlite:///{tmp_path / 'wq.db'}"))
+    await manager.init_db()
+    yield manager
+    await manager.close()
+
+
+@pytest.fixture
+async def write_queue(manager):
+    """Running write queue with a generous batching window."""
+    queue = WriteQueue(manager.get_session_factory(), max_batch_size=8, max_delay_ms=50)
+    await queue.start()
+    yield queue
+    await queue.stop()
+
+
+def _add(name: str):
+    async def operation(session):
+        return await IngredientRepository(session).create(Ingredient(name=name, category="other"))
+
+    return operation
+
+
+class TestWriteQueue:
+    """Test batching, isolation and service integration."""
+
+    @pytest.mark.unit
+    async def test_concurrent_writes_share_one_commit(self, tmp_path, write_queue):
+        """Should keep the whole group invisible to other connections until it commits."""
+        seen: list[int] = []
+
+        async def add_and_look(session):
+            created = await _add("Item 2")(session)
+            with closing(sqlite3.connect(tmp_path / "wq.db")) as other:
+                seen.append(other.execute("SELECT count(*) FROM ingredients").fetchone()[0])
+            return created
+
+        results = await asyncio.gather(
+            write_queue.submit(_add("Item 0")),
+            write_queue.submit(_add("Item 1")),
+            write_queue.submit(add_and_look),
+            write_queue.submit(_add("Item 3")),
+            write_queue.submit(_add("Item 4")),
+        )
+
+        assert [r.name for r in results] == [f"Item {i}" for i in range(5)]
+        assert seen == [0]
+        with closing(sqlite3.connect(tmp_path / "wq.db")) as other:
+            assert other.execute("SELECT count(*) FROM ingredients").fetchone()[0] == 5
+        assert write_queue.batches_committed == 1
+        assert write_queue.items_committed == 5
+
+    @pytest.mark.unit
+    async def test_batch_size_bounds_group(self, manager, write_queue):
+        """Should split groups larger than max_batch_size."""
+        await asyncio.gather(*(write_queue.submit(_add(f"Item {i}")) for i in range(10)))
+
+        assert write_queue.batches_committed == 2
+
+    @pytest.mark.unit
+    async def test_failing_item_does_not_abort_group(self, manager, write_queue):
+        """Should report each caller's own error and keep the other writes."""
+        results = await asyncio.gather(
+            write_queue.submit(_add("Salt")),
+            write_queue.submit(_add("Salt")),
+            write_queue.submit(_add("Pepper")),
+            return_exceptions=True,
+        )
+
+        assert results[0].name == "Salt"
+        assert isinstance(results[1], IntegrityError)
+        assert results[2].name == "Pepper"
+        async with manager.get_session_factory()() as session:
+            count = (await session.execute(select(func.count(Ingredient.id)))).scalar_one()
+        assert count == 2
+
+    @pytest.mark.unit
+    async def test_submit_requires_running_queue(self, manager):
+        """Should refuse work before start()."""
+        queue = WriteQueue(manager.get_session_factory())
+
+        with pytest.raises(RuntimeError, match="not running"):
+            await queue.submit(_add("Salt"))
+
+    @pytest.mark.unit
+    async def test_service_writes_through_queue(self, manager, write_queue):
+        """Should route IngredientService mutations through the writer task."""
+        async with manager.get_session_factory()() as session:
+            service = IngredientService(IngredientRepository(session), write_queue)
+
+            created = await service.create_ingredient(
+                IngredientSchema(name="Rice", category="grain", quantity=100)
+            )
+            updated = await service.update_ingredient(created.id, IngredientPatch(quantity=250))
+            await service.delete_ingredient(created.id)
+
+        assert float(updated.quantity) == 250
+        assert write_queue.items_committed == 3
+        async with manager.get_session_factory()() as session:
+            assert await IngredientRepository(session).get_by_id(created.id) is None
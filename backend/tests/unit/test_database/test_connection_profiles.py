@@ -0,0 +1,75 @@
+"""Unit tests for SQLite connection profiles."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+
+from app.config import Settings
+from app.database import CONNECTION_PROFILES, DatabaseManager, get_connection_profile
+
+
+def _manager(tmp_path, profile: str) -> DatabaseManager:
+    return DatabaseManager(
+        Settings(
+            database_url=f"sqlite+aiosqlite:///{tmp_path / 'profile.db'}",
+            database_connection_profile=profile,
+        )
+    )
+
+
+class TestConnectionProfiles:
+    """Test profile lookup and the engine connect hook."""
+
+    @pytest.mark.unit
+    def test_presets_are_registered(self):
+        """Should expose the documented presets."""
+        assert {"raspberry-pi-sd", "ssd", "test-memory"} <= set(CONNECTION_PROFILES)
+
+    @pytest.mark.unit
+    def test_none_disables_tuning(self):
+        """Should return no profile for 'none'."""
+        assert get_connection_profile("none") is None
+
+    @pytest.mark.unit
+    def test_unknown_profile_fails(self):
+        """Should reject unknown profile names."""
+        with pytest.raises(ValueError, match="Unknown SQLite connection profile"):
+            get_connection_profile("floppy")
+
+    @pytest.mark.unit
+    async def test_profile_applied_to_every_pooled_connection(self, tmp_path):
+        """Should apply PRAGMAs to each new connection, not just the first one."""
+        manager = _manager(tmp_path, "raspberry-pi-sd")
+        profile = CONNECTION_PROFILES["raspberry-pi-sd"]
+        await manager.init_db()
+        try:
+            # Hold several connections at once so the pools have to open new ones
+            async with (
+                manager.get_engine().connect() as writer,
+                manager.get_read_engine().connect() as first_reader,
+                manager.get_read_engine().connect() as second_reader,
+            ):
+                for conn in (writer, first_reader, second_reader):
+                    busy_timeout = (await conn.execute(text("PRAGMA busy_timeout"))).scalar()
+                    cache_size = (await conn.execute(text("PRAGMA cache_size"))).scalar()
+                    foreign_keys = (await conn.execute(text("PRAGMA foreign_keys"))).scalar()
+                    checkpoint = (await conn.execute(text("PRAGMA wal_autocheckpoint"))).scalar()
+
+                    assert busy_timeout == profile.busy_timeout
+                    assert cache_size == profile.cache_size
+                    assert foreign_keys == 1
+                    assert checkpoint == profile.wal_autocheckpoint
+        finally:
+            await manager.close()
+
+    @pytest.mark.unit
+    async def test_profile_none_keeps_sqlite_defaults(self, tmp_path):
+        """Should leave connections untouched when tuning is disabled."""
+        manager = _manager(tmp_path, "none")
+        try:
+            async with manager.get_engine().connect() as conn:
+                foreign_keys = (await conn.execute(text("PRAGMA foreign_keys"))).scalar()
+            assert foreign_keys == 0
+        finally:
+            await manager.close()
@@ -0,0 +1,78 @@
+"""Unit tests for the read-only SQLite pool."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+
+from app.config import Settings
+from app.database import DatabaseManager
+from app.models import Ingredient
+
+
+@pytest.fixture
+async def file_manager(tmp_path):
+    """Database manager backed by a WAL-mode SQLite file."""
+    manager = DatabaseManager(Settings(database_url=f"sqlite+aiosqlite:///{tmp_path / 'split.db'}"))
+    await manager.init_db()
+    yield manager
+    await manager.close()
+
+
+class TestReadWriteSplit:
+    """Test reader/writer engine separation."""
+
+    @pytest.mark.unit
+    async def test_memory_database_shares_writer_engine(self):
+        """Should fall back to the writer engine for in-memory SQLite."""
+        manager = DatabaseManager(Settings(database_url="sqlite+aiosqlite:///:memory:"))
+        try:
+            assert not manager.uses_read_pool
+            assert manager.get_read_engine() is manager.get_engine()
+        finally:
+            await manager.close()
+
+    @pytest.mark.unit
+    async def test_read_pool_disabled_by_size(self, tmp_path):
+        """Should share the writer engine when the read pool size is 0."""
+        manager = DatabaseManager(
+            Settings(
+                database_url=f"sqlite+aiosqlite:///{tmp_path / 'nopool.db'}",
+                database_read_pool_size=0,
+            )
+        )
+        try:
+            assert manager.get_read_engine() is manager.get_engine()
+        finally:
+            await manager.close()
+
+    @pytest.mark.unit
+    async def test_read_session_rejects_writes(self, file_manager):
+        """Should open read connections in read-only mode."""
+        assert file_manager.get_read_engine() is not file_manager.get_engine()
+
+        async with file_manager.get_read_session_factory()() as session:
+            session.add(Ingredient(name="Salt", category="spice"))
+            with pytest.raises(OperationalError, match="readonly"):
+                await session.flush()
+
+    @pytest.mark.unit
+    async def test_read_does_not_wait_for_open_write_transaction(self, file_manager):
+        """Should serve reads while the writer holds an uncommitted transaction."""
+        writer = file_manager.get_session_factory()()
+        reader = file_manager.get_read_session_factory()()
+        try:
+            writer.add(Ingredient(name="Salt", category="spice"))
+            await writer.flush()  # takes the SQLite write lock
+
+            count = (await reader.execute(select(func.count(Ingredient.id)))).scalar_one()
+            assert count == 0  # WAL snapshot, uncommitted row invisible
+
+            await writer.commit()
+            await reader.rollback()  # end the old snapshot
+            count = (await reader.execute(select(func.count(Ingredient.id)))).scalar_one()
+            assert count == 1
+        finally:
+            await writer.close()
+            await reader.close()
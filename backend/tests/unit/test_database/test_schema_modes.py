@@ -0,0 +1,103 @@
+"""Unit tests for Alembic-backed startup schema modes."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from sqlalchemy import inspect
+
+from app.config import Settings
+from app.core.migrations import (
+    SchemaRevisionError,
+    alembic_config,
+    current_revisions,
+    head_revisions,
+    migrate_schema,
+    migration_lock_path,
+)
+from app.database import DatabaseManager
+
+
+@pytest.fixture
+def database_url(tmp_path) -> str:
+    """URL of a fresh SQLite file."""
+    return f"sqlite+aiosqlite:///{tmp_path / 'schema.db'}"
+
+
+async def _table_names(manager: DatabaseManager) -> set[str]:
+    async with manager.get_engine().connect() as conn:
+        return set(await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names()))
+
+
+class TestSchemaModes:
+    """Test create_all, check and migrate startup modes."""
+
+    @pytest.mark.unit
+    async def test_check_rejects_unversioned_database(self, database_url):
+        """Should refuse to start when the database is not at head."""
+        manager = DatabaseManager(Settings(database_url=database_url, database_schema_mode="check"))
+        try:
+            with pytest.raises(SchemaRevisionError, match="no revision"):
+                await manager.init_db()
+        finally:
+            await manager.close()
+
+    @pytest.mark.unit
+    async def test_migrate_then_check(self, database_url):
+        """Should upgrade a fresh database to head, after which check passes."""
+        manager = DatabaseManager(
+            Settings(database_url=database_url, database_schema_mode="migrate")
+        )
+        try:
+            await manager.init_db()
+            assert {"ingredients", "recipes", "recipe_ingredients"} <= await _table_names(manager)
+            assert await current_revisions(manager.get_engine()) == head_revisions(
+                alembic_config(database_url)
+            )
+        finally:
+            await manager.close()
+
+        checked = DatabaseManager(Settings(database_url=database_url, database_schema_mode="check"))
+        try:
+            await checked.init_db()
+        finally:
+            await checked.close()
+
+    @pytest.mark.unit
+    async def test_migrate_stamps_create_all_database(self, database_url):
+        """Should adopt a database created by create_all without re-creating tables."""
+        legacy = DatabaseManager(Settings(database_url=database_url))
+        await legacy.init_db()
+        await legacy.close()
+
+        manager = DatabaseManager(
+            Settings(database_url=database_url, database_schema_mode="migrate")
+        )
+        try:
+            assert await migrate_schema(manager.get_engine(), database_url) is True
+            assert await migrate_schema(manager.get_engine(), database_url) is False
+        finally:
+            await manager.close()
+
+    @pytest.mark.unit
+    async def test_concurrent_workers_migrate_once(self, database_url):
+        """Should serialise workers on the lock file so only one runs the upgrade."""
+        managers = [
+            DatabaseManager(Settings(database_url=database_url, database_schema_mode="migrate"))
+            for _ in range(3)
+        ]
+        try:
+            ran = await asyncio.gather(
+                *(migrate_schema(m.get_engine(), database_url) for m in managers)
+            )
+        finally:
+            for manager in managers:
+                await manager.close()
+
+        assert sorted(ran) == [False, False, True]
+
+    @pytest.mark.unit
+    def test_lock_file_sits_next_to_sqlite_database(self, tmp_path, database_url):
+        """Should derive the lock path from the database file."""
+        assert migration_lock_path(database_url) == (tmp_path / "schema.db.migrate.lock").resolve()
@@ -0,0 +1,133 @@
+"""Unit tests for trigram ingredient name search and autocomplete."""
+
+import pytest
+
+from app.models import Ingredient
+from app.repositories import IngredientRepository
+from app.repositories.search import (
+    fts5_fuzzy_match,
+    fts5_string,
+    like_escape,
+    prefix_upper_bound,
+    word_similarity,
+)
+from tests.fixtures.factories import ingredient_factory
+
+
+async def _seed(repo: IngredientRepository, *names: str) -> list[Ingredient]:
+    created = [await repo.create(Ingredient(**ingredient_factory(name=name))) for name in names]
+    await repo.session.commit()
+    return created
+
+
+class TestTrigramHelpers:
+    """Test the pure query-building helpers."""
+
+    @pytest.mark.unit
+    def test_prefix_range(self):
+        """Should bound every string that starts with the prefix."""
+        upper = prefix_upper_bound("chick")
+
+        assert "chick" <= "chickpeas" < upper
+        assert upper <= "chicl"
+
+    @pytest.mark.unit
+    def test_like_escape(self):
+        """Should escape LIKE wildcards and the escape character."""
+        assert like_escape("50%_a/b") == "50/%/_a//b"
+
+    @pytest.mark.unit
+    def test_fts5_string_escapes_quotes(self):
+        """Should keep user input a single FTS5 string."""
+        assert fts5_string('say "hi" OR x') == '"say ""hi"" OR x"'
+
+    @pytest.mark.unit
+    def test_fuzzy_match_needs_two_of_three_pieces(self):
+        """Should tolerate one edit by requiring any two intact pieces."""
+        assert fts5_fuzzy_match("Parmesan") == '"parm" OR "esan"'
+        assert fts5_fuzzy_match("mozzarella") == (
+            '("moz" AND "zare") OR ("moz" AND "lla") OR ("zare" AND "lla")'
+        )
+        with pytest.raises(ValueError):
+            fts5_fuzzy_match("ab")
+
+    @pytest.mark.unit
+    def test_word_similarity(self):
+        """Should score the share of query trigrams found in the value."""
+        assert word_similarity("chick", "Chickpeas") == 1.0
+        assert word_similarity("chikpea", "Chickpeas") == 0.6
+        assert word_similarity("xyz", "Chickpeas") == 0.0
+
+
+class TestAutocomplete:
+    """Test IngredientRepository.autocomplete."""
+
+    @pytest.mark.unit
+    async def test_prefix_matches_first_then_substrings(self, db_session):
+        """Should list prefix matches alphabetically before substring matches."""
+        repo = IngredientRepository(db_session)
+        await _seed(repo, "Tomato Paste", "Cherry Tomato", "tomatillo", "Potato", "Basil")
+
+        names = [name for _, name in await repo.autocomplete("TOMA")]
+
+        assert names == ["tomatillo", "Tomato Paste", "Cherry Tomato"]
+
+    @pytest.mark.unit
+    async def test_short_prefix_and_limit(self, db_session):
+        """Should only prefix-match below three characters and honour the limit."""
+        repo = IngredientRepository(db_session)
+        await _seed(repo, "Basil", "Bay Leaf", "Barley", "Kebab Spice")
+
+        assert [name for _, name in await repo.autocomplete("ba")] == [
+            "Barley",
+            "Basil",
+            "Bay Leaf",
+        ]
+        assert len(await repo.autocomplete("ba", limit=2)) == 2
+        assert await repo.autocomplete("   ") == []
+
+    @pytest.mark.unit
+    async def test_typo_tolerant_fallback(self, db_session):
+        """Should suggest similar names when nothing contains the input."""
+        repo = IngredientRepository(db_session)
+        await _seed(repo, "Chickpeas", "Chicken Breast", "Mozzarella")
+
+        assert [name for _, name in await repo.autocomplete("chikpea")] == ["Chickpeas"]
+        assert [name for _, name in await repo.autocomplete("mozarella")] == ["Mozzarella"]
+        assert await repo.autocomplete("zzzzzz") == []
+
+    @pytest.mark.unit
+    async def test_wildcards_and_deleted_rows(self, db_session):
+        """Should treat LIKE wildcards literally and skip soft-deleted rows."""
+        repo = IngredientRepository(db_session)
+        salt, _ = await _seed(repo, "Salt", "Sage")
+        await repo.soft_delete(salt)
+        await db_session.commit()
+
+        assert await repo.autocomplete("s%") == []
+        assert [name for _, name in await repo.autocomplete("sa")] == ["Sage"]
+
+
+class TestTrigramNameFilter:
+    """Test list(name_contains=...) through the trigram index."""
+
+    @pytest.mark.unit
+    async def test_substring_filter_follows_renames(self, db_session):
+        """Should find substrings case-insensitively and re-index renamed rows."""
+        repo = IngredientRepository(db_session)
+        paprika, _ = await _seed(repo, "Smoked Paprika", "Sweet Potato")
+
+        items, total = await repo.list(name_contains="PAPR")
+        assert [item.name for item in items] == ["Smoked Paprika"]
+        assert total == 1
+
+        paprika.name = "Chilli Flakes"
+        await repo.update(paprika)
+        await db_session.commit()
+
+        assert (await repo.list(name_contains="papr"))[0] == []
+        assert [item.name for item in (await repo.list(name_contains="lake"))[0]] == [
+            "Chilli Flakes"
+        ]
+        # Two characters are below the trigram size and fall back to ILIKE
+        assert {item.name for item in (await repo.list(name_contains="ee"))[0]} == {"Sweet Potato"}
@@ -0,0 +1,199 @@
+"""Unit tests for keyset (cursor) pagination."""
+
+import pytest
+from sqlalchemy import event, text
+
+from app.enums import TotalMode
+from app.models import Ingredient, Recipe
+from app.repositories import IngredientRepository, RecipeRepository
+from app.repositories.pagination import decode_cursor, encode_cursor, next_cursor
+from app.schemas.requests.recipe import RecipeListRequest
+from tests.fixtures.factories import ingredient_factory, recipe_factory
+
+
+class TestCursorEncoding:
+    """Test opaque cursor round-trips."""
+
+    @pytest.mark.unit
+    def test_round_trip(self):
+        """Should decode to the encoded (name, id) key."""
+        cursor = encode_cursor("Crème fraîche / 50%", 42)
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == ("Crème fraîche / 50%", 42)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("cursor", ["not-a-cursor!", "e30", encode_cursor("x", 1)[:-3]])
+    def test_invalid_cursor(self, cursor):
+        """Should raise ValueError for malformed cursors."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(cursor)
+
+    @pytest.mark.unit
+    def test_next_cursor_only_for_full_pages(self):
+        """Should stop issuing cursors once a page comes back short."""
+        rows = [Ingredient(id=i, name=f"Item{i}") for i in range(3)]
+
+        assert decode_cursor(next_cursor(rows, 3)) == ("Item2", 2)
+        assert next_cursor(rows, 4) is None
+        assert next_cursor([], 1) is None
+
+
+class TestKeysetPagination:
+    """Test repository keyset pagination."""
+
+    @pytest.mark.unit
+    async def test_walks_every_ingredient_once(self, db_session):
+        """Should page through all rows in (name, id) order without repeats."""
+        repo = IngredientRepository(db_session)
+        for name in ["Salt", "Basil", "Rice", "Apple", "Tomato"]:
+            await repo.create(Ingredient(**ingredient_factory(name=name)))
+        await db_session.commit()
+
+        seen: list[str] = []
+        after = None
+        while True:
+            page, total = await repo.list(after=after, limit=2)
+            seen.extend(item.name for item in page)
+            if len(page) < 2:
+                break
+            after = (page[-1].name, page[-1].id)
+
+        assert seen == ["Apple", "Basil", "Rice", "Salt", "Tomato"]
+        assert total == 5
+
+    @pytest.mark.unit
+    async def test_duplicate_recipe_names_break_ties_by_id(self, db_session):
+        """Should not skip recipes that share a name across a page boundary."""
+        repo = RecipeRepository(db_session)
+        for _ in range(3):
+            data = recipe_factory(name="Soup")
+            data.pop("ingredients", None)
+            await repo.create(Recipe(**data))
+        await db_session.commit()
+
+        first, _ = await repo.list(limit=2)
+        second, _ = await repo.list(after=(first[-1].name, first[-1].id), limit=2)
+
+        assert len({r.id for r in [*first, *second]}) == 3
+
+    @pytest.mark.unit
+    async def test_service_cursor_overrides_page(self, recipe_service, db_session):
+        """Should ignore page when a cursor is supplied."""
+        repo = RecipeRepository(db_session)
+        for name in ["A", "B", "C"]:
+            data = recipe_factory(name=name)
+            data.pop("ingredients", None)
+            await repo.create(Recipe(**data))
+        await db_session.commit()
+        first, _ = await recipe_service.list_recipes(RecipeListRequest(page_size=1))
+
+        recipes, total = await recipe_service.list_recipes(
+            RecipeListRequest(page=3, page_size=1, cursor=next_cursor(first, 1))
+        )
+
+        assert [r.name for r in recipes] == ["B"]
+        assert total == 3
+
+    @pytest.mark.unit
+    async def test_cursor_page_is_an_index_seek(self, db_session):
+        """Should seek the live-row (name, id) index instead of sorting."""
+        plan = await db_session.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT * FROM ingredients WHERE is_deleted IS 0 "
+                "AND (name, id) > (:name, :id) ORDER BY name, id LIMIT 10"
+            ),
+            {"name": "Salt", "id": 1},
+        )
+        details = " ".join(row[-1] for row in plan)
+
+        assert "idx_ingredient_live_name_id" in details
+        assert "TEMP B-TREE" not in details
+
+
+class TestTotalModes:
+    """Test none / exact / estimate totals."""
+
+    @pytest.fixture
+    async def five_ingredients(self, db_session):
+        """Five ingredients, two of them in the fridge."""
+        repo = IngredientRepository(db_session)
+        for i in range(5):
+            location = "fridge" if i % 2 else "pantry"
+            await repo.create(
+                Ingredient(**ingredient_factory(name=f"Item{i}", storage_location=location))
+            )
+        await db_session.commit()
+        return repo
+
+    @pytest.fixture
+    def statements(self, db_session):
+        """SQL statements executed after the fixture is set up."""
+        executed: list[str] = []
+        engine = db_session.bind.sync_engine
+
+        def record(_conn, _cursor, statement, *_args):
+            executed.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        yield executed
+        event.remove(engine, "before_cursor_execute", record)
+
+    @pytest.mark.unit
+    async def test_none_skips_count(self, five_ingredients, statements):
+        """Should run only the page query and report no total."""
+        items, total = await five_ingredients.list(limit=2, total_mode=TotalMode.NONE)
+
+        assert len(items) == 2
+        assert total is None
+        assert len(statements) == 1
+
+    @pytest.mark.unit
+    async def test_exact_counts_in_page_query(self, five_ingredients, statements):
+        """Should count inside the page query instead of issuing a second one."""
+        items, total = await five_ingredients.list(storage_location="fridge", limit=1)
+
+        assert len(items) == 1
+        assert total == 2
+        assert len(statements) == 1
+        assert "count(*)" in statements[0]
+
+    @pytest.mark.unit
+    async def test_exact_total_ignores_cursor(self, five_ingredients):
+        """Should report the full filtered total on cursor pages."""
+        first, _ = await five_ingredients.list(limit=2)
+
+        _, total = await five_ingredients.list(after=(first[-1].name, first[-1].id), limit=2)
+
+        assert total == 5
+
+    @pytest.mark.unit
+    async def test_exact_total_past_last_page(self, five_ingredients):
+        """Should still count when the requested page is beyond the end."""
+        items, total = await five_ingredients.list(skip=10, limit=2)
+
+        assert items == []
+        assert total == 5
+
+    @pytest.mark.unit
+    async def test_estimate_reads_sqlite_stat1(self, five_ingredients, db_session):
+        """Should use ANALYZE statistics for unfiltered lists."""
+        await db_session.execute(text("ANALYZE"))
+        await db_session.execute(
+            text("UPDATE sqlite_stat1 SET stat = '1000 1' WHERE tbl = 'ingredients'")
+        )
+        try:
+            _, total = await five_ingredients.list(limit=2, total_mode=TotalMode.ESTIMATE)
+        finally:
+            await db_session.execute(text("DELETE FROM sqlite_stat1"))
+
+        assert total == 1000
+
+    @pytest.mark.unit
+    async def test_estimate_falls_back_to_exact_when_filtered(self, five_ingredients):
+        """Should count exactly when filters make table statistics meaningless."""
+        _, total = await five_ingredients.list(
+            storage_location="fridge", total_mode=TotalMode.ESTIMATE
+        )
+
+        assert total == 2
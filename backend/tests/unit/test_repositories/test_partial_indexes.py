@@ -0,0 +1,127 @@
+"""Query-plan tests for the partial indexes over live (not soft-deleted) rows."""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import event, text
+
+from app.enums import IngredientCategory, TotalMode
+from app.repositories import IngredientRepository, RecipeRepository
+
+LIVE_INDEXES = {
+    "ingredients": {
+        "idx_ingredient_live_name_id",
+        "idx_ingredient_live_category",
+        "idx_ingredient_live_storage_location",
+        "idx_ingredient_live_expiry_date",
+        "idx_ingredient_live_lower_name",
+    },
+    "recipes": {
+        "idx_recipe_live_tags",
+        "idx_recipe_live_cooking_method",
+        "idx_recipe_live_author",
+    },
+}
+
+
+@pytest.fixture
+def query_plan(db_session):
+    """Run a repository call and return the query plan of its last statement."""
+
+    async def plan(call) -> str:
+        executed: list[tuple[str, tuple]] = []
+        engine = db_session.bind.sync_engine
+
+        def record(_conn, _cursor, statement, parameters, *_args):
+            executed.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            await call
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        statement, parameters = executed[-1]
+        connection = await db_session.connection()
+        rows = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return " | ".join(row[-1] for row in rows)
+
+    return plan
+
+
+class TestLiveIndexes:
+    """The soft-delete filter is served by partial indexes."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("table", LIVE_INDEXES)
+    async def test_indexes_are_partial(self, db_session, table):
+        """Should create every live-row index with a WHERE clause."""
+        rows = (await db_session.execute(text(f"PRAGMA index_list({table})"))).all()
+        partial = {row.name for row in rows if row.partial}
+
+        assert LIVE_INDEXES[table] <= partial
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("filters", "index"),
+        [
+            ({}, "idx_ingredient_live_name_id"),
+            ({"category": IngredientCategory.VEGETABLE}, "idx_ingredient_live_category"),
+            ({"storage_location": "fridge"}, "idx_ingredient_live_storage_location"),
+        ],
+        ids=["name", "category", "storage_location"],
+    )
+    async def test_ingredient_list_uses_live_index(self, db_session, query_plan, filters, index):
+        """Should read a filtered ingredient page in order from a partial index."""
+        repo = IngredientRepository(db_session)
+
+        plan = await query_plan(repo.list(**filters, limit=10, total_mode=TotalMode.NONE))
+
+        assert index in plan
+        assert "TEMP B-TREE" not in plan
+
+    @pytest.mark.unit
+    async def test_expiring_total_uses_live_index(self, db_session, query_plan):
+        """Should count expiring ingredients from the partial expiry index."""
+        repo = IngredientRepository(db_session)
+
+        plan = await query_plan(repo.list(expiring_before=date(2026, 1, 1), limit=10))
+
+        assert "idx_ingredient_live_expiry_date" in plan
+
+    @pytest.mark.unit
+    async def test_autocomplete_uses_live_index(self, db_session, query_plan):
+        """Should range-scan lower(name) in the partial index."""
+        repo = IngredientRepository(db_session)
+
+        plan = await query_plan(repo.autocomplete("to"))
+
+        assert "idx_ingredient_live_lower_name" in plan
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("filters", "index"),
+        [
+            ({}, "idx_recipe_live_tags"),
+            ({"cooking_method": "bake"}, "idx_recipe_live_cooking_method"),
+            ({"author": "Ada"}, "idx_recipe_live_author"),
+            ({"meal_types": ["dinner"], "exclude_allergens": ["nuts"]}, "idx_recipe_live_tags"),
+        ],
+        ids=["name", "cooking_method", "author", "tags"],
+    )
+    async def test_recipe_list_uses_live_index(self, db_session, query_plan, filters, index):
+        """Should read a filtered recipe page in order from a partial index."""
+        repo = RecipeRepository(db_session)
+
+        plan = await query_plan(repo.list(**filters, limit=10, total_mode=TotalMode.NONE))
+
+        assert index in plan
+        assert "TEMP B-TREE" not in plan
+
+    @pytest.mark.unit
+    async def test_recipe_tag_total_is_index_only(self, db_session, query_plan):
+        """Should count tag-filtered recipes without reading the table."""
+        repo = RecipeRepository(db_session)
+
+        plan = await query_plan(repo.list(cuisine="thai", dietary=["vegan"], limit=10))
+
+        assert "COVERING INDEX idx_recipe_live_tags" in plan
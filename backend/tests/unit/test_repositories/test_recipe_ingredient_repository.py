@@ -0,0 +1,98 @@
+"""Unit tests for recipe-ingredient association writes."""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from app.models import Ingredient, Recipe, RecipeIngredient
+from app.repositories.recipe_ingredient_repository import RecipeIngredientRepository
+from tests.fixtures.queries import count_queries
+
+
+@pytest.fixture
+async def recipe_and_ingredients(db_session):
+    """A recipe and five ingredients to associate with it."""
+    recipe = Recipe(name="Stew", instructions="Simmer.")
+    ingredients = [Ingredient(name=f"Item {i}", category="vegetable") for i in range(5)]
+    db_session.add_all([recipe, *ingredients])
+    await db_session.flush()
+    return recipe, ingredients
+
+
+def _payload(ingredient: Ingredient, quantity: int = 1, unit: str = "g") -> dict:
+    return {
+        "ingredient_id": ingredient.id,
+        "quantity": Decimal(quantity),
+        "unit": unit,
+        "is_optional": False,
+        "note": None,
+        "order_in_recipe": None,
+        "preparation_details": {"ingredient_id": ingredient.id, "unit": unit},
+    }
+
+
+async def _rows(db_session, recipe_id: int) -> dict[int, tuple[int, Decimal, str]]:
+    result = await db_session.execute(
+        select(
+            RecipeIngredient.ingredient_id,
+            RecipeIngredient.id,
+            RecipeIngredient.quantity,
+            RecipeIngredient.unit,
+        ).where(RecipeIngredient.recipe_id == recipe_id)
+    )
+    return {row[0]: tuple(row[1:]) for row in result}
+
+
+class TestBulkWrites:
+    """Test bulk association inserts and diffed updates."""
+
+    @pytest.mark.unit
+    async def test_bulk_create_is_one_insert(self, db_session, recipe_and_ingredients):
+        """Should insert every association with a single statement."""
+        recipe, ingredients = recipe_and_ingredients
+        repo = RecipeIngredientRepository(db_session)
+
+        with count_queries() as queries:
+            await repo.bulk_create(recipe.id, [_payload(i) for i in ingredients])
+
+        assert len(queries) == 1
+        assert set(await _rows(db_session, recipe.id)) == {i.id for i in ingredients}
+
+    @pytest.mark.unit
+    async def test_upsert_applies_diff(self, db_session, recipe_and_ingredients):
+        """Should delete, update and insert only what changed, keeping row ids."""
+        recipe, (a, b, c, d, _) = recipe_and_ingredients
+        repo = RecipeIngredientRepository(db_session)
+        await repo.bulk_create(recipe.id, [_payload(a), _payload(b), _payload(c)])
+        before = await _rows(db_session, recipe.id)
+
+        with count_queries() as queries:
+            await repo.upsert_recipe_ingredients(
+                recipe.id, [_payload(a), _payload(b, quantity=3), _payload(d)]
+            )
+
+        after = await _rows(db_session, recipe.id)
+        assert set(after) == {a.id, b.id, d.id}
+        assert after[a.id] == before[a.id]
+        assert after[b.id] == (before[b.id][0], Decimal("3.000"), "g")
+        # SELECT existing, DELETE c, UPDATE b, INSERT d
+        assert [s.split()[0] for s in queries.statements] == [
+            "SELECT",
+            "DELETE",
+            "UPDATE",
+            "INSERT",
+        ]
+
+    @pytest.mark.unit
+    async def test_upsert_unchanged_writes_nothing(self, db_session, recipe_and_ingredients):
+        """Should only read when the associations already match."""
+        recipe, ingredients = recipe_and_ingredients
+        repo = RecipeIngredientRepository(db_session)
+        payloads = [_payload(i, quantity=2) for i in ingredients]
+        await repo.bulk_create(recipe.id, payloads)
+
+        with count_queries() as queries:
+            await repo.upsert_recipe_ingredients(recipe.id, payloads)
+
+        assert len(queries) == queries.selects == 1
@@ -1,6 +1,8 @@
 """Unit tests for recipe repository."""
 
 import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.exc import InvalidRequestError
 
 from app.models import Recipe
 from app.repositories.recipe_repository import RecipeRepository
@@ -103,6 +105,128 @@ class TestRecipeRepositoryFilters:
         assert total == 1
         assert "soup" in result[0].name.lower()
 
+    @pytest.mark.unit
+    async def test_filter_by_cooking_method_and_author(self, db_session):
+        """Should filter by cooking method and author, skipping deleted recipes."""
+        repo = RecipeRepository(db_session)
+        specs = [
+            ("Bread", "bake", "Ada", False),
+            ("Stew", "braise", "Ada", False),
+            ("Cake", "bake", "Ben", False),
+            ("Old Bread", "bake", "Ada", True),
+        ]
+        for name, method, author, deleted in specs:
+            data = recipe_factory(name=name, cooking_method=method, author=author)
+            data.pop("ingredients", None)
+            await repo.create(Recipe(**data, is_deleted=deleted))
+        await db_session.commit()
+
+        baked, _ = await repo.list(cooking_method="bake")
+        by_ada, _ = await repo.list(author="Ada")
+        both, total = await repo.list(cooking_method="bake", author="Ada")
+
+        assert [r.name for r in baked] == ["Bread", "Cake"]
+        assert [r.name for r in by_ada] == ["Bread", "Stew"]
+        assert [r.name for r in both] == ["Bread"]
+        assert total == 1
+
+    @pytest.mark.unit
+    async def test_filter_by_tags(self, db_session):
+        """Should match any meal type, all dietary requirements and no excluded allergen."""
+        repo = RecipeRepository(db_session)
+        specs = [
+            ("Curry", ["thai"], ["dinner"], ["vegan", "gluten_free"], ["soy"]),
+            ("Pad Thai", ["thai"], ["lunch"], ["vegan"], ["nuts", "soy"]),
+            ("Pancakes", ["american"], ["breakfast"], ["vegetarian"], ["eggs", "dairy"]),
+            ("Salad", ["greek", "mediterranean"], ["lunch", "dinner"], ["vegan"], []),
+        ]
+        for name, cuisines, meals, diets, allergens in specs:
+            data = recipe_factory(name=name)
+            data.pop("ingredients", None)
+            data.update(
+                cuisine_types=cuisines,
+                meal_types=meals,
+                dietary_requirements=diets,
+                contains_allergens=allergens,
+            )
+            await repo.create(Recipe(**data))
+        await db_session.commit()
+
+        async def names(**filters) -> list[str]:
+            recipes, _ = await repo.list(**filters)
+            return [r.name for r in recipes]
+
+        assert await names(cuisine="mediterranean") == ["Salad"]
+        assert await names(meal_types=["breakfast", "lunch"]) == ["Pad Thai", "Pancakes", "Salad"]
+        assert await names(dietary=["vegan", "gluten_free"]) == ["Curry"]
+        assert await names(exclude_allergens=["nuts", "dairy"]) == ["Curry", "Salad"]
+        assert await names(
+            cuisine="thai", meal_types=["dinner", "lunch"], exclude_allergens=["nuts"]
+        ) == ["Curry"]
+
+    @pytest.mark.unit
+    async def test_tag_masks_follow_writes(self, db_session):
+        """Should derive masks on ORM updates and on Core bulk inserts."""
+        repo = RecipeRepository(db_session)
+        data = recipe_factory(name="Risotto")
+        data.pop("ingredients", None)
+        recipe = await repo.create(Recipe(**{**data, "cuisine_types": ["italian"]}))
+        await db_session.execute(
+            insert(Recipe),
+            [{**data, "name": "Ramen", "cuisine_types": ["japanese"]}],
+        )
+        await db_session.commit()
+
+        recipe.cuisine_types = ["fusion"]
+        await repo.update(recipe)
+        await db_session.commit()
+
+        assert [r.name for r in (await repo.list(cuisine="japanese"))[0]] == ["Ramen"]
+        assert [r.name for r in (await repo.list(cuisine="fusion"))[0]] == ["Risotto"]
+        assert (await repo.list(cuisine="italian"))[1] == 0
+        masks = await db_session.execute(select(Recipe.cuisine_mask).order_by(Recipe.name))
+        assert masks.scalars().all() == [1 << 2, 1 << 17]
+
+
+class TestRecipeRepositorySummary:
+    """Test the summary list projection."""
+
+    @pytest.mark.unit
+    async def test_summary_skips_text_and_ingredients(self, db_session):
+        """Should load summary columns only and never the ingredient associations."""
+        repo = RecipeRepository(db_session)
+        data = recipe_factory(name="Summary Soup")
+        data.pop("ingredients", None)
+        await repo.create(Recipe(**data))
+        await db_session.commit()
+        db_session.expunge_all()
+
+        (recipe,), total = await repo.list(summary=True)
+
+        assert total == 1
+        assert recipe.name == "Summary Soup"
+        assert recipe.cuisine_types == data["cuisine_types"]
+        with pytest.raises(InvalidRequestError):
+            _ = recipe.instructions
+        with pytest.raises(InvalidRequestError):
+            _ = recipe.ingredient_associations
+
+    @pytest.mark.unit
+    async def test_summary_search(self, db_session):
+        """Should apply the same projection to search results."""
+        repo = RecipeRepository(db_session)
+        data = recipe_factory(name="Summary Stew")
+        data.pop("ingredients", None)
+        await repo.create(Recipe(**data))
+        await db_session.commit()
+        db_session.expunge_all()
+
+        [(recipe, _, _)], _ = await repo.search("stew", summary=True)
+
+        assert recipe.name == "Summary Stew"
+        with pytest.raises(InvalidRequestError):
+            _ = recipe.notes
+
 
 class TestRecipeRepositoryPagination:
     """Test pagination."""
@@ -0,0 +1,119 @@
+"""Unit tests for full-text recipe search."""
+
+import pytest
+from sqlalchemy import text
+
+from app.enums import TotalMode
+from app.models import Recipe
+from app.repositories import RecipeRepository
+from app.repositories.search import fts5_match
+from app.schemas.requests.recipe import RecipeListRequest
+from tests.fixtures.factories import recipe_factory
+
+
+async def _create(repo: RecipeRepository, **fields) -> Recipe:
+    fields = {"description": "A plain dish.", "instructions": "Cook it.", "tags": [], **fields}
+    data = recipe_factory(**fields)
+    data.pop("ingredients", None)
+    return await repo.create(Recipe(**data))
+
+
+class TestSearchQueryParsing:
+    """Test conversion of user input to FTS5 MATCH expressions."""
+
+    @pytest.mark.unit
+    def test_terms_are_quoted_and_last_is_prefix(self):
+        """Should AND quoted words and prefix-match the last one."""
+        assert fts5_match("Smoky  chickpea STE") == '"smoky" "chickpea" "ste"*'
+
+    @pytest.mark.unit
+    def test_operators_are_not_parsed(self):
+        """Should strip FTS5 syntax so user input cannot break the query."""
+        assert fts5_match('curry OR -"tofu" NEAR(x)') == '"curry" "or" "tofu" "near" "x"*'
+
+    @pytest.mark.unit
+    def test_empty_query_rejected(self):
+        """Should raise ValueError when no searchable words remain."""
+        with pytest.raises(ValueError, match="at least one word"):
+            fts5_match(' "*" - ')
+
+
+class TestRecipeSearch:
+    """Test ranked full-text search through the repository."""
+
+    @pytest.mark.unit
+    async def test_ranks_name_matches_first(self, db_session):
+        """Should rank a name hit above a description hit above an instructions hit."""
+        repo = RecipeRepository(db_session)
+        await _create(repo, name="Plain Rice", instructions="Stir in the curry paste.")
+        await _create(repo, name="Weeknight Curry")
+        await _create(repo, name="Lentil Bowl", description="Like a mild curry.")
+        await _create(repo, name="Toast")
+        await db_session.commit()
+
+        rows, total = await repo.search("curry")
+
+        assert total == 3
+        assert [recipe.name for recipe, _, _ in rows] == [
+            "Weeknight Curry",
+            "Lentil Bowl",
+            "Plain Rice",
+        ]
+        ranks = [rank for _, rank, _ in rows]
+        assert ranks == sorted(ranks, reverse=True)
+
+    @pytest.mark.unit
+    async def test_stemming_prefix_and_snippet(self, db_session):
+        """Should match word stems and half-typed words and highlight the match."""
+        repo = RecipeRepository(db_session)
+        await _create(repo, name="Roast", description="Slowly roasted smoky aubergines.")
+        await db_session.commit()
+
+        (recipe, _, snippet), *_ = (await repo.search("aubergine"))[0]
+        assert recipe.name == "Roast"
+        assert "<mark>aubergines</mark>" in snippet
+
+        rows, _ = await repo.search("smo")
+        assert [recipe.name for recipe, _, _ in rows] == ["Roast"]
+
+    @pytest.mark.unit
+    async def test_index_follows_updates_and_deletes(self, db_session):
+        """Should re-index edited text and drop deleted or soft-deleted recipes."""
+        repo = RecipeRepository(db_session)
+        edited = await _create(repo, name="Tomato Soup")
+        soft_deleted = await _create(repo, name="Tomato Tart")
+        deleted = await _create(repo, name="Tomato Salad")
+        await db_session.commit()
+
+        edited.name = "Pumpkin Soup"
+        await repo.update(edited)
+        await repo.soft_delete(soft_deleted)
+        await db_session.delete(deleted)
+        await db_session.commit()
+
+        assert (await repo.search("tomato"))[0] == []
+        assert [r.name for r, _, _ in (await repo.search("pumpkin"))[0]] == ["Pumpkin Soup"]
+        integrity = text("INSERT INTO recipes_fts(recipes_fts, rank) VALUES ('integrity-check', 1)")
+        await db_session.execute(integrity)
+
+    @pytest.mark.unit
+    async def test_filters_and_total_modes(self, db_session):
+        """Should combine search with list filters and honour total=none."""
+        repo = RecipeRepository(db_session)
+        await _create(repo, name="Quick Stew", prep_time_minutes=10)
+        await _create(repo, name="Slow Stew", prep_time_minutes=50)
+        await db_session.commit()
+
+        rows, total = await repo.search("stew", max_prep_time_minutes=20)
+        assert [r.name for r, _, _ in rows] == ["Quick Stew"]
+        assert total == 1
+
+        rows, total = await repo.search("stew", limit=1, total_mode=TotalMode.NONE)
+        assert len(rows) == 1
+        assert total is None
+
+    @pytest.mark.unit
+    async def test_service_rejects_cursor_with_query(self, recipe_service):
+        """Should refuse keyset cursors for relevance-ordered results."""
+        with pytest.raises(ValueError, match="Cursor pagination is not supported"):
+            await recipe_service.search_recipes(RecipeListRequest(q="stew", cursor="abc"))
@@ -1,12 +1,19 @@
 """Unit tests for ingredient service."""
 
+import asyncio
 from datetime import date, timedelta
 
 import pytest
 from pydantic import ValidationError
+from sqlalchemy import select
 
+from app.config import Settings
+from app.database import DatabaseManager
+from app.models import Ingredient as IngredientModel
+from app.repositories import IngredientRepository
 from app.schemas.core.ingredient import Ingredient
 from app.schemas.requests.ingredient import IngredientListRequest, IngredientPatch
+from app.services import IngredientService
 from tests.fixtures.factories import ingredient_factory
 
 
@@ -109,6 +116,89 @@ class TestIngredientCreation:
         assert result2.id == result1.id
         assert float(result2.quantity) == initial_qty + 50.0
 
+    @pytest.mark.unit
+    async def test_create_keeps_fields_not_provided(self, ingredient_service, db_session):
+        """Should only overwrite the fields the duplicate actually sets."""
+        data1 = Ingredient(**ingredient_factory(name="Rice", quantity=500, notes="Basmati"))
+        result1 = await ingredient_service.create_ingredient(data1)
+        await db_session.commit()
+
+        result2 = await ingredient_service.create_ingredient(Ingredient(name="rice", quantity=250))
+        await db_session.commit()
+
+        assert result2.id == result1.id
+        assert float(result2.quantity) == 750.0
+        assert result2.notes == "Basmati"
+        assert result2.category == data1.category
+
+    @pytest.mark.unit
+    async def test_create_revives_soft_deleted_ingredient(self, ingredient_service, db_session):
+        """Should restore a deleted ingredient with only the new quantity."""
+        data = Ingredient(**ingredient_factory(name="Basil", quantity=30))
+        deleted = await ingredient_service.create_ingredient(data)
+        await ingredient_service.delete_ingredient(deleted.id)
+        await db_session.commit()
+
+        revived = await ingredient_service.create_ingredient(
+            Ingredient(**ingredient_factory(name="BASIL", quantity=10))
+        )
+        await db_session.commit()
+
+        assert revived.id == deleted.id
+        assert revived.is_deleted is False
+        assert float(revived.quantity) == 10.0
+
+    @pytest.mark.unit
+    async def test_revived_ingredient_drops_stale_fields(self, ingredient_service, db_session):
+        """Should not keep a deleted ingredient's expiry and storage when re-added bare."""
+        data = Ingredient(
+            **ingredient_factory(
+                name="Milk",
+                quantity=1000,
+                storage_location="fridge",
+                expiry_date=date.today() - timedelta(days=30),
+                notes="Semi-skimmed",
+            )
+        )
+        deleted = await ingredient_service.create_ingredient(data)
+        await ingredient_service.delete_ingredient(deleted.id)
+        await db_session.commit()
+
+        revived = await ingredient_service.create_ingredient(
+            Ingredient(name="milk", quantity=500), enrich_later=True
+        )
+        await db_session.commit()
+
+        assert revived.id == deleted.id
+        assert (revived.storage_location, revived.expiry_date, revived.notes) == (None, None, None)
+        assert revived.enrichment_pending is True
+
+    @pytest.mark.unit
+    async def test_concurrent_creates_from_separate_connections(self, tmp_path):
+        """Should merge racing creates of one name instead of violating uniqueness."""
+        url = f"sqlite+aiosqlite:///{tmp_path / 'race.db'}"
+        managers = [DatabaseManager(Settings(database_url=url)) for _ in range(2)]
+        await managers[0].init_db()
+
+        async def create(manager: DatabaseManager, name: str) -> None:
+            async with manager.get_session_factory()() as session:
+                service = IngredientService(IngredientRepository(session))
+                await service.create_ingredient(
+                    Ingredient(name=name, quantity=1, category="vegetable")
+                )
+                await session.commit()
+
+        try:
+            names = ["Tomato", "tomato", "TOMATO", "Onion"] * 5
+            await asyncio.gather(*(create(managers[i % 2], name) for i, name in enumerate(names)))
+            async with managers[0].get_session_factory()() as session:
+                rows = (await session.execute(select(IngredientModel))).scalars().all()
+        finally:
+            for manager in managers:
+                await manager.close()
+
+        assert sorted(float(row.quantity) for row in rows) == [5.0, 15.0]
+
 
 class TestIngredientUpdate:
     """Test ingredient update operations."""
@@ -171,9 +261,10 @@ class TestIngredientListing:
         await db_session.commit()
 
         filters = IngredientListRequest()
-        result = await ingredient_service.list_ingredients(filters)
+        result, total = await ingredient_service.list_ingredients(filters)
 
         assert len(result) == 3
+        assert total == 3
 
     @pytest.mark.unit
     async def test_list_with_storage_filter(self, ingredient_service, db_session):
@@ -187,9 +278,10 @@ class TestIngredientListing:
         await db_session.commit()
 
         filters = IngredientListRequest(storage_location="fridge")
-        result = await ingredient_service.list_ingredients(filters)
+        result, total = await ingredient_service.list_ingredients(filters)
 
         assert len(result) == 1
+        assert total == 1
         assert result[0].storage_location == "fridge"
 
     @pytest.mark.unit
@@ -224,7 +316,7 @@ class TestIngredientListing:
         await db_session.commit()
 
         filters = IngredientListRequest(expiring_before=tomorrow + timedelta(days=2))
-        result = await ingredient_service.list_ingredients(filters)
+        result, total = await ingredient_service.list_ingredients(filters)
 
         assert len(result) == 1
 
@@ -239,7 +331,7 @@ class TestIngredientListing:
         await db_session.commit()
 
         filters = IngredientListRequest(name_contains="tomato")
-        result = await ingredient_service.list_ingredients(filters)
+        result, total = await ingredient_service.list_ingredients(filters)
 
         assert len(result) == 1
         assert "tomato" in result[0].name.lower()
@@ -77,6 +77,39 @@ class TestRecipeCreation:
         with pytest.raises(ValueError, match="invalid"):
             await recipe_service.create_recipe(recipe_data)
 
+    @pytest.mark.unit
+    async def test_create_recipe_with_duplicate_ingredient(self, recipe_service, db_session):
+        """Should reject an ingredient listed twice."""
+        factory_data = recipe_factory(name="Double Recipe")
+        factory_data.pop("ingredients", None)
+        preparation = IngredientPreparation(**recipe_ingredient_factory(ingredient_id=1))
+        recipe_data = Recipe(**factory_data, ingredients=[preparation, preparation])
+
+        with pytest.raises(ValueError, match="only be listed once"):
+            await recipe_service.create_recipe(recipe_data)
+
+    @pytest.mark.unit
+    async def test_create_recipes_keeps_valid_items(self, recipe_service, db_session):
+        """Should create the valid recipes of a batch and return errors for the rest."""
+        factory_data = recipe_factory()
+        factory_data.pop("ingredients", None)
+        preparation = IngredientPreparation(**recipe_ingredient_factory(ingredient_id=1))
+        batch = [
+            Recipe(**{**factory_data, "name": "First"}, ingredients=[]),
+            Recipe(**{**factory_data, "name": "Double"}, ingredients=[preparation, preparation]),
+            Recipe(name="Nameless"),
+            Recipe(**{**factory_data, "name": "Last"}, ingredients=[]),
+        ]
+
+        results = await recipe_service.create_recipes(batch)
+        await db_session.commit()
+
+        first, double, nameless, last = results
+        assert (first.name, last.name) == ("First", "Last")
+        assert first.id < last.id
+        assert "only be listed once" in double
+        assert nameless == "Recipe name and instructions are required"
+
 
 class TestRecipeUpdate:
     """Test recipe update operations."""
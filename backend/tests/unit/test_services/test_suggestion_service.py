@@ -0,0 +1,76 @@
+"""Unit tests for suggestion service."""
+
+import asyncio
+
+import pytest
+
+from app.schemas import Recipe, SuggestionRequest
+from app.services import SuggestionService
+
+
+class VariantRepository:
+    """Suggestion repository whose variations finish after set delays."""
+
+    def __init__(self, delays: list[float], failing: set[int] = frozenset()) -> None:
+        self.delays = delays
+        self.failing = failing
+        self.cancelled: list[int] = []
+
+    async def generate_recipe(self, prompt, n_completions, draft, *, variant=0):
+        try:
+            await asyncio.sleep(self.delays[variant])
+        except asyncio.CancelledError:
+            self.cancelled.append(variant)
+            raise
+        if variant in self.failing:
+            raise RuntimeError(f"variation {variant} failed")
+        return [Recipe(name=f"{draft.name} {variant}", instructions="Cook.")]
+
+
+def _request(n: int) -> SuggestionRequest:
+    return SuggestionRequest(recipe=Recipe(name="Soup"), n_completions=n)
+
+
+class TestStreamRecipeCompletions:
+    """Test streaming recipe variations as they finish."""
+
+    @pytest.mark.unit
+    async def test_yields_variations_in_finishing_order(self):
+        """Should send the fastest variation first and a summary last."""
+        service = SuggestionService(VariantRepository([0.03, 0.0, 0.01]))
+
+        events = [e async for e in service.stream_recipe_completions(_request(3))]
+
+        assert [(e.event, getattr(e, "index", None)) for e in events] == [
+            ("recipe", 1),
+            ("recipe", 2),
+            ("recipe", 0),
+            ("done", None),
+        ]
+        assert events[0].recipe.name == "Soup 1"
+        assert (events[-1].completed, events[-1].failed) == (3, 0)
+        assert events[-1].first_ms <= events[-1].total_ms
+
+    @pytest.mark.unit
+    async def test_failed_variation_does_not_stop_the_others(self):
+        """Should report the failure and still send the other variations."""
+        service = SuggestionService(VariantRepository([0.0, 0.01], failing={0}))
+
+        events = [e async for e in service.stream_recipe_completions(_request(2))]
+
+        assert [e.event for e in events] == ["error", "recipe", "done"]
+        assert events[0].error == "variation 0 failed"
+        assert (events[-1].completed, events[-1].failed) == (1, 1)
+
+    @pytest.mark.unit
+    async def test_leaving_early_cancels_pending_variations(self):
+        """Should cancel the calls still running when the consumer stops."""
+        repository = VariantRepository([0.0, 10.0])
+        events = SuggestionService(repository).stream_recipe_completions(_request(2))
+
+        first = await anext(events)
+        await events.aclose()
+        await asyncio.sleep(0)
+
+        assert first.index == 0
+        assert repository.cancelled == [1]
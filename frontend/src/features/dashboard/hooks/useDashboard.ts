@@ -14,7 +14,7 @@ export function useDashboard() {
   const recipesQuery = useQuery({
     queryKey: ['recipes', 'count'],
     queryFn: async () => {
-      const data = await recipeService.list({ page_size: 1 })
+      const data = await recipeService.list({ page_size: 1, view: 'summary' })
       return data.total
     },
   })
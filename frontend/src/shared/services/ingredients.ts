@@ -1,6 +1,8 @@
 import httpClient from './http'
 import type {
   IngredientCreateRequest,
+  IngredientListResponse,
+  IngredientNameMatch,
   IngredientResponse,
   IngredientSuggestionRequest,
   IngredientSuggestionResponse,
@@ -15,7 +17,17 @@ export const ingredientService = {
     page?: number
     page_size?: number
   }): Promise<IngredientResponse[]> => {
-    const response = await httpClient.get<IngredientResponse[]>('/ingredients', { params })
+    // Callers only use the items, so skip counting the total
+    const response = await httpClient.get<IngredientListResponse>('/ingredients', {
+      params: { total: 'none', ...params },
+    })
+    return response.data.items
+  },
+
+  autocomplete: async (prefix: string, limit = 10): Promise<IngredientNameMatch[]> => {
+    const response = await httpClient.get<IngredientNameMatch[]>('/ingredients/autocomplete', {
+      params: { prefix, limit },
+    })
     return response.data
   },
 
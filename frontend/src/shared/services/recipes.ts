@@ -1,11 +1,15 @@
 import httpClient from './http'
 import type {
+  ListView,
+  RecipeBatchCreateRequest,
+  RecipeBatchCreateResponse,
   RecipeCreateRequest,
   RecipeDetail,
   RecipeListResponse,
   RecipeResponse,
   SuggestionRequest,
   SuggestionResponse,
+  TotalMode,
 } from '../types'
 
 export const recipeService = {
@@ -14,10 +18,23 @@ export const recipeService = {
     max_prep_time_minutes?: number
     max_cook_time_minutes?: number
     name_contains?: string
+    cooking_method?: string
+    author?: string
+    meal_types?: string[]
+    dietary?: string[]
+    exclude_allergens?: string[]
+    ids?: number[]
     page?: number
     page_size?: number
+    cursor?: string
+    total?: TotalMode
+    view?: ListView
   }): Promise<RecipeListResponse> => {
-    const response = await httpClient.get<RecipeListResponse>('/recipes', { params })
+    // Repeat list params without brackets (meal_types=a&meal_types=b)
+    const response = await httpClient.get<RecipeListResponse>('/recipes', {
+      params,
+      paramsSerializer: { indexes: null },
+    })
     return response.data
   },
 
@@ -31,6 +48,11 @@ export const recipeService = {
     return response.data
   },
 
+  createBatch: async (data: RecipeBatchCreateRequest): Promise<RecipeBatchCreateResponse> => {
+    const response = await httpClient.post<RecipeBatchCreateResponse>('/recipes/batch', data)
+    return response.data
+  },
+
   update: async (id: number, data: Partial<RecipeResponse>): Promise<RecipeDetail> => {
     const response = await httpClient.patch<RecipeDetail>(`/recipes/${id}`, { recipe: data })
     return response.data
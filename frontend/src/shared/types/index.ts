@@ -1,3 +1,3 @@
 export * from './ingredient'
+export * from './pagination'
 export * from './recipe'
-
@@ -1,3 +1,5 @@
+import type { TotalMode } from './pagination'
+
 export type IngredientCategory =
   | 'protein'
   | 'vegetable'
@@ -32,10 +34,17 @@ export interface IngredientResponse extends Ingredient {
 
 export interface IngredientListResponse {
   items: IngredientResponse[]
-  total: number
+  total: number | null
+  total_mode: TotalMode
   page: number
   page_size: number
   has_next: boolean
+  next_cursor: string | null
+}
+
+export interface IngredientNameMatch {
+  id: number
+  name: string
 }
 
 export interface IngredientCreateRequest {
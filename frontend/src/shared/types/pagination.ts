@@ -0,0 +1,2 @@
+export type TotalMode = 'none' | 'exact' | 'estimate'
+export type ListView = 'full' | 'summary'
@@ -1,3 +1,5 @@
+import type { ListView, TotalMode } from './pagination'
+
 export type CuisineType =
   | 'italian'
   | 'indian'
@@ -122,18 +124,55 @@ export interface RecipeDetail extends RecipeResponse {
   missing_ingredients: string[]
 }
 
-export interface RecipeListResponse {
-  items: RecipeResponse[]
-  total: number
+export interface RecipeSummary {
+  id: number
+  name: string
+  author: string | null
+  cooking_method: string | null
+  cuisine_types: CuisineType[]
+  meal_types: MealType[]
+  dietary_requirements: DietaryRequirement[]
+  contains_allergens: string[]
+  prep_time_minutes: number | null
+  cook_time_minutes: number | null
+  servings: number
+  tags: string[]
+  created_at: string
+  updated_at: string
+}
+
+// Items are RecipeSummary rows when the list was requested with view: 'summary'
+export interface RecipeListResponse<Item = RecipeResponse> {
+  items: Item[]
+  view: ListView
+  total: number | null
+  total_mode: TotalMode
   page: number
   page_size: number
   has_next: boolean
+  next_cursor: string | null
 }
 
 export interface RecipeCreateRequest {
   recipe: Recipe
 }
 
+export interface RecipeBatchCreateRequest {
+  recipes: Recipe[]
+}
+
+export interface RecipeBatchItemResult {
+  index: number
+  recipe: RecipeDetail | null
+  error: string | null
+}
+
+export interface RecipeBatchCreateResponse {
+  items: RecipeBatchItemResult[]
+  created: number
+  failed: number
+}
+
 export interface SuggestionRequest {
   recipe: Recipe
   prompt?: string | null